@@ -15,6 +15,8 @@ from __future__ import absolute_import
 
 import io
 import logging
+import mmap
+import os
 import struct
 import sys
 
@@ -66,15 +68,25 @@ class RecordSerializer(SimpleBaseSerializer):
 class RecordDeserializer(SimpleBaseDeserializer):
     """Deserialize RecordIO Protobuf data from an inference endpoint."""
 
-    def __init__(self, accept="application/x-recordio-protobuf"):
+    def __init__(self, accept="application/x-recordio-protobuf", output_format="records"):
         """Initialize a ``RecordDeserializer`` instance.
 
         Args:
             accept (union[str, tuple[str]]): The MIME type (or tuple of allowable MIME types) that
                 is expected from the inference endpoint (default:
                 "application/x-recordio-protobuf").
+            output_format (str): What to deserialize the records into: "records" for a list of
+                ``Record`` protobufs, "numpy" for a 2D array of the features or "csr" for a
+                scipy CSR matrix of the features (default: "records").
         """
         super(RecordDeserializer, self).__init__(accept=accept)
+        if output_format not in ("records", "numpy", "csr"):
+            raise ValueError(
+                "output_format must be one of 'records', 'numpy' or 'csr', got {}".format(
+                    output_format
+                )
+            )
+        self.output_format = output_format
 
     def deserialize(self, data, content_type):
         """Deserialize RecordIO Protobuf data from an inference endpoint.
@@ -83,10 +95,15 @@ class RecordDeserializer(SimpleBaseDeserializer):
             data (object): The protobuf message to deserialize.
             content_type (str): The MIME type of the data.
         Returns:
-            list: A list of records.
+            object: A list of records, or the features decoded as a NumPy array or CSR matrix.
         """
         try:
-            return read_records(data)
+            if self.output_format == "records":
+                return read_records(data)
+            reader = RecordIOReader(data.read())
+            if self.output_format == "numpy":
+                return reader.to_numpy()
+            return reader.to_csr()
         finally:
             data.close()
 
@@ -131,13 +148,166 @@ def _write_shape(resolved_type, record, scalar):
         record.features["values"].float32_tensor.shape.extend([scalar])
 
 
-def write_numpy_to_dense_tensor(file, array, labels=None):
+# Protobuf field tags of the ``aialgs.data.Value`` oneof members that hold dense
+# floating point tensors, and the little-endian wire dtype of their packed values.
+_DENSE_VALUE_FIELD_TAGS = {"Float32": 0x12, "Float64": 0x1A}
+_DENSE_WIRE_DTYPES = {"Float32": np.dtype("<f4"), "Float64": np.dtype("<f8")}
+
+# ``aialgs.data.Value`` tensor fields, their resolved types and the NumPy dtypes they decode to.
+_TENSOR_FIELD_TYPES = {
+    "int32_tensor": "Int32",
+    "float64_tensor": "Float64",
+    "float32_tensor": "Float32",
+}
+_RECORD_DTYPES = {
+    "Int32": np.dtype("int32"),
+    "Float64": np.dtype("float64"),
+    "Float32": np.dtype("float32"),
+}
+
+# Target size in bytes of each chunk of records encoded by the vectorized dense writer.
+_DENSE_CHUNK_BYTES = 64 * 1024 * 1024
+
+# Number of encoded bytes the sparse writer buffers before writing them to the file.
+_SPARSE_CHUNK_BYTES = 8 * 1024 * 1024
+
+
+def _encode_varint(value):
+    """Encodes a non-negative integer as a protobuf base 128 varint.
+
+    Args:
+        value (int): The integer to encode.
+
+    Returns:
+        bytes: The varint encoding of ``value``.
+    """
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _encode_dense_value_prefix(resolved_type, num_values):
+    """Encodes the ``"values"`` map entry of a dense tensor up to its packed values.
+
+    The returned bytes are, in order, the ``Record.features`` (or ``Record.label``) map entry
+    length delimiter, the ``"values"`` key, the ``Value`` oneof tag and the packed values
+    length delimiter, i.e. exactly what protobuf writes before the raw little-endian values.
+
+    Args:
+        resolved_type (str): One of the floating point types returned by ``_resolve_type``.
+        num_values (int): The number of packed values in the tensor.
+
+    Returns:
+        bytes: The encoded prefix, excluding the tag of the map field itself.
+    """
+    values_size = num_values * _DENSE_WIRE_DTYPES[resolved_type].itemsize
+    tensor_prefix = b"\x0a" + _encode_varint(values_size)
+    tensor_size = len(tensor_prefix) + values_size
+    value_prefix = bytes([_DENSE_VALUE_FIELD_TAGS[resolved_type]]) + _encode_varint(tensor_size)
+    value_size = len(value_prefix) + tensor_size
+    entry_prefix = b"\x0a\x06values\x12" + _encode_varint(value_size)
+    entry_size = len(entry_prefix) + value_size
+    return _encode_varint(entry_size) + entry_prefix + value_prefix + tensor_prefix
+
+
+def _can_write_dense_tensor_vectorized(array, resolved_type, labels, resolved_label_type):
+    """Checks whether the records of an array all share the same fixed-width encoding.
+
+    Args:
+        array (numpy.ndarray): The validated 2D array to write.
+        resolved_type (str): The resolved type of ``array``.
+        labels (numpy.ndarray): The validated labels, or None.
+        resolved_label_type (str): The resolved type of ``labels``, or None.
+
+    Returns:
+        bool: True if ``array`` can be encoded by ``_write_numpy_to_dense_tensor_vectorized``.
+    """
+    if resolved_type not in _DENSE_WIRE_DTYPES or array.shape[1] == 0:
+        return False
+    if labels is not None:
+        return resolved_label_type in _DENSE_WIRE_DTYPES and labels.shape[0] == array.shape[0]
+    return True
+
+
+def _write_numpy_to_dense_tensor_vectorized(
+    file, array, resolved_type, labels=None, resolved_label_type=None, chunk_size=None
+):
+    """Writes floating point records in large chunks without building ``Record`` objects.
+
+    Every record of a floating point matrix (with optional floating point labels) has the
+    same length, so the RecordIO framing and protobuf prefixes are constant. They are laid
+    out once in a template row, broadcast into a buffer of ``chunk_size`` records that is
+    allocated once and reused, and the raw values of each chunk are copied in with a single
+    vectorized assignment. The bytes written are identical to those written record by record.
+
+    Args:
+        file (file-like object): The file to write the records to.
+        array (numpy.ndarray): The 2D floating point array to write.
+        resolved_type (str): The resolved type of ``array``.
+        labels (numpy.ndarray): The 1D floating point labels, one per row (default: None).
+        resolved_label_type (str): The resolved type of ``labels`` (default: None).
+        chunk_size (int): The number of records encoded per write (default: None). If None,
+            chunks of roughly ``_DENSE_CHUNK_BYTES`` bytes are used.
+    """
+    n_rows, n_cols = array.shape
+    wire_dtype = _DENSE_WIRE_DTYPES[resolved_type]
+
+    features = b"\x0a" + _encode_dense_value_prefix(resolved_type, n_cols)
+    record_length = len(features) + n_cols * wire_dtype.itemsize
+    label = b""
+    if labels is not None:
+        label_wire_dtype = _DENSE_WIRE_DTYPES[resolved_label_type]
+        label = b"\x12" + _encode_dense_value_prefix(resolved_label_type, 1)
+        label_offset = record_length + len(label)
+        record_length = label_offset + label_wire_dtype.itemsize
+    pad = (((record_length + 3) >> 2) << 2) - record_length
+
+    header = struct.pack("II", _kmagic, record_length)
+    template = np.zeros(len(header) + record_length + pad, dtype=np.uint8)
+    prefix = header + features
+    template[: len(prefix)] = np.frombuffer(prefix, dtype=np.uint8)
+    names, formats, offsets = ["values"], [(wire_dtype, (n_cols,))], [len(prefix)]
+    if labels is not None:
+        values_end = len(prefix) + n_cols * wire_dtype.itemsize
+        label_start = len(header) + label_offset
+        template[values_end:label_start] = np.frombuffer(label, dtype=np.uint8)
+        names.append("label")
+        formats.append(label_wire_dtype)
+        offsets.append(label_start)
+    record_dtype = np.dtype(
+        {"names": names, "formats": formats, "offsets": offsets, "itemsize": template.size}
+    )
+
+    if chunk_size is None:
+        chunk_size = max(1, _DENSE_CHUNK_BYTES // template.size)
+    chunk_size = max(1, min(chunk_size, n_rows))
+    buffer = np.empty(chunk_size, dtype=record_dtype)
+    buffer.view(np.uint8).reshape(chunk_size, template.size)[:] = template
+
+    for start in range(0, n_rows, chunk_size):
+        stop = min(start + chunk_size, n_rows)
+        records = buffer[: stop - start]
+        records["values"] = array[start:stop]
+        if labels is not None:
+            records["label"] = labels[start:stop]
+        file.write(memoryview(records.view(np.uint8)))
+
+
+def write_numpy_to_dense_tensor(file, array, labels=None, chunk_size=None):
     """Writes a numpy array to a dense tensor
 
+    Floating point arrays with no labels or floating point labels are encoded in vectorized
+    chunks; other arrays are encoded one ``Record`` at a time. Both produce the same bytes.
+
     Args:
         file:
         array:
         labels:
+        chunk_size (int): The number of records to encode per write when the vectorized
+            encoder is used (default: None). If None, chunks of about 64 MiB are written.
     """
 
     # Validate shape of array and labels, resolve array and label types
@@ -153,8 +323,16 @@ def write_numpy_to_dense_tensor(file, array, labels=None):
                 )
             )
         resolved_label_type = _resolve_type(labels.dtype)
+    else:
+        resolved_label_type = None
     resolved_type = _resolve_type(array.dtype)
 
+    if _can_write_dense_tensor_vectorized(array, resolved_type, labels, resolved_label_type):
+        _write_numpy_to_dense_tensor_vectorized(
+            file, array, resolved_type, labels, resolved_label_type, chunk_size
+        )
+        return
+
     # Write each vector in array into a Record in the file object
     record = Record()
     for index, vector in enumerate(array):
@@ -165,13 +343,18 @@ def write_numpy_to_dense_tensor(file, array, labels=None):
         _write_recordio(file, record.SerializeToString())
 
 
-def write_spmatrix_to_sparse_tensor(file, array, labels=None):
+def write_spmatrix_to_sparse_tensor(file, array, labels=None, chunk_bytes=_SPARSE_CHUNK_BYTES):
     """Writes a scipy sparse matrix to a sparse tensor
 
+    Rows are read directly from the CSR ``indptr``, ``indices`` and ``data`` buffers and the
+    encoded records are written in chunks, so memory use is bounded by ``chunk_bytes``.
+
     Args:
         file:
         array:
         labels:
+        chunk_bytes (int): The number of encoded bytes to buffer before each write
+            (default: 8 MiB).
     """
     try:
         import scipy
@@ -203,14 +386,21 @@ def write_spmatrix_to_sparse_tensor(file, array, labels=None):
     csr_array = array.tocsr()
     n_rows, n_cols = csr_array.shape
 
+    # Cast the column indices once for the whole matrix, then slice each row's keys and values
+    # straight out of the CSR buffers instead of materializing a sparse matrix per row.
+    indptr = csr_array.indptr
+    keys = csr_array.indices.astype(np.uint64)
+    values = csr_array.data
+
     record = Record()
+    chunk = bytearray()
     for row_idx in range(n_rows):
         record.Clear()
-        row = csr_array.getrow(row_idx)
+        start, end = indptr[row_idx], indptr[row_idx + 1]
         # Write values
-        _write_feature_tensor(resolved_type, record, row.data)
+        _write_feature_tensor(resolved_type, record, values[start:end])
         # Write keys
-        _write_keys_tensor(resolved_type, record, row.indices.astype(np.uint64))
+        _write_keys_tensor(resolved_type, record, keys[start:end])
 
         # Write labels
         if labels is not None:
@@ -219,7 +409,12 @@ def write_spmatrix_to_sparse_tensor(file, array, labels=None):
         # Write shape
         _write_shape(resolved_type, record, n_cols)
 
-        _write_recordio(file, record.SerializeToString())
+        chunk += _encode_recordio(record.SerializeToString())
+        if len(chunk) >= chunk_bytes:
+            file.write(chunk)
+            chunk.clear()
+    if chunk:
+        file.write(chunk)
 
 
 def read_records(file):
@@ -249,6 +444,20 @@ for amount in range(4):
 _kmagic = 0xCED7230A
 
 
+def _encode_recordio(data):
+    """Frames a single data point as a RecordIO record.
+
+    Args:
+        data (bytes): The serialized data point.
+
+    Returns:
+        bytes: The RecordIO header, the data and its padding.
+    """
+    length = len(data)
+    pad = (((length + 3) >> 2) << 2) - length
+    return struct.pack("II", _kmagic, length) + data + padding[pad]
+
+
 def _write_recordio(f, data):
     """Writes a single data point as a RecordIO record to the given file.
 
@@ -256,29 +465,313 @@ def _write_recordio(f, data):
         f:
         data:
     """
-    length = len(data)
-    f.write(struct.pack("I", _kmagic))
-    f.write(struct.pack("I", length))
-    pad = (((length + 3) >> 2) << 2) - length
-    f.write(data)
-    f.write(padding[pad])
+    f.write(_encode_recordio(data))
 
 
 def read_recordio(f):
     """Placeholder Docstring"""
     while True:
         try:
-            (read_kmagic,) = struct.unpack("I", f.read(4))
+            read_kmagic, len_record = struct.unpack("II", f.read(8))
         except struct.error:
             return
         assert read_kmagic == _kmagic
-        (len_record,) = struct.unpack("I", f.read(4))
         pad = (((len_record + 3) >> 2) << 2) - len_record
         yield f.read(len_record)
         if pad:
             f.read(pad)
 
 
+def _index_recordio(buffer):
+    """Finds the data of every RecordIO record in a buffer in a single pass over the headers.
+
+    Args:
+        buffer (bytes-like object): The RecordIO encoded bytes.
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray]: The offsets and lengths of the data of each
+            record within ``buffer``.
+    """
+    offsets, lengths = [], []
+    position, size = 0, len(buffer)
+    while position + 8 <= size:
+        read_kmagic, len_record = struct.unpack_from("II", buffer, position)
+        if read_kmagic != _kmagic:
+            raise ValueError("Invalid RecordIO magic number at offset {}".format(position))
+        position += 8
+        if position + len_record > size:
+            raise ValueError("Truncated RecordIO record at offset {}".format(position - 8))
+        offsets.append(position)
+        lengths.append(len_record)
+        position += ((len_record + 3) >> 2) << 2
+    return np.array(offsets, dtype=np.int64), np.array(lengths, dtype=np.int64)
+
+
+class RecordIOReader(object):
+    """Random access, zero-copy reader of RecordIO records.
+
+    The offsets of all records are indexed once when the reader is created. Records are
+    returned as ``memoryview`` slices of the underlying buffer and only parsed into ``Record``
+    protobufs, or decoded into arrays, on request. Use ``RecordIOReader.open`` to memory-map
+    a file so that only the pages that are read are loaded into memory.
+    """
+
+    def __init__(self, buffer):
+        """Initialize a ``RecordIOReader`` over a buffer of RecordIO encoded bytes.
+
+        Args:
+            buffer (bytes-like object): The RecordIO encoded bytes, for example ``bytes`` or
+                a ``mmap.mmap``.
+        """
+        self._buffer = buffer
+        self._view = memoryview(buffer).cast("B")
+        self.offsets, self.lengths = _index_recordio(self._view)
+        self._file = None
+
+    @classmethod
+    def open(cls, path):
+        """Memory-map a RecordIO file and index its records.
+
+        Args:
+            path (str): The path of the file to read.
+
+        Returns:
+            RecordIOReader: A reader over the memory-mapped file.
+        """
+        f = open(path, "rb")
+        try:
+            if os.fstat(f.fileno()).st_size == 0:
+                buffer = b""
+            else:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            reader = cls(buffer)
+        except Exception:
+            f.close()
+            raise
+        reader._file = f
+        return reader
+
+    def close(self):
+        """Release the buffer, closing the memory-mapped file if the reader opened one.
+
+        ``memoryview`` objects returned by the reader must be released before closing it.
+        """
+        self._view.release()
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        if self._file is not None:
+            self._file.close()
+
+    def __enter__(self):
+        """Return the reader itself."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the reader."""
+        self.close()
+
+    def __len__(self):
+        """Return the number of records."""
+        return len(self.offsets)
+
+    def __getitem__(self, index):
+        """Return the data of a record, without copying it.
+
+        Args:
+            index (int): The number of the record.
+
+        Returns:
+            memoryview: The serialized data of the record.
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Record index out of range")
+        offset = self.offsets[index]
+        return self._view[offset : offset + self.lengths[index]]
+
+    def __iter__(self):
+        """Iterate over the data of all records."""
+        for index in range(len(self)):
+            yield self[index]
+
+    def records(self, start=0, stop=None):
+        """Lazily parse a range of records.
+
+        Args:
+            start (int): The number of the first record (default: 0).
+            stop (int): The number of the record to stop before (default: None). If None,
+                records are parsed until the end of the buffer.
+
+        Yields:
+            Record: The parsed records.
+        """
+        for index in range(*slice(start, stop).indices(len(self))):
+            record = Record()
+            record.ParseFromString(self[index])
+            yield record
+
+    def to_numpy(self, start=0, stop=None, field="features"):
+        """Decode the dense ``"values"`` tensors of a range of records into a 2D array.
+
+        Ranges of floating point records written by ``write_numpy_to_dense_tensor`` share
+        one layout and are read with a single strided copy out of the buffer. Other records
+        are parsed one at a time; sparse tensors, the ones written with a shape, are
+        scattered into rows of that shape.
+
+        Args:
+            start (int): The number of the first record (default: 0).
+            stop (int): The number of the record to stop before (default: None).
+            field (str): The ``Record`` field to decode, "features" or "label"
+                (default: "features").
+
+        Returns:
+            numpy.ndarray: An array with one row per record.
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        if stop <= start:
+            return np.empty((0, 0))
+        array = self._to_numpy_strided(start, stop, field)
+        if array is not None:
+            return array
+        rows = []
+        for record in self.records(start, stop):
+            resolved_type, tensor = _record_tensor(record, field)
+            values = np.asarray(tensor.values, dtype=_RECORD_DTYPES[resolved_type])
+            if tensor.shape:
+                row = np.zeros(tensor.shape[0], dtype=values.dtype)
+                row[np.asarray(tensor.keys, dtype=np.int64)] = values
+                values = row
+            rows.append(values)
+        return np.stack(rows)
+
+    def to_csr(self, start=0, stop=None, field="features"):
+        """Decode the ``"values"`` tensors of a range of records into a CSR matrix.
+
+        Args:
+            start (int): The number of the first record (default: 0).
+            stop (int): The number of the record to stop before (default: None).
+            field (str): The ``Record`` field to decode, "features" or "label"
+                (default: "features").
+
+        Returns:
+            scipy.sparse.csr_matrix: A matrix with one row per record.
+        """
+        import scipy.sparse
+
+        indptr, indices, data = [0], [], []
+        n_cols, dtype = 0, None
+        for record in self.records(start, stop):
+            resolved_type, tensor = _record_tensor(record, field)
+            dtype = _RECORD_DTYPES[resolved_type]
+            values = np.asarray(tensor.values, dtype=dtype)
+            if tensor.shape:
+                keys = np.asarray(tensor.keys, dtype=np.int64)
+                n_cols = max(n_cols, tensor.shape[0])
+            else:
+                keys = np.arange(len(values), dtype=np.int64)
+                n_cols = max(n_cols, len(values))
+            indices.append(keys)
+            data.append(values)
+            indptr.append(indptr[-1] + len(values))
+        if dtype is None:
+            return scipy.sparse.csr_matrix((0, 0))
+        return scipy.sparse.csr_matrix(
+            (np.concatenate(data), np.concatenate(indices), np.array(indptr)),
+            shape=(len(indptr) - 1, n_cols),
+        )
+
+    def _to_numpy_strided(self, start, stop, field):
+        """Read equally laid out floating point records with one strided copy, if possible.
+
+        Returns:
+            numpy.ndarray: The decoded array, or None if the records do not share a layout.
+        """
+        lengths = self.lengths[start:stop]
+        offsets = self.offsets[start:stop]
+        stride = (((int(lengths[0]) + 3) >> 2) << 2) + 8
+        if (lengths != lengths[0]).any() or (np.diff(offsets) != stride).any():
+            return None
+
+        first = Record()
+        first.ParseFromString(self[start])
+        layout = [_dense_field_layout(first, "features", b"\x0a")]
+        if getattr(first, "label"):
+            layout.append(_dense_field_layout(first, "label", b"\x12"))
+        if None in layout or field not in [name for name, _, _, _ in layout]:
+            return None
+        return self._read_strided(
+            int(offsets[0]), int(lengths[0]), stride, stop - start, layout, field
+        )
+
+    def _read_strided(self, offset, length, stride, n_rows, layout, field):
+        """Copy the values of a field out of records laid out every ``stride`` bytes.
+
+        Returns:
+            numpy.ndarray: The decoded array, or None if a record does not match the layout.
+        """
+        buffer = np.frombuffer(self._view, dtype=np.uint8)
+        position = offset
+        array = None
+        for name, prefix, wire_dtype, n_values in layout:
+            prefixes = np.lib.stride_tricks.as_strided(
+                buffer[position:], shape=(n_rows, len(prefix)), strides=(stride, 1)
+            )
+            if (prefixes != np.frombuffer(prefix, dtype=np.uint8)).any():
+                return None
+            position += len(prefix)
+            n_bytes = n_values * wire_dtype.itemsize
+            if name == field:
+                values = np.lib.stride_tricks.as_strided(
+                    buffer[position:], shape=(n_rows, n_bytes), strides=(stride, 1)
+                )
+                array = np.ascontiguousarray(values).view(wire_dtype)
+                array = array.astype(wire_dtype.newbyteorder("="), copy=False)
+            position += n_bytes
+        if position - offset != length:
+            return None
+        return array
+
+
+def _dense_field_layout(record, name, tag):
+    """Returns the wire layout of the dense ``"values"`` tensor of a ``Record`` field.
+
+    Args:
+        record (Record): The parsed record.
+        name (str): The ``Record`` field, "features" or "label".
+        tag (bytes): The protobuf tag of the field.
+
+    Returns:
+        tuple[str, bytes, numpy.dtype, int]: The field, the bytes preceding its values, the
+            dtype of the values on the wire and their number, or None if the field is not a
+            single non-empty dense tensor of a floating point type.
+    """
+    if list(getattr(record, name).keys()) != ["values"]:
+        return None
+    resolved_type, tensor = _record_tensor(record, name)
+    if resolved_type not in _DENSE_WIRE_DTYPES or tensor.keys or tensor.shape or not tensor.values:
+        return None
+    prefix = tag + _encode_dense_value_prefix(resolved_type, len(tensor.values))
+    return name, prefix, _DENSE_WIRE_DTYPES[resolved_type], len(tensor.values)
+
+
+def _record_tensor(record, field):
+    """Returns the ``"values"`` tensor of a ``Record`` field and its resolved type.
+
+    Args:
+        record (Record): The parsed record.
+        field (str): The ``Record`` field, "features" or "label".
+
+    Returns:
+        tuple[str, object]: The resolved type and the protobuf tensor.
+    """
+    value = getattr(record, field)["values"]
+    tensor_field = value.WhichOneof("value")
+    if tensor_field not in _TENSOR_FIELD_TYPES:
+        raise ValueError("Unsupported {} tensor {} in record".format(field, tensor_field))
+    return _TENSOR_FIELD_TYPES[tensor_field], getattr(value, tensor_field)
+
+
 def _resolve_type(dtype):
     """Placeholder Docstring"""
     if dtype == np.dtype(int):
@@ -17,3 +17,6 @@ from __future__ import absolute_import
 from sagemaker.async_inference.async_inference_config import AsyncInferenceConfig  # noqa: F401
 from sagemaker.async_inference.waiter_config import WaiterConfig  # noqa: F401
 from sagemaker.async_inference.async_inference_response import AsyncInferenceResponse  # noqa: F401
+from sagemaker.async_inference.result_collector import (  # noqa: F401
+    AsyncInferenceResultCollector,
+)
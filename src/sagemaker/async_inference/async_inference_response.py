@@ -86,6 +86,19 @@ class AsyncInferenceResponse(object):
                 )
         return self._result
 
+    def get_result_future(self):
+        """Get a future of the async inference result, resolved by the result collector
+
+        The ``AsyncInferenceResultCollector`` of the ``AsyncPredictor`` finds the results of
+        all the outstanding responses together, so that many results can be awaited without
+        a thread polling Amazon S3 for each of them.
+
+        Returns:
+            concurrent.futures.Future: The future of the inference result. It is resolved
+                with an ``AsyncInferenceModelError`` if the inference failed.
+        """
+        return self.predictor_async.result_collector.track(self.output_path, self.failure_path)
+
     def _get_result_from_s3(self, output_path, failure_path):
         """Retrieve output based on the presense of failure_path"""
         if failure_path is not None:
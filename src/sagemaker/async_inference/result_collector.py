@@ -0,0 +1,296 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""A class for AsyncInferenceResultCollector
+
+Used for collecting the results of many async inference requests, with batched Amazon S3
+listings or Amazon SQS notifications instead of polling each request.
+"""
+from __future__ import print_function, absolute_import
+
+import json
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from sagemaker.exceptions import AsyncInferenceModelError
+from sagemaker.s3 import parse_s3_url
+
+logger = logging.getLogger("sagemaker")
+
+# With notifications, the interval in seconds of the Amazon S3 listings that find the results
+# whose notifications were missed.
+NOTIFICATION_FALLBACK_INTERVAL = 60
+
+
+class _PendingResult(object):
+    """The locations of the result of a request, and the future resolved with the result."""
+
+    def __init__(self, output_location, failure_location, poll):
+        """Initialize a ``_PendingResult`` from (bucket, key) locations and a sweep interval."""
+        self.output_location = output_location
+        self.failure_location = failure_location
+        self.poll = poll
+        self.future = Future()
+
+
+class AsyncInferenceResultCollector(object):
+    """Collects the results of async inference requests, and resolves their futures.
+
+    A background thread lists the objects under the Amazon S3 prefixes of the output and
+    failure locations of the outstanding requests, with ``list_objects_v2`` requests restricted
+    to the range of the keys of these requests, so that the number of requests to Amazon S3
+    scales with the prefixes rather than with the requests. If an Amazon SQS queue subscribed to
+    the success and error topics of the endpoint is given, the thread consumes its
+    notifications instead, and only lists the prefixes every
+    ``NOTIFICATION_FALLBACK_INTERVAL`` seconds. The thread stops when no request is
+    outstanding.
+
+    Without notifications, the listings are made at the shortest polling interval of the
+    outstanding requests.
+    """
+
+    def __init__(
+        self,
+        s3_client,
+        response_handler,
+        poll=5,
+        sqs_client=None,
+        notification_queue_url=None,
+        max_fetch_concurrency=8,
+    ):
+        """Initialize an AsyncInferenceResultCollector object.
+
+        Args:
+            s3_client (boto3.S3.Client): Client to list and get the result objects.
+            response_handler (callable): Function deserializing the response of a
+                ``get_object`` request of a result object, such as
+                ``Predictor._handle_response``.
+            poll (float): The default interval in seconds between the Amazon S3 listings, or
+                the maximum wait time of the Amazon SQS ``receive_message`` requests, which is
+                capped at 20 seconds (Default: 5).
+            sqs_client (boto3.SQS.Client): Optional. Client to receive the notifications
+                (Default: None).
+            notification_queue_url (str): Optional. The URL of the Amazon SQS queue subscribed
+                to the success and error topics of the ``notification_config`` of the endpoint
+                (Default: None).
+            max_fetch_concurrency (int): The maximum number of result objects that are
+                downloaded concurrently (Default: 8).
+        """
+        if notification_queue_url is not None and sqs_client is None:
+            raise ValueError("sqs_client is required to receive notifications.")
+        self.s3_client = s3_client
+        self.response_handler = response_handler
+        self.poll = poll
+        self.sqs_client = sqs_client
+        self.notification_queue_url = notification_queue_url
+        self.max_fetch_concurrency = max_fetch_concurrency
+        # Outstanding requests by the (bucket, key) of their output and failure locations.
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self._executor = None
+
+    def track(self, output_path, failure_path=None, poll=None):
+        """Track the result of a request, and return the future resolved with it.
+
+        Args:
+            output_path (str): The Amazon S3 location that the endpoint uploads the inference
+                response to.
+            failure_path (str): Optional. The Amazon S3 location that the endpoint uploads the
+                model error to, if the request fails (Default: None).
+            poll (float): Optional. The maximum interval in seconds between the Amazon S3
+                listings looking for the result of the request. If not specified, the ``poll``
+                of the collector is used (Default: None).
+
+        Returns:
+            concurrent.futures.Future: The future of the deserialized inference result. It is
+                resolved with an ``AsyncInferenceModelError`` if the request fails. Cancelling
+                it stops tracking the request.
+        """
+        pending = _PendingResult(
+            parse_s3_url(output_path),
+            parse_s3_url(failure_path) if failure_path else None,
+            self.poll if poll is None else poll,
+        )
+        with self._lock:
+            for location in (pending.output_location, pending.failure_location):
+                if location is not None:
+                    self._pending.setdefault(location, []).append(pending)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+        pending.future.add_done_callback(lambda _: self._untrack(pending))
+        return pending.future
+
+    @property
+    def outstanding(self):
+        """int: The number of requests whose results have not been found yet."""
+        with self._lock:
+            return len({id(p) for requests in self._pending.values() for p in requests})
+
+    def _untrack(self, pending):
+        """Stop tracking a request, once its future is done."""
+        with self._lock:
+            for location in (pending.output_location, pending.failure_location):
+                requests = self._pending.get(location)
+                if requests and pending in requests:
+                    requests.remove(pending)
+                    if not requests:
+                        del self._pending[location]
+
+    def _run(self):
+        """Collect results until no request is outstanding."""
+        last_sweep = None
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._thread = None
+                    return
+            try:
+                if self.notification_queue_url is None:
+                    if last_sweep is not None:
+                        time.sleep(self._sweep_interval())
+                    last_sweep = time.monotonic()
+                    self._sweep()
+                else:
+                    now = time.monotonic()
+                    if last_sweep is None or now - last_sweep >= NOTIFICATION_FALLBACK_INTERVAL:
+                        last_sweep = now
+                        self._sweep()
+                    self._receive_notifications()
+            except Exception as e:  # pylint: disable=broad-except
+                logger.warning("Failed to collect async inference results: %s", e)
+                if self.notification_queue_url is not None:
+                    time.sleep(self.poll)
+
+    def _sweep_interval(self):
+        """Return the shortest polling interval of the outstanding requests."""
+        with self._lock:
+            return min(
+                (p.poll for requests in self._pending.values() for p in requests),
+                default=self.poll,
+            )
+
+    def _sweep(self):
+        """List the prefixes of the outstanding requests, and fetch the results found."""
+        with self._lock:
+            locations = list(self._pending)
+        prefixes = {}
+        for bucket, key in locations:
+            prefix = key[: key.rfind("/") + 1]
+            prefixes.setdefault((bucket, prefix), set()).add(key)
+        found = set()
+        for (bucket, prefix), keys in prefixes.items():
+            found.update((bucket, key) for key in self._list_keys(bucket, prefix, keys))
+        self._resolve_found(found)
+
+    def _list_keys(self, bucket, prefix, keys):
+        """Return the keys of a prefix that exist, listing only the range of these keys."""
+        first_key, last_key = min(keys), max(keys)
+        # Objects are listed in the order of their keys, from the key right before the first key.
+        kwargs = {"Bucket": bucket, "Prefix": prefix, "StartAfter": first_key[:-1]}
+        found = []
+        while True:
+            response = self.s3_client.list_objects_v2(**kwargs)
+            for s3_object in response.get("Contents", []):
+                if s3_object["Key"] in keys:
+                    found.append(s3_object["Key"])
+                if s3_object["Key"] >= last_key:
+                    return found
+            if not response.get("IsTruncated"):
+                return found
+            kwargs["ContinuationToken"] = response["NextContinuationToken"]
+
+    def _resolve_found(self, found):
+        """Fetch the results of the requests whose output or failure object was found."""
+        with self._lock:
+            requests = {
+                id(p): p for location in found for p in self._pending.get(location, [])
+            }.values()
+        for pending in requests:
+            if pending.output_location in found:
+                self._fetch(pending, pending.output_location, failed=False)
+            else:
+                self._fetch(pending, pending.failure_location, failed=True)
+
+    def _receive_notifications(self):
+        """Receive notifications, and fetch the results of the requests they notify of."""
+        response = self.sqs_client.receive_message(
+            QueueUrl=self.notification_queue_url,
+            MaxNumberOfMessages=10,
+            WaitTimeSeconds=int(min(self.poll, 20)),
+        )
+        processed = []
+        for message in response.get("Messages", []):
+            body = json.loads(message["Body"])
+            if "Message" in body and body.get("Type") == "Notification":
+                # Notifications of an SNS topic delivered without raw message delivery.
+                body = json.loads(body["Message"])
+            if self._resolve_notification(body):
+                processed.append(message)
+        if processed:
+            self.sqs_client.delete_message_batch(
+                QueueUrl=self.notification_queue_url,
+                Entries=[
+                    {"Id": str(i), "ReceiptHandle": message["ReceiptHandle"]}
+                    for i, message in enumerate(processed)
+                ],
+            )
+
+    def _resolve_notification(self, notification):
+        """Resolve the requests of a notification, and return whether there were any."""
+        parameters = notification.get("responseParameters", {})
+        failed = notification.get("invocationStatus") != "Completed"
+        locations = [
+            parse_s3_url(path)
+            for path in (parameters.get("outputLocation"), parameters.get("failureLocation"))
+            if path
+        ]
+        with self._lock:
+            requests = {
+                id(p): p for location in locations for p in self._pending.get(location, [])
+            }.values()
+        for pending in requests:
+            if not failed:
+                self._fetch(pending, pending.output_location, failed=False)
+            elif pending.failure_location in locations:
+                self._fetch(pending, pending.failure_location, failed=True)
+            elif pending.future.set_running_or_notify_cancel():
+                pending.future.set_exception(
+                    AsyncInferenceModelError(message=notification.get("failureReason"))
+                )
+        return bool(requests)
+
+    def _fetch(self, pending, location, failed):
+        """Download and deserialize a result object in the background, and resolve its future."""
+        if not pending.future.set_running_or_notify_cancel():
+            return
+        # The request is no longer tracked, so that later listings do not fetch it again.
+        self._untrack(pending)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_fetch_concurrency)
+
+        def fetch():
+            try:
+                bucket, key = location
+                result = self.response_handler(self.s3_client.get_object(Bucket=bucket, Key=key))
+            except Exception as e:  # pylint: disable=broad-except
+                pending.future.set_exception(e)
+                return
+            if failed:
+                pending.future.set_exception(AsyncInferenceModelError(message=result))
+            else:
+                pending.future.set_result(result)
+
+        self._executor.submit(fetch)
@@ -18,6 +18,7 @@ import csv
 import abc
 import codecs
 import io
+import itertools
 import json
 
 import numpy as np
@@ -139,30 +140,53 @@ class CSVDeserializer(SimpleBaseDeserializer):
     responses directly into other data types.
     """
 
-    def __init__(self, encoding="utf-8", accept="text/csv"):
+    def __init__(self, encoding="utf-8", accept="text/csv", output_type="list", dtype=None):
         """Initialize a ``CSVDeserializer`` instance.
 
         Args:
             encoding (str): The string encoding to use (default: "utf-8").
             accept (union[str, tuple[str]]): The MIME type (or tuple of allowable MIME types) that
                 is expected from the inference endpoint (default: "text/csv").
+            output_type (str): The type of the deserialized data. One of "list" for a list of
+                lists of strings, "numpy" for a 2-dimensional NumPy array, or "pandas" for a
+                pandas DataFrame without header (default: "list").
+            dtype (str): The dtype of the NumPy array, or of the columns of the DataFrame. If
+                None, the dtype of a NumPy array is float, and the dtypes of the columns of a
+                DataFrame are inferred (default: None).
         """
         super(CSVDeserializer, self).__init__(accept=accept)
+        if output_type not in ("list", "numpy", "pandas"):
+            raise ValueError(
+                "output_type must be one of 'list', 'numpy' or 'pandas'. Got %s" % output_type
+            )
         self.encoding = encoding
+        self.output_type = output_type
+        self.dtype = dtype
 
     def deserialize(self, stream, content_type):
         """Deserialize data from an inference endpoint into a list of lists.
 
+        With the "numpy" and "pandas" output types, the data is parsed directly into a NumPy
+        array or a pandas DataFrame, without building the lists of strings.
+
         Args:
             stream (botocore.response.StreamingBody): Data to be deserialized.
             content_type (str): The MIME type of the data.
 
         Returns:
-            list: The data deserialized into a list of lists representing the
-                contents of a CSV file.
+            object: The data deserialized into a list of lists representing the
+                contents of a CSV file, a NumPy array or a pandas DataFrame.
         """
         try:
+            if self.output_type == "pandas":
+                return pandas.read_csv(
+                    io.BytesIO(stream.read()), header=None, dtype=self.dtype, encoding=self.encoding
+                )
             decoded_string = stream.read().decode(self.encoding)
+            if self.output_type == "numpy":
+                return np.loadtxt(
+                    io.StringIO(decoded_string), delimiter=",", dtype=self.dtype or float, ndmin=2
+                )
             return list(csv.reader(decoded_string.splitlines()))
         finally:
             stream.close()
@@ -227,7 +251,9 @@ class NumpyDeserializer(SimpleBaseDeserializer):
             if content_type == "application/json":
                 return np.array(json.load(codecs.getreader("utf-8")(stream)), dtype=self.dtype)
             if content_type == "application/x-npy":
-                return np.load(io.BytesIO(stream.read()), allow_pickle=self.allow_pickle)
+                # Reads the array from its header into a preallocated array, in chunks,
+                # rather than buffering the whole response.
+                return np.lib.format.read_array(stream, allow_pickle=self.allow_pickle)
             if content_type == "application/x-npz":
                 try:
                     return np.load(io.BytesIO(stream.read()), allow_pickle=self.allow_pickle)
@@ -270,14 +296,18 @@ class JSONDeserializer(SimpleBaseDeserializer):
 class PandasDeserializer(SimpleBaseDeserializer):
     """Deserialize CSV or JSON data from an inference endpoint into a pandas dataframe."""
 
-    def __init__(self, accept=("text/csv", "application/json")):
+    def __init__(self, accept=("text/csv", "application/json"), chunksize=None):
         """Initialize a ``PandasDeserializer`` instance.
 
         Args:
             accept (union[str, tuple[str]]): The MIME type (or tuple of allowable MIME types) that
                 is expected from the inference endpoint (default: ("text/csv","application/json")).
+            chunksize (int): Optional. If set, CSV data is deserialized into an iterator of
+                DataFrames of up to ``chunksize`` rows, which reads the stream as it is iterated
+                (default: None).
         """
         super(PandasDeserializer, self).__init__(accept=accept)
+        self.chunksize = chunksize
 
     def deserialize(self, stream, content_type):
         """Deserialize CSV or JSON data from an inference endpoint into a pandas dataframe.
@@ -290,10 +320,11 @@ class PandasDeserializer(SimpleBaseDeserializer):
             content_type (str): The MIME type of the data.
 
         Returns:
-            pandas.DataFrame: The data deserialized into a pandas DataFrame.
+            pandas.DataFrame: The data deserialized into a pandas DataFrame, or an iterator of
+                DataFrames if ``chunksize`` is set and the data is CSV.
         """
         if content_type == "text/csv":
-            return pandas.read_csv(stream)
+            return pandas.read_csv(stream, chunksize=self.chunksize)
 
         if content_type == "application/json":
             return pandas.read_json(stream)
@@ -332,3 +363,145 @@ class JSONLinesDeserializer(SimpleBaseDeserializer):
             return [json.loads(line) for line in lines]
         finally:
             stream.close()
+
+
+class CSVIteratorDeserializer(SimpleBaseDeserializer):
+    """Deserialize a stream of CSV data into an iterator of rows, or of batches of rows.
+
+    Unlike :class:~`sagemaker.deserializers.CSVDeserializer`, the stream is read in chunks as
+    the rows are iterated, so that the memory used is bounded by the size of the chunks and
+    batches rather than by the size of the response. The stream is closed once the iterator is
+    exhausted or closed.
+    """
+
+    def __init__(
+        self,
+        encoding="utf-8",
+        accept="text/csv",
+        chunk_size=65536,
+        batch_size=None,
+        output_type="list",
+        dtype=None,
+    ):
+        """Initialize a ``CSVIteratorDeserializer`` instance.
+
+        Args:
+            encoding (str): The string encoding to use (default: "utf-8").
+            accept (union[str, tuple[str]]): The MIME type (or tuple of allowable MIME types) that
+                is expected from the inference endpoint (default: "text/csv").
+            chunk_size (int): The number of bytes read from the stream at a time (default: 65536).
+            batch_size (int): Optional. If set, the iterator yields batches of up to
+                ``batch_size`` rows instead of rows (default: None).
+            output_type (str): The type of the rows. One of "list" for lists of strings, or
+                "numpy" for NumPy arrays, in which case a batch is a 2-dimensional NumPy array
+                (default: "list").
+            dtype (str): The dtype of the NumPy arrays. If None, the dtype is float
+                (default: None).
+        """
+        super(CSVIteratorDeserializer, self).__init__(accept=accept)
+        if output_type not in ("list", "numpy"):
+            raise ValueError("output_type must be one of 'list' or 'numpy'. Got %s" % output_type)
+        self.encoding = encoding
+        self.chunk_size = chunk_size
+        self.batch_size = batch_size
+        self.output_type = output_type
+        self.dtype = dtype
+
+    def deserialize(self, stream, content_type):
+        """Deserialize CSV data from an inference endpoint into an iterator of rows.
+
+        Args:
+            stream (botocore.response.StreamingBody): Data to be deserialized.
+            content_type (str): The MIME type of the data.
+
+        Returns:
+            iterator: The rows, or the batches of rows, of the CSV data.
+        """
+        lines = _iter_lines(stream, self.encoding, self.chunk_size)
+        rows = csv.reader(lines)
+        if self.batch_size is not None:
+            rows = _iter_batches(rows, self.batch_size)
+        if self.output_type == "numpy":
+            dtype = self.dtype or float
+            rows = (np.array(row, dtype=dtype) for row in rows)
+        return _closing(rows, lines)
+
+
+class JSONLinesIteratorDeserializer(SimpleBaseDeserializer):
+    """Deserialize a stream of JSON lines data into an iterator of objects, or of batches.
+
+    Unlike :class:~`sagemaker.deserializers.JSONLinesDeserializer`, the stream is read in chunks
+    as the objects are iterated, so that the memory used is bounded by the size of the chunks and
+    batches rather than by the size of the response. The stream is closed once the iterator is
+    exhausted or closed.
+    """
+
+    def __init__(self, accept="application/jsonlines", chunk_size=65536, batch_size=None):
+        """Initialize a ``JSONLinesIteratorDeserializer`` instance.
+
+        Args:
+            accept (union[str, tuple[str]]): The MIME type (or tuple of allowable MIME types) that
+                is expected from the inference endpoint (default: "application/jsonlines").
+            chunk_size (int): The number of bytes read from the stream at a time (default: 65536).
+            batch_size (int): Optional. If set, the iterator yields lists of up to
+                ``batch_size`` objects instead of objects (default: None).
+        """
+        super(JSONLinesIteratorDeserializer, self).__init__(accept=accept)
+        self.chunk_size = chunk_size
+        self.batch_size = batch_size
+
+    def deserialize(self, stream, content_type):
+        """Deserialize JSON lines data from an inference endpoint into an iterator of objects.
+
+        Args:
+            stream (botocore.response.StreamingBody): Data to be deserialized.
+            content_type (str): The MIME type of the data.
+
+        Returns:
+            iterator: The JSON serializable objects of the lines, or batches of them.
+        """
+        lines = _iter_lines(stream, "utf-8", self.chunk_size)
+        objects = (json.loads(line) for line in lines if line.strip())
+        if self.batch_size is not None:
+            objects = _iter_batches(objects, self.batch_size)
+        return _closing(objects, lines)
+
+
+def _iter_lines(stream, encoding, chunk_size):
+    """Yield the decoded lines of a stream, with their line endings, reading it in chunks.
+
+    The stream is closed once the lines are exhausted, or the generator is closed.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    remainder = ""
+    try:
+        while True:
+            chunk = stream.read(chunk_size)
+            lines = (remainder + decoder.decode(chunk, final=not chunk)).split("\n")
+            remainder = lines.pop()
+            for line in lines:
+                yield line + "\n"
+            if not chunk:
+                if remainder:
+                    yield remainder
+                return
+    finally:
+        stream.close()
+
+
+def _iter_batches(iterable, batch_size):
+    """Yield lists of up to ``batch_size`` consecutive items of an iterable."""
+    iterator = iter(iterable)
+    while True:
+        batch = list(itertools.islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def _closing(iterable, lines):
+    """Yield the items of an iterable, and close the generator of lines it reads from."""
+    try:
+        yield from iterable
+    finally:
+        lines.close()
@@ -86,18 +86,24 @@ class SimpleBaseSerializer(with_metaclass(abc.ABCMeta, BaseSerializer)):
 class CSVSerializer(SimpleBaseSerializer):
     """Serialize data of various formats to a CSV-formatted string."""
 
-    def __init__(self, content_type="text/csv"):
+    def __init__(self, content_type="text/csv", float_precision=None):
         """Initialize a ``CSVSerializer`` instance.
 
         Args:
             content_type (str): The MIME type to signal to the inference endpoint when sending
                 request data (default: "text/csv").
+            float_precision (int): The number of significant digits of the floating point
+                values of NumPy arrays and pandas DataFrames. If None, floating point values are
+                formatted with the shortest representation that round-trips (default: None).
         """
         super(CSVSerializer, self).__init__(content_type=content_type)
+        self.float_precision = float_precision
 
     def serialize(self, data):
         """Serialize data of various formats to a CSV-formatted string.
 
+        Numeric NumPy arrays are formatted in a single pass, rather than row by row.
+
         Args:
             data (object): Data to be serialized. Can be a NumPy array, list,
                 file, Pandas DataFrame, or buffer.
@@ -109,7 +115,13 @@ class CSVSerializer(SimpleBaseSerializer):
             return data.read()
 
         if isinstance(data, DataFrame):
-            return data.to_csv(header=False, index=False)
+            float_format = None
+            if self.float_precision is not None:
+                float_format = "%.{}g".format(self.float_precision)
+            return data.to_csv(header=False, index=False, float_format=float_format)
+
+        if isinstance(data, np.ndarray) and data.dtype.kind in "biuf" and data.size > 0:
+            return self._serialize_numeric_array(data)
 
         is_mutable_sequence_like = self._is_sequence_like(data) and hasattr(data, "__setitem__")
         has_multiple_rows = len(data) > 0 and self._is_sequence_like(data[0])
@@ -119,6 +131,33 @@ class CSVSerializer(SimpleBaseSerializer):
 
         return self._serialize_row(data)
 
+    def _serialize_numeric_array(self, data):
+        """Serialize a non-empty numeric NumPy array with a single formatting operation.
+
+        A 1-dimensional array is serialized as a row, and the rows of an array with more
+        dimensions are flattened, as they are by ``_serialize_row``.
+
+        Args:
+            data (numpy.ndarray): Array of booleans, integers or floating point values.
+
+        Returns:
+            str: The data serialized as CSV-formatted rows.
+        """
+        rows = 1 if data.ndim == 1 else len(data)
+        columns = data.size // rows
+        if data.dtype.kind == "f" and self.float_precision is not None:
+            value_format = "%.{}g".format(self.float_precision)
+        else:
+            value_format = "%s"
+        if data.dtype.kind == "f" and data.dtype.itemsize < 8 and self.float_precision is None:
+            # The shortest representations of single and half precision values differ from
+            # those of the Python floats that they convert to.
+            values = data.astype(str).ravel().tolist()
+        else:
+            values = data.ravel().tolist()
+        row_format = ",".join([value_format] * columns)
+        return "\n".join([row_format] * rows) % tuple(values)
+
     def _serialize_row(self, data):
         """Serialize data as a CSV-formatted row.
 
@@ -22,9 +22,11 @@ from sagemaker.base_deserializers import (  # noqa: F401 # pylint: disable=W0611
     BaseDeserializer,
     BytesDeserializer,
     CSVDeserializer,
+    CSVIteratorDeserializer,
     DeferredError,
     JSONDeserializer,
     JSONLinesDeserializer,
+    JSONLinesIteratorDeserializer,
     NumpyDeserializer,
     PandasDeserializer,
     SimpleBaseDeserializer,
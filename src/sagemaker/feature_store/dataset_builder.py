@@ -19,13 +19,25 @@ from __future__ import absolute_import
 import datetime
 from enum import Enum
 import os
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Dict, Iterator, List, Tuple, Union
 
 import attr
 import pandas as pd
 
 from sagemaker import Session, s3, utils
 from sagemaker.feature_store.feature_group import FeatureDefinition, FeatureGroup, FeatureTypeEnum
+from sagemaker.feature_store.inputs import QueryResultFormatEnum
+from sagemaker.feature_store.query_results import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_PREFETCH,
+    QueryResultCache,
+    feature_group_version,
+    iter_result_batches,
+    read_parquet_result,
+    result_s3_client,
+    unload_query_string,
+)
+from sagemaker.s3_transfer import DEFAULT_MAX_CONCURRENCY
 
 
 _DEFAULT_CATALOG = "AwsDataCatalog"
@@ -107,6 +119,8 @@ class FeatureGroupToBeMerged:
             in the target feature group. (default: JoinComparatorEnum.EQUALS).
         join_type (JoinTypeEnum): A JoinTypeEnum representing the type of join between
             the base and target feature groups. (default: JoinTypeEnum.INNER_JOIN).
+        feature_group_version (str): A string representing the version of this FeatureGroup,
+            which is part of the keys of the cached query results (default: None).
     """
 
     features: List[str] = attr.ib()
@@ -122,6 +136,7 @@ class FeatureGroupToBeMerged:
     feature_name_in_target: str = attr.ib(default=None)
     join_comparator: JoinComparatorEnum = attr.ib(default=JoinComparatorEnum.EQUALS)
     join_type: JoinTypeEnum = attr.ib(default=JoinTypeEnum.INNER_JOIN)
+    feature_group_version: str = attr.ib(default=None)
 
 
 def construct_feature_group_to_be_merged(
@@ -215,6 +230,7 @@ def construct_feature_group_to_be_merged(
         feature_name_in_target,
         join_comparator,
         join_type,
+        feature_group_version(feature_group_metadata),
     )
 
 
@@ -266,6 +282,8 @@ class DatasetBuilder:
             FeatureGroupToBeMerged which will be joined to base (default: []).
         _event_time_identifier_feature_type (FeatureTypeEnum): A FeatureTypeEnum representing the
             type of event time identifier feature (default: None).
+        _query_result_cache (QueryResultCache): A QueryResultCache recording the executions of
+            the queries, which are reused by identical queries (default: None).
     """
 
     _sagemaker_session: Session = attr.ib()
@@ -286,6 +304,7 @@ class DatasetBuilder:
     _event_time_ending_timestamp: datetime.datetime = attr.ib(init=False, default=None)
     _feature_groups_to_be_merged: List[FeatureGroupToBeMerged] = attr.ib(init=False, factory=list)
     _event_time_identifier_feature_type: FeatureTypeEnum = attr.ib(default=None)
+    _query_result_cache: QueryResultCache = attr.ib(init=False, default=None)
 
     _DATAFRAME_TYPE_TO_COLUMN_TYPE_MAP = {
         "object": "STRING",
@@ -417,6 +436,23 @@ class DatasetBuilder:
         self._event_time_ending_timestamp = ending_timestamp
         return self
 
+    def with_query_result_cache(self, query_result_cache: QueryResultCache = None):
+        """Reuse the results of identical queries over the same feature group versions.
+
+        Only the queries of a FeatureGroup base are cached, a DataFrame base is uploaded to a
+        new table for each query. Records ingested into a feature group do not change its
+        version, see ``QueryResultCache.max_age_seconds`` to bound the age of the results.
+
+        Args:
+            query_result_cache (QueryResultCache): A QueryResultCache, which can be shared with
+                other DatasetBuilder objects. If not set, a new QueryResultCache is used
+                (default: None).
+        Returns:
+            This DatasetBuilder object.
+        """
+        self._query_result_cache = query_result_cache or QueryResultCache()
+        return self
+
     def to_csv_file(self) -> Tuple[str, str]:
         """Get query string and result in .csv format file
 
@@ -424,6 +460,111 @@ class DatasetBuilder:
             The S3 path of the .csv file.
             The query string executed.
         """
+        query_result, csv_file = self._run_dataset_query(QueryResultFormatEnum.CSV)
+        return csv_file, query_result.get("QueryExecution", {}).get("Query", None)
+
+    def to_dataframe(
+        self,
+        result_format: QueryResultFormatEnum = QueryResultFormatEnum.CSV,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> Tuple[pd.DataFrame, str]:
+        """Get query string and result in pandas.Dataframe
+
+        Args:
+            result_format (QueryResultFormatEnum): The format of the query result. With
+                QueryResultFormatEnum.PARQUET the query is run as an UNLOAD to Parquet files,
+                which are downloaded concurrently and keep the types of the columns
+                (default: QueryResultFormatEnum.CSV).
+            max_concurrency (int): The maximum number of concurrent requests downloading the
+                Parquet files (default: 10).
+        Returns:
+            The pandas.DataFrame object.
+            The query string executed.
+        """
+        if result_format == QueryResultFormatEnum.PARQUET:
+            query_result, result_location = self._run_dataset_query(result_format)
+            query_string = query_result.get("QueryExecution", {}).get("Query", None)
+            df = read_parquet_result(
+                result_s3_client(self._sagemaker_session),
+                result_location,
+                max_concurrency=max_concurrency,
+            )
+        else:
+            csv_file, query_string = self.to_csv_file()
+            s3.S3Downloader.download(
+                s3_uri=csv_file,
+                local_path="./",
+                kms_key=self._kms_key_id,
+                sagemaker_session=self._sagemaker_session,
+            )
+            local_file_name = csv_file.split("/")[-1]
+            df = pd.read_csv(local_file_name)
+            os.remove(local_file_name)
+
+            local_metadata_file_name = local_file_name + ".metadata"
+            if os.path.exists(local_metadata_file_name):
+                os.remove(local_file_name + ".metadata")
+
+        if "row_recent" in df:
+            df = df.drop("row_recent", axis="columns")
+        return df, query_string
+
+    def to_batches(
+        self,
+        result_format: QueryResultFormatEnum = QueryResultFormatEnum.CSV,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        as_arrow: bool = False,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> Tuple[Iterator, str]:
+        """Get query string and an iterator streaming the result in batches of rows
+
+        The query is executed when this method is called. The result is never held in memory
+        as a whole: the next files are downloaded, and the next batches decoded, by background
+        threads while the current batch is used.
+
+        Args:
+            result_format (QueryResultFormatEnum): The format of the query result. The types of
+                the columns of a CSV result are inferred batch by batch, the Parquet result keeps
+                the types of its columns (default: QueryResultFormatEnum.CSV).
+            batch_size (int): The number of rows of the batches, the last batch can be smaller
+                (default: 100000).
+            as_arrow (bool): Whether to yield pyarrow.RecordBatch objects instead of
+                pandas.DataFrame objects (default: False).
+            max_concurrency (int): The maximum number of concurrent requests downloading the
+                Parquet files (default: 10).
+            prefetch (int): The number of files downloaded, and of batches decoded, ahead of the
+                batch being used (default: 2).
+        Returns:
+            An iterator over the batches of the result.
+            The query string executed.
+        """
+        query_result, result_location = self._run_dataset_query(result_format)
+        batches = iter_result_batches(
+            result_s3_client(self._sagemaker_session),
+            result_location,
+            batch_size=batch_size,
+            as_arrow=as_arrow,
+            max_concurrency=max_concurrency,
+            prefetch=prefetch,
+            exclude_columns=["row_recent"],
+        )
+        return batches, query_result.get("QueryExecution", {}).get("Query", None)
+
+    def _run_dataset_query(
+        self, result_format: QueryResultFormatEnum
+    ) -> Tuple[Dict[str, Any], str]:
+        """Internal method for constructing and executing the query of the dataset.
+
+        Args:
+            result_format (QueryResultFormatEnum): The format of the query result.
+        Returns:
+            The query result.
+            The S3 URI of the result file, or of the folder of the Parquet files.
+
+        Raises:
+            ValueError: The base is neither a FeatureGroup nor a DataFrame.
+        """
         if isinstance(self._base, pd.DataFrame):
             temp_id = utils.unique_name_from_base("dataframe-base")
             local_file_name = f"{temp_id}.csv"
@@ -464,11 +605,10 @@ class DatasetBuilder:
                     TableType.DATA_FRAME,
                 )
             )
-            query_result = self._run_query(query_string, _DEFAULT_CATALOG, _DEFAULT_DATABASE)
             # TODO: cleanup temp table, need more clarification, keep it for now
-            return query_result.get("QueryExecution", {}).get("ResultConfiguration", {}).get(
-                "OutputLocation", None
-            ), query_result.get("QueryExecution", {}).get("Query", None)
+            return self._run_result_query(
+                query_string, _DEFAULT_CATALOG, _DEFAULT_DATABASE, result_format
+            )
         if isinstance(self._base, FeatureGroup):
             base_feature_group = construct_feature_group_to_be_merged(
                 self._base, self._included_feature_names
@@ -481,42 +621,18 @@ class DatasetBuilder:
                 base_feature_group.event_time_identifier_feature.feature_type
             )
             query_string = self._construct_query_string(base_feature_group)
-            query_result = self._run_query(
+            return self._run_result_query(
                 query_string,
                 base_feature_group.catalog,
                 base_feature_group.database,
+                result_format,
+                tuple(
+                    feature_group.feature_group_version
+                    for feature_group in [base_feature_group] + self._feature_groups_to_be_merged
+                ),
             )
-            return query_result.get("QueryExecution", {}).get("ResultConfiguration", {}).get(
-                "OutputLocation", None
-            ), query_result.get("QueryExecution", {}).get("Query", None)
         raise ValueError("Base must be either a FeatureGroup or a DataFrame.")
 
-    def to_dataframe(self) -> Tuple[pd.DataFrame, str]:
-        """Get query string and result in pandas.Dataframe
-
-        Returns:
-            The pandas.DataFrame object.
-            The query string executed.
-        """
-        csv_file, query_string = self.to_csv_file()
-        s3.S3Downloader.download(
-            s3_uri=csv_file,
-            local_path="./",
-            kms_key=self._kms_key_id,
-            sagemaker_session=self._sagemaker_session,
-        )
-        local_file_name = csv_file.split("/")[-1]
-        df = pd.read_csv(local_file_name)
-        os.remove(local_file_name)
-
-        local_metadata_file_name = local_file_name + ".metadata"
-        if os.path.exists(local_metadata_file_name):
-            os.remove(local_file_name + ".metadata")
-
-        if "row_recent" in df:
-            df = df.drop("row_recent", axis="columns")
-        return df, query_string
-
     def _construct_event_time_conditions(
         self,
         table_name: str,
@@ -1078,7 +1194,19 @@ class DatasetBuilder:
             output_location=self._output_path,
             kms_key=self._kms_key_id,
         )
-        query_id = query.get("QueryExecutionId", None)
+        return self._wait_for_query(query.get("QueryExecutionId", None))
+
+    def _wait_for_query(self, query_id: str) -> Dict[str, Any]:
+        """Internal method for waiting for an Athena query to finish and get query result.
+
+        Args:
+            query_id (str): The execution id of the query.
+        Returns:
+            The query result.
+
+        Raises:
+            RuntimeError: Athena query failed.
+        """
         self._sagemaker_session.wait_for_athena_query(query_execution_id=query_id)
         query_result = self._sagemaker_session.get_query_execution(query_execution_id=query_id)
         query_state = query_result.get("QueryExecution", {}).get("Status", {}).get("State", None)
@@ -1086,3 +1214,61 @@ class DatasetBuilder:
         if query_state != "SUCCEEDED":
             raise RuntimeError(f"Failed to execute query {query_id}.")
         return query_result
+
+    def _run_result_query(
+        self,
+        query_string: str,
+        catalog: str,
+        database: str,
+        result_format: QueryResultFormatEnum,
+        feature_group_versions: Tuple[str, ...] = None,
+    ) -> Tuple[Dict[str, Any], str]:
+        """Internal method for executing the query of the dataset, or reusing its cached result.
+
+        Args:
+            query_string (str): The SQL query statements to be executed.
+            catalog (str): The name of the data catalog used in the query execution.
+            database (str): The name of the database used in the query execution.
+            result_format (QueryResultFormatEnum): The format of the query result.
+            feature_group_versions (Tuple[str, ...]): The versions of the queried feature
+                groups. If not set, the query result is not cached (default: None).
+        Returns:
+            The query result.
+            The S3 URI of the result file, or of the folder of the Parquet files.
+        """
+        cache_key = None
+        if self._query_result_cache is not None and feature_group_versions is not None:
+            cache_key = QueryResultCache.key(
+                query_string,
+                catalog=catalog,
+                database=database,
+                output_path=self._output_path,
+                kms_key_id=self._kms_key_id,
+                result_format=result_format.value,
+                feature_group_versions=feature_group_versions,
+            )
+            cached_execution = self._query_result_cache.lookup(cache_key, self._sagemaker_session)
+            if cached_execution is not None:
+                query_result = self._wait_for_query(cached_execution.query_execution_id)
+                return query_result, cached_execution.result_location
+
+        result_location = None
+        if result_format == QueryResultFormatEnum.PARQUET:
+            result_location = (
+                f"{self._output_path.rstrip('/')}/{utils.unique_name_from_base('query-result')}"
+            )
+            query_string = unload_query_string(query_string, result_location)
+        query_result = self._run_query(query_string, catalog, database)
+        if result_location is None:
+            result_location = (
+                query_result.get("QueryExecution", {})
+                .get("ResultConfiguration", {})
+                .get("OutputLocation", None)
+            )
+        if cache_key is not None:
+            self._query_result_cache.put(
+                cache_key,
+                query_result.get("QueryExecution", {}).get("QueryExecutionId", None),
+                result_location,
+            )
+        return query_result, result_location
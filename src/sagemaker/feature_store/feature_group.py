@@ -28,7 +28,7 @@ import os
 import tempfile
 from concurrent.futures import as_completed
 from concurrent.futures import ThreadPoolExecutor
-from typing import Sequence, List, Dict, Any, Union
+from typing import Sequence, List, Dict, Any, Iterable, Iterator, Union
 from urllib.parse import urlparse
 
 from multiprocessing.pool import AsyncResult
@@ -51,6 +51,11 @@ from sagemaker.feature_store.feature_definition import (
     FeatureDefinition,
     FeatureTypeEnum,
 )
+from sagemaker.feature_store.ingestion import (
+    IngestionError,
+    StreamIngestionManager,
+    _encode_records,
+)
 from sagemaker.feature_store.inputs import (
     OnlineStoreConfig,
     OnlineStoreSecurityConfig,
@@ -61,8 +66,20 @@ from sagemaker.feature_store.inputs import (
     FeatureParameter,
     TableFormatEnum,
     DeletionModeEnum,
+    QueryResultFormatEnum,
+)
+from sagemaker.feature_store.query_results import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_PREFETCH,
+    QueryResultCache,
+    iter_result_batches,
+    read_parquet_result,
+    result_s3_client,
+    unload_query_string,
+    feature_group_version,
 )
-from sagemaker.utils import resolve_value_from_config
+from sagemaker.s3_transfer import DEFAULT_MAX_CONCURRENCY
+from sagemaker.utils import resolve_value_from_config, unique_name_from_base
 
 logger = logging.getLogger(__name__)
 
@@ -79,18 +96,29 @@ class AthenaQuery:
         database (str): name of the database.
         table_name (str): name of the table.
         sagemaker_session (Session): instance of the Session class to perform boto calls.
+        feature_group_version (str): version of the queried feature group, part of the keys of
+            the cached query results (default: None).
     """
 
     catalog: str = attr.ib()
     database: str = attr.ib()
     table_name: str = attr.ib()
     sagemaker_session: Session = attr.ib()
+    feature_group_version: str = attr.ib(default=None)
     _current_query_execution_id: str = attr.ib(init=False, default=None)
     _result_bucket: str = attr.ib(init=False, default=None)
     _result_file_prefix: str = attr.ib(init=False, default=None)
+    _result_format: QueryResultFormatEnum = attr.ib(init=False, default=QueryResultFormatEnum.CSV)
+    _result_location: str = attr.ib(init=False, default=None)
 
     def run(
-        self, query_string: str, output_location: str, kms_key: str = None, workgroup: str = None
+        self,
+        query_string: str,
+        output_location: str,
+        kms_key: str = None,
+        workgroup: str = None,
+        result_format: QueryResultFormatEnum = QueryResultFormatEnum.CSV,
+        query_result_cache: QueryResultCache = None,
     ) -> str:
         """Execute a SQL query given a query string, output location and kms key.
 
@@ -102,10 +130,45 @@ class AthenaQuery:
             output_location: S3 URI of the query result.
             kms_key: KMS key id. If set, will be used to encrypt the query result file.
             workgroup (str): The name of the workgroup in which the query is being started.
+            result_format (QueryResultFormatEnum): format of the query result. With
+                ``QueryResultFormatEnum.PARQUET`` the query is run as an ``UNLOAD`` to Parquet
+                files in a new folder of output_location, which keep the types of the columns
+                (default: QueryResultFormatEnum.CSV).
+            query_result_cache (QueryResultCache): cache of the query executions. If set, the
+                execution of an identical query is reused instead of running the query again
+                (default: None).
 
         Returns:
             Execution id of the query.
         """
+        cache_key = None
+        if query_result_cache is not None:
+            cache_key = QueryResultCache.key(
+                query_string,
+                catalog=self.catalog,
+                database=self.database,
+                output_location=output_location,
+                kms_key=kms_key,
+                workgroup=workgroup,
+                result_format=result_format.value,
+                feature_group_version=self.feature_group_version,
+            )
+            cached_execution = query_result_cache.lookup(cache_key, self.sagemaker_session)
+            if cached_execution is not None:
+                self._set_result(
+                    cached_execution.query_execution_id,
+                    output_location,
+                    result_format,
+                    cached_execution.result_location,
+                )
+                return self._current_query_execution_id
+
+        result_location = None
+        if result_format == QueryResultFormatEnum.PARQUET:
+            result_location = (
+                f"{output_location.rstrip('/')}/{unique_name_from_base('query-result')}"
+            )
+            query_string = unload_query_string(query_string, result_location)
         response = self.sagemaker_session.start_query_execution(
             catalog=self.catalog,
             database=self.database,
@@ -114,11 +177,38 @@ class AthenaQuery:
             kms_key=kms_key,
             workgroup=workgroup,
         )
-        self._current_query_execution_id = response["QueryExecutionId"]
+        self._set_result(
+            response["QueryExecutionId"], output_location, result_format, result_location
+        )
+        if cache_key is not None:
+            query_result_cache.put(
+                cache_key,
+                self._current_query_execution_id,
+                result_location or self._csv_result_location(),
+            )
+        return self._current_query_execution_id
+
+    def _set_result(
+        self,
+        query_execution_id: str,
+        output_location: str,
+        result_format: QueryResultFormatEnum,
+        result_location: str,
+    ):
+        """Record the execution and the result location of the current query."""
+        self._current_query_execution_id = query_execution_id
         parse_result = urlparse(output_location, allow_fragments=False)
         self._result_bucket = parse_result.netloc
         self._result_file_prefix = parse_result.path.strip("/")
-        return self._current_query_execution_id
+        self._result_format = result_format
+        self._result_location = result_location
+
+    def _csv_result_location(self) -> str:
+        """The S3 URI of the CSV result file of the current query."""
+        key = f"{self._current_query_execution_id}.csv"
+        if self._result_file_prefix:
+            key = f"{self._result_file_prefix}/{key}"
+        return f"s3://{self._result_bucket}/{key}"
 
     def wait(self):
         """Wait for the current query to finish."""
@@ -136,19 +226,23 @@ class AthenaQuery:
             query_execution_id=self._current_query_execution_id
         )
 
-    def as_dataframe(self) -> DataFrame:
+    def as_dataframe(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> DataFrame:
         """Download the result of the current query and load it into a DataFrame.
 
+        Args:
+            max_concurrency (int): maximum number of concurrent requests downloading the
+                Parquet files of the result (default: 10).
+
         Returns:
             A pandas DataFrame contains the query result.
         """
-        query_state = self.get_query_execution().get("QueryExecution").get("Status").get("State")
-        if query_state != "SUCCEEDED":
-            if query_state in ("QUEUED", "RUNNING"):
-                raise RuntimeError(
-                    f"Current query {self._current_query_execution_id} is still being executed."
-                )
-            raise RuntimeError(f"Failed to execute query {self._current_query_execution_id}")
+        self._check_query_succeeded()
+        if self._result_format == QueryResultFormatEnum.PARQUET:
+            return read_parquet_result(
+                result_s3_client(self.sagemaker_session),
+                self._result_location,
+                max_concurrency=max_concurrency,
+            )
 
         output_filename = os.path.join(
             tempfile.gettempdir(), f"{self._current_query_execution_id}.csv"
@@ -161,6 +255,55 @@ class AthenaQuery:
         )
         return pd.read_csv(output_filename, delimiter=",")
 
+    def as_batches(
+        self,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        as_arrow: bool = False,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> Iterator:
+        """Stream the result of the current query in batches of rows.
+
+        The result is never held in memory as a whole: the next files are downloaded, and the
+        next batches decoded, by background threads while the current batch is used. The types
+        of the columns of a CSV result are inferred batch by batch, the Parquet result of a
+        query run with ``QueryResultFormatEnum.PARQUET`` keeps the types of its columns.
+
+        Args:
+            batch_size (int): number of rows of the batches, the last batch can be smaller
+                (default: 100000).
+            as_arrow (bool): whether to yield ``pyarrow.RecordBatch`` objects instead of
+                DataFrames (default: False).
+            max_concurrency (int): maximum number of concurrent requests downloading the
+                Parquet files of the result (default: 10).
+            prefetch (int): number of files downloaded, and of batches decoded, ahead of the
+                batch being used (default: 2).
+
+        Returns:
+            An iterator over the batches of the query result.
+        """
+        self._check_query_succeeded()
+        return iter_result_batches(
+            result_s3_client(self.sagemaker_session),
+            self._result_location
+            if self._result_format == QueryResultFormatEnum.PARQUET
+            else self._csv_result_location(),
+            batch_size=batch_size,
+            as_arrow=as_arrow,
+            max_concurrency=max_concurrency,
+            prefetch=prefetch,
+        )
+
+    def _check_query_succeeded(self):
+        """Raise a RuntimeError if the current query did not succeed."""
+        query_state = self.get_query_execution().get("QueryExecution").get("Status").get("State")
+        if query_state != "SUCCEEDED":
+            if query_state in ("QUEUED", "RUNNING"):
+                raise RuntimeError(
+                    f"Current query {self._current_query_execution_id} is still being executed."
+                )
+            raise RuntimeError(f"Failed to execute query {self._current_query_execution_id}")
+
 
 @attr.s
 class IngestionManagerPandas:
@@ -225,10 +368,11 @@ class IngestionManagerPandas:
 
         logger.info("Started ingesting index %d to %d", start_index, end_index)
         failed_rows = list()
-        for row in data_frame[start_index:end_index].itertuples():
+        batch = data_frame[start_index:end_index]
+        for row, record in zip(batch.index.tolist(), _encode_records(batch)):
             IngestionManagerPandas._ingest_row(
-                data_frame=data_frame,
                 row=row,
+                record=record,
                 feature_group_name=feature_group_name,
                 sagemaker_fs_runtime_client=sagemaker_fs_runtime_client,
                 failed_rows=failed_rows,
@@ -276,8 +420,8 @@ class IngestionManagerPandas:
 
     @staticmethod
     def _ingest_row(
-        data_frame: DataFrame,
         row: int,
+        record: List[Dict[str, str]],
         feature_group_name: str,
         sagemaker_fs_runtime_client: Session,
         failed_rows: List[int],
@@ -285,32 +429,21 @@ class IngestionManagerPandas:
         """Ingest a single Dataframe row into FeatureStore.
 
         Args:
-            data_frame (DataFrame): source DataFrame to be ingested.
-            row (int): current row that is being ingested
+            row (int): index of the current row that is being ingested.
+            record (List[Dict[str, str]]): feature values of the row, built by
+                ``_encode_records``.
             feature_group_name (str): name of the Feature Group.
             sagemaker_featurestore_runtime_client (Session): session instance to perform boto calls.
             failed_rows (List[int]): list of indices from the data frame for which ingestion failed.
-
-
-        Returns:
-            int of row indices that failed to be ingested.
         """
-        record = [
-            FeatureValue(
-                feature_name=data_frame.columns[index - 1],
-                value_as_string=str(row[index]),
-            )
-            for index in range(1, len(row))
-            if pd.notna(row[index])
-        ]
         try:
             sagemaker_fs_runtime_client.put_record(
                 FeatureGroupName=feature_group_name,
-                Record=[value.to_dict() for value in record],
+                Record=record,
             )
         except Exception as e:  # pylint: disable=broad-except
-            logger.error("Failed to ingest row %d: %s", row[0], e)
-            failed_rows.append(row[0])
+            logger.error("Failed to ingest row %d: %s", row, e)
+            failed_rows.append(row)
 
     def _run_single_process_single_thread(self, data_frame: DataFrame):
         """Ingest a utilizing single process and single thread.
@@ -321,10 +454,10 @@ class IngestionManagerPandas:
         logger.info("Started ingesting index %d to %d")
         failed_rows = list()
         sagemaker_fs_runtime_client = self.sagemaker_session.sagemaker_featurestore_runtime_client
-        for row in data_frame.itertuples():
+        for row, record in zip(data_frame.index.tolist(), _encode_records(data_frame)):
             IngestionManagerPandas._ingest_row(
-                data_frame=data_frame,
                 row=row,
+                record=record,
                 feature_group_name=self.feature_group_name,
                 sagemaker_fs_runtime_client=sagemaker_fs_runtime_client,
                 failed_rows=failed_rows,
@@ -452,24 +585,6 @@ class IngestionManagerPandas:
             self._run_multi_process(data_frame=data_frame, wait=wait, timeout=timeout)
 
 
-class IngestionError(Exception):
-    """Exception raised for errors during ingestion.
-
-    Attributes:
-        failed_rows: list of indices from the data frame for which ingestion failed.
-        message: explanation of the error
-    """
-
-    def __init__(self, failed_rows, message):
-        super(IngestionError, self).__init__(message)
-        self.failed_rows = failed_rows
-        self.message = message
-
-    def __str__(self) -> str:
-        """String representation of the error."""
-        return f"{self.failed_rows} -> {self.message}"
-
-
 @attr.s
 class FeatureGroup:
     """FeatureGroup definition.
@@ -878,6 +993,69 @@ class FeatureGroup:
 
         return manager
 
+    def ingest_stream(
+        self,
+        source: Union[DataFrame, str, Iterable[DataFrame]],
+        max_concurrency: int = 32,
+        chunk_size: int = 10000,
+        max_attempts: int = 10,
+        profile_name: str = None,
+        journal_path: str = None,
+    ) -> StreamIngestionManager:
+        """Ingest a stream of DataFrame chunks or Parquet files to feature store.
+
+        Unlike ``ingest``, the rows are read chunk by chunk, so that the data to ingest never
+        needs to be held in memory as a whole, and the records of each chunk are built column
+        by column. They are sent with up to ``max_concurrency`` PutRecord requests in flight
+        over the connection pool of a single client, in a single process. The number of
+        requests in flight is halved when requests are throttled and grows back as requests
+        succeed, and the throttled or transiently failed requests are sent again with an
+        exponential backoff.
+
+        The ingestion is synchronous. You receive an ``IngestionError`` with the index labels
+        of the rows that failed to ingest, if any. The records ingested per second, and the
+        numbers of retries and throttled requests are logged, and available in the ``report``
+        of the returned ``StreamIngestionManager``.
+
+        With a ``journal_path``, the ingestion is checkpointed: each chunk whose records are all
+        done is recorded in a local journal file, with the rows that failed to ingest and their
+        error codes. Running the ingestion again with the same source, chunk size and journal
+        resumes it: the chunks already ingested are skipped, and only their failed rows are sent
+        again, so that a large backfill interrupted midway does not start over.
+
+        Args:
+            source (Union[DataFrame, str, Iterable[DataFrame]]): a DataFrame, the path of a
+                Parquet file or of a directory of Parquet files, a list of such paths, or an
+                iterable of DataFrames, such as the chunks of ``pandas.read_csv`` with a
+                ``chunksize``. Reading Parquet files requires ``pyarrow``.
+            max_concurrency (int): maximum number of PutRecord requests in flight
+                (default: 32).
+            chunk_size (int): number of rows of the chunks read from a DataFrame or from
+                Parquet files (default: 10000).
+            max_attempts (int): maximum number of attempts of each PutRecord request
+                (default: 10).
+            profile_name (str): the profile credential should be used for ``PutRecord``
+                (default: None).
+            journal_path (str): path of the local journal file of the ingestion. If it exists,
+                the ingestion resumes from it (default: None).
+
+        Returns:
+            An instance of StreamIngestionManager.
+        """
+        if profile_name is None and self.sagemaker_session.boto_session.profile_name != "default":
+            profile_name = self.sagemaker_session.boto_session.profile_name
+
+        manager = StreamIngestionManager(
+            feature_group_name=self.name,
+            sagemaker_session=self.sagemaker_session,
+            max_concurrency=max_concurrency,
+            max_attempts=max_attempts,
+            profile_name=profile_name,
+        )
+        manager.run(source, chunk_size=chunk_size, journal_path=journal_path)
+
+        return manager
+
     def athena_query(self) -> AthenaQuery:
         """Create an AthenaQuery instance.
 
@@ -893,6 +1071,7 @@ class FeatureGroup:
                 database=data_catalog_config["Database"],
                 table_name=data_catalog_config["TableName"],
                 sagemaker_session=self.sagemaker_session,
+                feature_group_version=feature_group_version(response),
             )
             return query
         raise RuntimeError("No metastore is configured with this feature group.")
@@ -0,0 +1,585 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""The ingestion of records into a FeatureGroup with concurrent PutRecord requests.
+
+The records of a chunk of a DataFrame are built column by column, and sent with
+``PutRecord`` requests pipelined over a pool of connections of a single client. The number of
+requests in flight adapts to throttling: it is halved when a request is throttled, and grows
+back by one request after each window of successful requests. The input is read chunk by
+chunk, from an iterator of DataFrames or from Parquet files, so that it never needs to be held
+in memory as a whole. The completed chunks, and the rows of these chunks that failed to be
+ingested, can be recorded in a journal, from which an interrupted ingestion is resumed.
+"""
+from __future__ import absolute_import
+
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Union
+
+import attr
+import boto3
+import pandas as pd
+from botocore.config import Config
+from botocore.exceptions import ClientError, ConnectionError as BotoConnectionError
+from botocore.exceptions import HTTPClientError
+from pandas import DataFrame
+
+from sagemaker.session import Session
+from sagemaker.utils import DeferredError
+from sagemaker.waiters import WaiterConfig
+
+try:
+    import pyarrow.parquet as pq
+except ImportError as e:
+    pq = DeferredError(e)
+
+logger = logging.getLogger(__name__)
+
+# Error codes of the PutRecord requests rejected because of the request rate.
+THROTTLING_ERROR_CODES = ("ThrottlingException", "Throttling", "TooManyRequestsException")
+
+# Error codes of the PutRecord requests that failed transiently, and can be sent again.
+TRANSIENT_ERROR_CODES = (
+    "InternalFailure",
+    "InternalServerError",
+    "ServiceUnavailable",
+    "RequestTimeout",
+    "RequestTimeoutException",
+)
+
+
+class IngestionError(Exception):
+    """Exception raised for errors during ingestion.
+
+    Attributes:
+        failed_rows: list of indices from the data frame for which ingestion failed.
+        message: explanation of the error
+    """
+
+    def __init__(self, failed_rows, message):
+        super(IngestionError, self).__init__(message)
+        self.failed_rows = failed_rows
+        self.message = message
+
+    def __str__(self) -> str:
+        """String representation of the error."""
+        return f"{self.failed_rows} -> {self.message}"
+
+
+def _encode_records(data_frame: DataFrame) -> List[List[Dict[str, str]]]:
+    """Build the ``Record`` of the PutRecord request of each row of a DataFrame.
+
+    The values of each column are converted to Python objects and to strings once for the
+    column, rather than cell by cell, with the same string representation as the values of
+    ``DataFrame.itertuples``. Missing values are left out of the records.
+
+    Args:
+        data_frame (DataFrame): The rows to build the records of.
+
+    Returns:
+        list: The list of the feature values of the record of each row.
+    """
+    columns = []
+    complete = True
+    for name, series in data_frame.items():
+        values = map(str, series.tolist())
+        present = series.notna().to_numpy()
+        if present.all():
+            columns.append([{"FeatureName": name, "ValueAsString": value} for value in values])
+        else:
+            complete = False
+            columns.append(
+                [
+                    {"FeatureName": name, "ValueAsString": value} if is_present else None
+                    for value, is_present in zip(values, present)
+                ]
+            )
+    if not columns:
+        return [[] for _ in range(len(data_frame))]
+    if complete:
+        return [list(row) for row in zip(*columns)]
+    return [[value for value in row if value is not None] for row in zip(*columns)]
+
+
+def _iter_chunks(source, chunk_size: int) -> Iterator[DataFrame]:
+    """Yield the chunks of DataFrame rows of an ingestion source.
+
+    Args:
+        source: A DataFrame, split in chunks of ``chunk_size`` rows, the path of a Parquet
+            file or of a directory of Parquet files, a list of such paths, or an iterable of
+            DataFrames, such as the chunks of ``pandas.read_csv`` with a ``chunksize``.
+        chunk_size (int): The number of rows of the chunks read from DataFrames and Parquet
+            files.
+    """
+    if isinstance(source, DataFrame):
+        for start in range(0, len(source), chunk_size):
+            yield source.iloc[start : start + chunk_size]
+    elif isinstance(source, (str, os.PathLike)):
+        yield from _iter_parquet_chunks([source], chunk_size)
+    elif isinstance(source, (list, tuple)) and all(
+        isinstance(path, (str, os.PathLike)) for path in source
+    ):
+        yield from _iter_parquet_chunks(source, chunk_size)
+    else:
+        for chunk in source:
+            if not isinstance(chunk, DataFrame):
+                raise TypeError(
+                    f"Expected the chunks to ingest to be DataFrames, got {type(chunk).__name__}."
+                )
+            yield chunk
+
+
+def _iter_parquet_chunks(paths, chunk_size: int) -> Iterator[DataFrame]:
+    """Yield the chunks of rows of Parquet files, read one batch of rows at a time.
+
+    The rows are indexed by their position in the sequence of files, so that the failed rows of
+    an ingestion can be found in the files.
+    """
+    offset = 0
+    for path in paths:
+        path = os.fspath(path)
+        if os.path.isdir(path):
+            files = sorted(
+                os.path.join(path, name)
+                for name in os.listdir(path)
+                if not name.startswith((".", "_"))
+            )
+        else:
+            files = [path]
+        for file in files:
+            for batch in pq.ParquetFile(file).iter_batches(batch_size=chunk_size):
+                chunk = batch.to_pandas()
+                chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+                offset += len(chunk)
+                yield chunk
+
+
+def _error_code(error: Exception) -> str:
+    """The error code of a failed request, or the name of the exception raised."""
+    if isinstance(error, ClientError):
+        return error.response.get("Error", {}).get("Code", type(error).__name__)
+    return type(error).__name__
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether a failed request can be sent again."""
+    if isinstance(error, (BotoConnectionError, HTTPClientError)):
+        return True
+    if isinstance(error, ClientError):
+        status = error.response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0)
+        return _error_code(error) in TRANSIENT_ERROR_CODES or status >= 500
+    return False
+
+
+@attr.s
+class _ChunkProgress:
+    """The records of a chunk of the source that are still being ingested.
+
+    Attributes:
+        index (int): position of the chunk in the source.
+        start (int): position of the first row of the chunk in the source.
+        rows (int): number of rows of the chunk.
+        pending (int): number of records of the chunk whose ingestion is not done.
+        failed (list): position in the chunk, index label and error code of each failed row.
+    """
+
+    index: int = attr.ib()
+    start: int = attr.ib()
+    rows: int = attr.ib()
+    pending: int = attr.ib(default=0)
+    failed: List[Tuple[int, Any, str]] = attr.ib(factory=list)
+
+
+class _IngestionJournal(object):
+    """A journal of the chunks of an ingestion whose records are all done.
+
+    The journal is a JSON Lines file. Its first line identifies the feature group and the size
+    of the chunks, and each other line records a completed chunk, with its offset in the source
+    and the rows that failed to be ingested, with their error codes. Each line is flushed to
+    disk as it is written, so that the journal survives the interruption of the ingestion.
+    """
+
+    def __init__(self, path: str, feature_group_name: str, chunk_size: int):
+        """Open a journal, reading the chunks completed by previous runs if it exists.
+
+        Raises:
+            ValueError: if the journal is the one of another feature group or chunk size.
+        """
+        self.path = path
+        self.chunks = {}
+        header = {"feature_group_name": feature_group_name, "chunk_size": chunk_size}
+        content = ""
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                content = f.read()
+        lines = content.splitlines()
+        if lines and json.loads(lines[0]) != header:
+            raise ValueError(
+                f"The ingestion journal {path} does not match the feature group "
+                f"{feature_group_name} and chunk size {chunk_size}: {lines[0]}"
+            )
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # The last line may be truncated by the interruption of the ingestion.
+                continue
+            self.chunks[entry["chunk"]] = entry
+        self._file = open(path, "a", encoding="utf-8")
+        if content and not content.endswith("\n"):
+            self._file.write("\n")
+        if not lines:
+            self._write(header)
+        self._lock = threading.Lock()
+
+    def _write(self, entry: Dict[str, Any]):
+        """Append an entry to the journal, and flush it to disk."""
+        self._file.write(json.dumps(entry, default=str) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def record(self, chunk: _ChunkProgress):
+        """Record a chunk whose records are all done."""
+        entry = {
+            "chunk": chunk.index,
+            "start": chunk.start,
+            "rows": chunk.rows,
+            "failed": [
+                {"position": position, "row": row, "code": code}
+                for position, row, code in sorted(chunk.failed, key=lambda failed: failed[0])
+            ],
+        }
+        with self._lock:
+            self._write(entry)
+            self.chunks[chunk.index] = entry
+
+    def close(self):
+        """Close the journal file."""
+        self._file.close()
+
+
+class _AdaptiveConcurrency(object):
+    """Limits the number of requests in flight, with an adaptive limit.
+
+    The limit is halved when a request is throttled, and increased by one after as many
+    successful requests as the limit. Only the requests started after the last decrease can
+    decrease the limit again, so that the requests throttled together halve it once.
+    """
+
+    def __init__(self, max_concurrency: int, min_concurrency: int = 1):
+        """Initialize an ``_AdaptiveConcurrency`` at its maximum limit."""
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min(min_concurrency, max_concurrency)
+        self.limit = max_concurrency
+        self.in_flight = 0
+        self.epoch = 0
+        self._successes = 0
+        self._condition = threading.Condition()
+
+    def acquire(self) -> int:
+        """Block until a request can be sent, and return the current epoch of the limit."""
+        with self._condition:
+            while self.in_flight >= self.limit:
+                self._condition.wait()
+            self.in_flight += 1
+            return self.epoch
+
+    def release(self):
+        """Release the slot of a request, once it is done."""
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify()
+
+    def succeeded(self):
+        """Record a successful request."""
+        with self._condition:
+            self._successes += 1
+            if self._successes >= self.limit and self.limit < self.max_concurrency:
+                self._successes = 0
+                self.limit += 1
+                self._condition.notify()
+
+    def throttled(self, epoch: int):
+        """Record a throttled request, started at the given epoch of the limit."""
+        with self._condition:
+            if epoch == self.epoch:
+                self.epoch += 1
+                self._successes = 0
+                self.limit = max(self.min_concurrency, self.limit // 2)
+
+
+@attr.s
+class IngestionReport:
+    """The progress of an ingestion.
+
+    Attributes:
+        ingested_records (int): number of records ingested.
+        failed_records (int): number of records that failed to be ingested.
+        retries (int): number of PutRecord requests sent again after a transient failure.
+        throttled_requests (int): number of PutRecord requests that were throttled.
+        skipped_records (int): number of records not sent again, as the journal of the
+            ingestion records them as ingested by a previous run.
+        seconds (float): duration of the ingestion in seconds.
+    """
+
+    ingested_records: int = attr.ib(default=0)
+    failed_records: int = attr.ib(default=0)
+    retries: int = attr.ib(default=0)
+    throttled_requests: int = attr.ib(default=0)
+    skipped_records: int = attr.ib(default=0)
+    seconds: float = attr.ib(default=0.0)
+
+    @property
+    def records_per_second(self) -> float:
+        """The number of records ingested per second."""
+        return self.ingested_records / self.seconds if self.seconds else 0.0
+
+
+@attr.s
+class StreamIngestionManager:
+    """Class to manage the ingestion of a stream of DataFrame chunks with concurrent requests.
+
+    The records of each chunk are built column by column, and sent with PutRecord requests
+    over the pool of connections of a single client. Up to ``max_concurrency`` requests are in
+    flight, fewer while requests are throttled. Throttled and transiently failed requests are
+    sent again with an exponential backoff, up to ``max_attempts`` times. Only one chunk is
+    held in memory at a time.
+
+    With a journal, the ingestion can be resumed: the chunks of the source whose records were
+    all ingested by a previous run are skipped, and only the rows of these chunks that failed
+    are sent again. The chunks are identified by their position in the source, which must be
+    read in the same order, and with the same chunk size, by each run.
+
+    Attributes:
+        feature_group_name (str): name of the Feature Group.
+        sagemaker_session (Session): session instance to perform boto calls.
+        max_concurrency (int): maximum number of PutRecord requests in flight (default: 32).
+        max_attempts (int): maximum number of attempts of each PutRecord request
+            (default: 10).
+        initial_backoff (float): the delay in seconds before the second attempt of a request,
+            which doubles with each attempt (default: 0.1).
+        max_backoff (float): the maximum delay in seconds between two attempts of a request
+            (default: 20).
+        profile_name (str): the profile credential should be used for ``PutRecord``
+            (default: None).
+    """
+
+    feature_group_name: str = attr.ib()
+    sagemaker_session: Session = attr.ib(default=None)
+    max_concurrency: int = attr.ib(default=32)
+    max_attempts: int = attr.ib(default=10)
+    initial_backoff: float = attr.ib(default=0.1)
+    max_backoff: float = attr.ib(default=20)
+    profile_name: str = attr.ib(default=None)
+    _report: IngestionReport = attr.ib(init=False, factory=IngestionReport)
+    _failures: List[Tuple[Any, str]] = attr.ib(init=False, factory=list)
+    _lock: threading.Lock = attr.ib(init=False, factory=threading.Lock)
+
+    @property
+    def failed_rows(self) -> List[Any]:
+        """Get rows that failed to ingest.
+
+        Returns:
+            List of the index labels of the rows that failed to be ingested.
+        """
+        return [row for row, _ in self._failures]
+
+    @property
+    def report(self) -> IngestionReport:
+        """Get the progress of the ingestion.
+
+        Returns:
+            The numbers of records ingested and failed, of retries and of throttled requests,
+            and the records ingested per second.
+        """
+        return self._report
+
+    def _runtime_client(self):
+        """Create a feature store runtime client with a connection per request in flight.
+
+        Its requests are not retried by botocore, so that the throttled requests can lower the
+        number of requests in flight.
+        """
+        session_client = self.sagemaker_session.sagemaker_featurestore_runtime_client
+        config = session_client.meta.config.merge(
+            Config(
+                max_pool_connections=self.max_concurrency,
+                retries={"total_max_attempts": 1, "mode": "standard"},
+            )
+        )
+        if self.profile_name is not None:
+            boto_session = boto3.Session(profile_name=self.profile_name)
+        else:
+            boto_session = self.sagemaker_session.boto_session
+        return boto_session.client(
+            service_name="sagemaker-featurestore-runtime",
+            region_name=session_client.meta.region_name,
+            endpoint_url=session_client.meta.endpoint_url,
+            config=config,
+        )
+
+    def run(
+        self,
+        source: Union[DataFrame, str, Iterable[DataFrame]],
+        chunk_size: int = 10000,
+        journal_path: str = None,
+    ):
+        """Ingest the rows of a source, and wait for the ingestion to finish.
+
+        Args:
+            source (Union[DataFrame, str, Iterable[DataFrame]]): a DataFrame, the path of a
+                Parquet file or of a directory of Parquet files, a list of such paths, or an
+                iterable of DataFrames. Reading Parquet files requires ``pyarrow``.
+            chunk_size (int): number of rows of the chunks read from a DataFrame or from
+                Parquet files (default: 10000).
+            journal_path (str): path of the local journal file of the ingestion. If it exists,
+                the ingestion resumes from it (default: None).
+
+        Raises:
+            IngestionError: if some records failed to be ingested.
+            ValueError: if the journal is the one of another feature group or chunk size, or
+                if the chunks of the source do not match the chunks of the journal.
+        """
+        if self.max_concurrency <= 0:
+            raise RuntimeError("max_concurrency must be greater than 0.")
+        if chunk_size <= 0:
+            raise RuntimeError("chunk_size must be greater than 0.")
+
+        client = self._runtime_client()
+        concurrency = _AdaptiveConcurrency(self.max_concurrency)
+        journal = None
+        if journal_path is not None:
+            journal = _IngestionJournal(journal_path, self.feature_group_name, chunk_size)
+            if journal.chunks:
+                logger.info(
+                    "Resuming the ingestion into FeatureGroup %s from the journal %s, "
+                    "with %d chunks already ingested.",
+                    self.feature_group_name,
+                    journal_path,
+                    len(journal.chunks),
+                )
+        start = time.perf_counter()
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                offset = 0
+                for index, chunk in enumerate(_iter_chunks(source, chunk_size)):
+                    progress = _ChunkProgress(index=index, start=offset, rows=len(chunk))
+                    offset += len(chunk)
+                    positions = range(len(chunk))
+                    if journal is not None and index in journal.chunks:
+                        positions = self._resumed_positions(journal.chunks[index], progress)
+                        self._report.skipped_records += len(chunk) - len(positions)
+                        if not positions:
+                            continue
+                        chunk = chunk.iloc[positions]
+                    records = _encode_records(chunk)
+                    progress.pending = len(records)
+                    if not records and journal is not None:
+                        journal.record(progress)
+                    for position, row, record in zip(positions, chunk.index.tolist(), records):
+                        epoch = concurrency.acquire()
+                        executor.submit(
+                            self._put_record,
+                            client,
+                            concurrency,
+                            epoch,
+                            row,
+                            record,
+                            progress,
+                            position,
+                            journal,
+                        )
+        finally:
+            if journal is not None:
+                journal.close()
+            self._report.seconds = time.perf_counter() - start
+            logger.info(
+                "Ingested %d records into FeatureGroup %s in %.1f seconds (%.1f records/s), "
+                "with %d retries and %d throttled requests.",
+                self._report.ingested_records,
+                self.feature_group_name,
+                self._report.seconds,
+                self._report.records_per_second,
+                self._report.retries,
+                self._report.throttled_requests,
+            )
+
+        if self._failures:
+            raise IngestionError(
+                self.failed_rows,
+                f"Failed to ingest some data into FeatureGroup {self.feature_group_name}",
+            )
+
+    @staticmethod
+    def _resumed_positions(entry: Dict[str, Any], progress: _ChunkProgress) -> List[int]:
+        """The positions of the rows of a journaled chunk that failed, and are sent again."""
+        if (entry["start"], entry["rows"]) != (progress.start, progress.rows):
+            raise ValueError(
+                f"Chunk {progress.index} of the source has {progress.rows} rows from row "
+                f"{progress.start}, but {entry['rows']} rows from row {entry['start']} in the "
+                "journal. The source must be read in the same order by each run."
+            )
+        return [failed["position"] for failed in entry["failed"]]
+
+    def _put_record(
+        self, client, concurrency, epoch, row, record, progress=None, position=None, journal=None
+    ):
+        """Send the PutRecord request of a row, retrying throttled and transient failures.
+
+        Once the requests of all the rows of its chunk are done, the chunk is journaled.
+        """
+        delays = WaiterConfig(max_poll=self.max_backoff, backoff_factor=2, jitter=0.5).delays(
+            self.initial_backoff
+        )
+        code = None
+        try:
+            for attempt in range(1, self.max_attempts + 1):
+                try:
+                    client.put_record(FeatureGroupName=self.feature_group_name, Record=record)
+                except Exception as error:  # pylint: disable=broad-except
+                    code = _error_code(error)
+                    throttled = code in THROTTLING_ERROR_CODES
+                    if throttled:
+                        concurrency.throttled(epoch)
+                    retried = attempt < self.max_attempts and (throttled or _is_transient(error))
+                    with self._lock:
+                        self._report.throttled_requests += throttled
+                        self._report.retries += retried
+                        if not retried:
+                            self._report.failed_records += 1
+                            self._failures.append((row, code))
+                    if not retried:
+                        logger.error("Failed to ingest row %s: %s", row, error)
+                        break
+                    time.sleep(next(delays))
+                    epoch = concurrency.epoch
+                else:
+                    code = None
+                    concurrency.succeeded()
+                    with self._lock:
+                        self._report.ingested_records += 1
+                    break
+        finally:
+            concurrency.release()
+        if progress is not None:
+            with self._lock:
+                if code is not None:
+                    progress.failed.append((position, row, code))
+                progress.pending -= 1
+                done = progress.pending == 0
+            if done and journal is not None:
+                journal.record(progress)
@@ -169,6 +169,16 @@ class TableFormatEnum(Enum):
     ICEBERG = "Iceberg"
 
 
+class QueryResultFormatEnum(Enum):
+    """Enum of query result formats.
+
+    The result of an Athena query can be a CSV file, or Parquet files written by ``UNLOAD``.
+    """
+
+    CSV = "CSV"
+    PARQUET = "PARQUET"
+
+
 @attr.s
 class OfflineStoreConfig(Config):
     """OfflineStoreConfig for FeatureStore.
@@ -0,0 +1,705 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""An in-process emulator of the offline store of feature groups.
+
+``LocalOfflineStoreSession`` is a ``Session`` which runs the Athena queries of ``AthenaQuery``
+and ``DatasetBuilder`` over tables of an embedded SQLite database, and keeps the S3 objects
+they read and write in a local folder. It is meant for tests and benchmarks of the generated
+queries without AWS resources.
+"""
+from __future__ import absolute_import
+
+import datetime
+import functools
+import logging
+import os
+import re
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Sequence, Union
+from urllib.parse import urlparse
+
+import boto3
+import numpy as np
+import pandas as pd
+from botocore.exceptions import ClientError
+from packaging.version import Version
+
+from sagemaker.feature_store.feature_definition import FeatureDefinition, FeatureTypeEnum
+from sagemaker.feature_store.feature_group import FeatureGroup
+from sagemaker.session import Session
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REGION = "us-west-2"
+DEFAULT_BUCKET = "sagemaker-local-offline-store"
+
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+_EPOCH = datetime.datetime(1970, 1, 1)
+_ACCOUNT_ID = "000000000000"
+_OFFLINE_STORE_COLUMNS = ("write_time", "api_invocation_time", "is_deleted")
+_UNLOAD_ROWS_PER_FILE = 1000000
+
+# SQLite caches the results of deterministic functions within a query, which Python exposes
+# from 3.8 on.
+_FUNCTION_FLAGS = (
+    {"deterministic": True}
+    if sys.version_info >= (3, 8) and sqlite3.sqlite_version_info >= (3, 8, 3)
+    else {}
+)
+# pandas 2 infers the format of the strings from the first one unless told they are ISO 8601,
+# while earlier versions parse each string and do not know the "ISO8601" format.
+_ISO8601_KWARGS = {"format": "ISO8601"} if Version(pd.__version__) >= Version("2.0") else {}
+
+_FEATURE_TYPE_TO_COLUMN_TYPE_MAP = {
+    FeatureTypeEnum.INTEGRAL: "INTEGER",
+    FeatureTypeEnum.FRACTIONAL: "REAL",
+    FeatureTypeEnum.STRING: "TEXT",
+}
+_ATHENA_TYPE_TO_COLUMN_TYPE_MAP = {
+    "STRING": "TEXT",
+    "INT": "INTEGER",
+    "BIGINT": "INTEGER",
+    "BOOLEAN": "INTEGER",
+    "FLOAT": "REAL",
+    "DOUBLE": "REAL",
+    "TIMESTAMP": "TEXT",
+}
+
+_UNLOAD_PATTERN = re.compile(
+    r"^UNLOAD \((?P<query>.*)\) TO '(?P<location>[^']*)' WITH \(format = 'PARQUET'\)$",
+    re.DOTALL | re.IGNORECASE,
+)
+_CREATE_EXTERNAL_TABLE_PATTERN = re.compile(
+    r"^CREATE EXTERNAL TABLE (?P<table>\w+) \((?P<columns>[^)]*)\) .*"
+    r"LOCATION '(?P<location>[^']*)'$",
+    re.DOTALL | re.IGNORECASE,
+)
+
+
+def _format_timestamp(timestamp: pd.Timestamp) -> str:
+    """Format a timestamp as the UTC time string the emulated timestamp functions return."""
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.tz_convert("UTC").tz_localize(None)
+    return timestamp.strftime(_TIMESTAMP_FORMAT)
+
+
+@functools.lru_cache(maxsize=65536)
+def _from_unixtime(seconds):
+    """Emulate the Presto function from_unixtime, which is deterministic and cached."""
+    if seconds is None:
+        return None
+    return (_EPOCH + datetime.timedelta(seconds=float(seconds))).strftime(_TIMESTAMP_FORMAT)
+
+
+@functools.lru_cache(maxsize=65536)
+def _from_iso8601_timestamp(text):
+    """Emulate the Presto function from_iso8601_timestamp, which is deterministic and cached."""
+    if text is None:
+        return None
+    return _format_timestamp(pd.Timestamp(text))
+
+
+def _to_timestamp(text, format_string):  # pylint: disable=unused-argument
+    """Emulate the Presto function to_timestamp for the format DatasetBuilder passes to it."""
+    return _from_iso8601_timestamp(text)
+
+
+def _timestamp_strings(series: pd.Series) -> pd.Series:
+    """Convert unix times, ISO 8601 strings or datetimes to the emulated timestamp strings.
+
+    Only the distinct timestamps are formatted, the write times of the records are usually few.
+    """
+    if pd.api.types.is_numeric_dtype(series):
+        timestamps = pd.to_datetime(series, unit="s", utc=True)
+    else:
+        timestamps = pd.to_datetime(series, utc=True, **_ISO8601_KWARGS)
+    codes, uniques = pd.factorize(timestamps.dt.tz_localize(None))
+    # The code of a missing timestamp is -1, which takes the trailing None.
+    formatted = np.append(pd.DatetimeIndex(uniques).strftime(_TIMESTAMP_FORMAT).to_numpy(), None)
+    return pd.Series(formatted[codes], index=series.index, dtype=object)
+
+
+def _quote(identifier: str) -> str:
+    """Quote a SQL identifier."""
+    escaped = identifier.replace('"', '""')
+    return f'"{escaped}"'
+
+
+def _not_found(code: str, message: str, operation_name: str) -> ClientError:
+    """A ClientError like the one of a missing AWS resource."""
+    return ClientError(
+        {"Error": {"Code": code, "Message": message}, "ResponseMetadata": {"HTTPStatusCode": 404}},
+        operation_name,
+    )
+
+
+class _LocalS3Client(object):
+    """The subset of an S3 client used by the offline store, backed by a local folder.
+
+    The object ``s3://{bucket}/{key}`` is the file ``{root_dir}/{bucket}/{key}``.
+    """
+
+    def __init__(self, root_dir: str):
+        """Initialize a _LocalS3Client over the local folder of the buckets."""
+        self.root_dir = root_dir
+
+    def path(self, bucket: str, key: str) -> str:
+        """The local path of an object."""
+        return os.path.join(self.root_dir, bucket, *key.split("/"))
+
+    def list_keys(self, bucket: str, prefix: str = "") -> List[str]:
+        """The sorted keys of the objects of a bucket starting with a prefix."""
+        bucket_dir = os.path.join(self.root_dir, bucket)
+        keys = []
+        for dirpath, _, filenames in os.walk(bucket_dir):
+            for name in filenames:
+                key = os.path.relpath(os.path.join(dirpath, name), bucket_dir)
+                key = key.replace(os.sep, "/")
+                if key.startswith(prefix):
+                    keys.append(key)
+        return sorted(keys)
+
+    def list_objects_v2(self, Bucket, Prefix="", **kwargs):  # pylint: disable=unused-argument
+        """List the objects of a bucket in a single page."""
+        contents = []
+        for key in self.list_keys(Bucket, Prefix):
+            stat = os.stat(self.path(Bucket, key))
+            contents.append(
+                {
+                    "Key": key,
+                    "Size": stat.st_size,
+                    "LastModified": datetime.datetime.fromtimestamp(
+                        stat.st_mtime, tz=datetime.timezone.utc
+                    ),
+                }
+            )
+        response = {"Name": Bucket, "Prefix": Prefix, "KeyCount": len(contents)}
+        if contents:
+            response["Contents"] = contents
+        return response
+
+    def get_paginator(self, operation_name):  # pylint: disable=unused-argument
+        """Paginate list_objects_v2, whose result is a single page."""
+        return self
+
+    def paginate(self, Bucket, Prefix="", **kwargs):
+        """Yield the single page of list_objects_v2."""
+        yield self.list_objects_v2(Bucket=Bucket, Prefix=Prefix, **kwargs)
+
+    def _existing_path(self, bucket: str, key: str, operation_name: str) -> str:
+        """The local path of an object, raising a NoSuchKey error if it does not exist."""
+        path = self.path(bucket, key)
+        if not os.path.isfile(path):
+            raise _not_found("NoSuchKey", f"The key {key} does not exist.", operation_name)
+        return path
+
+    def get_object(self, Bucket, Key, **kwargs):  # pylint: disable=unused-argument
+        """Open an object, whose body is streamed from the local file."""
+        path = self._existing_path(Bucket, Key, "GetObject")
+        return {
+            "Body": open(path, "rb"),
+            "ContentLength": os.path.getsize(path),
+        }
+
+    def download_fileobj(self, Bucket, Key, Fileobj, **kwargs):  # pylint: disable=unused-argument
+        """Copy an object into a file object."""
+        with open(self._existing_path(Bucket, Key, "GetObject"), "rb") as f:
+            shutil.copyfileobj(f, Fileobj)
+
+    def download_file(self, Bucket, Key, Filename, **kwargs):  # pylint: disable=unused-argument
+        """Copy an object into a local file."""
+        shutil.copyfile(self._existing_path(Bucket, Key, "GetObject"), Filename)
+
+    def upload_file(self, Filename, Bucket, Key, **kwargs):  # pylint: disable=unused-argument
+        """Copy a local file into an object."""
+        path = self.path(Bucket, Key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        shutil.copyfile(Filename, path)
+
+
+class LocalOfflineStoreSession(Session):
+    """A Session which emulates the offline store of feature groups in-process.
+
+    Feature groups are added with ``add_feature_group`` from a DataFrame or from Parquet or CSV
+    files, and are loaded into tables of an embedded SQLite database. The Athena queries started
+    with ``start_query_execution``, including the ``UNLOAD`` queries of Parquet results and the
+    ``CREATE EXTERNAL TABLE`` queries of a DataFrame base of ``DatasetBuilder``, run
+    synchronously over these tables, and write their results into a local folder which stands in
+    for S3. The Presto functions ``from_unixtime``, ``from_iso8601_timestamp`` and
+    ``to_timestamp`` return UTC times as ``YYYY-MM-DD HH:MM:SS.ffffff`` strings, which compare
+    like the times they represent.
+
+    The SQL dialect is the one of SQLite, which runs the queries generated by ``DatasetBuilder``
+    but differs from Athena elsewhere, e.g. NULL values are ordered first, and timestamps are
+    strings. ``RIGHT JOIN`` and ``FULL JOIN`` require SQLite 3.39 or later.
+
+    Attributes:
+        root_dir (str): The local folder of the emulated S3 objects.
+    """
+
+    def __init__(
+        self,
+        root_dir: str = None,
+        region_name: str = DEFAULT_REGION,
+        default_bucket: str = DEFAULT_BUCKET,
+    ):
+        """Initialize a LocalOfflineStoreSession.
+
+        Args:
+            root_dir (str): The local folder of the emulated S3 objects, the object
+                ``s3://{bucket}/{key}`` is the file ``{root_dir}/{bucket}/{key}``. If not set, a
+                new temporary folder is used (default: None).
+            region_name (str): The AWS region in the ARNs of the feature groups
+                (default: "us-west-2").
+            default_bucket (str): The bucket of the emulated S3 objects uploaded without a
+                bucket (default: "sagemaker-local-offline-store").
+        """
+        self.root_dir = root_dir or tempfile.mkdtemp(prefix="sagemaker-offline-store-")
+        self._local_region_name = region_name
+        self._feature_groups = {}
+        self._query_executions = {}
+        self._databases = set()
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(":memory:", check_same_thread=False)
+        self._connection.create_function("from_unixtime", 1, _from_unixtime, **_FUNCTION_FLAGS)
+        self._connection.create_function(
+            "from_iso8601_timestamp", 1, _from_iso8601_timestamp, **_FUNCTION_FLAGS
+        )
+        self._connection.create_function("to_timestamp", 2, _to_timestamp, **_FUNCTION_FLAGS)
+        super(LocalOfflineStoreSession, self).__init__(default_bucket=default_bucket)
+
+    def _initialize(
+        self,
+        boto_session,
+        sagemaker_client,
+        sagemaker_runtime_client,
+        sagemaker_featurestore_runtime_client,
+        sagemaker_metrics_client,
+        sagemaker_config: dict = None,
+    ):
+        """Initialize the local session without creating AWS clients."""
+        self.boto_session = boto_session or boto3.Session(region_name=self._local_region_name)
+        self._region_name = self.boto_session.region_name
+        self.sagemaker_client = sagemaker_client
+        self.sagemaker_runtime_client = sagemaker_runtime_client
+        self.sagemaker_featurestore_runtime_client = sagemaker_featurestore_runtime_client
+        self.sagemaker_metrics_client = sagemaker_metrics_client
+        self.s3_client = _LocalS3Client(self.root_dir)
+        self.local_mode = False
+        self.sagemaker_config = sagemaker_config or {}
+
+    def default_bucket(self):
+        """The bucket of the emulated S3 objects uploaded without a bucket."""
+        return self._default_bucket_name_override
+
+    def upload_data(
+        self, path, bucket=None, key_prefix="data", extra_args=None, **kwargs
+    ):  # pylint: disable=unused-argument
+        """Copy a local file or directory into the emulated S3 objects.
+
+        Args:
+            path (str): Path of the local file or directory to upload.
+            bucket (str): Name of the bucket to upload to. If not set, the default bucket is used
+                (default: None).
+            key_prefix (str): The prefix of the keys of the objects (default: "data").
+            extra_args (dict): Ignored (default: None).
+
+        Returns:
+            str: The S3 URI of the uploaded file, or of the prefix of the uploaded directory.
+        """
+        bucket = bucket or self.default_bucket()
+        files = []
+        key_suffix = None
+        if os.path.isdir(path):
+            for dirpath, _, filenames in os.walk(path):
+                for name in filenames:
+                    relative_path = os.path.relpath(os.path.join(dirpath, name), start=path)
+                    files.append((os.path.join(dirpath, name), relative_path.replace(os.sep, "/")))
+        else:
+            key_suffix = os.path.basename(path)
+            files.append((path, key_suffix))
+        for local_path, relative_key in files:
+            self.s3_client.upload_file(local_path, bucket, f"{key_prefix}/{relative_key}")
+        s3_uri = f"s3://{bucket}/{key_prefix}"
+        if key_suffix:
+            s3_uri = f"{s3_uri}/{key_suffix}"
+        return s3_uri
+
+    def download_data(
+        self, path, bucket, key_prefix="", extra_args=None, **kwargs
+    ):  # pylint: disable=unused-argument
+        """Copy the emulated S3 objects of a prefix into a local directory.
+
+        Args:
+            path (str): The local directory to download to.
+            bucket (str): Name of the bucket to download from.
+            key_prefix (str): The prefix of the keys of the objects (default: "").
+            extra_args (dict): Ignored (default: None).
+
+        Returns:
+            list[str]: The local paths of the downloaded files.
+        """
+        destination_paths = []
+        for key in self.s3_client.list_keys(bucket, key_prefix):
+            tail_s3_uri_path = os.path.basename(key)
+            if not os.path.splitext(key_prefix)[1]:
+                tail_s3_uri_path = os.path.relpath(key, key_prefix)
+            destination_path = os.path.join(path, tail_s3_uri_path)
+            os.makedirs(os.path.dirname(os.path.abspath(destination_path)), exist_ok=True)
+            self.s3_client.download_file(bucket, key, destination_path)
+            destination_paths.append(destination_path)
+        return destination_paths
+
+    def add_feature_group(
+        self,
+        feature_group_name: str,
+        data: Union[pd.DataFrame, str, Sequence[str]],
+        record_identifier_name: str,
+        event_time_feature_name: str,
+        database: str = "sagemaker_featurestore",
+        table_name: str = None,
+    ) -> FeatureGroup:
+        """Add a feature group, and load its records into its offline store table.
+
+        The types of the features are inferred from the dtypes of the columns like in
+        ``FeatureGroup.load_feature_definitions``. The columns ``write_time`` and
+        ``api_invocation_time`` of the offline store are set to the current time, and
+        ``is_deleted`` to False, unless the data has them.
+
+        Args:
+            feature_group_name (str): The name of the feature group.
+            data (Union[pd.DataFrame, str, Sequence[str]]): The records, as a DataFrame, or as the
+                paths of Parquet files, of CSV files with a ``.csv`` extension, or of directories
+                of such files.
+            record_identifier_name (str): The name of the record identifier feature.
+            event_time_feature_name (str): The name of the event time feature.
+            database (str): The database of the offline store table
+                (default: "sagemaker_featurestore").
+            table_name (str): The name of the offline store table. If not set, the lowercase name
+                of the feature group is used (default: None).
+
+        Returns:
+            The FeatureGroup, using this session.
+
+        Raises:
+            ValueError: The feature group already exists, or the type of a feature can not be
+                inferred.
+        """
+        data_frame = self._read_data(data)
+        table_name = table_name or feature_group_name.lower().replace("-", "_")
+        feature_definitions = []
+        for column in data_frame.columns:
+            if column in _OFFLINE_STORE_COLUMNS:
+                continue
+            feature_type = FeatureGroup.DTYPE_TO_FEATURE_DEFINITION_CLS_MAP.get(
+                str(data_frame[column].dtype).lower(), None
+            )
+            if feature_type is None:
+                raise ValueError(
+                    f"Failed to infer Feature type based on dtype {data_frame[column].dtype} "
+                    f"for column {column}."
+                )
+            feature_definitions.append(FeatureDefinition(column, feature_type))
+
+        now = pd.Timestamp.now(tz="UTC")
+        if "write_time" not in data_frame:
+            data_frame["write_time"] = now
+        if "api_invocation_time" not in data_frame:
+            data_frame["api_invocation_time"] = data_frame["write_time"]
+        if "is_deleted" not in data_frame:
+            data_frame["is_deleted"] = False
+        data_frame["write_time"] = _timestamp_strings(data_frame["write_time"])
+        data_frame["api_invocation_time"] = _timestamp_strings(data_frame["api_invocation_time"])
+        column_types = {
+            feature_definition.feature_name: _FEATURE_TYPE_TO_COLUMN_TYPE_MAP[
+                feature_definition.feature_type
+            ]
+            for feature_definition in feature_definitions
+        }
+        column_types.update(write_time="TEXT", api_invocation_time="TEXT", is_deleted="INTEGER")
+
+        with self._lock:
+            if feature_group_name in self._feature_groups:
+                raise ValueError(f"FeatureGroup {feature_group_name} already exists.")
+            self._create_table(database, table_name, data_frame, column_types)
+            self._feature_groups[feature_group_name] = {
+                "FeatureGroupName": feature_group_name,
+                "FeatureGroupArn": (
+                    f"arn:aws:sagemaker:{self.boto_region_name}:{_ACCOUNT_ID}:"
+                    f"feature-group/{feature_group_name.lower()}"
+                ),
+                "RecordIdentifierFeatureName": record_identifier_name,
+                "EventTimeFeatureName": event_time_feature_name,
+                "FeatureDefinitions": [
+                    feature_definition.to_dict() for feature_definition in feature_definitions
+                ],
+                "CreationTime": now.to_pydatetime(),
+                "OfflineStoreConfig": {
+                    "S3StorageConfig": {
+                        "S3Uri": f"s3://{self.default_bucket()}/{feature_group_name}"
+                    },
+                    "DataCatalogConfig": {
+                        "Catalog": "AwsDataCatalog",
+                        "Database": database,
+                        "TableName": table_name,
+                    },
+                },
+                "FeatureGroupStatus": "Created",
+                "OfflineStoreStatus": {"Status": "Active"},
+            }
+        return FeatureGroup(
+            name=feature_group_name,
+            sagemaker_session=self,
+            feature_definitions=feature_definitions,
+        )
+
+    def delete_feature_group(self, feature_group_name: str):
+        """Delete a feature group and drop its offline store table.
+
+        Args:
+            feature_group_name (str): The name of the feature group.
+        """
+        with self._lock:
+            description = self.describe_feature_group(feature_group_name)
+            data_catalog_config = description["OfflineStoreConfig"]["DataCatalogConfig"]
+            self._connection.execute(
+                f"DROP TABLE {_quote(data_catalog_config['Database'])}."
+                f"{_quote(data_catalog_config['TableName'])}"
+            )
+            del self._feature_groups[feature_group_name]
+
+    def describe_feature_group(
+        self, feature_group_name: str, next_token: str = None
+    ) -> Dict[str, Any]:
+        """Describe a feature group added to this session.
+
+        Args:
+            feature_group_name (str): The name of the feature group.
+            next_token (str): Ignored (default: None).
+
+        Returns:
+            A DescribeFeatureGroup response.
+
+        Raises:
+            botocore.exceptions.ClientError: The feature group does not exist.
+        """
+        with self._lock:
+            description = self._feature_groups.get(feature_group_name)
+            if description is None:
+                raise _not_found(
+                    "ResourceNotFound",
+                    f"Resource Not Found: FeatureGroup {feature_group_name} does not exist.",
+                    "DescribeFeatureGroup",
+                )
+            return dict(description)
+
+    def start_query_execution(
+        self,
+        catalog: str,
+        database: str,
+        query_string: str,
+        output_location: str,
+        kms_key: str = None,
+        workgroup: str = None,
+    ) -> Dict[str, str]:
+        """Run an Athena query over the offline store tables, and wait for it to finish.
+
+        A query which fails is recorded with the FAILED state, like in Athena.
+
+        Args:
+            catalog (str): Ignored.
+            database (str): The database of the tables created by the query.
+            query_string (str): The SQL query.
+            output_location (str): The S3 URI of the folder of the CSV result of the query.
+            kms_key (str): Ignored (default: None).
+            workgroup (str): Ignored (default: None).
+
+        Returns:
+            A StartQueryExecution response.
+        """
+        query_execution_id = str(uuid.uuid4())
+        result_location = f"{output_location.rstrip('/')}/{query_execution_id}.csv"
+        status = {"State": "SUCCEEDED"}
+        start = time.perf_counter()
+        try:
+            self._execute(database, query_string, result_location)
+        except (sqlite3.Error, ValueError, OSError) as e:
+            logger.warning("Query %s failed: %s", query_execution_id, e)
+            status = {"State": "FAILED", "StateChangeReason": str(e)}
+        engine_execution_time = int((time.perf_counter() - start) * 1000)
+        with self._lock:
+            self._query_executions[query_execution_id] = {
+                "QueryExecutionId": query_execution_id,
+                "Query": query_string,
+                "QueryExecutionContext": {"Catalog": catalog, "Database": database},
+                "ResultConfiguration": {"OutputLocation": result_location},
+                "Status": status,
+                "Statistics": {"EngineExecutionTimeInMillis": engine_execution_time},
+                "WorkGroup": workgroup,
+            }
+        return {"QueryExecutionId": query_execution_id}
+
+    def get_query_execution(self, query_execution_id: str) -> Dict[str, Any]:
+        """Get the execution of a query run by this session.
+
+        Args:
+            query_execution_id (str): The execution ID of the query.
+
+        Returns:
+            A GetQueryExecution response.
+
+        Raises:
+            botocore.exceptions.ClientError: The query execution does not exist.
+        """
+        with self._lock:
+            query_execution = self._query_executions.get(query_execution_id)
+        if query_execution is None:
+            raise _not_found(
+                "InvalidRequestException",
+                f"QueryExecution {query_execution_id} was not found",
+                "GetQueryExecution",
+            )
+        return {"QueryExecution": query_execution}
+
+    def _read_data(self, data: Union[pd.DataFrame, str, Sequence[str]]) -> pd.DataFrame:
+        """Read the records of a feature group into a new DataFrame."""
+        if isinstance(data, pd.DataFrame):
+            return data.copy()
+        paths = [data] if isinstance(data, str) else list(data)
+        files = []
+        for path in paths:
+            if os.path.isdir(path):
+                files.extend(
+                    os.path.join(dirpath, name)
+                    for dirpath, _, filenames in sorted(os.walk(path))
+                    for name in sorted(filenames)
+                )
+            else:
+                files.append(path)
+        data_frames = [
+            pd.read_csv(path) if path.endswith(".csv") else pd.read_parquet(path) for path in files
+        ]
+        return pd.concat(data_frames, ignore_index=True)
+
+    def _create_table(
+        self,
+        database: str,
+        table_name: str,
+        data_frame: pd.DataFrame,
+        column_types: Dict[str, str],
+    ):
+        """Create a table in a database, and insert the rows of a DataFrame."""
+        with self._lock:
+            if database not in self._databases:
+                self._connection.execute(f"ATTACH DATABASE ':memory:' AS {_quote(database)}")
+                self._databases.add(database)
+            table = f"{_quote(database)}.{_quote(table_name)}"
+            columns = ", ".join(
+                f"{_quote(column)} {column_types[column]}" for column in data_frame.columns
+            )
+            placeholders = ", ".join("?" for _ in data_frame.columns)
+            values = data_frame.astype(object).where(data_frame.notna(), None)
+            with self._connection:
+                self._connection.execute(f"CREATE TABLE {table} ({columns})")
+                self._connection.executemany(
+                    f"INSERT INTO {table} VALUES ({placeholders})",
+                    values.itertuples(index=False, name=None),
+                )
+
+    def _select(self, query_string: str) -> pd.DataFrame:
+        """Run a query, and read its result into a DataFrame."""
+        with self._lock:
+            cursor = self._connection.execute(query_string)
+            rows = cursor.fetchall()
+        return pd.DataFrame.from_records(
+            rows, columns=[description[0] for description in cursor.description or ()]
+        )
+
+    def _execute(self, database: str, query_string: str, result_location: str):
+        """Run a query, and write its result."""
+        query_string = query_string.strip().rstrip(";").strip()
+        match = _UNLOAD_PATTERN.match(query_string)
+        if match:
+            self._unload(match.group("query"), match.group("location"))
+            return
+        match = _CREATE_EXTERNAL_TABLE_PATTERN.match(query_string)
+        if match:
+            self._create_external_table(
+                database, match.group("table"), match.group("columns"), match.group("location")
+            )
+            return
+        result = self._select(query_string)
+        bucket, key = self._bucket_and_key(result_location)
+        path = self.s3_client.path(bucket, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        result.to_csv(path, index=False)
+
+    def _unload(self, query_string: str, location: str):
+        """Run the query of an UNLOAD, and write its result as Parquet files."""
+        bucket, prefix = self._bucket_and_key(location)
+        if self.s3_client.list_keys(bucket, prefix):
+            raise ValueError(f"HIVE_PATH_ALREADY_EXISTS: Target directory {location} exists")
+        result = self._select(query_string)
+        unload_id = uuid.uuid4().hex
+        for index, start in enumerate(range(0, len(result), _UNLOAD_ROWS_PER_FILE)):
+            path = self.s3_client.path(bucket, f"{prefix.rstrip('/')}/{unload_id}_{index:05d}")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            result.iloc[start : start + _UNLOAD_ROWS_PER_FILE].to_parquet(path, index=False)
+
+    def _create_external_table(self, database: str, table_name: str, columns: str, location: str):
+        """Create a table from the header-less CSV files of a CREATE EXTERNAL TABLE."""
+        column_types = {}
+        for column in columns.split(","):
+            column_name, athena_type = column.strip().rsplit(" ", 1)
+            if athena_type.upper() not in _ATHENA_TYPE_TO_COLUMN_TYPE_MAP:
+                raise ValueError(f"The column type {athena_type} is not supported.")
+            column_types[column_name] = athena_type.upper()
+        bucket, prefix = self._bucket_and_key(location)
+        data_frames = [
+            pd.read_csv(
+                self.s3_client.path(bucket, key),
+                header=None,
+                names=list(column_types),
+                dtype={
+                    column_name: "string"
+                    for column_name, athena_type in column_types.items()
+                    if athena_type in ("STRING", "TIMESTAMP")
+                },
+            )
+            for key in self.s3_client.list_keys(bucket, prefix.rstrip("/") + "/")
+        ]
+        data_frame = pd.concat(data_frames, ignore_index=True)
+        for column_name, athena_type in column_types.items():
+            if athena_type == "TIMESTAMP":
+                data_frame[column_name] = _timestamp_strings(data_frame[column_name])
+        self._create_table(
+            database,
+            table_name,
+            data_frame,
+            {
+                column_name: _ATHENA_TYPE_TO_COLUMN_TYPE_MAP[athena_type]
+                for column_name, athena_type in column_types.items()
+            },
+        )
+
+    @staticmethod
+    def _bucket_and_key(s3_uri: str):
+        """The bucket and the key of an S3 URI."""
+        parse_result = urlparse(s3_uri, allow_fragments=False)
+        return parse_result.netloc, parse_result.path.lstrip("/")
@@ -0,0 +1,508 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""The results of the Athena queries over the offline store of feature groups.
+
+A query can be run as an ``UNLOAD`` to Parquet files instead of a ``SELECT`` written to a
+single CSV file. The Parquet files keep the types of the columns, are written in parallel by
+Athena, and are read back with concurrent ranged downloads into Arrow tables.
+
+A result too large to be held in memory is iterated over in batches of rows, streamed from its
+CSV file or Parquet files. The next files are downloaded, and the next batches decoded, by
+background threads while the current batch is used, within a bounded number of files and
+batches.
+
+The executions of queries can be recorded in a ``QueryResultCache``, keyed on the normalized
+query string and on the versions of the queried feature groups, so that the result of an
+identical query is read again instead of being computed again.
+"""
+from __future__ import absolute_import
+
+import collections
+import io
+import logging
+import queue
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from urllib.parse import urlparse
+
+import attr
+import pandas as pd
+from pandas import DataFrame
+
+from sagemaker import s3_transfer
+from sagemaker.session import Session
+from sagemaker.utils import DeferredError
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError as e:
+    pa = DeferredError(e)
+    pq = DeferredError(e)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 100000
+DEFAULT_PREFETCH = 2
+
+# String literals and quoted identifiers, which are kept as they are, or whitespace and comments.
+_QUERY_TOKEN_PATTERN = re.compile(
+    r"('(?:[^']|'')*'|\"(?:[^\"]|\"\")*\")|(?:\s|--[^\n]*|/\*.*?\*/)+", re.DOTALL
+)
+
+
+def normalize_query_string(query_string: str) -> str:
+    """Normalize the whitespace and the trailing semicolons of a query string.
+
+    The runs of whitespace and comments outside of string literals and quoted identifiers are
+    replaced by a single space, so that queries which only differ by their formatting are equal.
+
+    Args:
+        query_string (str): The SQL query string.
+
+    Returns:
+        str: The normalized query string.
+    """
+    normalized = _QUERY_TOKEN_PATTERN.sub(
+        lambda match: match.group(1) if match.group(1) else " ", query_string
+    )
+    return normalized.strip().rstrip(";").strip()
+
+
+def unload_query_string(query_string: str, location: str) -> str:
+    """Wrap a ``SELECT`` query string in an ``UNLOAD`` of its result to Parquet files.
+
+    Args:
+        query_string (str): The SQL query string.
+        location (str): The S3 URI of the empty folder the Parquet files are written to.
+
+    Returns:
+        str: The ``UNLOAD`` query string.
+    """
+    return (
+        f"UNLOAD ({normalize_query_string(query_string)}) "
+        f"TO '{location.rstrip('/')}/' WITH (format = 'PARQUET')"
+    )
+
+
+def feature_group_version(feature_group_metadata: Dict[str, Any]) -> str:
+    """The version of a feature group, from the response of ``DescribeFeatureGroup``.
+
+    The version changes when the feature group is recreated or updated, not when records are
+    ingested into it.
+
+    Args:
+        feature_group_metadata (Dict[str, Any]): The description of the feature group.
+
+    Returns:
+        str: The version of the feature group, None if it is unknown.
+    """
+    arn = feature_group_metadata.get("FeatureGroupArn")
+    if not arn:
+        return None
+    modified_time = feature_group_metadata.get(
+        "LastModifiedTime", feature_group_metadata.get("CreationTime")
+    )
+    return f"{arn}@{modified_time}"
+
+
+def result_s3_client(sagemaker_session: Session):
+    """The S3 client of a session, used to read the results of queries."""
+    if sagemaker_session.s3_client is not None:
+        return sagemaker_session.s3_client
+    return sagemaker_session.boto_session.client(
+        "s3", region_name=sagemaker_session.boto_region_name
+    )
+
+
+def _split_s3_uri(s3_uri: str) -> Tuple[str, str]:
+    """Split an S3 URI into its bucket and its key."""
+    parse_result = urlparse(s3_uri, allow_fragments=False)
+    return parse_result.netloc, parse_result.path.lstrip("/")
+
+
+def list_result_objects(s3_client, s3_uri: str) -> List[Dict[str, Any]]:
+    """List the non-empty objects of a query result, in the order of their keys.
+
+    Args:
+        s3_client: The S3 client.
+        s3_uri (str): The S3 URI of the result file, or of the folder of the result files.
+
+    Returns:
+        List[Dict[str, Any]]: The ``Bucket``, ``Key`` and ``Size`` of the objects.
+    """
+    bucket, prefix = _split_s3_uri(s3_uri)
+    objects = []
+    paginator = s3_client.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+        for content in page.get("Contents", []):
+            if content["Size"] > 0 and not content["Key"].endswith("/"):
+                objects.append({"Bucket": bucket, "Key": content["Key"], "Size": content["Size"]})
+    return sorted(objects, key=lambda content: content["Key"])
+
+
+def _download_object(s3_client, s3_object: Dict[str, Any], transfer_config) -> bytes:
+    """Download an object into memory, in concurrent ranged parts when it is large."""
+    buffer = io.BytesIO()
+    s3_client.download_fileobj(
+        Bucket=s3_object["Bucket"], Key=s3_object["Key"], Fileobj=buffer, Config=transfer_config
+    )
+    return buffer.getvalue()
+
+
+def read_parquet_result(
+    s3_client,
+    s3_uri: str,
+    max_concurrency: int = s3_transfer.DEFAULT_MAX_CONCURRENCY,
+    multipart_chunksize: int = s3_transfer.DEFAULT_MULTIPART_CHUNKSIZE,
+) -> DataFrame:
+    """Read the Parquet files of an ``UNLOAD`` query into a DataFrame.
+
+    The files are downloaded concurrently, and the parts of the large files are downloaded with
+    concurrent ranged requests, within a budget of ``max_concurrency`` requests.
+
+    Args:
+        s3_client: The S3 client.
+        s3_uri (str): The S3 URI of the folder of the Parquet files.
+        max_concurrency (int): The maximum number of concurrent requests (default: 10).
+        multipart_chunksize (int): The size of the ranged requests (default: 8 MiB).
+
+    Returns:
+        DataFrame: The result of the query, with the types of its columns.
+    """
+    objects = list_result_objects(s3_client, s3_uri)
+    if not objects:
+        return pd.DataFrame()
+    num_workers = min(max_concurrency, len(objects))
+    transfer_config = s3_transfer.get_transfer_config(
+        max_concurrency, multipart_chunksize, num_workers
+    )
+
+    def read_table(s3_object):
+        data = _download_object(s3_client, s3_object, transfer_config)
+        return pq.read_table(pa.BufferReader(data))
+
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        tables = list(executor.map(read_table, objects))
+    return pa.concat_tables(tables).to_pandas()
+
+
+class _Prefetcher(object):
+    """Iterates over an iterator in a background thread, a bounded number of items ahead."""
+
+    _END = object()
+
+    def __init__(self, iterator: Iterator, max_buffered_items: int):
+        """Initialize a ``_Prefetcher`` instance, whose thread starts with the iteration.
+
+        Args:
+            iterator (Iterator): The iterator to iterate over in the background.
+            max_buffered_items (int): The number of items produced before the thread blocks
+                until they are consumed.
+        """
+        self._iterator = iterator
+        self._queue = queue.Queue(maxsize=max(1, max_buffered_items))
+        self._consumer_closed = threading.Event()
+        self._thread = threading.Thread(target=self._produce, daemon=True)
+
+    def _put(self, item) -> bool:
+        """Queues an item, unless the consumer stopped consuming. Returns whether it was queued."""
+        while not self._consumer_closed.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(self):
+        """Queues the items of the iterator, then its end or its error."""
+        try:
+            for item in self._iterator:
+                if not self._put(item):
+                    return
+            self._put(self._END)
+        except Exception as error:  # pylint: disable=broad-except
+            self._put(error)
+        finally:
+            close = getattr(self._iterator, "close", None)
+            if close is not None:
+                close()
+
+    def __iter__(self) -> Iterator:
+        """Yields the items of the iterator, and raises its error."""
+        self._thread.start()
+        try:
+            while True:
+                item = self._queue.get()
+                if item is self._END:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            self._consumer_closed.set()
+
+
+def _iter_parquet_batches(
+    s3_client,
+    objects: Sequence[Dict[str, Any]],
+    batch_size: int,
+    max_concurrency: int,
+    prefetch: int,
+) -> Iterator:
+    """Yields the record batches of Parquet objects, downloading ``prefetch`` objects ahead."""
+    transfer_config = s3_transfer.get_transfer_config(max_concurrency, num_workers=prefetch)
+    with ThreadPoolExecutor(max_workers=prefetch) as executor:
+        downloads = collections.deque()
+        remaining = iter(objects)
+        try:
+            for s3_object in remaining:
+                downloads.append(
+                    executor.submit(_download_object, s3_client, s3_object, transfer_config)
+                )
+                if len(downloads) == prefetch:
+                    break
+            while downloads:
+                data = downloads.popleft().result()
+                s3_object = next(remaining, None)
+                if s3_object is not None:
+                    downloads.append(
+                        executor.submit(_download_object, s3_client, s3_object, transfer_config)
+                    )
+                for batch in pq.ParquetFile(pa.BufferReader(data)).iter_batches(batch_size):
+                    yield batch
+        finally:
+            for download in downloads:
+                download.cancel()
+
+
+def _rebatch(batches: Iterable, batch_size: int) -> Iterator:
+    """Yields record batches of ``batch_size`` rows, the last one excepted."""
+    pending = []
+    num_rows = 0
+    for batch in batches:
+        if batch.num_rows == 0:
+            continue
+        pending.append(batch)
+        num_rows += batch.num_rows
+        while num_rows >= batch_size:
+            table = pa.Table.from_batches(pending)
+            yield table.slice(0, batch_size).combine_chunks().to_batches()[0]
+            rest = table.slice(batch_size)
+            pending = rest.combine_chunks().to_batches() if rest.num_rows else []
+            num_rows = rest.num_rows
+    if num_rows:
+        yield pa.Table.from_batches(pending).combine_chunks().to_batches()[0]
+
+
+def _iter_csv_batches(s3_client, s3_object: Dict[str, Any], batch_size: int) -> Iterator:
+    """Yields the DataFrames of ``batch_size`` rows of a CSV object, parsed while it streams."""
+    body = s3_client.get_object(Bucket=s3_object["Bucket"], Key=s3_object["Key"])["Body"]
+    try:
+        with pd.read_csv(body, delimiter=",", chunksize=batch_size) as reader:
+            for data_frame in reader:
+                yield data_frame
+    finally:
+        body.close()
+
+
+def iter_result_batches(
+    s3_client,
+    s3_uri: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    as_arrow: bool = False,
+    max_concurrency: int = s3_transfer.DEFAULT_MAX_CONCURRENCY,
+    prefetch: int = DEFAULT_PREFETCH,
+    exclude_columns: Sequence[str] = (),
+) -> Iterator[Union[DataFrame, "pa.RecordBatch"]]:
+    """Iterate over the result of a query in batches of rows, without holding it in memory.
+
+    The result is the CSV file of a ``SELECT`` query when ``s3_uri`` ends with ``.csv``, else the
+    Parquet files of an ``UNLOAD`` query. The CSV file is parsed while it is downloaded, and the
+    types of its columns are inferred batch by batch. The Parquet files are downloaded
+    ``prefetch`` at a time, each with concurrent ranged requests, and keep the types of their
+    columns. The next batches are decoded by a background thread, at most ``prefetch`` batches
+    ahead, so that the memory used is bounded by ``prefetch`` Parquet files and batches.
+
+    Args:
+        s3_client: The S3 client.
+        s3_uri (str): The S3 URI of the result file, or of the folder of the result files.
+        batch_size (int): The number of rows of the batches; the last batch can be smaller
+            (default: 100000).
+        as_arrow (bool): Whether to yield ``pyarrow.RecordBatch`` objects instead of DataFrames
+            (default: False).
+        max_concurrency (int): The maximum number of concurrent requests (default: 10).
+        prefetch (int): The number of files downloaded, and of batches decoded, ahead of the
+            batch being used (default: 2).
+        exclude_columns (Sequence[str]): The columns dropped from the batches (default: ()).
+
+    Returns:
+        Iterator[Union[DataFrame, pyarrow.RecordBatch]]: The batches of the result. The
+        DataFrames are indexed by the position of their rows in the result.
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be positive, got {batch_size}.")
+    prefetch = max(1, prefetch)
+    objects = list_result_objects(s3_client, s3_uri)
+    if s3_uri.endswith(".csv"):
+        objects = [s3_object for s3_object in objects if s3_object["Key"].endswith(".csv")]
+        batches = (
+            batch
+            for s3_object in objects
+            for batch in _iter_csv_batches(s3_client, s3_object, batch_size)
+        )
+    else:
+        batches = _rebatch(
+            _iter_parquet_batches(s3_client, objects, batch_size, max_concurrency, prefetch),
+            batch_size,
+        )
+
+    converted = (_convert_batch(batch, as_arrow, exclude_columns) for batch in batches)
+    prefetched = _Prefetcher(converted, prefetch)
+    return iter(prefetched) if as_arrow else _index_data_frames(prefetched)
+
+
+def _convert_batch(batch, as_arrow: bool, exclude_columns: Sequence[str]):
+    """Converts a DataFrame or a record batch to the type of the batches, without some columns."""
+    if isinstance(batch, pd.DataFrame):
+        batch = batch.drop(columns=[column for column in exclude_columns if column in batch])
+        return pa.RecordBatch.from_pandas(batch, preserve_index=False) if as_arrow else batch
+    names = [name for name in batch.schema.names if name not in exclude_columns]
+    if len(names) < batch.num_columns:
+        batch = pa.RecordBatch.from_arrays([batch.column(name) for name in names], names=names)
+    return batch if as_arrow else batch.to_pandas()
+
+
+def _index_data_frames(data_frames: Iterable[DataFrame]) -> Iterator[DataFrame]:
+    """Yields DataFrames indexed by the position of their rows across the DataFrames."""
+    start = 0
+    for data_frame in data_frames:
+        data_frame.index = pd.RangeIndex(start, start + len(data_frame))
+        start += len(data_frame)
+        yield data_frame
+
+
+@attr.s(frozen=True)
+class CachedQueryExecution:
+    """A query execution recorded in a ``QueryResultCache``.
+
+    Attributes:
+        query_execution_id (str): The execution id of the query.
+        result_location (str): The S3 URI of the result file, or of the folder of the result
+            files of an ``UNLOAD`` query.
+        created_at (float): The time the execution was recorded at, in seconds since the epoch.
+    """
+
+    query_execution_id: str = attr.ib()
+    result_location: str = attr.ib()
+    created_at: float = attr.ib()
+
+
+class QueryResultCache(object):
+    """A thread-safe, in-memory cache of the executions of Athena queries.
+
+    The executions are keyed on the normalized query string and on the context of the query:
+    the catalog, database, output location and result format, and the versions of the
+    queried feature groups. Records ingested into a feature group do not change its version,
+    so the cached results can be bounded in age with ``max_age_seconds``.
+    """
+
+    def __init__(self, max_age_seconds: float = None):
+        """Initialize a ``QueryResultCache`` instance.
+
+        Args:
+            max_age_seconds (float): The age after which the executions are not reused
+                (default: None, they are reused as long as their result exists).
+        """
+        self.max_age_seconds = max_age_seconds
+        self._executions = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(query_string: str, **context: Hashable) -> Tuple:
+        """Build the cache key of a query.
+
+        Args:
+            query_string (str): The SQL query string.
+            **context: The catalog, database, output location, result format, feature group
+                versions, and any other value the result of the query depends on.
+
+        Returns:
+            tuple: The cache key.
+        """
+        return (normalize_query_string(query_string), tuple(sorted(context.items())))
+
+    def get(self, key: Tuple) -> Optional[CachedQueryExecution]:
+        """Get the execution recorded for a key, None if it is missing or expired."""
+        with self._lock:
+            execution = self._executions.get(key)
+            if execution is None:
+                return None
+            if (
+                self.max_age_seconds is not None
+                and time.time() - execution.created_at > self.max_age_seconds
+            ):
+                del self._executions[key]
+                return None
+            return execution
+
+    def put(self, key: Tuple, query_execution_id: str, result_location: str):
+        """Record the execution of the query of a key."""
+        with self._lock:
+            self._executions[key] = CachedQueryExecution(
+                query_execution_id, result_location, time.time()
+            )
+
+    def invalidate(self, key: Tuple = None):
+        """Forget the execution recorded for a key, or all executions if no key is given."""
+        with self._lock:
+            if key is None:
+                self._executions.clear()
+            else:
+                self._executions.pop(key, None)
+
+    def lookup(self, key: Tuple, sagemaker_session: Session) -> Optional[CachedQueryExecution]:
+        """Get the execution recorded for a key, if its result can still be read.
+
+        An execution which is still queued or running is returned, so that identical queries
+        share it. An execution which failed, or whose result was deleted, is forgotten.
+
+        Args:
+            key (tuple): The cache key of the query.
+            sagemaker_session (Session): Session instance to perform boto calls.
+
+        Returns:
+            CachedQueryExecution: The execution to reuse, None if the query must be run.
+        """
+        execution = self.get(key)
+        if execution is None:
+            return None
+        query_state = (
+            sagemaker_session.get_query_execution(query_execution_id=execution.query_execution_id)
+            .get("QueryExecution", {})
+            .get("Status", {})
+            .get("State")
+        )
+        if query_state in ("QUEUED", "RUNNING"):
+            return execution
+        if query_state == "SUCCEEDED" and list_result_objects(
+            result_s3_client(sagemaker_session), execution.result_location
+        ):
+            logger.info("Reusing the result of query %s.", execution.query_execution_id)
+            return execution
+        self.invalidate(key)
+        return None
@@ -25,6 +25,7 @@ from typing import Optional, Union, Dict
 from packaging import version
 
 import sagemaker.image_uris
+from sagemaker import s3_transfer, tar_utils, upload_cache
 from sagemaker.s3_utils import s3_path_join
 from sagemaker.session_settings import SessionSettings
 import sagemaker.utils
@@ -402,7 +403,9 @@ def tar_and_upload_dir(
 ) -> UploadedCode:
     """Package source files and upload a compress tar file to S3.
 
-    The S3 location will be ``s3://<bucket>/s3_key_prefix/sourcedir.tar.gz``.
+    The S3 location will be ``s3://<bucket>/s3_key_prefix/sourcedir.tar.gz``, unless the
+    ``upload_cache`` of the settings has the same content uploaded before to the same bucket,
+    in which case the S3 location of that upload is returned and nothing is uploaded.
     If directory is an S3 URI, an UploadedCode object will be returned, but
     nothing will be uploaded to S3 (this allow reuse of code already in S3).
     If directory is None, the script will be added to the archive at
@@ -454,12 +457,10 @@ def tar_and_upload_dir(
     local_download_dir = None if settings is None else settings.local_download_dir
     tmp = tempfile.mkdtemp(dir=local_download_dir)
     encrypt_artifact = True if settings is None else settings.encrypt_repacked_artifacts
+    packaging_settings = settings if isinstance(settings, SessionSettings) else SessionSettings()
 
     try:
         source_files = _list_files_to_compress(script, directory) + dependencies
-        tar_file = sagemaker.utils.create_tar_file(
-            source_files, os.path.join(tmp, _TAR_SOURCE_FILENAME)
-        )
 
         if kms_key:
             extra_args = {"ServerSideEncryption": "aws:kms", "SSEKMSKeyId": kms_key}
@@ -475,11 +476,43 @@ def tar_and_upload_dir(
         else:
             print("Using provided s3_resource")
 
-        s3_resource.Object(bucket, key).upload_file(tar_file, ExtraArgs=extra_args)
+        cache = packaging_settings.upload_cache
+        if cache is not None:
+            content_hash = upload_cache.compute_content_hash(
+                source_files, extra_args, kind=upload_cache.TAR_GZ_UPLOAD
+            )
+            cached_s3_uri = cache.get(s3_resource.meta.client, bucket, content_hash)
+            if cached_s3_uri is not None:
+                return UploadedCode(s3_prefix=cached_s3_uri, script_name=script_name)
+
+        if packaging_settings.stream_artifact_uploads:
+            with s3_transfer.upload_stream(s3_resource, bucket, key, extra_args=extra_args) as f:
+                with tar_utils.open_tar_writer(
+                    f,
+                    packaging_settings.compression_threads,
+                    packaging_settings.compression_level,
+                    dereference=True,
+                ) as t:
+                    for sf in source_files:
+                        t.add(sf, arcname=os.path.basename(sf))
+        else:
+            tar_file = sagemaker.utils.create_tar_file(
+                source_files,
+                os.path.join(tmp, _TAR_SOURCE_FILENAME),
+                compression_threads=packaging_settings.compression_threads,
+                compression_level=packaging_settings.compression_level,
+            )
+            s3_resource.Object(bucket, key).upload_file(
+                tar_file, ExtraArgs=extra_args, Config=s3_transfer.get_transfer_config()
+            )
+
+        s3_uri = "s3://%s/%s" % (bucket, key)
+        if cache is not None:
+            cache.put(s3_resource.meta.client, bucket, content_hash, s3_uri, key)
     finally:
         shutil.rmtree(tmp)
 
-    return UploadedCode(s3_prefix="s3://%s/%s" % (bucket, key), script_name=script_name)
+    return UploadedCode(s3_prefix=s3_uri, script_name=script_name)
 
 
 def _list_files_to_compress(script, directory):
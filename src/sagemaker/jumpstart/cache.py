@@ -12,14 +12,16 @@
 # language governing permissions and limitations under the License.
 """This module defines the JumpStartModelsCache class."""
 from __future__ import absolute_import
+import bisect
 import datetime
 from difflib import get_close_matches
 import os
-from typing import List, Optional, Tuple, Union
+import threading
+from typing import Dict, List, Optional, Tuple, Union
 import json
 import boto3
 import botocore
-from packaging.version import Version
+from packaging.version import InvalidVersion, Version
 from packaging.specifiers import SpecifierSet, InvalidSpecifier
 from sagemaker.jumpstart.constants import (
     ENV_VARIABLE_JUMPSTART_MANIFEST_LOCAL_ROOT_DIR_OVERRIDE,
@@ -46,6 +48,67 @@ from sagemaker.jumpstart import utils
 from sagemaker.utilities.cache import LRUCache
 
 
+class _ManifestIndex:
+    """Index of the versions of each model ID in a formatted JumpStart manifest.
+
+    The versions of each model ID are parsed once and sorted, along with the minimum SageMaker
+    version of each of them, so that resolving a semantic version does not scan the manifest.
+    """
+
+    def __init__(self, manifest: Dict[JumpStartVersionedModelId, JumpStartModelHeader]) -> None:
+        """Indexes a formatted manifest.
+
+        Args:
+            manifest (Dict[JumpStartVersionedModelId, JumpStartModelHeader]): The formatted
+                manifest, from ``utils.get_formatted_manifest``.
+        """
+        versions: Dict[str, List[Tuple[Version, str]]] = {}
+        for header in manifest.values():
+            versions.setdefault(header.model_id, []).append(
+                (Version(header.version), header.min_version)
+            )
+        for model_versions in versions.values():
+            model_versions.sort(key=lambda version: version[0])
+        self.model_ids = list(versions)
+        # Sorted versions of each model ID, with their minimum SageMaker versions.
+        self._versions = {
+            model_id: ([v for v, _ in model_versions], [m for _, m in model_versions])
+            for model_id, model_versions in versions.items()
+        }
+        self._compatible_versions: Dict[Tuple[str, str], List[Version]] = {}
+        self._lock = threading.Lock()
+
+    def versions(self, model_id: str) -> List[Version]:
+        """Returns the sorted versions of a model ID."""
+        return self._versions.get(model_id, ([], []))[0]
+
+    def min_sagemaker_version(self, model_id: str, version: str) -> Optional[str]:
+        """Returns the minimum SageMaker version of a version of a model ID."""
+        versions, min_versions = self._versions.get(model_id, ([], []))
+        parsed_version = Version(version)
+        i = bisect.bisect_left(versions, parsed_version)
+        if i < len(versions) and versions[i] == parsed_version:
+            return min_versions[i]
+        return None
+
+    def compatible_versions(self, model_id: str, sm_version: str) -> List[Version]:
+        """Returns the sorted versions of a model ID compatible with a SageMaker version."""
+        key = (model_id, sm_version)
+        with self._lock:
+            compatible_versions = self._compatible_versions.get(key)
+        if compatible_versions is None:
+            versions, min_versions = self._versions.get(model_id, ([], []))
+            parsed_sm_version = Version(sm_version)
+            compatible_versions = [
+                version
+                for version, min_version in zip(versions, min_versions)
+                if Version(min_version) <= parsed_sm_version
+            ]
+            with self._lock:
+                self._compatible_versions[key] = compatible_versions
+        return compatible_versions
+
+
 class JumpStartModelsCache:
     """Class that implements a cache for JumpStart models manifests and specs.
 
@@ -104,6 +167,7 @@ class JumpStartModelsCache:
             retrieval_function=self._get_manifest_key_from_model_id_semantic_version,
         )
         self._manifest_file_s3_key = manifest_file_s3_key
+        self._manifest_index: Optional[Tuple[dict, _ManifestIndex]] = None
         self.s3_bucket_name = (
             utils.get_jumpstart_content_bucket(self._region)
             if s3_bucket_name is None
@@ -171,42 +235,30 @@ class JumpStartModelsCache:
         manifest = self._s3_cache.get(
             JumpStartCachedS3ContentKey(JumpStartS3FileType.MANIFEST, self._manifest_file_s3_key)
         ).formatted_content
+        manifest_index = self._get_manifest_index(manifest)  # type: ignore
 
         sm_version = utils.get_sagemaker_version()
 
-        versions_compatible_with_sagemaker = [
-            Version(header.version)
-            for header in manifest.values()  # type: ignore
-            if header.model_id == model_id and Version(header.min_version) <= Version(sm_version)
-        ]
-
         sm_compatible_model_version = self._select_version(
-            version, versions_compatible_with_sagemaker
+            version, manifest_index.compatible_versions(model_id, sm_version)
         )
 
         if sm_compatible_model_version is not None:
             return JumpStartVersionedModelId(model_id, sm_compatible_model_version)
 
-        versions_incompatible_with_sagemaker = [
-            Version(header.version) for header in manifest.values()  # type: ignore
-            if header.model_id == model_id
-        ]
+        versions_incompatible_with_sagemaker = manifest_index.versions(model_id)
         sm_incompatible_model_version = self._select_version(
             version, versions_incompatible_with_sagemaker
         )
 
         if sm_incompatible_model_version is not None:
             model_version_to_use_incompatible_with_sagemaker = sm_incompatible_model_version
-            sm_version_to_use_list = [
-                header.min_version
-                for header in manifest.values()  # type: ignore
-                if header.model_id == model_id
-                and header.version == model_version_to_use_incompatible_with_sagemaker
-            ]
-            if len(sm_version_to_use_list) != 1:
+            sm_version_to_use = manifest_index.min_sagemaker_version(
+                model_id, model_version_to_use_incompatible_with_sagemaker
+            )
+            if sm_version_to_use is None:
                 # ``manifest`` dict should already enforce this
-                raise RuntimeError("Found more than one incompatible SageMaker version to use.")
-            sm_version_to_use = sm_version_to_use_list[0]
+                raise RuntimeError("Found no incompatible SageMaker version to use.")
 
             error_msg = (
                 f"Unable to find model manifest for '{model_id}' with version '{version}' "
@@ -232,12 +284,28 @@ class JumpStartModelsCache:
             )
 
         else:
-            possible_model_ids = [header.model_id for header in manifest.values()]  # type: ignore
-            closest_model_id = get_close_matches(model_id, possible_model_ids, n=1, cutoff=0)[0]
+            closest_model_id = get_close_matches(
+                model_id, manifest_index.model_ids, n=1, cutoff=0
+            )[0]
             error_msg += f"Did you mean to use model ID '{closest_model_id}'?"
 
         raise KeyError(error_msg)
 
+    def _get_manifest_index(
+        self, manifest: Dict[JumpStartVersionedModelId, JumpStartModelHeader]
+    ) -> _ManifestIndex:
+        """Return the index of the manifest, which is built again when the manifest is refreshed.
+
+        Args:
+            manifest (Dict[JumpStartVersionedModelId, JumpStartModelHeader]): The formatted
+                manifest in the s3 cache.
+        """
+        manifest_index = self._manifest_index
+        if manifest_index is None or manifest_index[0] is not manifest:
+            manifest_index = (manifest, _ManifestIndex(manifest))
+            self._manifest_index = manifest_index
+        return manifest_index[1]
+
     def _get_json_file_and_etag_from_s3(self, key: str) -> Tuple[Union[dict, list], str]:
         """Returns json file from s3, along with its etag."""
         response = self._s3_client.get_object(Bucket=self.s3_bucket_name, Key=key)
@@ -364,21 +432,31 @@ class JumpStartModelsCache:
         Args:
             semantic_version_str (str): the semantic version for which to filter
                 available versions.
-            available_versions (List[Version]): list of available versions.
+            available_versions (List[Version]): sorted list of available versions.
         """
         if semantic_version_str == "*":
             if len(available_versions) == 0:
                 return None
-            return str(max(available_versions))
+            return str(available_versions[-1])
 
         try:
             spec = SpecifierSet(f"=={semantic_version_str}")
         except InvalidSpecifier:
             raise KeyError(f"Bad semantic version: {semantic_version_str}")
+
+        try:
+            version = Version(semantic_version_str)
+        except InvalidVersion:
+            # Wildcard versions, such as ``1.*``, are matched against every available version.
+            version = None
+        if version is not None:
+            # Only the versions equal to an exact version can match it.
+            start = bisect.bisect_left(available_versions, version)
+            end = bisect.bisect_right(available_versions, version, lo=start)
+            available_versions = available_versions[start:end]
+
         available_versions_filtered = list(spec.filter(available_versions))
-        return (
-            str(max(available_versions_filtered)) if available_versions_filtered != [] else None
-        )
+        return str(available_versions_filtered[-1]) if available_versions_filtered != [] else None
 
     def _get_header_impl(
         self,
@@ -431,4 +509,5 @@ class JumpStartModelsCache:
     def clear(self) -> None:
         """Clears the model ID/version and s3 cache."""
         self._s3_cache.clear()
+        self._manifest_index = None
         self._model_id_semantic_version_manifest_key_cache.clear()
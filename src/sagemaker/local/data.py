@@ -13,9 +13,10 @@
 """Placeholder docstring"""
 from __future__ import absolute_import
 
+import contextlib
+import mmap
 import os
 import platform
-import sys
 import tempfile
 from abc import ABCMeta
 from abc import abstractmethod
@@ -216,6 +217,22 @@ class Splitter(with_metaclass(ABCMeta, object)):
             generator for the individual records that were split from the file
         """
 
+    def split_spans(self, buffer):  # pylint: disable=unused-argument
+        """Find the records of the content of a file, without copying them.
+
+        Batch strategies send the records that are contiguous in a file with a single copy
+        of their bytes, when the splitter can find them in the content of the file.
+
+        Args:
+            buffer (bytes-like object): content of the file to split, such as a
+                memory-mapped file.
+
+        Returns:
+            iterable of the (start, end) offsets of the individual records within the
+            buffer, or None if the splitter only splits files with ``split``.
+        """
+        return None
+
 
 class NoneSplitter(Splitter):
     """Does not split records, essentially reads the whole file."""
@@ -254,6 +271,17 @@ class NoneSplitter(Splitter):
         """
         return bool(buf.translate(None, self._textchars))
 
+    def split_spans(self, buffer):
+        """Find the records of the content of a file, which is a single record.
+
+        Args:
+            buffer (bytes-like object): content of the file to split.
+
+        Returns:
+            list of the (start, end) offsets of the content, if it is not empty.
+        """
+        return [(0, len(buffer))] if buffer else []
+
 
 class LineSplitter(Splitter):
     """Split records by new line."""
@@ -273,6 +301,22 @@ class LineSplitter(Splitter):
             for line in f:
                 yield line
 
+    def split_spans(self, buffer):
+        """Find the lines of the content of a file, including their line breaks.
+
+        Args:
+            buffer (bytes-like object): content of the file to split.
+
+        Returns:
+            generator of the (start, end) offsets of the individual lines.
+        """
+        start, size = 0, len(buffer)
+        while start < size:
+            end = buffer.find(b"\n", start)
+            end = size if end == -1 else end + 1
+            yield start, end
+            start = end
+
 
 class RecordIOSplitter(Splitter):
     """Split using Amazon Recordio.
@@ -296,6 +340,22 @@ class RecordIOSplitter(Splitter):
             for record in sagemaker.amazon.common.read_recordio(f):
                 yield record
 
+    def split_spans(self, buffer):
+        """Find the RecordIO records of the content of a file, including their headers.
+
+        Batches of records are sent as RecordIO encoded records, so that the serving
+        container can split them.
+
+        Args:
+            buffer (bytes-like object): content of the file to split.
+
+        Returns:
+            iterable of the (start, end) offsets of the individual records.
+        """
+        offsets, lengths = sagemaker.amazon.common._index_recordio(buffer)
+        ends = offsets + (((lengths + 3) >> 2) << 2)
+        return zip((offsets - 8).tolist(), ends.clip(max=len(buffer)).tolist())
+
 
 class BatchStrategy(with_metaclass(ABCMeta, object)):
     """Placeholder docstring"""
@@ -332,24 +392,38 @@ class MultiRecordStrategy(BatchStrategy):
     def pad(self, file, size=6):
         """Group together as many records as possible to fit in the specified size.
 
+        With the splitters of this module, the file is memory-mapped, and each group is a
+        single copy of the bytes of contiguous records. Otherwise, the records returned by
+        the ``split`` method of the splitter are joined.
+
         Args:
             file (str): file path to read the records from.
             size (int): maximum size in MB that each group of records will be
                 fitted to. passing 0 means unlimited size.
 
         Returns:
-            generator of records
+            generator of records: the bytes of each group, sliced from the memory-mapped
+                file, or the records of ``split`` joined as str or bytes otherwise.
         """
-        buffer = ""
+        if isinstance(self.splitter, Splitter):
+            with _mmap_file(file) as buffer:
+                spans = self.splitter.split_spans(buffer)
+                if spans is not None:
+                    for start, end in _group_spans(spans, size):
+                        yield buffer[start:end]
+                    return
+
+        records, records_size = [], 0
         for element in self.splitter.split(file):
-            if _payload_size_within_limit(buffer + element, size):
-                buffer += element
-            else:
-                tmp = buffer
-                buffer = element
-                yield tmp
-        if _validate_payload_size(buffer, size):
-            yield buffer
+            element_size = _payload_size(element)
+            if records and not _payload_size_within_limit(records_size + element_size, size):
+                yield records[0][:0].join(records)
+                records, records_size = [], 0
+            _validate_payload_size(element_size, size)
+            records.append(element)
+            records_size += element_size
+        if records:
+            yield records[0][:0].join(records)
 
 
 class SingleRecordStrategy(BatchStrategy):
@@ -378,12 +452,54 @@ class SingleRecordStrategy(BatchStrategy):
                 yield element
 
 
+@contextlib.contextmanager
+def _mmap_file(path):
+    """Memory-map a file for reading, or read it if it is empty, as it can not be mapped."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield buffer
+
+
+def _group_spans(spans, size):
+    """Group contiguous records to fit in the size in MB threshold.
+
+    Args:
+        spans: the (start, end) offsets of contiguous records.
+        size (int): max size in MB. 0 means unlimited size.
+
+    Returns:
+        generator of the (start, end) offsets of the groups of records.
+    """
+    group_start = group_end = None
+    for start, end in spans:
+        if group_start is not None and not _payload_size_within_limit(end - group_start, size):
+            yield group_start, group_end
+            group_start = None
+        _validate_payload_size(end - start, size)
+        if group_start is None:
+            group_start = start
+        group_end = end
+    if group_start is not None:
+        yield group_start, group_end
+
+
+def _payload_size(payload):
+    """Return the size in bytes of a payload, encoding strings as the requests do."""
+    if isinstance(payload, str):
+        return len(payload.encode("utf-8"))
+    return len(payload)
+
+
 def _payload_size_within_limit(payload, size):
-    """Placeholder docstring."""
-    size_in_bytes = size * 1024 * 1024
+    """Check if a payload, or a size in bytes, is within the size in MB threshold."""
     if size == 0:
         return True
-    return sys.getsizeof(payload) < size_in_bytes
+    if not isinstance(payload, int):
+        payload = _payload_size(payload)
+    return payload <= size * 1024 * 1024
 
 
 def _validate_payload_size(payload, size):
@@ -392,7 +508,7 @@ def _validate_payload_size(payload, size):
     Raise an exception if the payload is beyond the size in MB threshold.
 
     Args:
-        payload: data that will be checked
+        payload: data that will be checked, or its size in bytes
         size (int): max size in MB
 
     Returns:
@@ -13,6 +13,7 @@
 """Placeholder docstring"""
 from __future__ import absolute_import
 
+import collections
 import enum
 import datetime
 import json
@@ -20,6 +21,7 @@ import logging
 import os
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from uuid import uuid4
 from copy import deepcopy
 from botocore.exceptions import ClientError
@@ -283,6 +285,7 @@ class _LocalTransformJob(object):
         self.start_time = None
         self.end_time = None
         self.batch_strategy = None
+        self.max_concurrent_transforms = None
         self.transform_resources = None
         self.input_data = None
         self.output_data = None
@@ -325,8 +328,7 @@ class _LocalTransformJob(object):
         response, code = _perform_request(endpoint_url)
         if code == 200:
             execution_parameters = json.loads(response.data.decode("utf-8"))
-            # MaxConcurrentTransforms is ignored because we currently only support 1
-            for setting in ("BatchStrategy", "MaxPayloadInMB"):
+            for setting in ("BatchStrategy", "MaxPayloadInMB", "MaxConcurrentTransforms"):
                 if setting not in kwargs and setting in execution_parameters:
                     kwargs[setting] = execution_parameters[setting]
 
@@ -335,6 +337,7 @@ class _LocalTransformJob(object):
 
         self.start_time = datetime.datetime.now()
         self.batch_strategy = kwargs["BatchStrategy"]
+        self.max_concurrent_transforms = int(kwargs["MaxConcurrentTransforms"])
         if "Environment" in kwargs:
             self.environment = kwargs["Environment"]
 
@@ -362,6 +365,7 @@ class _LocalTransformJob(object):
             "TransformStartTime": self.start_time,
             "Environment": {},
             "BatchStrategy": self.batch_strategy,
+            "MaxConcurrentTransforms": self.max_concurrent_transforms,
         }
 
         if self.transform_resources:
@@ -404,13 +408,9 @@ class _LocalTransformJob(object):
                 raise ValueError("Invalid BatchStrategy, must be 'SingleRecord' or 'MultiRecord'")
             environment["SAGEMAKER_BATCH_STRATEGY"] = strategy_env_value
 
-        # we only do 1 max concurrent transform in Local Mode
-        if "MaxConcurrentTransforms" in kwargs and int(kwargs["MaxConcurrentTransforms"]) > 1:
-            logger.warning(
-                "Local Mode only supports 1 ConcurrentTransform. Setting MaxConcurrentTransforms "
-                "to 1"
-            )
-        environment["SAGEMAKER_MAX_CONCURRENT_TRANSFORMS"] = "1"
+        environment["SAGEMAKER_MAX_CONCURRENT_TRANSFORMS"] = str(
+            kwargs.get("MaxConcurrentTransforms", 1)
+        )
 
         # if there were environment variables passed to the Transformer we will pass them to the
         # container as well.
@@ -436,6 +436,9 @@ class _LocalTransformJob(object):
         if "MaxPayloadInMB" not in kwargs:
             defaults["MaxPayloadInMB"] = 6
 
+        if "MaxConcurrentTransforms" not in kwargs:
+            defaults["MaxConcurrentTransforms"] = 1
+
         return defaults
 
     def _get_working_directory(self):
@@ -477,6 +480,10 @@ class _LocalTransformJob(object):
         (Line, RecordIO, None), and finally, it batch them according to the batch
         strategy and limit the request size.
 
+        Up to ``MaxConcurrentTransforms`` requests are sent to the container concurrently,
+        while the next batches are read and the responses of the previous ones are written,
+        in order, to the output files.
+
         Args:
             input_data: Input data source.
             output_data: Output data source.
@@ -484,38 +491,111 @@ class _LocalTransformJob(object):
         """
         batch_strategy = kwargs["BatchStrategy"]
         max_payload = int(kwargs["MaxPayloadInMB"])
+        # A MaxConcurrentTransforms of 0 lets the service choose, which is one request at a time.
+        max_concurrent_transforms = max(1, int(kwargs.get("MaxConcurrentTransforms", 1)))
         data_source, batch_provider = self._prepare_data_transformation(input_data, batch_strategy)
 
         # Output settings
         accept = output_data["Accept"] if "Accept" in output_data else None
+        assemble_with_line = output_data.get("AssembleWith") == "Line"
 
         working_dir = self._get_working_directory()
         dataset_dir = data_source.get_root_dir()
 
-        for fn in data_source.get_file_list():
-
-            relative_path = os.path.dirname(os.path.relpath(fn, dataset_dir))
-            filename = os.path.basename(fn)
-            copy_directory_structure(working_dir, relative_path)
-            destination_path = os.path.join(working_dir, relative_path, filename + ".out")
-
-            with open(destination_path, "wb") as f:
-                for item in batch_provider.pad(fn, max_payload):
-                    # call the container and add the result to inference.
-                    response = self.local_session.sagemaker_runtime_client.invoke_endpoint(
-                        item, "", input_data["ContentType"], accept
-                    )
+        # Requests in flight and responses to write, in the order of the input batches. A None
+        # request marks the end of an output file.
+        pending = collections.deque()
+        output_files = []
 
-                    response_body = response["Body"]
-                    data = response_body.read()
-                    response_body.close()
-                    f.write(data)
-                    if "AssembleWith" in output_data and output_data["AssembleWith"] == "Line":
-                        f.write(b"\n")
+        def write_next_response():
+            output_file, request = pending.popleft()
+            if request is None:
+                output_file.close()
+            else:
+                output_file.write(request.result(), assemble_with_line)
+
+        self.local_session.sagemaker_runtime_client.set_max_connections(max_concurrent_transforms)
+        try:
+            with ThreadPoolExecutor(max_workers=max_concurrent_transforms) as executor:
+                for fn in data_source.get_file_list():
+                    relative_path = os.path.dirname(os.path.relpath(fn, dataset_dir))
+                    filename = os.path.basename(fn)
+                    copy_directory_structure(working_dir, relative_path)
+                    destination_path = os.path.join(working_dir, relative_path, filename + ".out")
+
+                    output_file = _LocalTransformOutputFile(fn, destination_path)
+                    output_files.append(output_file)
+                    for item in batch_provider.pad(fn, max_payload):
+                        output_file.add_request(item)
+                        request = executor.submit(
+                            self._invoke_container, item, input_data["ContentType"], accept
+                        )
+                        pending.append((output_file, request))
+                        while len(pending) > 2 * max_concurrent_transforms:
+                            write_next_response()
+                    pending.append((output_file, None))
+
+                while pending:
+                    write_next_response()
+        finally:
+            for output_file in output_files:
+                output_file.close()
 
         move_to_destination(working_dir, output_data["S3OutputPath"], self.name, self.local_session)
         self.container.stop_serving()
 
+    def _invoke_container(self, body, content_type, accept):
+        """Send a batch to the serving container, and return the response body."""
+        response = self.local_session.sagemaker_runtime_client.invoke_endpoint(
+            body, "", content_type, accept
+        )
+        response_body = response["Body"]
+        data = response_body.read()
+        response_body.close()
+        return data
+
+
+class _LocalTransformOutputFile(object):
+    """The output file of an input file of a local transform job, and its throughput."""
+
+    def __init__(self, input_path, output_path):
+        """Open the output file of an input file."""
+        self.input_path = input_path
+        self.file = open(output_path, "wb")
+        self.requests = 0
+        self.input_bytes = 0
+        self.output_bytes = 0
+        self.start_time = time.time()
+
+    def add_request(self, body):
+        """Count a request sent for the input file."""
+        self.requests += 1
+        self.input_bytes += len(body)
+
+    def write(self, data, assemble_with_line):
+        """Write the response of a request to the output file."""
+        self.file.write(data)
+        if assemble_with_line:
+            self.file.write(b"\n")
+        self.output_bytes += len(data)
+
+    def close(self):
+        """Close the output file, and log the throughput of its input file."""
+        if self.file.closed:
+            return
+        self.file.close()
+        seconds = time.time() - self.start_time
+        logger.info(
+            "Transformed %s with %d requests in %.2f seconds: %.2f MB in, %.2f MB out, "
+            "%.2f MB/s",
+            self.input_path,
+            self.requests,
+            seconds,
+            self.input_bytes / 1e6,
+            self.output_bytes / 1e6,
+            self.input_bytes / 1e6 / max(seconds, 1e-6),
+        )
+
 
 class _LocalModel(object):
     """Placeholder docstring"""
@@ -638,12 +718,14 @@ class _LocalPipeline(object):
         pipeline,
         pipeline_description=None,
         local_session=None,
+        parallelism_config=None,
     ):
         from sagemaker.local import LocalSession
 
         self.local_session = local_session or LocalSession()
         self.pipeline = pipeline
         self.pipeline_description = pipeline_description
+        self.parallelism_config = parallelism_config
         self.creation_time = datetime.datetime.now().timestamp()
         self.last_modified_time = self.creation_time
 
@@ -666,6 +748,8 @@ class _LocalPipeline(object):
         from sagemaker.local.pipeline import LocalPipelineExecutor
 
         execution_id = str(uuid4())
+        if kwargs.get("ParallelismConfiguration") is None:
+            kwargs["ParallelismConfiguration"] = self.parallelism_config
         execution = _LocalPipelineExecution(execution_id, self.pipeline, **kwargs)
 
         self._executions[execution_id] = execution
@@ -687,6 +771,7 @@ class _LocalPipelineExecution(object):
         PipelineParameters=None,
         PipelineExecutionDescription=None,
         PipelineExecutionDisplayName=None,
+        ParallelismConfiguration=None,
     ):
         from sagemaker.workflow.pipeline import PipelineGraph
 
@@ -702,6 +787,9 @@ class _LocalPipelineExecution(object):
         self.pipeline_dag = PipelineGraph.from_pipeline(self.pipeline)
         self._initialize_step_execution(self.pipeline_dag.step_map.values())
         self.pipeline_parameters = self._initialize_and_validate_parameters(PipelineParameters)
+        self.max_parallel_execution_steps = _get_max_parallel_execution_steps(
+            ParallelismConfiguration
+        )
         self._blocked_steps = {}
 
     def describe(self):
@@ -755,6 +843,16 @@ class _LocalPipelineExecution(object):
         print(f"Pipeline step '{step_name}' FAILED. Failure message is: {failure_message}")
         self.step_execution.get(step_name).update_step_failure(failure_message)
 
+    def update_step_cache_hit(self, step_name, step_properties, source_execution_arn):
+        """Update pipeline step execution output properties reused from a previous execution."""
+        self.step_execution.get(step_name).update_step_cache_hit(
+            step_properties, source_execution_arn
+        )
+        print(
+            f"Pipeline step '{step_name}' SUCCEEDED with the cached results of pipeline "
+            f"execution {source_execution_arn}."
+        )
+
     def mark_step_executing(self, step_name):
         """Update pipelines step's status to EXECUTING and start_time to now."""
         print(f"Starting pipeline step: '{step_name}'")
@@ -835,6 +933,7 @@ class _LocalPipelineExecutionStep(object):
         status=None,
         properties=None,
         failure_reason=None,
+        cache_hit_result=None,
     ):
         from sagemaker.workflow.steps import StepTypeEnum
 
@@ -847,6 +946,7 @@ class _LocalPipelineExecutionStep(object):
         self.properties = properties or {}
         self.start_time = start_time
         self.end_time = end_time
+        self.cache_hit_result = cache_hit_result
         self._step_type_to_output_format_map = {
             StepTypeEnum.TRAINING: self._construct_training_metadata,
             StepTypeEnum.PROCESSING: self._construct_processing_metadata,
@@ -862,6 +962,11 @@ class _LocalPipelineExecutionStep(object):
         self.status = _LocalExecutionStatus.SUCCEEDED.value
         self.end_time = datetime.datetime.now().timestamp()
 
+    def update_step_cache_hit(self, properties, source_execution_arn):
+        """Update pipeline step execution output properties reused from a previous execution."""
+        self.update_step_properties(properties)
+        self.cache_hit_result = {"SourcePipelineExecutionArn": source_execution_arn}
+
     def update_step_failure(self, failure_message):
         """Update pipeline step execution failure status and message."""
         self.failure_reason = failure_message
@@ -886,6 +991,8 @@ class _LocalPipelineExecutionStep(object):
             "StepName": self.name,
             "StepStatus": self.status,
         }
+        if self.cache_hit_result:
+            response["CacheHitResult"] = self.cache_hit_result
         filtered_response = {k: v for k, v in response.items() if v is not None}
         return filtered_response
 
@@ -928,6 +1035,20 @@ class _LocalExecutionStatus(enum.Enum):
     FAILED = "Failed"
 
 
+def _get_max_parallel_execution_steps(parallelism_config):
+    """Return the maximum number of steps of a local pipeline execution to run concurrently.
+
+    Args:
+        parallelism_config (Union[dict, ParallelismConfiguration]): The parallelism configuration
+            of the pipeline or of the execution, if any. Without one, steps run one at a time.
+    """
+    if parallelism_config is None:
+        return 1
+    if isinstance(parallelism_config, dict):
+        return int(parallelism_config["MaxParallelExecutionSteps"])
+    return int(parallelism_config.max_parallel_execution_steps)
+
+
 def _wait_for_serving_container(serving_port):
     """Placeholder docstring."""
     i = 0
@@ -428,6 +428,7 @@ class LocalSagemakerClient(object):  # pylint: disable=too-many-public-methods
             pipeline=pipeline,
             pipeline_description=pipeline_description,
             local_session=self.sagemaker_session,
+            parallelism_config=kwargs.get("ParallelismConfiguration"),
         )
         LocalSagemakerClient._pipelines[pipeline.name] = local_pipeline
         return {"PipelineArn": pipeline.name}
@@ -455,6 +456,10 @@ class LocalSagemakerClient(object):  # pylint: disable=too-many-public-methods
             raise ClientError(error_response, "update_pipeline")
         LocalSagemakerClient._pipelines[pipeline.name].pipeline_description = pipeline_description
         LocalSagemakerClient._pipelines[pipeline.name].pipeline = pipeline
+        if kwargs.get("ParallelismConfiguration") is not None:
+            LocalSagemakerClient._pipelines[pipeline.name].parallelism_config = kwargs[
+                "ParallelismConfiguration"
+            ]
         LocalSagemakerClient._pipelines[
             pipeline.name
         ].last_modified_time = datetime.now().timestamp()
@@ -503,8 +508,6 @@ class LocalSagemakerClient(object):  # pylint: disable=too-many-public-methods
         Returns: _LocalPipelineExecution object
 
         """
-        if "ParallelismConfiguration" in kwargs:
-            logger.warning("Parallelism configuration is not supported in local mode.")
         if "SelectiveExecutionConfig" in kwargs:
             raise ValueError("SelectiveExecutionConfig is not supported in local mode.")
         if PipelineName not in LocalSagemakerClient._pipelines:
@@ -539,6 +542,21 @@ class LocalSagemakerRuntimeClient(object):
         self.config = config
         self.serving_port = get_config_value("local.serving_port", config) or 8080
 
+    def set_max_connections(self, max_connections):
+        """Keep the connections of up to ``max_connections`` concurrent requests open.
+
+        Args:
+            max_connections (int): The maximum number of concurrent requests to the serving
+                container, such as the ``MaxConcurrentTransforms`` of a local transform job.
+                At least one connection is kept open.
+        """
+        import urllib3
+
+        max_connections = max(1, max_connections)
+        if self.http.connection_pool_kw.get("maxsize", 1) != max_connections:
+            self.http.clear()
+            self.http = urllib3.PoolManager(maxsize=max_connections)
+
     def invoke_endpoint(
         self,
         Body,
@@ -14,9 +14,15 @@
 from __future__ import absolute_import
 from abc import ABC, abstractmethod
 
+import collections
+import hashlib
 import json
+import logging
+import os
+import re
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from copy import deepcopy
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, List, Union
 from botocore.exceptions import ClientError
 
@@ -31,9 +37,10 @@ from sagemaker.workflow.execution_variables import ExecutionVariable, ExecutionV
 from sagemaker.workflow.pipeline import PipelineGraph
 from sagemaker.local.exceptions import StepExecutionException
 from sagemaker.local.utils import get_using_dot_notation
-from sagemaker.utils import unique_name_from_base
+from sagemaker.utils import get_config_value, unique_name_from_base
 from sagemaker.s3 import parse_s3_url, s3_path_join
 
+logger = logging.getLogger(__name__)
 
 PRIMITIVES = (str, int, bool, float)
 BINARY_CONDITION_TYPES = (
@@ -43,6 +50,19 @@ BINARY_CONDITION_TYPES = (
     ConditionTypeEnum.LT.value,
     ConditionTypeEnum.LTE.value,
 )
+DEFAULT_STEP_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".sagemaker", "local_pipeline_cache")
+# Step arguments holding the locations that a step writes to, rather than reads from.
+OUTPUT_ARGUMENTS = (
+    "CheckpointConfig",
+    "DebugHookConfig",
+    "DebugRuleConfigurations",
+    "OutputDataConfig",
+    "ProcessingOutputConfig",
+    "ProfilerConfig",
+    "ProfilerRuleConfigurations",
+    "TensorBoardOutputConfig",
+    "TransformOutput",
+)
 
 
 class LocalPipelineExecutor(object):
@@ -61,24 +81,103 @@ class LocalPipelineExecutor(object):
         self.local_sagemaker_client = self.sagemaker_session.sagemaker_client
         self._blocked_steps = set()
         self._step_executor_factory = _StepExecutorFactory(self)
+        self._step_cache = _StepCache(self)
 
     def execute(self):
-        """Execute a local pipeline."""
+        """Execute a local pipeline.
+
+        Steps run one at a time in topological order, unless the ``ParallelismConfiguration``
+        of the execution allows several steps to run concurrently, in which case each step is
+        started as soon as the steps it depends on have completed.
+        """
         try:
-            for step in self.pipeline_dag:
-                if step.name not in self._blocked_steps:
-                    self._execute_step(step)
+            if self.execution.max_parallel_execution_steps > 1:
+                self._execute_concurrently(self.execution.max_parallel_execution_steps)
+            else:
+                for step in self.pipeline_dag:
+                    if step.name not in self._blocked_steps:
+                        self._execute_step(step)
         except StepExecutionException as e:
             self.execution.update_execution_failure(e.step_name, e.message)
         else:
             self.execution.update_execution_success()
         return self.execution
 
+    def _execute_concurrently(self, max_parallel_execution_steps):
+        """Execute the steps of the pipeline, running up to a number of ready steps at once.
+
+        Once a step fails, no other step is started, and the failure is raised after the running
+        steps have completed.
+
+        Raises:
+            StepExecutionException: If a step fails.
+        """
+        adjacency_list = self.pipeline_dag.adjacency_list
+        dependencies_left = {step_name: 0 for step_name in adjacency_list}
+        for child_steps in adjacency_list.values():
+            for child_step in child_steps:
+                dependencies_left[child_step] += 1
+        # Ready steps are started in topological order, so that runs are reproducible.
+        order = {step.name: index for index, step in enumerate(self.pipeline_dag)}
+        ready_steps = sorted(
+            (name for name, count in dependencies_left.items() if count == 0), key=order.get
+        )
+        ready_steps = collections.deque(ready_steps)
+        running_steps = {}
+        failure = None
+
+        def complete(step_name):
+            for child_step in sorted(adjacency_list[step_name], key=order.get):
+                dependencies_left[child_step] -= 1
+                if dependencies_left[child_step] == 0:
+                    ready_steps.append(child_step)
+
+        with ThreadPoolExecutor(max_workers=max_parallel_execution_steps) as executor:
+            while running_steps or (ready_steps and failure is None):
+                while (
+                    ready_steps
+                    and failure is None
+                    and len(running_steps) < max_parallel_execution_steps
+                ):
+                    step_name = ready_steps.popleft()
+                    # Steps are blocked by the condition steps they depend on, which complete
+                    # before the steps are ready.
+                    if step_name in self._blocked_steps:
+                        complete(step_name)
+                        continue
+                    step = self.pipeline_dag.step_map[step_name]
+                    running_steps[executor.submit(self._execute_step, step)] = step_name
+                if not running_steps:
+                    continue
+                done, _ = wait(running_steps, return_when=FIRST_COMPLETED)
+                for future in done:
+                    step_name = running_steps.pop(future)
+                    try:
+                        future.result()
+                    except StepExecutionException as e:
+                        failure = failure or e
+                    else:
+                        complete(step_name)
+        if failure is not None:
+            raise failure
+
     def _execute_step(self, step):
-        """Execute a local pipeline step."""
+        """Execute a local pipeline step, or reuse its cached properties if caching is enabled."""
         self.execution.mark_step_executing(step.name)
+        cache_key = self._step_cache.key(step)
+        try:
+            cache_entry = self._step_cache.get(step, cache_key) if cache_key else None
+        except ValueError as e:
+            self.execution.update_step_failure(step.name, str(e))
+        if cache_entry is not None:
+            self.execution.update_step_cache_hit(
+                step.name, cache_entry["Properties"], cache_entry["PipelineExecutionArn"]
+            )
+            return
         step_properties = self._step_executor_factory.get(step).execute()
         self.execution.update_step_properties(step.name, step_properties)
+        if cache_key:
+            self._step_cache.put(step, cache_key, step_properties)
 
     def evaluate_step_arguments(self, step):
         """Parses and evaluate step arguments."""
@@ -204,6 +303,165 @@ class LocalPipelineExecutor(object):
             )
 
 
+class _StepCache(object):
+    """A local cache of the properties of the steps that have caching enabled.
+
+    The entries are kept in the ``local.pipeline_cache_dir`` directory of the local mode
+    configuration, or ``~/.sagemaker/local_pipeline_cache``, one JSON file per pipeline, step and
+    key. The key of a step hashes its type, its evaluated arguments, and fingerprints of the
+    ``file://`` and ``s3://`` inputs these arguments refer to, so that the step runs again when
+    its arguments or the contents of its inputs change. An entry is reused until the
+    ``expire_after`` duration of the ``CacheConfig`` of the step has elapsed.
+    """
+
+    def __init__(self, pipeline_executor: LocalPipelineExecutor):
+        self.pipeline_executor = pipeline_executor
+        self.cache_dir = (
+            get_config_value("local.pipeline_cache_dir", pipeline_executor.sagemaker_session.config)
+            or DEFAULT_STEP_CACHE_DIR
+        )
+
+    def key(self, step: Step):
+        """Return the cache key of a step, or None if caching is not enabled for the step."""
+        cache_config = getattr(step, "cache_config", None)
+        if cache_config is None or not cache_config.enable_caching:
+            return None
+        step_arguments = self.pipeline_executor.evaluate_step_arguments(step)
+        try:
+            fingerprints = {
+                uri: self._fingerprint(uri) for uri in sorted(set(_input_uris(step_arguments)))
+            }
+        except Exception as e:  # pylint: disable=W0703
+            logger.warning("Not caching step '%s': cannot fingerprint its inputs: %s", step.name, e)
+            return None
+        content = json.dumps(
+            [step.step_type.value, step_arguments, fingerprints], sort_keys=True, default=str
+        )
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def get(self, step: Step, key: str):
+        """Return the unexpired cache entry of a step, if any.
+
+        Raises:
+            ValueError: If the ``expire_after`` duration of the step is not an ISO 8601 duration.
+        """
+        expire_after = step.cache_config.expire_after
+        max_age = _parse_duration(expire_after) if expire_after is not None else None
+        try:
+            with open(self._path(step, key), "r") as f:
+                entry = json.load(f, object_hook=_decode_datetime)
+        except (OSError, ValueError):
+            return None
+        if max_age is not None:
+            expiry = datetime.fromtimestamp(entry["CreationTime"]) + max_age
+            if expiry < datetime.now():
+                return None
+        logger.info(
+            "Reusing the cached properties of step '%s' from pipeline execution %s.",
+            step.name,
+            entry["PipelineExecutionArn"],
+        )
+        return entry
+
+    def put(self, step: Step, key: str, properties: Dict):
+        """Record the properties of a step that succeeded."""
+        entry = {
+            "CreationTime": datetime.now().timestamp(),
+            "PipelineExecutionArn": self.pipeline_executor.execution.pipeline_execution_name,
+            "Properties": properties,
+        }
+        path = self._path(step, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Entries are replaced atomically, so that a concurrent read never sees a partial entry.
+        temporary_path = "{}.{}.tmp".format(path, os.getpid())
+        with open(temporary_path, "w") as f:
+            json.dump(entry, f, default=_encode_datetime)
+        os.replace(temporary_path, path)
+
+    def _path(self, step: Step, key: str):
+        """Return the path of the cache entry of a step."""
+        pipeline_name = self.pipeline_executor.execution.pipeline.name
+        return os.path.join(self.cache_dir, pipeline_name, step.name, key + ".json")
+
+    def _fingerprint(self, uri: str):
+        """Return the names, sizes and versions of the files or objects under a URI."""
+        if uri.startswith("file://"):
+            path = uri[len("file://") :]
+            if os.path.isfile(path):
+                return [["", os.path.getsize(path), os.stat(path).st_mtime_ns]]
+            fingerprint = []
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    file_path = os.path.join(root, name)
+                    stat = os.stat(file_path)
+                    fingerprint.append(
+                        [os.path.relpath(file_path, path), stat.st_size, stat.st_mtime_ns]
+                    )
+            return fingerprint
+        sagemaker_session = self.pipeline_executor.sagemaker_session
+        s3 = sagemaker_session.s3_client or sagemaker_session.boto_session.client("s3")
+        bucket, prefix = parse_s3_url(uri)
+        fingerprint = []
+        for page in s3.get_paginator("list_objects_v2").paginate(Bucket=bucket, Prefix=prefix):
+            for s3_object in page.get("Contents", []):
+                fingerprint.append([s3_object["Key"], s3_object["Size"], s3_object["ETag"]])
+        return fingerprint
+
+
+def _input_uris(obj):
+    """Yield the ``file://`` and ``s3://`` URIs of evaluated step arguments, except outputs."""
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            if k not in OUTPUT_ARGUMENTS:
+                yield from _input_uris(v)
+    elif isinstance(obj, list):
+        for item in obj:
+            yield from _input_uris(item)
+    elif isinstance(obj, str):
+        # Hyperparameters are JSON encoded, so URIs among them are quoted.
+        uri = obj.strip('"')
+        if uri.startswith(("file://", "s3://")):
+            yield uri
+
+
+def _parse_duration(duration: str) -> timedelta:
+    """Parse an ISO 8601 duration, such as ``P30D``, ``P4DT12H`` or ``T12H``.
+
+    Years and months are counted as 365 and 30 days.
+    """
+    match = re.fullmatch(
+        r"P?(?:(\d+)Y)?(?:(\d+)M)?(?:(\d+)W)?(?:(\d+)D)?"
+        r"(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+(?:\.\d+)?)S)?)?",
+        duration.upper(),
+    )
+    if not match or not any(match.groups()):
+        raise ValueError(f"Invalid ISO 8601 duration '{duration}' in CacheConfig.")
+    years, months, weeks, days, hours, minutes, seconds = (
+        float(group or 0) for group in match.groups()
+    )
+    return timedelta(
+        days=years * 365 + months * 30 + weeks * 7 + days,
+        hours=hours,
+        minutes=minutes,
+        seconds=seconds,
+    )
+
+
+def _encode_datetime(obj):
+    """Encode the datetimes of step properties as JSON."""
+    if isinstance(obj, datetime):
+        return {"__datetime__": obj.isoformat()}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _decode_datetime(obj):
+    """Decode the datetimes of step properties from JSON."""
+    if set(obj) == {"__datetime__"}:
+        return datetime.fromisoformat(obj["__datetime__"])
+    return obj
+
+
 class _StepExecutor(ABC):
     """An abstract base class for step executors running steps locally"""
 
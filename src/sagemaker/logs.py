@@ -13,10 +13,15 @@
 """Placeholder docstring"""
 from __future__ import absolute_import
 
+import asyncio
 import collections
 import functools
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from botocore.exceptions import ClientError
 
 ##############################################################################
 #
@@ -179,3 +184,237 @@ def log_stream(client, log_group, stream_name, start_time=0, skip=0):
             events = []
         for ev in events:
             yield ev
+
+
+##############################################################################
+#
+# Support for following the logs of many jobs at once
+#
+##############################################################################
+
+# The SageMaker Describe API, name argument and status key of each job type with a log group.
+_JOB_DESCRIBE_APIS = {
+    "Training": ("describe_training_job", "TrainingJobName", "TrainingJobStatus"),
+    "Processing": ("describe_processing_job", "ProcessingJobName", "ProcessingJobStatus"),
+    "Transform": ("describe_transform_job", "TransformJobName", "TransformJobStatus"),
+}
+_TERMINAL_JOB_STATUSES = ("Completed", "Failed", "Stopped")
+
+
+class AsyncRateLimiter(object):
+    """Spaces out the requests of coroutines, so that they are made at a maximum rate."""
+
+    def __init__(self, rate):
+        """Initialize an ``AsyncRateLimiter`` instance.
+
+        Args:
+            rate (float): The maximum number of requests per second.
+        """
+        self._interval = 1.0 / rate
+        self._next_request = 0.0
+
+    async def acquire(self):
+        """Waits until a request can be made."""
+        now = time.monotonic()
+        wait = self._next_request - now
+        self._next_request = max(now, self._next_request) + self._interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class _JobLogPosition(object):
+    """The position of a follower in the log events of a job."""
+
+    def __init__(self):
+        """Starts before the first event of the job."""
+        self.start_time = 0
+        self.seen_event_ids = {}
+
+    def add(self, event):
+        """Records an event, and returns False if it was already seen."""
+        if event["eventId"] in self.seen_event_ids:
+            return False
+        self.seen_event_ids[event["eventId"]] = event["timestamp"]
+        self.start_time = max(self.start_time, event["timestamp"])
+        return True
+
+    def forget_old_events(self, lookback_ms):
+        """Forgets the events older than the lookback window, which are not read again."""
+        oldest = self.start_time - lookback_ms
+        self.seen_event_ids = {
+            event_id: timestamp
+            for event_id, timestamp in self.seen_event_ids.items()
+            if timestamp >= oldest
+        }
+
+
+class MultiJobLogFollower(object):
+    """Follows the CloudWatch logs of many SageMaker jobs concurrently, with asyncio.
+
+    The events of all the log streams of a job are read with ``FilterLogEvents`` requests, so
+    that a job with many hosts costs a single request per poll. The jobs are polled
+    concurrently, within a request rate shared by all of them, and their events are returned
+    by an async iterator of ``(job_name, host, event)`` tuples:
+
+    .. code:: python
+
+        follower = MultiJobLogFollower(logs_client, job_names, sagemaker_client=sm_client)
+        async for job_name, host, event in follower:
+            print(job_name, host, event["message"])
+
+    The boto3 clients are called in a thread pool, as they are not asynchronous.
+    """
+
+    def __init__(
+        self,
+        logs_client,
+        job_names,
+        job_type="Training",
+        sagemaker_client=None,
+        wait=True,
+        poll=5,
+        status_poll=30,
+        max_requests_per_second=5,
+        max_concurrency=8,
+        lookback=10,
+        rate_limiter=None,
+    ):
+        """Initialize a ``MultiJobLogFollower`` instance.
+
+        Args:
+            logs_client (boto3.CloudWatchLogs.Client): The client to read the logs with.
+            job_names (list[str]): The names of the jobs to follow.
+            job_type (str): The type of the jobs, "Training", "Processing" or "Transform"
+                (default: "Training").
+            sagemaker_client (boto3.SageMaker.Client): The client to check the status of the
+                jobs with. Required if ``wait`` is True (default: None).
+            wait (bool): Whether to follow the logs until the jobs are complete. If False, only
+                the events available now are returned (default: True).
+            poll (float): The interval in seconds between reads of the logs of a job
+                (default: 5).
+            status_poll (float): The interval in seconds between checks of the status of a job
+                (default: 30).
+            max_requests_per_second (float): The maximum number of requests per second made
+                for all the jobs (default: 5).
+            max_concurrency (int): The maximum number of concurrent requests (default: 8).
+            lookback (float): The time window in seconds that is read again on each poll, to
+                get the events ingested late by CloudWatch (default: 10).
+            rate_limiter (sagemaker.logs.AsyncRateLimiter): Optional. A rate limiter shared
+                with other followers, instead of ``max_requests_per_second`` (default: None).
+        """
+        if job_type not in _JOB_DESCRIBE_APIS:
+            raise ValueError(
+                "job_type must be one of {}, got: {}".format(sorted(_JOB_DESCRIBE_APIS), job_type)
+            )
+        if wait and sagemaker_client is None:
+            raise ValueError("A sagemaker_client is required to wait for the jobs to complete.")
+
+        self.logs_client = logs_client
+        self.job_names = list(job_names)
+        self.job_type = job_type
+        self.log_group = "/aws/sagemaker/{}Jobs".format(job_type)
+        self.sagemaker_client = sagemaker_client
+        self.wait = wait
+        self.poll = poll
+        self.status_poll = status_poll
+        self.max_concurrency = max_concurrency
+        self.lookback_ms = int(lookback * 1000)
+        self.rate_limiter = rate_limiter or AsyncRateLimiter(max_requests_per_second)
+        self.descriptions = {}
+
+    def __aiter__(self):
+        """Returns an async iterator of the ``(job_name, host, event)`` tuples of the jobs."""
+        return self.events()
+
+    async def events(self):
+        """Yields the ``(job_name, host, event)`` tuples of the jobs, in order for each job.
+
+        The host is the name of the log stream without the job name, such as
+        ``algo-1-1234567890``. The last description of each job is kept in ``descriptions``.
+        """
+        loop = asyncio.get_event_loop()
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+        queue = asyncio.Queue(maxsize=1000)
+        tasks = [
+            loop.create_task(self._follow_job(loop, executor, job_name, queue))
+            for job_name in self.job_names
+        ]
+        remaining = len(tasks)
+        try:
+            while remaining:
+                item = await queue.get()
+                if isinstance(item, BaseException):
+                    raise item
+                if item is None:
+                    remaining -= 1
+                    continue
+                yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            executor.shutdown(wait=False)
+
+    async def _call(self, loop, executor, fn, **kwargs):
+        """Makes a request within the rate limit, in the thread pool."""
+        await self.rate_limiter.acquire()
+        return await loop.run_in_executor(executor, functools.partial(fn, **kwargs))
+
+    async def _follow_job(self, loop, executor, job_name, queue):
+        """Reads the events of a job until it is complete, then signals the end with None."""
+        try:
+            position = _JobLogPosition()
+            complete = not self.wait
+            last_status_check = None
+            while True:
+                await self._read_new_events(loop, executor, job_name, position, queue)
+                if complete:
+                    break
+                await asyncio.sleep(self.poll)
+                now = time.monotonic()
+                if last_status_check is None or now - last_status_check >= self.status_poll:
+                    last_status_check = now
+                    # After the job completes, the events are read once more, as they can
+                    # reach CloudWatch after the status changes.
+                    complete = await self._is_complete(loop, executor, job_name)
+            await queue.put(None)
+        # CancelledError is an Exception before Python 3.8, and must not be put in the queue.
+        except asyncio.CancelledError:  # pylint: disable=try-except-raise
+            raise
+        except Exception as e:  # pylint: disable=broad-except
+            await queue.put(e)
+
+    async def _is_complete(self, loop, executor, job_name):
+        """Describes a job and returns whether its status is terminal."""
+        api, name_arg, status_key = _JOB_DESCRIBE_APIS[self.job_type]
+        description = await self._call(
+            loop, executor, getattr(self.sagemaker_client, api), **{name_arg: job_name}
+        )
+        self.descriptions[job_name] = description
+        return description[status_key] in _TERMINAL_JOB_STATUSES
+
+    async def _read_new_events(self, loop, executor, job_name, position, queue):
+        """Reads the events of all the streams of a job since its position."""
+        prefix = job_name + "/"
+        kwargs = {
+            "logGroupName": self.log_group,
+            "logStreamNamePrefix": prefix,
+            "startTime": max(0, position.start_time - self.lookback_ms),
+        }
+        while True:
+            try:
+                response = await self._call(
+                    loop, executor, self.logs_client.filter_log_events, **kwargs
+                )
+            except ClientError as e:
+                # There is no log group until the first job of the account starts logging.
+                if e.response.get("Error", {}).get("Code") == "ResourceNotFoundException":
+                    return
+                raise
+            for event in sorted(response.get("events", []), key=lambda e: e["timestamp"]):
+                if position.add(event):
+                    host = event.get("logStreamName", "")[len(prefix) :]
+                    await queue.put((job_name, host, event))
+            if not response.get("nextToken"):
+                break
+            kwargs["nextToken"] = response["nextToken"]
+        position.forget_old_events(self.lookback_ms)
@@ -12,14 +12,16 @@
 # language governing permissions and limitations under the License.
 """Placeholder docstring"""
 from __future__ import absolute_import
-import threading
-import time
+import concurrent.futures
 import uuid
-from botocore.exceptions import WaiterError
 
 from sagemaker import s3
-from sagemaker.exceptions import PollingTimeoutError, AsyncInferenceModelError
-from sagemaker.async_inference import WaiterConfig, AsyncInferenceResponse
+from sagemaker.exceptions import PollingTimeoutError
+from sagemaker.async_inference import (
+    WaiterConfig,
+    AsyncInferenceResponse,
+    AsyncInferenceResultCollector,
+)
 from sagemaker.s3 import parse_s3_url
 from sagemaker.session import Session
 from sagemaker.utils import name_from_base, sagemaker_timestamp
@@ -32,6 +34,7 @@ class AsyncPredictor:
         self,
         predictor,
         name=None,
+        notification_queue_url=None,
     ):
         """Initialize an ``AsyncPredictor``.
 
@@ -39,6 +42,12 @@ class AsyncPredictor:
             predictor (sagemaker.predictor.Predictor): General ``Predictor``
                 object has useful methods and variables. ``AsyncPredictor``
                 stands on top of it with capability for async inference.
+            name (str): Optional. The name used in the Amazon S3 keys of the uploaded
+                input data. (Default: None)
+            notification_queue_url (str): Optional. The URL of an Amazon SQS queue
+                subscribed to the success and error topics of the endpoint, whose
+                notifications are used to find the results of the requests, instead of
+                listing their Amazon S3 locations. (Default: None)
         """
         self.predictor = predictor
         self.endpoint_name = predictor.endpoint_name
@@ -58,6 +67,17 @@ class AsyncPredictor:
         self._model_names = None
         self._context = None
         self._input_path = None
+        sqs_client = None
+        if notification_queue_url is not None:
+            sqs_client = self.sagemaker_session.boto_session.client(
+                "sqs", region_name=self.sagemaker_session.boto_region_name
+            )
+        self.result_collector = AsyncInferenceResultCollector(
+            self.s3_client,
+            self.predictor._handle_response,
+            sqs_client=sqs_client,
+            notification_queue_url=notification_queue_url,
+        )
 
     def predict(
         self,
@@ -219,107 +239,26 @@ class AsyncPredictor:
         return response
 
     def _wait_for_output(self, output_path, failure_path, waiter_config):
-        """Retrieve output based on the presense of failure_path."""
-        if failure_path is not None:
-            return self._check_output_and_failure_paths(output_path, failure_path, waiter_config)
-
-        return self._check_output_path(output_path, waiter_config)
+        """Wait for the output or the failure of a request with the result collector.
 
-    def _check_output_path(self, output_path, waiter_config):
-        """Check the Amazon S3 output path for the output.
-
-        Periodically check Amazon S3 output path for async inference result.
-        Timeout automatically after max attempts reached
+        Raises:
+            AsyncInferenceModelError: If the failure file is found before the output file.
+            PollingTimeoutError: If neither file is found after waiting for the
+                ``delay * max_attempts`` seconds of the ``waiter_config``.
         """
-        bucket, key = parse_s3_url(output_path)
-        s3_waiter = self.s3_client.get_waiter("object_exists")
+        future = self.result_collector.track(output_path, failure_path, poll=waiter_config.delay)
+        seconds = waiter_config.delay * waiter_config.max_attempts
         try:
-            s3_waiter.wait(Bucket=bucket, Key=key, WaiterConfig=waiter_config._to_request_dict())
-        except WaiterError:
+            return future.result(timeout=seconds)
+        except concurrent.futures.TimeoutError:
+            # The result may be downloading, in which case the future can not be cancelled.
+            if not future.cancel():
+                return future.result()
             raise PollingTimeoutError(
                 message="Inference could still be running",
                 output_path=output_path,
-                seconds=waiter_config.delay * waiter_config.max_attempts,
+                seconds=seconds,
             )
-        s3_object = self.s3_client.get_object(Bucket=bucket, Key=key)
-        result = self.predictor._handle_response(response=s3_object)
-        return result
-
-    def _check_output_and_failure_paths(self, output_path, failure_path, waiter_config):
-        """Check the Amazon S3 output path for the output.
-
-        This method waits for either the output file or the failure file to be found on the
-        specified S3 output path. Whichever file is found first, its corresponding event is
-        triggered, and the method executes the appropriate action based on the event.
-
-        Args:
-            output_path (str): The S3 path where the output file is expected to be found.
-            failure_path (str): The S3 path where the failure file is expected to be found.
-            waiter_config (boto3.waiter.WaiterConfig): The configuration for the S3 waiter.
-
-        Returns:
-            Any: The deserialized result from the output file, if the output file is found first.
-            Otherwise, raises an exception.
-
-        Raises:
-            AsyncInferenceModelError: If the failure file is found before the output file.
-            PollingTimeoutError: If both files are not found and the S3 waiter
-             has thrown a WaiterError.
-        """
-        output_bucket, output_key = parse_s3_url(output_path)
-        failure_bucket, failure_key = parse_s3_url(failure_path)
-
-        output_file_found = threading.Event()
-        failure_file_found = threading.Event()
-
-        def check_output_file():
-            try:
-                output_file_waiter = self.s3_client.get_waiter("object_exists")
-                output_file_waiter.wait(
-                    Bucket=output_bucket,
-                    Key=output_key,
-                    WaiterConfig=waiter_config._to_request_dict(),
-                )
-                output_file_found.set()
-            except WaiterError:
-                pass
-
-        def check_failure_file():
-            try:
-                failure_file_waiter = self.s3_client.get_waiter("object_exists")
-                failure_file_waiter.wait(
-                    Bucket=failure_bucket,
-                    Key=failure_key,
-                    WaiterConfig=waiter_config._to_request_dict(),
-                )
-                failure_file_found.set()
-            except WaiterError:
-                pass
-
-        output_thread = threading.Thread(target=check_output_file)
-        failure_thread = threading.Thread(target=check_failure_file)
-
-        output_thread.start()
-        failure_thread.start()
-
-        while not output_file_found.is_set() and not failure_file_found.is_set():
-            time.sleep(1)
-
-        if output_file_found.is_set():
-            s3_object = self.s3_client.get_object(Bucket=output_bucket, Key=output_key)
-            result = self.predictor._handle_response(response=s3_object)
-            return result
-
-        failure_object = self.s3_client.get_object(Bucket=failure_bucket, Key=failure_key)
-        failure_response = self.predictor._handle_response(response=failure_object)
-
-        raise AsyncInferenceModelError(
-            message=failure_response
-        ) if failure_file_found.is_set() else PollingTimeoutError(
-            message="Inference could still be running",
-            output_path=output_path,
-            seconds=waiter_config.delay * waiter_config.max_attempts,
-        )
 
     def update_endpoint(
         self,
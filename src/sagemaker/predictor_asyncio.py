@@ -0,0 +1,165 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""This module contains the asyncio predictor of real-time endpoints.
+
+Requests are made with the ``sagemaker_runtime_client`` of the session of a ``Predictor``
+in a pool of threads, so that coroutines can await predictions while the client keeps
+handling its credentials, CA bundle, proxies, timeouts, retries and connection pool.
+"""
+from __future__ import absolute_import
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+
+class AsyncioPredictor(object):
+    """Make prediction requests to an Amazon SageMaker endpoint with asyncio.
+
+    Unlike ``sagemaker.predictor_async.AsyncPredictor``, which uses asynchronous inference
+    endpoints with inputs and outputs in Amazon S3, this predictor sends real-time inference
+    requests, as ``Predictor.predict`` does, with coroutines instead of blocking calls.
+    ``AsyncioPredictor`` objects must be used from a single event loop.
+    """
+
+    def __init__(self, predictor, max_concurrency=32, timeout=60):
+        """Initialize an ``AsyncioPredictor``.
+
+        Args:
+            predictor (sagemaker.predictor.Predictor): The ``Predictor`` of the endpoint. Its
+                serializer and deserializer, and the ``sagemaker_runtime_client`` of its
+                session, are used for the requests. To keep a connection open for each request
+                in flight, the ``max_pool_connections`` of the configuration of the client
+                should be at least ``max_concurrency``.
+            max_concurrency (int): The maximum number of requests in flight, which is the
+                number of threads making the requests (default: 32).
+            timeout (float): The default timeout of each request in seconds, or None for no
+                timeout (default: 60). A request that times out is not interrupted, and keeps
+                its thread until it completes or the read timeout of the client is reached.
+        """
+        self.predictor = predictor
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="AsyncioPredictor"
+        )
+
+    async def predict(
+        self,
+        data,
+        initial_args=None,
+        target_model=None,
+        target_variant=None,
+        inference_id=None,
+        timeout=None,
+    ):
+        """Return the inference from the endpoint.
+
+        Args:
+            data (object): Input data for which you want the model to provide inference. It is
+                serialized with the serializer of the ``Predictor``.
+            initial_args (dict[str,str]): Optional. Default arguments for the
+                ``InvokeEndpoint`` request (default: None).
+            target_model (str): S3 model artifact path to run an inference request on,
+                in case of a multi model endpoint (default: None).
+            target_variant (str): The name of the production variant to run an inference
+                request on (default: None).
+            inference_id (str): If you provide a value, it is added to the captured data
+                when you enable data capture on the endpoint (default: None).
+            timeout (float): The timeout of the request in seconds (default: None). If not
+                specified, the timeout of the ``AsyncioPredictor`` is used.
+
+        Returns:
+            object: Inference for the given input, deserialized with the deserializer of the
+                ``Predictor``.
+        """
+        return await asyncio.wait_for(
+            self._run(
+                self.predictor.predict,
+                data,
+                initial_args,
+                target_model,
+                target_variant,
+                inference_id,
+            ),
+            timeout if timeout is not None else self.timeout,
+        )
+
+    async def predict_stream(
+        self,
+        data,
+        initial_args=None,
+        target_variant=None,
+        inference_id=None,
+        timeout=None,
+    ):
+        """Yield the parts of a streamed inference from the endpoint.
+
+        The request is an ``InvokeEndpointWithResponseStream`` request. Its parts are the
+        bytes of the ``PayloadPart`` events of the response, which are yielded as they are
+        received, without deserialization.
+
+        Args:
+            data (object): Input data for which you want the model to provide inference. It is
+                serialized with the serializer of the ``Predictor``.
+            initial_args (dict[str,str]): Optional. Default arguments for the
+                ``InvokeEndpointWithResponseStream`` request (default: None).
+            target_variant (str): The name of the production variant to run an inference
+                request on (default: None).
+            inference_id (str): If you provide a value, it is added to the captured data
+                when you enable data capture on the endpoint (default: None).
+            timeout (float): The timeout in seconds of receiving the response headers, and
+                then of receiving each part (default: None). If not specified, the timeout of
+                the ``AsyncioPredictor`` is used.
+
+        Yields:
+            bytes: The parts of the inference.
+        """
+        timeout = timeout if timeout is not None else self.timeout
+        request_args = self.predictor._create_request_args(
+            data, initial_args, None, target_variant, inference_id
+        )
+        runtime_client = self.predictor.sagemaker_session.sagemaker_runtime_client
+        response = await asyncio.wait_for(
+            self._run(runtime_client.invoke_endpoint_with_response_stream, **request_args),
+            timeout,
+        )
+        event_stream = response["Body"]
+        events = iter(event_stream)
+        try:
+            while True:
+                event = await asyncio.wait_for(self._run(next, events, None), timeout)
+                if event is None:
+                    break
+                if "PayloadPart" in event:
+                    yield event["PayloadPart"]["Bytes"]
+        finally:
+            event_stream.close()
+
+    async def close(self):
+        """Stop the threads of the ``AsyncioPredictor`` once their requests complete."""
+        self._executor.shutdown(wait=False)
+
+    async def __aenter__(self):
+        """Return the ``AsyncioPredictor``, which is closed on exit."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close the ``AsyncioPredictor``."""
+        await self.close()
+
+    async def _run(self, func, *args, **kwargs):
+        """Call a function in a thread of the ``AsyncioPredictor``, and return its result."""
+        return await asyncio.get_event_loop().run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
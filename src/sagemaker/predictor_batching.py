@@ -0,0 +1,217 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""This module contains the predictor batching records into fewer endpoint invocations."""
+from __future__ import absolute_import
+
+import collections
+import itertools
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+_STOP = object()
+
+
+class BatchingPredictor:
+    """Make predictions on many records with batched requests to an Amazon SageMaker endpoint.
+
+    Records submitted one at a time are coalesced into batches of up to ``max_batch_size``
+    records, waiting at most ``max_latency`` seconds for a batch to fill up, and the batches are
+    sent concurrently. A batch is sent as the serialization of the list of its records by the
+    serializer of the ``Predictor``, so the serializer must encode a list of records as a batch
+    (for example rows of ``CSVSerializer`` or an array of ``JSONSerializer``). The response to a
+    batch is deserialized by the deserializer of the ``Predictor``, and must be a sequence with a
+    prediction per record, in the order of the records.
+    """
+
+    def __init__(
+        self,
+        predictor,
+        max_batch_size=64,
+        max_latency=0.05,
+        max_concurrency=4,
+        initial_args=None,
+        target_model=None,
+        target_variant=None,
+        response_key=None,
+    ):
+        """Initialize a ``BatchingPredictor``.
+
+        Args:
+            predictor (sagemaker.predictor.Predictor): The ``Predictor`` of the endpoint, whose
+                serializer and deserializer encode the batches and decode their responses.
+            max_batch_size (int): The maximum number of records of a request (default: 64).
+            max_latency (float): The maximum time in seconds that a record submitted with
+                ``submit`` waits for more records to fill up its batch (default: 0.05).
+            max_concurrency (int): The maximum number of requests in flight (default: 4).
+            initial_args (dict[str,str]): Optional. Default arguments for the boto3
+                ``invoke_endpoint`` calls (default: None).
+            target_model (str): S3 model artifact path to run the requests on, in case of a
+                multi model endpoint (default: None).
+            target_variant (str): The name of the production variant to run the requests on
+                (default: None).
+            response_key (str): Optional. The key of the predictions in the deserialized
+                response, if the response is a dict such as ``{"predictions": [...]}``
+                (default: None).
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1.")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        self.predictor = predictor
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self.max_concurrency = max_concurrency
+        self.initial_args = initial_args
+        self.target_model = target_model
+        self.target_variant = target_variant
+        self.response_key = response_key
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        self._slots = threading.Semaphore(max_concurrency)
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._dispatcher = None
+        self._closed = False
+
+    def predict_many(self, records):
+        """Return the predictions for records, in the order of the records.
+
+        The records are split into batches of ``max_batch_size`` records, which are sent
+        concurrently. Records are read from the iterable as batches are sent, so that at most
+        twice ``max_concurrency`` batches are held in memory.
+
+        Args:
+            records (iterable): The records for which you want the model to provide inference.
+
+        Returns:
+            list: The prediction for each record.
+        """
+        records = iter(records)
+        pending = collections.deque()
+        predictions = []
+        while True:
+            while len(pending) < 2 * self.max_concurrency:
+                batch = list(itertools.islice(records, self.max_batch_size))
+                if not batch:
+                    break
+                pending.append(self._executor.submit(self._predict_batch, batch))
+            if not pending:
+                return predictions
+            predictions.extend(pending.popleft().result())
+
+    def submit(self, data):
+        """Submit a record, to be sent with the next batch.
+
+        Args:
+            data (object): A record for which you want the model to provide inference.
+
+        Returns:
+            concurrent.futures.Future: The future of the prediction for the record.
+        """
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Cannot submit records to a closed BatchingPredictor.")
+            if self._dispatcher is None:
+                self._dispatcher = threading.Thread(target=self._dispatch, daemon=True)
+                self._dispatcher.start()
+            self._queue.put((data, future))
+        return future
+
+    def predict(self, data):
+        """Return the prediction for a record, sent with the next batch.
+
+        Args:
+            data (object): A record for which you want the model to provide inference.
+
+        Returns:
+            object: The prediction for the record.
+        """
+        return self.submit(data).result()
+
+    def close(self):
+        """Send the records submitted so far, and wait for their predictions."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            dispatcher = self._dispatcher
+            self._queue.put(_STOP)
+        if dispatcher is not None:
+            dispatcher.join()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        """Return the ``BatchingPredictor``, which is closed on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Close the ``BatchingPredictor``."""
+        self.close()
+
+    def _dispatch(self):
+        """Coalesce the submitted records into batches until the predictor is closed."""
+        stop = False
+        while not stop:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.max_latency
+            while len(batch) < self.max_batch_size:
+                try:
+                    item = self._queue.get(timeout=max(0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+            # Wait for a request slot, so that batches keep filling up while requests are busy.
+            self._slots.acquire()
+            future = self._executor.submit(self._send_batch, batch)
+            future.add_done_callback(lambda _: self._slots.release())
+
+    def _send_batch(self, batch):
+        """Send a batch of submitted records, and resolve their futures."""
+        batch = [(data, future) for data, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+        try:
+            predictions = self._predict_batch([data for data, _ in batch])
+        except Exception as e:  # pylint: disable=broad-except
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        for (_, future), prediction in zip(batch, predictions):
+            future.set_result(prediction)
+
+    def _predict_batch(self, records):
+        """Return the predictions for a batch of records, with a single request."""
+        request_args = self.predictor._create_request_args(
+            records, self.initial_args, self.target_model, self.target_variant
+        )
+        response = self.predictor.sagemaker_session.sagemaker_runtime_client.invoke_endpoint(
+            **request_args
+        )
+        predictions = self.predictor._handle_response(response)
+        if self.response_key is not None:
+            predictions = predictions[self.response_key]
+        predictions = list(predictions)
+        if len(predictions) != len(records):
+            raise ValueError(
+                f"Got {len(predictions)} predictions for a batch of {len(records)} records. "
+                "The response must have a prediction per record."
+            )
+        return predictions
@@ -52,6 +52,7 @@ from sagemaker.utils import (
     resolve_class_attribute_from_config,
 )
 from sagemaker.session import Session
+from sagemaker.session_settings import SessionSettings
 from sagemaker.workflow import is_pipeline_variable
 from sagemaker.workflow.functions import Join
 from sagemaker.workflow.pipeline_context import runnable_by_pipeline
@@ -812,6 +813,7 @@ class ScriptProcessor(Processor):
             desired_s3_uri=desired_s3_uri,
             kms_key=kms_key,
             sagemaker_session=self.sagemaker_session,
+            use_upload_cache=True,
         )
 
     def _convert_code_and_add_to_inputs(self, inputs, s3_uri):
@@ -1810,16 +1812,26 @@ class FrameworkProcessor(ScriptProcessor):
                 "sagemaker_session unspecified when creating your Processor to have one set up "
                 "automatically."
             )
+        script = estimator.uploaded_code.script_name
         if "/sourcedir.tar.gz" in estimator.uploaded_code.s3_prefix:
             # Upload the bootstrapping code as s3://.../jobname/source/runproc.sh.
+            runproc_file_name = "runproc.sh"
+            if isinstance(self.sagemaker_session.settings, SessionSettings) and (
+                self.sagemaker_session.settings.upload_cache is not None
+            ):
+                # The code bundle can be shared with other jobs by the upload cache, so the
+                # bootstrapping code is stored under the hash of its content next to it.
+                from sagemaker.workflow.utilities import hash_object
+
+                runproc_file_hash = hash_object(self._generate_framework_script(script))
+                runproc_file_name = "{}/runproc.sh".format(runproc_file_hash)
             entrypoint_s3_uri = estimator.uploaded_code.s3_prefix.replace(
                 "sourcedir.tar.gz",
-                "runproc.sh",
+                runproc_file_name,
             )
         else:
             raise RuntimeError("S3 source_dir file must be named `sourcedir.tar.gz.`")
 
-        script = estimator.uploaded_code.script_name
         evaluated_kms_key = kms_key if kms_key else self.output_kms_key
         s3_runproc_sh = self._create_and_upload_runproc(
             script, evaluated_kms_key, entrypoint_s3_uri
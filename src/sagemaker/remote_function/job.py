@@ -856,11 +856,14 @@ def _prepare_and_upload_runtime_scripts(
         shutil.copy2(bootstrap_script_path, bootstrap_scripts)
         shutil.copy2(runtime_manager_script_path, bootstrap_scripts)
 
+        # The runtime scripts channel uses the returned S3 uri, so the scripts uploaded by a
+        # previous job can be reused when the session settings have an upload cache.
         return S3Uploader.upload(
             bootstrap_scripts,
             s3_path_join(s3_base_uri, RUNTIME_SCRIPTS_CHANNEL_NAME),
             s3_kms_key,
             sagemaker_session,
+            use_upload_cache=True,
         )
 
 
@@ -15,9 +15,12 @@ from __future__ import print_function, absolute_import
 
 import logging
 import io
+import os
 
 from typing import Union
+from sagemaker import s3_transfer, upload_cache
 from sagemaker.session import Session
+from sagemaker.session_settings import SessionSettings
 
 # These were defined inside s3.py initially. Kept here for backward compatibility
 from sagemaker.s3_utils import (  # pylint: disable=unused-import # noqa: F401
@@ -33,7 +36,16 @@ class S3Uploader(object):
     """Contains static methods for uploading directories or files to S3."""
 
     @staticmethod
-    def upload(local_path, desired_s3_uri, kms_key=None, sagemaker_session=None):
+    def upload(
+        local_path,
+        desired_s3_uri,
+        kms_key=None,
+        sagemaker_session=None,
+        max_concurrency=s3_transfer.DEFAULT_MAX_CONCURRENCY,
+        multipart_chunksize=s3_transfer.DEFAULT_MULTIPART_CHUNKSIZE,
+        skip_unchanged=False,
+        use_upload_cache=False,
+    ):
         """Static method that uploads a given file or directory to S3.
 
         Args:
@@ -45,6 +57,15 @@ class S3Uploader(object):
                 manages interactions with Amazon SageMaker APIs and any other
                 AWS services needed. If not specified, one is created
                 using the default AWS configuration chain.
+            max_concurrency (int): The maximum number of concurrent S3 requests (default: 10).
+            multipart_chunksize (int): The part size in bytes of multipart uploads of large
+                files (default: 8 MiB).
+            skip_unchanged (bool): Whether to skip files whose S3 object already has the same
+                size and ETag (default: False).
+            use_upload_cache (bool): Whether to look up the content in the ``upload_cache`` of
+                the session settings, and to return the S3 uri of a previous upload of the same
+                content instead of uploading it again (default: False). Only use it when the
+                caller relies on the returned S3 uri, rather than on ``desired_s3_uri``.
 
         Returns:
             The S3 uri of the uploaded file(s).
@@ -58,10 +79,45 @@ class S3Uploader(object):
         else:
             extra_args = None
 
-        return sagemaker_session.upload_data(
-            path=local_path, bucket=bucket, key_prefix=key_prefix, extra_args=extra_args
+        cache = None
+        if use_upload_cache and isinstance(sagemaker_session.settings, SessionSettings):
+            cache = sagemaker_session.settings.upload_cache
+        if cache is not None and os.path.isdir(local_path):
+            # The files of a directory are uploaded under ``key_prefix`` without the name of the
+            # directory, and the first one is checked before a previous upload is reused.
+            first_file = _first_file(local_path)
+            paths = [os.path.join(local_path, name) for name in sorted(os.listdir(local_path))]
+            if first_file is None:
+                cache = None
+        else:
+            first_file = None
+            paths = [local_path]
+        if cache is not None:
+            content_hash = upload_cache.compute_content_hash(
+                paths, extra_args, kind=upload_cache.RAW_UPLOAD
+            )
+            s3_client = sagemaker_session.s3_client
+            cached_s3_uri = cache.get(s3_client, bucket, content_hash)
+            if cached_s3_uri is not None:
+                return cached_s3_uri
+
+        s3_uri = sagemaker_session.upload_data(
+            path=local_path,
+            bucket=bucket,
+            key_prefix=key_prefix,
+            extra_args=extra_args,
+            max_concurrency=max_concurrency,
+            multipart_chunksize=multipart_chunksize,
+            skip_unchanged=skip_unchanged,
         )
 
+        if cache is not None:
+            _, key = parse_s3_url(s3_uri)
+            if first_file is not None:
+                key = "{}/{}".format(key, first_file)
+            cache.put(s3_client, bucket, content_hash, s3_uri, key)
+        return s3_uri
+
     @staticmethod
     def upload_string_as_file_body(
         body: str, desired_s3_uri=None, kms_key=None, sagemaker_session=None
@@ -125,11 +181,29 @@ class S3Uploader(object):
         return s3_uri
 
 
+def _first_file(directory):
+    """Returns the path relative to ``directory`` of its first file, or None if it has none."""
+    for dirpath, dirnames, filenames in os.walk(directory):
+        dirnames.sort()
+        if filenames:
+            first_file = os.path.join(dirpath, min(filenames))
+            return os.path.relpath(first_file, directory).replace(os.sep, "/")
+    return None
+
+
 class S3Downloader(object):
     """Contains static methods for downloading directories or files from S3."""
 
     @staticmethod
-    def download(s3_uri, local_path, kms_key=None, sagemaker_session=None):
+    def download(
+        s3_uri,
+        local_path,
+        kms_key=None,
+        sagemaker_session=None,
+        max_concurrency=s3_transfer.DEFAULT_MAX_CONCURRENCY,
+        multipart_chunksize=s3_transfer.DEFAULT_MULTIPART_CHUNKSIZE,
+        skip_unchanged=False,
+    ):
         """Static method that downloads a given S3 uri to the local machine.
 
         Args:
@@ -140,6 +214,11 @@ class S3Downloader(object):
                 manages interactions with Amazon SageMaker APIs and any other
                 AWS services needed. If not specified, one is created
                 using the default AWS configuration chain.
+            max_concurrency (int): The maximum number of concurrent S3 requests (default: 10).
+            multipart_chunksize (int): The part size in bytes of multipart downloads of large
+                objects (default: 8 MiB).
+            skip_unchanged (bool): Whether to skip objects whose local file already has the
+                same size, and the same mtime or ETag (default: False).
 
         Returns:
             list[str]: List of local paths of downloaded files
@@ -152,7 +231,13 @@ class S3Downloader(object):
             extra_args = None
 
         return sagemaker_session.download_data(
-            path=local_path, bucket=bucket, key_prefix=key_prefix, extra_args=extra_args
+            path=local_path,
+            bucket=bucket,
+            key_prefix=key_prefix,
+            extra_args=extra_args,
+            max_concurrency=max_concurrency,
+            multipart_chunksize=multipart_chunksize,
+            skip_unchanged=skip_unchanged,
         )
 
     @staticmethod
@@ -0,0 +1,476 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""This module contains a concurrent engine for transferring many files to and from S3.
+
+Like `s3_utils.py`, it does not depend on `session.py` so that it can be used by the ``Session``.
+"""
+from __future__ import absolute_import
+
+import contextlib
+import hashlib
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError
+
+logger = logging.getLogger("sagemaker")
+
+DEFAULT_MAX_CONCURRENCY = 10
+DEFAULT_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+
+
+class TransferStats(object):
+    """Thread-safe counters of the files and bytes handled by a transfer."""
+
+    def __init__(self, total_files=0):
+        """Initialize a ``TransferStats`` instance.
+
+        Args:
+            total_files (int): The number of files the transfer will handle (default: 0).
+        """
+        self.total_files = total_files
+        self.transferred_files = 0
+        self.transferred_bytes = 0
+        self.skipped_files = 0
+        self.skipped_bytes = 0
+        self.start_time = time.time()
+        self.end_time = None
+        self._lock = threading.Lock()
+
+    def add_transferred(self, num_bytes):
+        """Count a file that was transferred."""
+        with self._lock:
+            self.transferred_files += 1
+            self.transferred_bytes += num_bytes
+
+    def add_skipped(self, num_bytes):
+        """Count a file that was skipped because it was unchanged."""
+        with self._lock:
+            self.skipped_files += 1
+            self.skipped_bytes += num_bytes
+
+    def finish(self):
+        """Record the end time of the transfer."""
+        self.end_time = time.time()
+
+    @property
+    def elapsed_seconds(self):
+        """float: Seconds since the transfer started, until it finished if it has."""
+        return (self.end_time or time.time()) - self.start_time
+
+    @property
+    def throughput(self):
+        """float: Transferred bytes per second."""
+        elapsed = self.elapsed_seconds
+        return self.transferred_bytes / elapsed if elapsed > 0 else 0.0
+
+    def __str__(self):
+        """Summarize the transfer in a single line."""
+        return (
+            "{}/{} files ({:.1f} MiB) transferred, {} unchanged skipped "
+            "in {:.1f}s ({:.1f} MiB/s)"
+        ).format(
+            self.transferred_files,
+            self.total_files,
+            self.transferred_bytes / 1024.0 / 1024.0,
+            self.skipped_files,
+            self.elapsed_seconds,
+            self.throughput / 1024.0 / 1024.0,
+        )
+
+
+def get_transfer_config(
+    max_concurrency=DEFAULT_MAX_CONCURRENCY,
+    multipart_chunksize=DEFAULT_MULTIPART_CHUNKSIZE,
+    num_workers=1,
+):
+    """Returns the boto3 transfer configuration for one of ``num_workers`` concurrent uploads.
+
+    The ``max_concurrency`` budget is split between the workers, so that the parts of a large
+    file are uploaded in parallel when few files are uploaded at the same time.
+
+    Args:
+        max_concurrency (int): The maximum number of concurrent requests (default: 10).
+        multipart_chunksize (int): The part size in bytes of multipart transfers
+            (default: 8 MiB).
+        num_workers (int): The number of files transferred at the same time (default: 1).
+
+    Returns:
+        boto3.s3.transfer.TransferConfig: The transfer configuration.
+    """
+    max_concurrency = max(1, max_concurrency or DEFAULT_MAX_CONCURRENCY)
+    return TransferConfig(
+        multipart_chunksize=multipart_chunksize or DEFAULT_MULTIPART_CHUNKSIZE,
+        max_concurrency=max(1, max_concurrency // max(1, num_workers)),
+    )
+
+
+def compute_etag(path, multipart_threshold, multipart_chunksize):
+    """Computes the S3 ETag a file gets when it is uploaded without SSE-KMS encryption.
+
+    Files smaller than ``multipart_threshold`` are uploaded in one part and their ETag is the
+    MD5 of their content. Larger files are uploaded in parts of ``multipart_chunksize`` bytes
+    and their ETag is the MD5 of the concatenated part MD5s, followed by the number of parts.
+
+    Args:
+        path (str): Path of the local file.
+        multipart_threshold (int): The size from which files are uploaded in parts.
+        multipart_chunksize (int): The size of each part.
+
+    Returns:
+        str: The ETag, without quotes.
+    """
+    whole_digest = hashlib.md5()
+    part_digests = []
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(multipart_chunksize), b""):
+            whole_digest.update(chunk)
+            part_digests.append(hashlib.md5(chunk).digest())
+    if os.path.getsize(path) < multipart_threshold:
+        return whole_digest.hexdigest()
+    combined = hashlib.md5(b"".join(part_digests))
+    return "{}-{}".format(combined.hexdigest(), len(part_digests))
+
+
+def _is_unchanged(client, bucket, key, local_path, transfer_config):
+    """Checks whether an S3 object has the size and ETag of a local file.
+
+    Objects encrypted with SSE-KMS do not have MD5 ETags, so they never compare as unchanged.
+    """
+    try:
+        head = client.head_object(Bucket=bucket, Key=key)
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+            return False
+        raise
+    if head.get("ContentLength") != os.path.getsize(local_path):
+        return False
+    etag = head.get("ETag", "").strip('"')
+    return etag == compute_etag(
+        local_path, transfer_config.multipart_threshold, transfer_config.multipart_chunksize
+    )
+
+
+def upload_files(
+    s3_resource,
+    bucket,
+    files,
+    extra_args=None,
+    max_concurrency=DEFAULT_MAX_CONCURRENCY,
+    multipart_chunksize=DEFAULT_MULTIPART_CHUNKSIZE,
+    skip_unchanged=False,
+    progress_callback=None,
+):
+    """Uploads local files to S3 concurrently over the shared client of an S3 resource.
+
+    Up to ``max_concurrency`` files are uploaded at the same time by a bounded thread pool.
+    Concurrency left over when there are fewer files than threads is used to upload the parts
+    of large files in parallel, so a single large file is uploaded with ``max_concurrency``
+    concurrent parts.
+
+    Args:
+        s3_resource (boto3.resource("s3")): The S3 resource to upload with.
+        bucket (str): Name of the S3 bucket to upload to.
+        files (list[tuple[str, str]]): ``(local_path, s3_key)`` pairs of the files to upload.
+        extra_args (dict): Optional extra arguments passed to each upload (default: None).
+            Similar to the ExtraArgs parameter of the S3 ``upload_file`` function.
+        max_concurrency (int): The maximum number of concurrent requests (default: 10).
+        multipart_chunksize (int): The part size in bytes of multipart uploads
+            (default: 8 MiB).
+        skip_unchanged (bool): Whether to skip files whose S3 object already has the same size
+            and ETag (default: False). Only objects uploaded without SSE-KMS encryption can be
+            detected as unchanged.
+        progress_callback (callable): Optional function called with the ``TransferStats``
+            after each file is uploaded or skipped (default: None).
+
+    Returns:
+        sagemaker.s3_transfer.TransferStats: The statistics of the upload.
+    """
+    files = list(files)
+    stats = TransferStats(total_files=len(files))
+    num_workers = max(1, min(max_concurrency or DEFAULT_MAX_CONCURRENCY, len(files)))
+    transfer_config = get_transfer_config(max_concurrency, multipart_chunksize, num_workers)
+
+    def _upload(local_path, s3_key):
+        size = os.path.getsize(local_path) if os.path.isfile(local_path) else 0
+        if skip_unchanged and _is_unchanged(
+            s3_resource.meta.client, bucket, s3_key, local_path, transfer_config
+        ):
+            stats.add_skipped(size)
+        else:
+            s3_resource.meta.client.upload_file(
+                local_path, bucket, s3_key, ExtraArgs=extra_args, Config=transfer_config
+            )
+            stats.add_transferred(size)
+        if progress_callback is not None:
+            progress_callback(stats)
+
+    _run_concurrently(_upload, files, num_workers)
+
+    stats.finish()
+    if len(files) > 1:
+        logger.info("Uploaded to s3://%s: %s", bucket, stats)
+    return stats
+
+
+def _is_local_unchanged(s3_object, local_path, transfer_config):
+    """Checks whether a local file has the size and either the mtime or the ETag of an S3 object.
+
+    Files downloaded with ``skip_unchanged`` get the ``LastModified`` time of their object as
+    mtime, so they are recognized without being read again. Other files are compared by ETag.
+    """
+    if not os.path.isfile(local_path):
+        return False
+    if s3_object.get("Size") != os.path.getsize(local_path):
+        return False
+    last_modified = s3_object.get("LastModified")
+    if last_modified is not None and int(os.path.getmtime(local_path)) == int(
+        last_modified.timestamp()
+    ):
+        return True
+    etag = (s3_object.get("ETag") or "").strip('"')
+    return bool(etag) and etag == compute_etag(
+        local_path, transfer_config.multipart_threshold, transfer_config.multipart_chunksize
+    )
+
+
+def download_files(
+    s3_client,
+    bucket,
+    files,
+    extra_args=None,
+    max_concurrency=DEFAULT_MAX_CONCURRENCY,
+    multipart_chunksize=DEFAULT_MULTIPART_CHUNKSIZE,
+    skip_unchanged=False,
+    progress_callback=None,
+):
+    """Downloads S3 objects to local files concurrently over a shared S3 client.
+
+    The local directories of all the files are created in one pass before any download starts.
+    Up to ``max_concurrency`` objects are then downloaded at the same time by a bounded thread
+    pool, and the parts of large objects are downloaded in parallel with the leftover
+    concurrency, as in :func:`upload_files`.
+
+    Args:
+        s3_client (boto3.client("s3")): The S3 client to download with.
+        bucket (str): Name of the S3 bucket to download from.
+        files (list[tuple[dict, str]]): ``(s3_object, local_path)`` pairs of the objects to
+            download, where ``s3_object`` is an entry of the ``Contents`` of a
+            ``ListObjectsV2`` response. Only its ``Key`` is required; its ``Size``, ``ETag``
+            and ``LastModified`` are used by ``skip_unchanged``.
+        extra_args (dict): Optional extra arguments passed to each download (default: None).
+            Similar to the ExtraArgs parameter of the S3 ``download_file`` function.
+        max_concurrency (int): The maximum number of concurrent requests (default: 10).
+        multipart_chunksize (int): The part size in bytes of multipart downloads
+            (default: 8 MiB).
+        skip_unchanged (bool): Whether to skip objects whose local file already has the same
+            size, and the same mtime or ETag, like ``rsync`` does (default: False). Downloaded
+            files get the ``LastModified`` time of their object as mtime, so that the next
+            comparison does not need to read them.
+        progress_callback (callable): Optional function called with the ``TransferStats``
+            after each object is downloaded or skipped (default: None).
+
+    Returns:
+        sagemaker.s3_transfer.TransferStats: The statistics of the download.
+    """
+    files = list(files)
+    stats = TransferStats(total_files=len(files))
+    num_workers = max(1, min(max_concurrency or DEFAULT_MAX_CONCURRENCY, len(files)))
+    transfer_config = get_transfer_config(max_concurrency, multipart_chunksize, num_workers)
+
+    for directory in sorted({os.path.dirname(local_path) for _, local_path in files}):
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _download(s3_object, local_path):
+        if skip_unchanged and _is_local_unchanged(s3_object, local_path, transfer_config):
+            stats.add_skipped(os.path.getsize(local_path))
+        else:
+            s3_client.download_file(
+                Bucket=bucket,
+                Key=s3_object["Key"],
+                Filename=local_path,
+                ExtraArgs=extra_args,
+                Config=transfer_config,
+            )
+            if os.path.isfile(local_path):
+                last_modified = s3_object.get("LastModified")
+                if skip_unchanged and last_modified is not None:
+                    mtime = last_modified.timestamp()
+                    os.utime(local_path, (mtime, mtime))
+                stats.add_transferred(os.path.getsize(local_path))
+            else:
+                stats.add_transferred(0)
+        if progress_callback is not None:
+            progress_callback(stats)
+
+    _run_concurrently(_download, files, num_workers)
+
+    stats.finish()
+    if len(files) > 1:
+        logger.info("Downloaded from s3://%s: %s", bucket, stats)
+    return stats
+
+
+class _StreamPipe(object):
+    """A bounded in-memory pipe between a thread writing a stream and an S3 upload reading it."""
+
+    _EOF = object()
+
+    def __init__(self, max_buffered_writes=64):
+        """Initialize a ``_StreamPipe`` instance.
+
+        Args:
+            max_buffered_writes (int): The number of writes buffered before ``write`` blocks
+                until the reader catches up (default: 64).
+        """
+        self._queue = queue.Queue(maxsize=max_buffered_writes)
+        self._buffer = b""
+        self._eof = False
+        self._reader_closed = threading.Event()
+
+    def _put(self, item):
+        """Queues an item, unless the reader stopped reading. Returns whether it was queued."""
+        while not self._reader_closed.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def write(self, data):
+        """Queues ``data`` for the reader, blocking while the pipe is full."""
+        if data and not self._put(bytes(data)):
+            raise BrokenPipeError("The S3 upload stopped before the stream was fully written.")
+        return len(data)
+
+    def close(self):
+        """Signals the end of the stream to the reader."""
+        self._put(self._EOF)
+
+    def abort(self, error):
+        """Makes the reader raise ``error``, so that the upload is aborted."""
+        self._put(error)
+
+    def close_reader(self):
+        """Signals that the reader stopped reading, so that the writer does not block."""
+        self._reader_closed.set()
+
+    def read(self, size=-1):
+        """Reads ``size`` bytes, or less only at the end of the stream."""
+        chunks = [self._buffer]
+        length = len(self._buffer)
+        while (size is None or size < 0 or length < size) and not self._eof:
+            item = self._queue.get()
+            if item is self._EOF:
+                self._eof = True
+            elif isinstance(item, BaseException):
+                raise item
+            else:
+                chunks.append(item)
+                length += len(item)
+        data = b"".join(chunks)
+        if size is None or size < 0:
+            self._buffer = b""
+            return data
+        self._buffer = data[size:]
+        return data[:size]
+
+
+@contextlib.contextmanager
+def upload_stream(
+    s3_resource,
+    bucket,
+    key,
+    extra_args=None,
+    max_concurrency=DEFAULT_MAX_CONCURRENCY,
+    multipart_chunksize=DEFAULT_MULTIPART_CHUNKSIZE,
+):
+    """Opens a writable stream that is uploaded to S3 while it is written.
+
+    The stream is uploaded by a background thread with a multipart upload, so that large
+    content, such as an archive, is uploaded without being written to a temporary file. If the
+    ``with`` block raises an exception, the multipart upload is aborted and no object is created.
+
+    Args:
+        s3_resource (boto3.resource("s3")): The S3 resource to upload with.
+        bucket (str): Name of the S3 bucket to upload to.
+        key (str): The S3 key of the object to upload.
+        extra_args (dict): Optional extra arguments passed to the upload (default: None).
+            Similar to the ExtraArgs parameter of the S3 ``upload_fileobj`` function.
+        max_concurrency (int): The maximum number of concurrent requests (default: 10).
+        multipart_chunksize (int): The part size in bytes of the multipart upload
+            (default: 8 MiB).
+
+    Yields:
+        The stream to write the content of the object to.
+    """
+    pipe = _StreamPipe()
+    errors = []
+
+    def _upload():
+        try:
+            s3_resource.meta.client.upload_fileobj(
+                pipe,
+                bucket,
+                key,
+                ExtraArgs=extra_args,
+                Config=get_transfer_config(max_concurrency, multipart_chunksize),
+            )
+        except BaseException as e:  # pylint: disable=broad-except
+            errors.append(e)
+        finally:
+            pipe.close_reader()
+
+    upload_thread = threading.Thread(target=_upload, daemon=True)
+    upload_thread.start()
+    try:
+        yield pipe
+    except BaseException as e:
+        pipe.abort(e)
+        upload_thread.join()
+        if errors:
+            # The upload failed first, which made writing fail with a BrokenPipeError.
+            raise errors[0]
+        raise
+    pipe.close()
+    upload_thread.join()
+    if errors:
+        raise errors[0]
+
+
+def _run_concurrently(task, items, num_workers):
+    """Calls ``task`` with each tuple of arguments in ``items`` on a bounded thread pool.
+
+    The first exception raised by a task cancels the tasks that have not started yet, and is
+    raised again.
+    """
+    if num_workers == 1:
+        for args in items:
+            task(*args)
+        return
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        futures = [executor.submit(task, *args) for args in items]
+        try:
+            for future in futures:
+                future.result()
+        except Exception:
+            for future in futures:
+                future.cancel()
+            raise
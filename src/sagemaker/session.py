@@ -13,11 +13,13 @@
 """Placeholder docstring"""
 from __future__ import absolute_import, print_function
 
+import itertools
 import json
 import logging
 import os
 import re
 import sys
+import threading
 import time
 import typing
 import warnings
@@ -32,7 +34,7 @@ import six
 from sagemaker.utils import instance_supports_kms
 
 import sagemaker.logs
-from sagemaker import vpc_utils, s3_utils
+from sagemaker import vpc_utils, s3_utils, s3_transfer, waiters
 from sagemaker._studio import _append_project_tags
 from sagemaker.config import load_sagemaker_config, validate_sagemaker_config
 from sagemaker.config import (
@@ -130,6 +132,9 @@ from sagemaker.session_settings import SessionSettings
 LOGGER = logging.getLogger("sagemaker")
 
 NOTEBOOK_METADATA_FILE = "/opt/ml/metadata/resource-metadata.json"
+
+# Guards the creation of the rate limiters and status pollers shared by the waiters of sessions.
+_WAITERS_LOCK = threading.Lock()
 _STATUS_CODE_TABLE = {
     "COMPLETED": "Completed",
     "INPROGRESS": "InProgress",
@@ -240,6 +245,8 @@ class Session(object):  # pylint: disable=too-many-public-methods
         self.config = None
         self.lambda_client = None
         self.settings = settings
+        self._describe_rate_limiter = None
+        self._status_pollers = {}
 
         self._initialize(
             boto_session=boto_session,
@@ -329,14 +336,24 @@ class Session(object):  # pylint: disable=too-many-public-methods
         """Placeholder docstring"""
         return self._region_name
 
-    def upload_data(self, path, bucket=None, key_prefix="data", extra_args=None):
+    def upload_data(
+        self,
+        path,
+        bucket=None,
+        key_prefix="data",
+        extra_args=None,
+        max_concurrency=s3_transfer.DEFAULT_MAX_CONCURRENCY,
+        multipart_chunksize=s3_transfer.DEFAULT_MULTIPART_CHUNKSIZE,
+        skip_unchanged=False,
+    ):
         """Upload local file or directory to S3.
 
         If a single file is specified for upload, the resulting S3 object key is
         ``{key_prefix}/{filename}`` (filename does not include the local path, if any specified).
         If a directory is specified for upload, the API uploads all content, recursively,
         preserving relative structure of subdirectories. The resulting object key names are:
-        ``{key_prefix}/{relative_subdirectory_path}/filename``.
+        ``{key_prefix}/{relative_subdirectory_path}/filename``. Files are uploaded concurrently
+        by a bounded thread pool sharing the S3 client of the ``Session``.
 
         Args:
             path (str): Path (absolute or relative) of local file or directory to upload.
@@ -350,6 +367,12 @@ class Session(object):  # pylint: disable=too-many-public-methods
                 Similar to ExtraArgs parameter in S3 upload_file function. Please refer to the
                 ExtraArgs parameter documentation here:
                 https://boto3.amazonaws.com/v1/documentation/api/latest/guide/s3-uploading-files.html#the-extraargs-parameter
+            max_concurrency (int): The maximum number of concurrent S3 requests (default: 10).
+            multipart_chunksize (int): The part size in bytes of multipart uploads of large
+                files (default: 8 MiB).
+            skip_unchanged (bool): Whether to skip files whose S3 object already has the same
+                size and ETag, so that re-runs only upload changed files (default: False).
+                Objects encrypted with SSE-KMS are always uploaded again.
 
         Returns:
             str: The S3 URI of the uploaded file(s). If a file is specified in the path argument,
@@ -384,8 +407,15 @@ class Session(object):  # pylint: disable=too-many-public-methods
         else:
             s3 = self.s3_resource
 
-        for local_path, s3_key in files:
-            s3.Object(bucket, s3_key).upload_file(local_path, ExtraArgs=extra_args)
+        s3_transfer.upload_files(
+            s3,
+            bucket,
+            files,
+            extra_args=extra_args,
+            max_concurrency=max_concurrency,
+            multipart_chunksize=multipart_chunksize,
+            skip_unchanged=skip_unchanged,
+        )
 
         s3_uri = "s3://{}/{}".format(bucket, key_prefix)
         # If a specific file was used as input (instead of a directory), we return the full S3 key
@@ -425,9 +455,21 @@ class Session(object):  # pylint: disable=too-many-public-methods
         s3_uri = "s3://{}/{}".format(bucket, key)
         return s3_uri
 
-    def download_data(self, path, bucket, key_prefix="", extra_args=None):
+    def download_data(
+        self,
+        path,
+        bucket,
+        key_prefix="",
+        extra_args=None,
+        max_concurrency=s3_transfer.DEFAULT_MAX_CONCURRENCY,
+        multipart_chunksize=s3_transfer.DEFAULT_MULTIPART_CHUNKSIZE,
+        skip_unchanged=False,
+    ):
         """Download file or directory from S3.
 
+        Objects are downloaded concurrently by a bounded thread pool sharing the S3 client of
+        the ``Session``.
+
         Args:
             path (str): Local path where the file or directory should be downloaded to.
             bucket (str): Name of the S3 Bucket to download from.
@@ -436,6 +478,12 @@ class Session(object):  # pylint: disable=too-many-public-methods
                 download operation. Please refer to the ExtraArgs parameter in the boto3
                 documentation here:
                 https://boto3.amazonaws.com/v1/documentation/api/latest/guide/s3-example-download-file.html
+            max_concurrency (int): The maximum number of concurrent S3 requests (default: 10).
+            multipart_chunksize (int): The part size in bytes of multipart downloads of large
+                objects (default: 8 MiB).
+            skip_unchanged (bool): Whether to skip objects whose local file already has the
+                same size, and the same mtime or ETag, so that re-runs only download changed
+                objects (default: False).
 
         Returns:
             list[str]: List of local paths of downloaded files
@@ -447,7 +495,7 @@ class Session(object):  # pylint: disable=too-many-public-methods
             s3 = self.s3_client
 
         # Initialize the variables used to loop through the contents of the S3 bucket.
-        keys = []
+        s3_objects = []
         next_token = ""
         base_parameters = {"Bucket": bucket, "Prefix": key_prefix}
 
@@ -464,27 +512,30 @@ class Session(object):  # pylint: disable=too-many-public-methods
                     "Nothing to download from bucket: %s, key_prefix: %s.", bucket, key_prefix
                 )
                 return []
-            # For each object, save its key or directory.
-            for s3_object in contents:
-                key = s3_object.get("Key")
-                keys.append(key)
+            # For each object, save its key or directory along with its size and ETag.
+            s3_objects.extend(contents)
             next_token = response.get("NextContinuationToken")
 
-        # For each object key, create the directory on the local machine if needed, and then
-        # download the file.
-        downloaded_paths = []
-        for key in keys:
+        # For each object key, compute the destination path on the local machine, and then
+        # download all the files.
+        files = []
+        for s3_object in s3_objects:
+            key = s3_object.get("Key")
             tail_s3_uri_path = os.path.basename(key)
             if not os.path.splitext(key_prefix)[1]:
                 tail_s3_uri_path = os.path.relpath(key, key_prefix)
-            destination_path = os.path.join(path, tail_s3_uri_path)
-            if not os.path.exists(os.path.dirname(destination_path)):
-                os.makedirs(os.path.dirname(destination_path))
-            s3.download_file(
-                Bucket=bucket, Key=key, Filename=destination_path, ExtraArgs=extra_args
-            )
-            downloaded_paths.append(destination_path)
-        return downloaded_paths
+            files.append((s3_object, os.path.join(path, tail_s3_uri_path)))
+
+        s3_transfer.download_files(
+            s3,
+            bucket,
+            files,
+            extra_args=extra_args,
+            max_concurrency=max_concurrency,
+            multipart_chunksize=multipart_chunksize,
+            skip_unchanged=skip_unchanged,
+        )
+        return [destination_path for _, destination_path in files]
 
     def read_s3_file(self, bucket, key_prefix):
         """Read a single file from S3.
@@ -2353,7 +2404,9 @@ class Session(object):  # pylint: disable=too-many-public-methods
             exceptions.CapacityError: If the auto ml job fails with CapacityError.
             exceptions.UnexpectedStatusException: If the auto ml job fails.
         """
-        desc = _wait_until(lambda: _auto_ml_job_status(self.sagemaker_client, job), poll)
+        desc = _wait_until(
+            lambda: _auto_ml_job_status(self.sagemaker_client, job), poll, self._waiter()
+        )
         _check_job_status(job, desc, "AutoMLJobStatus")
         return desc
 
@@ -3769,7 +3822,9 @@ class Session(object):  # pylint: disable=too-many-public-methods
             exceptions.UnexpectedStatusException: If waiting and the Model Package job fails.
         """
         desc = _wait_until(
-            lambda: _create_model_package_status(self.sagemaker_client, model_package_name), poll
+            lambda: _create_model_package_status(self.sagemaker_client, model_package_name),
+            poll,
+            self._waiter(),
         )
         status = desc["ModelPackageStatus"]
 
@@ -4251,6 +4306,36 @@ class Session(object):  # pylint: disable=too-many-public-methods
             print("Error retrieving tags. resource_arn: {}".format(resource_arn))
             raise error
 
+    def _waiter(self, resource=None, name=None, poll=5):
+        """Returns the waiter pacing the polls of a resource, as configured by the settings.
+
+        Args:
+            resource (str): Optional. The ``Search`` resource type of the resource, if its
+                status can be polled by the multiplexed poller of the session (default: None).
+            name (str): Optional. The name of the resource (default: None).
+            poll (int): The polling interval of the multiplexed poller in seconds (default: 5).
+
+        Returns:
+            sagemaker.waiters.Waiter: The waiter.
+        """
+        config = getattr(self.settings, "waiter_config", None) or waiters.WaiterConfig()
+        poller = None
+        with _WAITERS_LOCK:
+            if config.max_describe_rate and self._describe_rate_limiter is None:
+                self._describe_rate_limiter = waiters.RateLimiter(config.max_describe_rate)
+            # Local mode has no ``Search`` API, so its resources are always described.
+            if (
+                config.multiplexed
+                and resource in waiters.SEARCHABLE_RESOURCES
+                and not self.local_mode
+            ):
+                poller = self._status_pollers.get(resource)
+                if poller is None:
+                    poller = waiters.StatusPoller(self.sagemaker_client, resource, poll)
+                    self._status_pollers[resource] = poller
+                poller.poll = min(poller.poll, poll)
+        return waiters.Waiter(config, self._describe_rate_limiter, poller, name)
+
     def wait_for_job(self, job, poll=5):
         """Wait for an Amazon SageMaker training job to complete.
 
@@ -4266,7 +4351,10 @@ class Session(object):  # pylint: disable=too-many-public-methods
             exceptions.UnexpectedStatusException: If the training job fails.
         """
         desc = _wait_until_training_done(
-            lambda last_desc: _train_done(self.sagemaker_client, job, last_desc), None, poll
+            lambda last_desc: _train_done(self.sagemaker_client, job, last_desc),
+            None,
+            poll,
+            waiter=self._waiter("TrainingJob", job, poll),
         )
         _check_job_status(job, desc, "TrainingJobStatus")
         return desc
@@ -4285,7 +4373,9 @@ class Session(object):  # pylint: disable=too-many-public-methods
             exceptions.CapacityError: If the processing job fails with CapacityError.
             exceptions.UnexpectedStatusException: If the processing job fails.
         """
-        desc = _wait_until(lambda: _processing_job_status(self.sagemaker_client, job), poll)
+        desc = _wait_until(
+            lambda: _processing_job_status(self.sagemaker_client, job), poll, self._waiter()
+        )
         _check_job_status(job, desc, "ProcessingJobStatus")
         return desc
 
@@ -4303,7 +4393,9 @@ class Session(object):  # pylint: disable=too-many-public-methods
             exceptions.CapacityError: If the compilation job fails with CapacityError.
             exceptions.UnexpectedStatusException: If the compilation job fails.
         """
-        desc = _wait_until(lambda: _compilation_job_status(self.sagemaker_client, job), poll)
+        desc = _wait_until(
+            lambda: _compilation_job_status(self.sagemaker_client, job), poll, self._waiter()
+        )
         _check_job_status(job, desc, "CompilationJobStatus")
         return desc
 
@@ -4321,7 +4413,9 @@ class Session(object):  # pylint: disable=too-many-public-methods
             exceptions.CapacityError: If the edge packaging job fails with CapacityError.
             exceptions.UnexpectedStatusException: If the edge packaging job fails.
         """
-        desc = _wait_until(lambda: _edge_packaging_job_status(self.sagemaker_client, job), poll)
+        desc = _wait_until(
+            lambda: _edge_packaging_job_status(self.sagemaker_client, job), poll, self._waiter()
+        )
         _check_job_status(job, desc, "EdgePackagingJobStatus")
         return desc
 
@@ -4339,7 +4433,11 @@ class Session(object):  # pylint: disable=too-many-public-methods
             exceptions.CapacityError: If the hyperparameter tuning job fails with CapacityError.
             exceptions.UnexpectedStatusException: If the hyperparameter tuning job fails.
         """
-        desc = _wait_until(lambda: _tuning_job_status(self.sagemaker_client, job), poll)
+        desc = _wait_until(
+            lambda: _tuning_job_status(self.sagemaker_client, job),
+            poll,
+            self._waiter("HyperParameterTuningJob", job, poll),
+        )
         _check_job_status(job, desc, "HyperParameterTuningJobStatus")
         return desc
 
@@ -4368,7 +4466,9 @@ class Session(object):  # pylint: disable=too-many-public-methods
             exceptions.CapacityError: If the transform job fails with CapacityError.
             exceptions.UnexpectedStatusException: If the transform job fails.
         """
-        desc = _wait_until(lambda: _transform_job_status(self.sagemaker_client, job), poll)
+        desc = _wait_until(
+            lambda: _transform_job_status(self.sagemaker_client, job), poll, self._waiter()
+        )
         _check_job_status(job, desc, "TransformJobStatus")
         return desc
 
@@ -4407,7 +4507,11 @@ class Session(object):  # pylint: disable=too-many-public-methods
         Returns:
             dict: Return value from the ``DescribeEndpoint`` API.
         """
-        desc = _wait_until(lambda: _deploy_done(self.sagemaker_client, endpoint), poll)
+        desc = _wait_until(
+            lambda: _deploy_done(self.sagemaker_client, endpoint),
+            poll,
+            self._waiter("Endpoint", endpoint, poll),
+        )
         status = desc["EndpointStatus"]
 
         if status != "InService":
@@ -6458,16 +6562,34 @@ def _deploy_done(sagemaker_client, endpoint_name):
     return None if status in in_progress_statuses else desc
 
 
-def _wait_until_training_done(callable_fn, desc, poll=5):
-    """Placeholder docstring"""
+def _wait_until_training_done(callable_fn, desc, poll=5, waiter=None):
+    """Polls ``callable_fn`` until the training job is done.
+
+    Args:
+        callable_fn (callable): Function called with the last job description, which returns
+            the new description and whether the job is done.
+        desc (dict): The initial job description.
+        poll (int): Polling interval in seconds (default: 5).
+        waiter (sagemaker.waiters.Waiter): Optional. The waiter pacing the polls, with a backoff
+            and a rate limit. If not specified, polls every ``poll`` seconds (default: None).
+
+    Returns:
+        dict: The last job description.
+    """
     elapsed_time = 0
     finished = None
     job_desc = desc
+    delays = waiter.delays(poll) if waiter is not None else itertools.repeat(poll)
     while not finished:
         try:
-            elapsed_time += poll
-            time.sleep(poll)
-            job_desc, finished = callable_fn(job_desc)
+            delay = next(delays)
+            elapsed_time += delay
+            if waiter is not None:
+                waiter.sleep(delay)
+                job_desc, finished = waiter.call(callable_fn, job_desc)
+            else:
+                time.sleep(delay)
+                job_desc, finished = callable_fn(job_desc)
         except botocore.exceptions.ClientError as err:
             # For initial 5 mins we accept/pass AccessDeniedException.
             # The reason is to await tag propagation to avoid false AccessDenied claims for an
@@ -6485,15 +6607,31 @@ def _wait_until_training_done(callable_fn, desc, poll=5):
     return job_desc
 
 
-def _wait_until(callable_fn, poll=5):
-    """Placeholder docstring"""
+def _wait_until(callable_fn, poll=5, waiter=None):
+    """Polls ``callable_fn`` until it returns a result other than None.
+
+    Args:
+        callable_fn (callable): Function returning None while the resource is in progress.
+        poll (int): Polling interval in seconds (default: 5).
+        waiter (sagemaker.waiters.Waiter): Optional. The waiter pacing the polls, with a backoff
+            and a rate limit. If not specified, polls every ``poll`` seconds (default: None).
+
+    Returns:
+        The result of ``callable_fn``.
+    """
     elapsed_time = 0
     result = None
+    delays = waiter.delays(poll) if waiter is not None else itertools.repeat(poll)
     while result is None:
         try:
-            elapsed_time += poll
-            time.sleep(poll)
-            result = callable_fn()
+            delay = next(delays)
+            elapsed_time += delay
+            if waiter is not None:
+                waiter.sleep(delay)
+                result = waiter.call(callable_fn)
+            else:
+                time.sleep(delay)
+                result = callable_fn()
         except botocore.exceptions.ClientError as err:
             # For initial 5 mins we accept/pass AccessDeniedException.
             # The reason is to await tag propagation to avoid false AccessDenied claims for an
@@ -6786,14 +6924,17 @@ def _flush_log_streams(
                 orderBy="LogStreamName",
                 limit=min(instance_count, 50),
             )
-            stream_names = [s["logStreamName"] for s in streams["logStreams"]]
+            # Update the list of the caller, so that the streams are only described again
+            # until there is one for every instance.
+            stream_names[:] = [s["logStreamName"] for s in streams["logStreams"]]
 
-            while "nextToken" in streams:
+            while "nextToken" in streams and len(stream_names) < instance_count:
                 streams = client.describe_log_streams(
                     logGroupName=log_group,
                     logStreamNamePrefix=job_name + "/",
                     orderBy="LogStreamName",
                     limit=50,
+                    nextToken=streams["nextToken"],
                 )
 
                 stream_names.extend([s["logStreamName"] for s in streams["logStreams"]])
@@ -22,6 +22,11 @@ class SessionSettings(object):
         self,
         encrypt_repacked_artifacts=True,
         local_download_dir=None,
+        compression_threads=1,
+        compression_level=9,
+        stream_artifact_uploads=False,
+        upload_cache=None,
+        waiter_config=None,
     ) -> None:
         """Initialize the ``SessionSettings`` of a SageMaker ``Session``.
 
@@ -31,9 +36,33 @@ class SessionSettings(object):
                 is not provided (Default: True).
             local_download_dir (str): Optional. A path specifying the local directory
                 for downloading artifacts. (Default: None).
+            compression_threads (int): The number of threads compressing the tar.gz archives of
+                source code and repacked models. With more than one thread, the archives are
+                written as multi-member gzip files, which are read like regular gzip files
+                (Default: 1).
+            compression_level (int): The gzip compression level of the tar.gz archives of
+                source code and repacked models, from 0 to 9 (Default: 9).
+            stream_artifact_uploads (bool): Flag to indicate whether to stream the archives of
+                source code and repacked models to S3 while they are written, and to stream
+                models from S3 while they are repacked, instead of using temporary files
+                (Default: False).
+            upload_cache (sagemaker.upload_cache.UploadCache): Optional. A cache of the code
+                uploaded to S3, so that the same code bundles and dependencies are uploaded once
+                and reused by ``Estimator``, ``Processor``, ``FrameworkModel`` and remote
+                functions (Default: None).
+            waiter_config (sagemaker.waiters.WaiterConfig): Optional. The configuration of how
+                the ``wait_for_*`` methods of the session poll the status of jobs and endpoints:
+                exponential backoff with jitter, a rate limit on Describe requests, and batched
+                ``Search`` requests. If not specified, ``WaiterConfig()`` is used, which polls
+                at the fixed interval of each method (Default: None).
         """
         self._encrypt_repacked_artifacts = encrypt_repacked_artifacts
         self._local_download_dir = local_download_dir
+        self._compression_threads = compression_threads
+        self._compression_level = compression_level
+        self._stream_artifact_uploads = stream_artifact_uploads
+        self._upload_cache = upload_cache
+        self._waiter_config = waiter_config
 
     @property
     def encrypt_repacked_artifacts(self) -> bool:
@@ -44,3 +73,28 @@ class SessionSettings(object):
     def local_download_dir(self) -> str:
         """Return path specifying the local directory for downloading artifacts."""
         return self._local_download_dir
+
+    @property
+    def compression_threads(self) -> int:
+        """Return the number of threads compressing source code and repacked models."""
+        return self._compression_threads
+
+    @property
+    def compression_level(self) -> int:
+        """Return the gzip compression level of source code and repacked models."""
+        return self._compression_level
+
+    @property
+    def stream_artifact_uploads(self) -> bool:
+        """Return True if source code and repacked models should be streamed to S3."""
+        return self._stream_artifact_uploads
+
+    @property
+    def upload_cache(self):
+        """Return the cache of the code uploaded to S3, if any."""
+        return self._upload_cache
+
+    @property
+    def waiter_config(self):
+        """Return the configuration of the waiters of the session, if any."""
+        return self._waiter_config
@@ -0,0 +1,185 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""This module contains helper functions to write tar.gz archives as streams.
+
+Archives can be compressed by several threads, and written to any writable file object, such as
+the stream of an S3 upload returned by ``sagemaker.s3_transfer.upload_stream``.
+"""
+from __future__ import absolute_import
+
+import collections
+import contextlib
+import gzip
+import posixpath
+import tarfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_COMPRESSION_LEVEL = 9
+DEFAULT_BLOCK_SIZE = 4 * 1024 * 1024
+
+
+def _gzip_member(data, compression_level):
+    """Compresses ``data`` into a complete gzip member."""
+    compressor = zlib.compressobj(compression_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+class ParallelGzipWriter(object):
+    """A writable file object that compresses its content in parallel into a gzip file.
+
+    The content is split into blocks of ``block_size`` bytes, which are compressed by a thread
+    pool into separate gzip members and written in order to the underlying file object. A file
+    made of several gzip members is a valid gzip file, which is read by ``gzip``, ``tarfile`` and
+    ``tar`` like a single member file. At most two blocks per thread are held in memory.
+    """
+
+    def __init__(
+        self,
+        fileobj,
+        compression_threads,
+        compression_level=DEFAULT_COMPRESSION_LEVEL,
+        block_size=DEFAULT_BLOCK_SIZE,
+    ):
+        """Initialize a ``ParallelGzipWriter`` instance.
+
+        Args:
+            fileobj (io.BufferedIOBase): The file object the compressed content is written to.
+                It is not closed by the writer.
+            compression_threads (int): The number of threads compressing blocks.
+            compression_level (int): The gzip compression level, from 0 to 9 (default: 9).
+            block_size (int): The size in bytes of the blocks compressed in parallel
+                (default: 4 MiB).
+        """
+        self._fileobj = fileobj
+        self._compression_level = compression_level
+        self._block_size = block_size
+        self._max_pending = 2 * compression_threads
+        self._executor = ThreadPoolExecutor(max_workers=compression_threads)
+        self._pending = collections.deque()
+        self._buffer = bytearray()
+        self._written_members = 0
+        self.closed = False
+
+    def write(self, data):
+        """Buffers ``data`` and compresses every complete block."""
+        if self.closed:
+            raise ValueError("write to closed file")
+        self._buffer += data
+        while len(self._buffer) >= self._block_size:
+            block = bytes(self._buffer[: self._block_size])
+            del self._buffer[: self._block_size]
+            self._submit(block)
+        return len(data)
+
+    def _submit(self, block):
+        """Compresses a block in the thread pool, waiting for the oldest one if too many are."""
+        self._pending.append(self._executor.submit(_gzip_member, block, self._compression_level))
+        while len(self._pending) >= self._max_pending:
+            self._write_oldest()
+
+    def _write_oldest(self):
+        """Writes the oldest compressed block to the underlying file object."""
+        self._fileobj.write(self._pending.popleft().result())
+        self._written_members += 1
+
+    def close(self):
+        """Compresses the last block and writes all the remaining blocks."""
+        if self.closed:
+            return
+        try:
+            if self._buffer or not (self._pending or self._written_members):
+                self._submit(bytes(self._buffer))
+                self._buffer = bytearray()
+            while self._pending:
+                self._write_oldest()
+        finally:
+            self.closed = True
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        """Returns the writer itself."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Closes the writer, or only stops its threads when an exception was raised."""
+        if exc_type is None:
+            self.close()
+        else:
+            self.closed = True
+            for future in self._pending:
+                future.cancel()
+            self._executor.shutdown(wait=True)
+
+
+@contextlib.contextmanager
+def open_tar_writer(
+    fileobj,
+    compression_threads=1,
+    compression_level=DEFAULT_COMPRESSION_LEVEL,
+    dereference=False,
+):
+    """Opens a tar.gz archive that is written as a stream to a file object.
+
+    The file object only needs a ``write`` method, so that the archive can be streamed to a pipe
+    or to S3 without a temporary file.
+
+    Args:
+        fileobj (io.BufferedIOBase): The file object to write the archive to. It is not closed.
+        compression_threads (int): The number of threads compressing the archive (default: 1).
+            With more than one thread, the archive is written as a multi-member gzip file by a
+            ``ParallelGzipWriter``.
+        compression_level (int): The gzip compression level, from 0 to 9 (default: 9).
+        dereference (bool): Whether to add the files that symbolic links point to, instead of
+            the links (default: False).
+
+    Yields:
+        tarfile.TarFile: The archive, open for writing.
+    """
+    if compression_threads and compression_threads > 1:
+        gz_fileobj = ParallelGzipWriter(fileobj, compression_threads, compression_level)
+    else:
+        gz_fileobj = gzip.GzipFile(fileobj=fileobj, mode="wb", compresslevel=compression_level)
+    with gz_fileobj:
+        with tarfile.open(fileobj=gz_fileobj, mode="w|", dereference=dereference) as tar:
+            yield tar
+
+
+def normalize_member_name(name):
+    """Returns the path of an archive member without its leading ``./`` or ``/``."""
+    return posixpath.normpath(name).lstrip("/")
+
+
+def is_under(name, directory):
+    """Checks whether an archive member is ``directory`` itself or is inside of it."""
+    name = normalize_member_name(name)
+    return name == directory or name.startswith(directory + "/")
+
+
+def copy_members(source_tar, target_tar, exclude=None):
+    """Copies the members of an archive open as a stream to another archive.
+
+    The content of the members is streamed from one archive to the other, without being
+    extracted to disk.
+
+    Args:
+        source_tar (tarfile.TarFile): The archive to copy the members of.
+        target_tar (tarfile.TarFile): The archive to add the members to.
+        exclude (callable): Optional function called with each ``tarfile.TarInfo``, which returns
+            True for the members that must not be copied (default: None).
+            They can still be extracted from ``source_tar`` by this function.
+    """
+    for member in source_tar:
+        if exclude is not None and exclude(member):
+            continue
+        target_tar.addfile(member, source_tar.extractfile(member) if member.isfile() else None)
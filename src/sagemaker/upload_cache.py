@@ -0,0 +1,198 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""This module contains a content-addressed cache of the code uploaded to S3.
+
+Code bundles are identified by a hash of their content, so that an unchanged ``source_dir`` is
+uploaded once and its S3 URI is reused by the following jobs, models and remote functions.
+"""
+from __future__ import absolute_import
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+
+from botocore.exceptions import ClientError
+
+logger = logging.getLogger("sagemaker")
+
+DEFAULT_MANIFEST_PATH = os.path.join(os.path.expanduser("~"), ".sagemaker", "upload_cache.json")
+_READ_SIZE = 1024 * 1024
+
+# The kinds of uploads, which are cached separately even when their content is the same.
+TAR_GZ_UPLOAD = "tar.gz"
+RAW_UPLOAD = "raw"
+
+
+def _hash_file(path):
+    """Returns the SHA-256 digest of the content of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_READ_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def compute_content_hash(paths, *extra, kind):
+    """Computes a hash of the content of files and directories, as they are uploaded.
+
+    Each path is hashed under its base name, as it is added to code bundles, and directories are
+    hashed recursively with the relative path of each file. Modification times are ignored, so
+    the hash only changes when the content or the layout of the files does.
+
+    Args:
+        paths (list[str]): Paths of the files and directories.
+        *extra: Values that also distinguish uploads of the same content, such as the
+            encryption arguments of the upload.
+        kind (str): How the files are uploaded, ``TAR_GZ_UPLOAD`` for a ``tar.gz`` archive of
+            the files, or ``RAW_UPLOAD`` for the files themselves.
+
+    Returns:
+        str: The hexadecimal SHA-256 hash.
+    """
+    digest = hashlib.sha256()
+    digest.update("K {}\n".format(kind).encode("utf-8"))
+    for path in paths:
+        arcname = os.path.basename(os.path.normpath(path))
+        if os.path.isdir(path):
+            digest.update("D {}\n".format(arcname).encode("utf-8"))
+            for root, dirs, files in os.walk(path, followlinks=True):
+                dirs.sort()
+                relative_root = os.path.relpath(root, path)
+                for name in dirs:
+                    relative_path = os.path.normpath(os.path.join(arcname, relative_root, name))
+                    digest.update("D {}\n".format(relative_path).encode("utf-8"))
+                for name in sorted(files):
+                    relative_path = os.path.normpath(os.path.join(arcname, relative_root, name))
+                    file_hash = _hash_file(os.path.join(root, name))
+                    digest.update("F {} {}\n".format(relative_path, file_hash).encode("utf-8"))
+        else:
+            digest.update("F {} {}\n".format(arcname, _hash_file(path)).encode("utf-8"))
+    for value in extra:
+        digest.update("X {}\n".format(json.dumps(value, sort_keys=True)).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class UploadCache(object):
+    """A cache of the S3 URIs of uploaded code, keyed by the hash of its content.
+
+    Entries are kept in a local JSON manifest shared by the processes of the user. Each entry is
+    confirmed by a ``HeadObject`` request before it is reused, so that code whose S3 object was
+    deleted or overwritten is uploaded again. The numbers of hits and misses are counted, and can
+    be logged with ``str(cache)``.
+    """
+
+    def __init__(self, manifest_path=DEFAULT_MANIFEST_PATH):
+        """Initialize an ``UploadCache`` instance.
+
+        Args:
+            manifest_path (str): Path of the local JSON manifest of the cache
+                (default: ``~/.sagemaker/upload_cache.json``). If None, the cache is only kept
+                in memory.
+        """
+        self.manifest_path = manifest_path
+        self.hits = 0
+        self.misses = 0
+        self._entries = None
+        self._lock = threading.Lock()
+
+    def get(self, s3_client, bucket, content_hash):
+        """Returns the S3 URI of content uploaded to a bucket, if it is still there.
+
+        Args:
+            s3_client (boto3.client("s3")): The S3 client to check the object with.
+            bucket (str): Name of the S3 bucket the content is uploaded to.
+            content_hash (str): The hash of the content, from ``compute_content_hash``.
+
+        Returns:
+            str: The S3 URI of the content, or None if it has to be uploaded.
+        """
+        entry_key = self._entry_key(bucket, content_hash)
+        with self._lock:
+            entry = self._load_entries().get(entry_key)
+
+        if entry is not None and self._object_unchanged(s3_client, bucket, entry):
+            with self._lock:
+                self.hits += 1
+            logger.info("Reusing code uploaded to %s (upload cache: %s).", entry["s3_uri"], self)
+            return entry["s3_uri"]
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, s3_client, bucket, content_hash, s3_uri, key):
+        """Records content uploaded to a bucket.
+
+        Args:
+            s3_client (boto3.client("s3")): The S3 client to check the object with.
+            bucket (str): Name of the S3 bucket the content is uploaded to.
+            content_hash (str): The hash of the content, from ``compute_content_hash``.
+            s3_uri (str): The S3 URI to reuse for the content.
+            key (str): The key of an S3 object of the content, which is checked before the
+                S3 URI is reused.
+        """
+        etag = s3_client.head_object(Bucket=bucket, Key=key).get("ETag")
+        with self._lock:
+            # Reload the manifest to keep the entries written by other processes.
+            self._entries = None
+            entries = self._load_entries()
+            entries[self._entry_key(bucket, content_hash)] = {
+                "s3_uri": s3_uri,
+                "key": key,
+                "etag": etag,
+            }
+            self._save_entries(entries)
+
+    def _object_unchanged(self, s3_client, bucket, entry):
+        """Checks whether the S3 object of an entry still exists, with the same ETag."""
+        try:
+            head = s3_client.head_object(Bucket=bucket, Key=entry["key"])
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("403", "404", "NoSuchKey", "NotFound"):
+                return False
+            raise
+        return head.get("ETag") == entry["etag"]
+
+    @staticmethod
+    def _entry_key(bucket, content_hash):
+        """Returns the key of the manifest entry of content uploaded to a bucket."""
+        return "{}/{}".format(bucket, content_hash)
+
+    def _load_entries(self):
+        """Returns the entries of the manifest, reading it if they are not loaded yet."""
+        if self._entries is None:
+            self._entries = {}
+            if self.manifest_path is not None and os.path.exists(self.manifest_path):
+                try:
+                    with open(self.manifest_path, "r") as f:
+                        self._entries = json.load(f)
+                except (OSError, ValueError) as e:
+                    logger.warning("Ignoring unreadable upload cache %s: %s", self.manifest_path, e)
+        return self._entries
+
+    def _save_entries(self, entries):
+        """Writes the entries to the manifest, atomically."""
+        if self.manifest_path is None:
+            return
+        directory = os.path.dirname(os.path.abspath(self.manifest_path))
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=directory, delete=False) as f:
+            json.dump(entries, f, indent=1, sort_keys=True)
+        os.replace(f.name, self.manifest_path)
+
+    def __str__(self):
+        """Summarize the hits and misses of the cache."""
+        return "{} hits, {} misses".format(self.hits, self.misses)
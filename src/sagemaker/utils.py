@@ -15,7 +15,7 @@ from __future__ import absolute_import
 
 import contextlib
 import copy
-import errno
+import gzip
 import inspect
 import logging
 import os
@@ -36,7 +36,7 @@ import botocore
 from botocore.utils import merge_dicts
 from six.moves.urllib import parse
 
-from sagemaker import deprecations
+from sagemaker import deprecations, s3_transfer, tar_utils
 from sagemaker.config import validate_sagemaker_config
 from sagemaker.config.config_utils import (
     _log_sagemaker_config_single_substitution,
@@ -343,7 +343,14 @@ def secondary_training_status_message(job_description, prev_description):
     return "\n".join(status_strs)
 
 
-def download_folder(bucket_name, prefix, target, sagemaker_session):
+def download_folder(
+    bucket_name,
+    prefix,
+    target,
+    sagemaker_session,
+    max_concurrency=s3_transfer.DEFAULT_MAX_CONCURRENCY,
+    skip_unchanged=False,
+):
     """Download a folder from S3 to a local path
 
     Args:
@@ -353,6 +360,9 @@ def download_folder(bucket_name, prefix, target, sagemaker_session):
         target (str): destination path where the downloaded items will be placed
         sagemaker_session (sagemaker.session.Session): a sagemaker session to
             interact with S3.
+        max_concurrency (int): The maximum number of concurrent S3 requests (default: 10).
+        skip_unchanged (bool): Whether to skip objects whose local file already has the same
+            size, and the same mtime or ETag (default: False).
     """
     boto_session = sagemaker_session.boto_session
     s3 = boto_session.resource("s3", region_name=boto_session.region_name)
@@ -375,10 +385,24 @@ def download_folder(bucket_name, prefix, target, sagemaker_session):
             else:
                 raise
 
-    _download_files_under_prefix(bucket_name, prefix, target, s3)
+    _download_files_under_prefix(
+        bucket_name,
+        prefix,
+        target,
+        s3,
+        max_concurrency=max_concurrency,
+        skip_unchanged=skip_unchanged,
+    )
 
 
-def _download_files_under_prefix(bucket_name, prefix, target, s3):
+def _download_files_under_prefix(
+    bucket_name,
+    prefix,
+    target,
+    s3,
+    max_concurrency=s3_transfer.DEFAULT_MAX_CONCURRENCY,
+    skip_unchanged=False,
+):
     """Download all S3 files which match the given prefix
 
     Args:
@@ -386,32 +410,47 @@ def _download_files_under_prefix(bucket_name, prefix, target, s3):
         prefix (str): S3 prefix within the bucket that will be downloaded
         target (str): destination path where the downloaded items will be placed
         s3 (boto3.resources.base.ServiceResource): S3 resource
+        max_concurrency (int): The maximum number of concurrent S3 requests (default: 10).
+        skip_unchanged (bool): Whether to skip objects whose local file already has the same
+            size, and the same mtime or ETag (default: False).
     """
     bucket = s3.Bucket(bucket_name)
+    files = []
     for obj_sum in bucket.objects.filter(Prefix=prefix):
         # if obj_sum is a folder object skip it.
         if obj_sum.key.endswith("/"):
             continue
-        obj = s3.Object(obj_sum.bucket_name, obj_sum.key)
         s3_relative_path = obj_sum.key[len(prefix) :].lstrip("/")
         file_path = os.path.join(target, s3_relative_path)
+        s3_object = {"Key": obj_sum.key}
+        if skip_unchanged:
+            s3_object.update(
+                Size=obj_sum.size, ETag=obj_sum.e_tag, LastModified=obj_sum.last_modified
+            )
+        files.append((s3_object, file_path))
 
-        try:
-            os.makedirs(os.path.dirname(file_path))
-        except OSError as exc:
-            # EEXIST means the folder already exists, this is safe to skip
-            # anything else will be raised.
-            if exc.errno != errno.EEXIST:
-                raise
-        obj.download_file(file_path)
+    s3_transfer.download_files(
+        s3.meta.client,
+        bucket_name,
+        files,
+        max_concurrency=max_concurrency,
+        skip_unchanged=skip_unchanged,
+    )
 
 
-def create_tar_file(source_files, target=None):
+def create_tar_file(
+    source_files,
+    target=None,
+    compression_threads=1,
+    compression_level=tar_utils.DEFAULT_COMPRESSION_LEVEL,
+):
     """Create a tar file containing all the source_files
 
     Args:
         source_files: (List[str]): List of file paths that will be contained in the tar file
         target:
+        compression_threads (int): The number of threads compressing the tar file (default: 1).
+        compression_level (int): The gzip compression level, from 0 to 9 (default: 9).
 
     Returns:
         (str): path to created tar file
@@ -421,13 +460,27 @@ def create_tar_file(source_files, target=None):
     else:
         _, filename = tempfile.mkstemp()
 
-    with tarfile.open(filename, mode="w:gz", dereference=True) as t:
-        for sf in source_files:
-            # Add all files from the directory into the root of the directory structure of the tar
-            t.add(sf, arcname=os.path.basename(sf))
+    if compression_threads > 1:
+        with open(filename, "wb") as f:
+            with tar_utils.open_tar_writer(
+                f, compression_threads, compression_level, dereference=True
+            ) as t:
+                _add_files_to_tar(t, source_files)
+    else:
+        with tarfile.open(
+            filename, mode="w:gz", compresslevel=compression_level, dereference=True
+        ) as t:
+            _add_files_to_tar(t, source_files)
     return filename
 
 
+def _add_files_to_tar(tar, source_files):
+    """Add the source files to the root of the directory structure of a tar file."""
+    for sf in source_files:
+        # Add all files from the directory into the root of the directory structure of the tar
+        tar.add(sf, arcname=os.path.basename(sf))
+
+
 @contextlib.contextmanager
 def _tmpdir(suffix="", prefix="tmp", directory=None):
     """Create a temporary directory with a context manager.
@@ -469,10 +522,15 @@ def repack_model(
 ):
     """Unpack model tarball and creates a new model tarball with the provided code script.
 
-    This function does the following: - uncompresses model tarball from S3 or
-    local system into a temp folder - replaces the inference code from the model
-    with the new code provided - compresses the new model tarball and saves it
-    in S3 or local file system
+    This function does the following: - reads the model tarball from S3 or
+    local system as a stream, and extracts only its ``code/`` directory into a
+    temp folder - replaces the inference code from the model with the new code
+    provided - copies the other members of the model tarball, such as the
+    weights, to the new model tarball without extracting them, adds the new
+    code and saves it in S3 or local file system
+
+    The compression and the streaming of the tarballs are configured by the
+    ``SessionSettings`` of the ``sagemaker_session``.
 
     Args:
         inference_script (str): path or basename of the inference script that
@@ -513,23 +571,142 @@ def repack_model(
         or sagemaker_session.settings.local_download_dir is None
         else sagemaker_session.settings.local_download_dir
     )
+    settings = (
+        sagemaker_session.settings
+        if isinstance(sagemaker_session.settings, SessionSettings)
+        else SessionSettings()
+    )
     with _tmpdir(directory=local_download_dir) as tmp:
-        model_dir = _extract_model(model_uri, sagemaker_session, tmp)
-
-        _create_or_update_code_dir(
-            model_dir,
-            inference_script,
-            source_directory,
-            dependencies,
-            sagemaker_session,
-            tmp,
+        model_dir = os.path.join(tmp, "model")
+        os.mkdir(model_dir)
+
+        with contextlib.ExitStack() as stack:
+            model_fileobj = stack.enter_context(
+                _open_model(model_uri, sagemaker_session, tmp, settings.stream_artifact_uploads)
+            )
+            repacked_model_fileobj, tmp_model_path = _open_repacked_model(
+                stack, repacked_model_uri, sagemaker_session, kms_key, tmp, settings
+            )
+            _repack_model_archive(
+                model_fileobj,
+                repacked_model_fileobj,
+                model_dir,
+                inference_script,
+                source_directory,
+                dependencies,
+                sagemaker_session,
+                tmp,
+                settings,
+            )
+
+        if tmp_model_path is not None:
+            _save_model(repacked_model_uri, tmp_model_path, sagemaker_session, kms_key=kms_key)
+
+
+def _repack_model_archive(
+    model_fileobj,
+    repacked_model_fileobj,
+    model_dir,
+    inference_script,
+    source_directory,
+    dependencies,
+    sagemaker_session,
+    tmp,
+    settings,
+):
+    """Copy a model archive to a new archive, replacing its ``code/`` directory.
+
+    Only the members of the ``code/`` directory are extracted, to ``model_dir``. The other
+    members, such as the model weights, are streamed from one archive to the other.
+    """
+
+    def _extract_code(member):
+        if not tar_utils.is_under(member.name, "code"):
+            return False
+        member.name = tar_utils.normalize_member_name(member.name)
+        model_tar.extract(member, path=model_dir)
+        return True
+
+    # The stream mode of tarfile only reads the first member of a gzip file, while GzipFile
+    # reads the multi-member archives written with several compression threads.
+    with gzip.GzipFile(fileobj=model_fileobj, mode="rb") as model_gz, tarfile.open(
+        fileobj=model_gz, mode="r|"
+    ) as model_tar:
+        with tar_utils.open_tar_writer(
+            repacked_model_fileobj, settings.compression_threads, settings.compression_level
+        ) as repacked_model_tar:
+            tar_utils.copy_members(model_tar, repacked_model_tar, exclude=_extract_code)
+
+            _create_or_update_code_dir(
+                model_dir,
+                inference_script,
+                source_directory,
+                dependencies,
+                sagemaker_session,
+                tmp,
+            )
+            repacked_model_tar.add(os.path.join(model_dir, "code"), arcname="code")
+
+
+@contextlib.contextmanager
+def _open_model(model_uri, sagemaker_session, tmp, stream):
+    """Open a model archive from S3 or the local file system as a stream."""
+    if model_uri.lower().startswith("s3://") and stream:
+        url = parse.urlparse(model_uri)
+        s3 = sagemaker_session.boto_session.resource(
+            "s3", region_name=sagemaker_session.boto_region_name
         )
+        body = s3.Object(url.netloc, url.path.lstrip("/")).get()["Body"]
+        try:
+            yield body
+        finally:
+            body.close()
+        return
+    if model_uri.lower().startswith("s3://"):
+        local_model_path = os.path.join(tmp, "tar_file")
+        download_file_from_url(model_uri, local_model_path, sagemaker_session)
+    else:
+        local_model_path = model_uri.replace("file://", "")
+    with open(local_model_path, "rb") as f:
+        yield f
 
-        tmp_model_path = os.path.join(tmp, "temp-model.tar.gz")
-        with tarfile.open(tmp_model_path, mode="w:gz") as t:
-            t.add(model_dir, arcname=os.path.sep)
 
-        _save_model(repacked_model_uri, tmp_model_path, sagemaker_session, kms_key=kms_key)
+def _open_repacked_model(stack, repacked_model_uri, sagemaker_session, kms_key, tmp, settings):
+    """Open the destination of a repacked model archive.
+
+    Returns:
+        tuple: The writable file object of the archive, and the path of the temporary file to
+            save with ``_save_model`` once it is written, or None if the archive is streamed
+            to S3.
+    """
+    if settings.stream_artifact_uploads and repacked_model_uri.lower().startswith("s3://"):
+        url = parse.urlparse(repacked_model_uri)
+        s3 = sagemaker_session.boto_session.resource(
+            "s3", region_name=sagemaker_session.boto_region_name
+        )
+        stream = stack.enter_context(
+            s3_transfer.upload_stream(
+                s3,
+                url.netloc,
+                url.path.lstrip("/"),
+                extra_args=_repacked_model_extra_args(sagemaker_session, kms_key),
+            )
+        )
+        return stream, None
+    tmp_model_path = os.path.join(tmp, "temp-model.tar.gz")
+    return stack.enter_context(open(tmp_model_path, "wb")), tmp_model_path
+
+
+def _repacked_model_extra_args(sagemaker_session, kms_key):
+    """Return the extra arguments of the upload of a repacked model, to encrypt it."""
+    settings = sagemaker_session.settings if sagemaker_session is not None else SessionSettings()
+    encrypt_artifact = settings.encrypt_repacked_artifacts
+
+    if kms_key:
+        return {"ServerSideEncryption": "aws:kms", "SSEKMSKeyId": kms_key}
+    if encrypt_artifact:
+        return {"ServerSideEncryption": "aws:kms"}
+    return None
 
 
 def _save_model(repacked_model_uri, tmp_model_path, sagemaker_session, kms_key):
@@ -539,17 +716,7 @@ def _save_model(repacked_model_uri, tmp_model_path, sagemaker_session, kms_key):
         bucket, key = url.netloc, url.path.lstrip("/")
         new_key = key.replace(os.path.basename(key), os.path.basename(repacked_model_uri))
 
-        settings = (
-            sagemaker_session.settings if sagemaker_session is not None else SessionSettings()
-        )
-        encrypt_artifact = settings.encrypt_repacked_artifacts
-
-        if kms_key:
-            extra_args = {"ServerSideEncryption": "aws:kms", "SSEKMSKeyId": kms_key}
-        elif encrypt_artifact:
-            extra_args = {"ServerSideEncryption": "aws:kms"}
-        else:
-            extra_args = None
+        extra_args = _repacked_model_extra_args(sagemaker_session, kms_key)
         sagemaker_session.boto_session.resource(
             "s3", region_name=sagemaker_session.boto_region_name
         ).Object(bucket, new_key).upload_file(tmp_model_path, ExtraArgs=extra_args)
@@ -594,20 +761,6 @@ def _create_or_update_code_dir(
             shutil.copy2(dependency, lib_dir)
 
 
-def _extract_model(model_uri, sagemaker_session, tmp):
-    """Placeholder docstring"""
-    tmp_model_dir = os.path.join(tmp, "model")
-    os.mkdir(tmp_model_dir)
-    if model_uri.lower().startswith("s3://"):
-        local_model_path = os.path.join(tmp, "tar_file")
-        download_file_from_url(model_uri, local_model_path, sagemaker_session)
-    else:
-        local_model_path = model_uri.replace("file://", "")
-    with tarfile.open(name=local_model_path, mode="r:gz") as t:
-        t.extractall(path=tmp_model_dir)
-    return tmp_model_dir
-
-
 def download_file_from_url(url, dst, sagemaker_session):
     """Placeholder docstring"""
     url = parse.urlparse(url)
@@ -0,0 +1,260 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""This module contains the waiters polling the status of SageMaker resources.
+
+Waiters poll at a fixed interval by default, and can be configured to poll with an exponential
+backoff with jitter, to share a rate limit on the Describe requests of a session, and to be
+multiplexed so that a single background poller checks the status of many resources with batched
+``Search`` requests.
+"""
+from __future__ import absolute_import
+
+import itertools
+import logging
+import random
+import threading
+import time
+
+logger = logging.getLogger("sagemaker")
+
+# Resources whose status can be polled with the ``Search`` API, with the properties holding their
+# name and status, and their in-progress statuses.
+SEARCHABLE_RESOURCES = {
+    "TrainingJob": ("TrainingJobName", "TrainingJobStatus", ("InProgress", "Created")),
+    "HyperParameterTuningJob": (
+        "HyperParameterTuningJobName",
+        "HyperParameterTuningJobStatus",
+        ("InProgress", "Stopping"),
+    ),
+    "Endpoint": ("EndpointName", "EndpointStatus", ("Creating", "Updating")),
+}
+
+# The maximum number of filters of a ``Search`` expression.
+_MAX_SEARCH_FILTERS = 20
+
+
+class WaiterConfig(object):
+    """Configuration of how the waiters of a ``Session`` poll the status of resources."""
+
+    def __init__(
+        self,
+        max_poll=None,
+        backoff_factor=1,
+        jitter=0,
+        max_describe_rate=None,
+        multiplexed=False,
+        fallback_interval=300,
+    ):
+        """Initialize a ``WaiterConfig`` instance.
+
+        Args:
+            max_poll (float): The maximum polling interval in seconds that the backoff grows to,
+                or None for the ``poll`` interval given to a waiter (default: None). It is never
+                lower than the ``poll`` interval.
+            backoff_factor (float): The factor the polling interval is multiplied by after each
+                poll (default: 1). A factor of 1 polls at the fixed ``poll`` interval.
+            jitter (float): The maximum fraction of each polling interval that is randomly
+                added or removed, so that waiters started together do not poll together
+                (default: 0).
+            max_describe_rate (float): The maximum number of Describe requests per second that
+                the waiters of a session make, or None for no limit (default: None).
+            multiplexed (bool): Whether training jobs, tuning jobs and endpoints are polled by a
+                background poller of the session, with a batched ``Search`` request for all the
+                resources waited for, instead of a Describe request per resource
+                (default: False).
+            fallback_interval (float): With ``multiplexed``, the interval in seconds of the
+                Describe requests made by each waiter in case its resource is not found by
+                ``Search`` (default: 300).
+        """
+        self.max_poll = max_poll
+        self.backoff_factor = backoff_factor
+        self.jitter = jitter
+        self.max_describe_rate = max_describe_rate
+        self.multiplexed = multiplexed
+        self.fallback_interval = fallback_interval
+
+    def delays(self, poll):
+        """Returns an iterator over the successive polling intervals of a waiter.
+
+        Args:
+            poll (float): The first polling interval in seconds.
+        """
+        max_poll = poll if self.max_poll is None else max(poll, self.max_poll)
+        delay = poll
+        while True:
+            yield max(0, delay * (1 + random.uniform(-self.jitter, self.jitter)))
+            delay = min(delay * self.backoff_factor, max_poll)
+
+
+class RateLimiter(object):
+    """Spaces out calls, so that they are made at a maximum rate across threads."""
+
+    def __init__(self, rate):
+        """Initialize a ``RateLimiter`` instance.
+
+        Args:
+            rate (float): The maximum number of calls per second.
+        """
+        self._interval = 1.0 / rate
+        self._next_call = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Blocks until a call can be made."""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_call - now
+            self._next_call = max(now, self._next_call) + self._interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+class Waiter(object):
+    """Paces the polls of a resource for ``sagemaker.session._wait_until``."""
+
+    def __init__(self, config, rate_limiter=None, poller=None, name=None):
+        """Initialize a ``Waiter`` instance.
+
+        Args:
+            config (sagemaker.waiters.WaiterConfig): The configuration of the waiter.
+            rate_limiter (sagemaker.waiters.RateLimiter): Optional. The rate limiter of the
+                Describe requests of the session (default: None).
+            poller (sagemaker.waiters.StatusPoller): Optional. The poller notifying the waiter
+                when the resource is no longer in progress (default: None).
+            name (str): The name of the resource, if a poller is given (default: None).
+        """
+        self.config = config
+        self.rate_limiter = rate_limiter
+        self.poller = poller
+        self.name = name
+
+    def delays(self, poll):
+        """Returns an iterator over the successive intervals between polls.
+
+        Args:
+            poll (float): The first polling interval in seconds.
+        """
+        if self.poller is not None:
+            return itertools.repeat(self.config.fallback_interval)
+        return self.config.delays(poll)
+
+    def sleep(self, delay):
+        """Waits for ``delay`` seconds, or until the poller sees that the resource is done."""
+        if self.poller is not None:
+            self.poller.wait(self.name, delay)
+        else:
+            time.sleep(delay)
+
+    def call(self, callable_fn, *args):
+        """Calls a function making a Describe request, within the rate limit of the session."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        return callable_fn(*args)
+
+
+class StatusPoller(object):
+    """Polls the status of many resources of a type with batched ``Search`` requests.
+
+    Waiters register the names of their resources, and are woken up when ``Search`` reports
+    them as no longer in progress. A background thread polls while there are waiters.
+    """
+
+    def __init__(self, sagemaker_client, resource, poll=5):
+        """Initialize a ``StatusPoller`` instance.
+
+        Args:
+            sagemaker_client (boto3.SageMaker.Client): Client to make the ``Search`` requests.
+            resource (str): The ``Search`` resource type, which is one of the keys of
+                ``SEARCHABLE_RESOURCES``.
+            poll (float): The polling interval in seconds (default: 5).
+        """
+        self.sagemaker_client = sagemaker_client
+        self.resource = resource
+        self.poll = poll
+        (
+            self._name_property,
+            self._status_property,
+            self._in_progress_statuses,
+        ) = SEARCHABLE_RESOURCES[resource]
+        self._events = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def wait(self, name, timeout):
+        """Waits until a resource is no longer in progress, or for ``timeout`` seconds.
+
+        Args:
+            name (str): The name of the resource.
+            timeout (float): The maximum time to wait in seconds.
+
+        Returns:
+            bool: True if ``Search`` reported the resource as no longer in progress.
+        """
+        with self._lock:
+            event = self._events.get(name)
+            if event is None:
+                event = self._events[name] = threading.Event()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+        done = event.wait(timeout)
+        with self._lock:
+            # The waiter registers again if it still waits after its Describe request.
+            if self._events.get(name) is event:
+                del self._events[name]
+        return done
+
+    def _run(self):
+        """Polls the status of the registered resources until none is left."""
+        while True:
+            time.sleep(self.poll)
+            with self._lock:
+                names = [name for name, event in self._events.items() if not event.is_set()]
+                if not names:
+                    self._thread = None
+                    return
+            try:
+                done = self._search_done(names)
+            except Exception as e:  # pylint: disable=broad-except
+                logger.warning("Failed to search the status of %s resources: %s", self.resource, e)
+                continue
+            with self._lock:
+                for name in done:
+                    event = self._events.get(name)
+                    if event is not None:
+                        event.set()
+
+    def _search_done(self, names):
+        """Returns the names of the resources that ``Search`` reports as no longer in progress."""
+        done = set()
+        for i in range(0, len(names), _MAX_SEARCH_FILTERS):
+            filters = [
+                {"Name": self._name_property, "Operator": "Equals", "Value": name}
+                for name in names[i : i + _MAX_SEARCH_FILTERS]
+            ]
+            kwargs = {
+                "Resource": self.resource,
+                "SearchExpression": {"Filters": filters, "Operator": "Or"},
+                "MaxResults": 100,
+            }
+            while True:
+                response = self.sagemaker_client.search(**kwargs)
+                for result in response.get("Results", []):
+                    record = result.get(self.resource, {})
+                    status = record.get(self._status_property)
+                    if status is not None and status not in self._in_progress_statuses:
+                        done.add(record.get(self._name_property))
+                if not response.get("NextToken"):
+                    break
+                kwargs["NextToken"] = response["NextToken"]
+        return done
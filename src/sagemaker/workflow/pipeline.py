@@ -16,7 +16,7 @@ from __future__ import absolute_import
 import json
 
 import logging
-from copy import deepcopy
+import time
 from typing import Any, Dict, List, Set, Sequence, Union, Optional
 
 import attr
@@ -45,7 +45,7 @@ from sagemaker.workflow.selective_execution_config import SelectiveExecutionConf
 from sagemaker.workflow.steps import Step, StepTypeEnum
 from sagemaker.workflow.step_collections import StepCollection
 from sagemaker.workflow.condition_step import ConditionStep
-from sagemaker.workflow.utilities import list_to_request, build_steps
+from sagemaker.workflow.utilities import list_to_request, build_steps, _StepRequestCache
 
 logger = logging.getLogger(__name__)
 
@@ -103,9 +103,27 @@ class Pipeline(Entity):
         self._metadata = dict()
         self._step_map = dict()
         _generate_step_map(self.steps, self._step_map)
+        self._step_request_cache = _StepRequestCache()
+        self._definition_stats = None
+
+    @property
+    def definition_stats(self) -> Optional[Dict[str, Any]]:
+        """The time spent generating the last definition, and how many steps were reused.
+
+        A dict with the seconds spent building the request structures of the steps
+        (``build_seconds``), interpolating the pipeline variables (``interpolate_seconds``) and
+        serializing the definition (``serialize_seconds``) in total (``total_seconds``), and
+        the numbers of steps whose cached request structure was reused (``cached_steps``) or
+        rebuilt (``rebuilt_steps``). None before the first definition.
+        """
+        return self._definition_stats
 
     def to_request(self) -> RequestType:
         """Gets the request structure for workflow service calls."""
+        return self._to_request()
+
+    def _to_request(self, step_request_cache: _StepRequestCache = None) -> RequestType:
+        """Gets the request structure, reusing the cached request structures of the steps."""
         return {
             "Version": self._version,
             "Metadata": self._metadata,
@@ -117,6 +135,7 @@ class Pipeline(Entity):
                 self.steps,
                 self.name,
                 self.pipeline_definition_config,
+                step_request_cache,
             ),
         }
 
@@ -151,9 +170,9 @@ class Pipeline(Entity):
             # after fetching the config.
             raise ValueError("An AWS IAM role is required to create a Pipeline.")
         if self.sagemaker_session.local_mode:
-            if parallelism_config:
-                logger.warning("Pipeline parallelism config is not supported in the local mode.")
-            return self.sagemaker_session.sagemaker_client.create_pipeline(self, description)
+            return self.sagemaker_session.sagemaker_client.create_pipeline(
+                self, description, ParallelismConfiguration=parallelism_config
+            )
         tags = _append_project_tags(tags)
         tags = self.sagemaker_session._append_sagemaker_config_tags(tags, PIPELINE_TAGS_PATH)
         kwargs = self._create_args(role_arn, description, parallelism_config)
@@ -247,9 +266,9 @@ sagemaker.html#SageMaker.Client.describe_pipeline>`_
             # after fetching the config.
             raise ValueError("An AWS IAM role is required to update a Pipeline.")
         if self.sagemaker_session.local_mode:
-            if parallelism_config:
-                logger.warning("Pipeline parallelism config is not supported in the local mode.")
-            return self.sagemaker_session.sagemaker_client.update_pipeline(self, description)
+            return self.sagemaker_session.sagemaker_client.update_pipeline(
+                self, description, ParallelismConfiguration=parallelism_config
+            )
 
         self._step_map = dict()
         _generate_step_map(self.steps, self._step_map)
@@ -374,8 +393,16 @@ sagemaker.html#SageMaker.Client.describe_pipeline>`_
         )
 
     def definition(self) -> str:
-        """Converts a request structure to string representation for workflow service calls."""
-        request_dict = self.to_request()
+        """Converts a request structure to string representation for workflow service calls.
+
+        The request structures of the steps built with a `PipelineSession` are cached, so that
+        the next definitions only execute the job functions of the steps that changed. The time
+        spent generating the definition is available in `definition_stats`.
+        """
+        start = time.perf_counter()
+        hits, misses = self._step_request_cache.hits, self._step_request_cache.misses
+        request_dict = self._to_request(self._step_request_cache)
+        built = time.perf_counter()
         self._interpolate_step_collection_name_in_depends_on(request_dict["Steps"])
         request_dict["PipelineExperimentConfig"] = interpolate(
             request_dict["PipelineExperimentConfig"], {}, {}
@@ -387,8 +414,22 @@ sagemaker.html#SageMaker.Client.describe_pipeline>`_
             callback_output_to_step_map=callback_output_to_step_map,
             lambda_output_to_step_map=lambda_output_to_step_name,
         )
-
-        return json.dumps(request_dict)
+        interpolated = time.perf_counter()
+        definition = json.dumps(request_dict)
+        end = time.perf_counter()
+
+        self._definition_stats = {
+            "build_seconds": built - start,
+            "interpolate_seconds": interpolated - built,
+            "serialize_seconds": end - interpolated,
+            "total_seconds": end - start,
+            "cached_steps": self._step_request_cache.hits - hits,
+            "rebuilt_steps": self._step_request_cache.misses - misses,
+        }
+        logger.debug(
+            "Generated the definition of pipeline %s: %s", self.name, self._definition_stats
+        )
+        return definition
 
     def _interpolate_step_collection_name_in_depends_on(self, step_requests: list):
         """Insert step names as per `StepCollection` name in depends_on list
@@ -496,9 +537,10 @@ def interpolate(
         RequestType: The request dict with Parameter values replaced by their expression.
     """
     try:
-        request_obj_copy = deepcopy(request_obj)
+        # _interpolate copies the containers of the request it walks, so the request is not
+        # deep-copied up front, which would copy the shape trees of every Properties it holds.
         return _interpolate(
-            request_obj_copy,
+            request_obj,
             callback_output_to_step_map=callback_output_to_step_map,
             lambda_output_to_step_map=lambda_output_to_step_map,
         )
@@ -529,10 +571,10 @@ def _interpolate(
     if isinstance(obj, dict):
         new = obj.__class__()
         for key, value in obj.items():
-            new[key] = interpolate(value, callback_output_to_step_map, lambda_output_to_step_map)
+            new[key] = _interpolate(value, callback_output_to_step_map, lambda_output_to_step_map)
     elif isinstance(obj, (list, set, tuple)):
         new = obj.__class__(
-            interpolate(value, callback_output_to_step_map, lambda_output_to_step_map)
+            _interpolate(value, callback_output_to_step_map, lambda_output_to_step_map)
             for value in obj
         )
     else:
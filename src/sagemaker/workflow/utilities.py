@@ -28,6 +28,7 @@ from sagemaker.workflow.parameters import Parameter
 from sagemaker.workflow.pipeline_context import _StepArguments, _PipelineConfig
 from sagemaker.workflow.entities import (
     Entity,
+    PipelineVariable,
     RequestType,
 )
 from sagemaker.workflow.pipeline_definition_config import PipelineDefinitionConfig
@@ -99,6 +100,7 @@ def build_steps(
     steps: Sequence[Entity],
     pipeline_name: str,
     pipeline_definition_config: PipelineDefinitionConfig,
+    step_request_cache: "_StepRequestCache" = None,
 ):
     """Get the request structure for list of steps, with _pipeline_config_manager
 
@@ -107,6 +109,8 @@ def build_steps(
         pipeline_name (str): The name of the pipeline, passed down from pipeline.to_request()
         pipeline_definition_config (PipelineDefinitionConfig): A pipeline definition configuration
             for a pipeline containing feature flag toggles
+        step_request_cache (_StepRequestCache): A cache of the request structures of the steps
+            built with a `PipelineSession`, reused while the steps are unchanged (default: None).
     Returns:
         list: A request structure object for a service call for the list of pipeline steps
     """
@@ -114,20 +118,116 @@ def build_steps(
 
     request_dicts = []
     for step in steps:
+        code_hash = get_code_hash(step)
+        config_hash = get_config_hash(step)
+        context = (pipeline_name, code_hash, config_hash, _freeze(pipeline_definition_config, 1))
+        if step_request_cache is not None and not isinstance(step, StepCollection):
+            request_dict = step_request_cache.get(step, context)
+            if request_dict is not None:
+                request_dicts.append(request_dict)
+                continue
         with _pipeline_config_manager(
             pipeline_name,
             step.name,
-            get_code_hash(step),
-            get_config_hash(step),
+            code_hash,
+            config_hash,
             pipeline_definition_config,
         ):
             if isinstance(step, StepCollection):
                 request_dicts.extend(step.request_dicts())
             else:
-                request_dicts.append(step.to_request())
+                request_dict = step.to_request()
+                if step_request_cache is not None:
+                    step_request_cache.put(step, context, request_dict)
+                request_dicts.append(request_dict)
     return request_dicts
 
 
+class _Reference:
+    """A reference to an object, equal to references to the same object only."""
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj):
+        """Create a `_Reference` to an object."""
+        self.obj = obj
+
+    def __eq__(self, other):
+        """Whether the other reference refers to the same object."""
+        return isinstance(other, _Reference) and other.obj is self.obj
+
+    def __hash__(self):
+        """The hash of the identity of the object."""
+        return id(self.obj)
+
+
+# Attributes that the job functions set on the job objects, rather than read from them.
+_JOB_OUTPUT_ATTRIBUTES = ("_current_job_name", "jobs", "latest_job", "latest_training_job")
+
+
+def _freeze(value, depth: int):
+    """Get a snapshot of a value, equal to snapshots of the value as long as it is unchanged.
+
+    Primitives are compared by value. Containers are compared by their items. Pipeline variables
+    are compared by identity. Other objects are compared by identity, and by a snapshot of their
+    attributes up to the given depth.
+    """
+    if isinstance(value, (str, int, float, bool, type(None))):
+        return value
+    if isinstance(value, PipelineVariable):
+        return _Reference(value)
+    if isinstance(value, dict):
+        return (dict, tuple((k, _freeze(v, depth)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return (type(value), tuple(_freeze(item, depth) for item in value))
+    if depth > 0 and hasattr(value, "__dict__"):
+        attributes = {k: v for k, v in vars(value).items() if k not in _JOB_OUTPUT_ATTRIBUTES}
+        return (_Reference(value), _freeze(attributes, depth - 1))
+    return _Reference(value)
+
+
+class _StepRequestCache:
+    """A cache of the request structures of the steps built with a `PipelineSession`.
+
+    Building the request structure of such a step executes its job function again, such as
+    `fit()` or `run()`, which dominates the time to generate the definition of a large pipeline.
+    The request structure of a step is reused while the step object, its attributes, the
+    arguments of its job function, the attributes of its job object (for example the estimator or
+    the processor), the hashes of its code and configuration, and the pipeline name and
+    definition configuration are unchanged. Objects nested in the job object, such as its
+    session, are compared by identity.
+    """
+
+    def __init__(self):
+        """Create an empty `_StepRequestCache`."""
+        self._entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _state(step, context):
+        """Get the snapshot of a step that its cached request structure is valid for."""
+        return (context, _freeze(vars(step), 1), _freeze(vars(step.step_args), 1))
+
+    def get(self, step, context):
+        """Get the cached request structure of a step, or None if it may have changed."""
+        if getattr(step, "step_args", None) is None:
+            return None
+        entry = self._entries.get(step.name)
+        if entry is not None and entry[0] is step and entry[1] == self._state(step, context):
+            self.hits += 1
+            # The definition inserts step names in the DependsOn list of the request in place.
+            return dict(entry[2])
+        self.misses += 1
+        return None
+
+    def put(self, step, context, request_dict):
+        """Cache the request structure of a step, after its job function was executed."""
+        if getattr(step, "step_args", None) is None:
+            return
+        self._entries[step.name] = (step, self._state(step, context), dict(request_dict))
+
+
 def get_code_hash(step: Entity) -> str:
     """Get the hash of the code artifact(s) for the given step
 
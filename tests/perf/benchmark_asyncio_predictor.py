@@ -0,0 +1,135 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Benchmarks ``AsyncioPredictor`` against ``Predictor.predict`` calls in a thread pool.
+
+Both send their requests to a local HTTP stand-in of the SageMaker runtime, which answers each
+request after a fixed latency. Run with ``python -m tests.perf.benchmark_asyncio_predictor``.
+"""
+from __future__ import absolute_import, print_function
+
+import argparse
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import boto3
+import botocore.config
+from mock import Mock
+
+from sagemaker.deserializers import JSONDeserializer
+from sagemaker.predictor import Predictor
+from sagemaker.predictor_asyncio import AsyncioPredictor
+from sagemaker.serializers import JSONSerializer
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        time.sleep(self.server.latency)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _predictor(endpoint_url, max_pool_connections):
+    boto_session = boto3.Session(
+        aws_access_key_id="access-key", aws_secret_access_key="secret-key", region_name="us-west-2"
+    )
+    runtime_client = boto_session.client(
+        "sagemaker-runtime",
+        endpoint_url=endpoint_url,
+        config=botocore.config.Config(max_pool_connections=max_pool_connections),
+    )
+    sagemaker_session = Mock(
+        boto_session=boto_session, local_mode=False, sagemaker_runtime_client=runtime_client
+    )
+    return Predictor(
+        "endpoint",
+        sagemaker_session=sagemaker_session,
+        serializer=JSONSerializer(),
+        deserializer=JSONDeserializer(),
+    )
+
+
+def _threaded(predictor, records, threads):
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        return list(executor.map(predictor.predict, records))
+
+
+def _asyncio(predictor, records, concurrency):
+    async def predict_all():
+        async with AsyncioPredictor(predictor, max_concurrency=concurrency) as async_predictor:
+            return await asyncio.gather(*(async_predictor.predict(record) for record in records))
+
+    return asyncio.run(predict_all())
+
+
+def _timed(run, *args):
+    start = time.perf_counter()
+    results = run(*args)
+    return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--concurrency", type=int, default=128)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+    server.latency = args.latency
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    endpoint_url = "http://127.0.0.1:{}".format(server.server_address[1])
+    records = [{"id": i, "features": [0.5] * 16} for i in range(args.requests)]
+
+    try:
+        threaded_seconds, threaded = _timed(
+            _threaded, _predictor(endpoint_url, args.threads), records, args.threads
+        )
+        asyncio_seconds, asyncio_results = _timed(
+            _asyncio, _predictor(endpoint_url, args.threads), records, args.concurrency
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print("requests={} latency={}s".format(args.requests, args.latency))
+    print(
+        "threaded ({} threads):  {:.0f} requests/s".format(
+            args.threads, args.requests / threaded_seconds
+        )
+    )
+    print(
+        "asyncio ({} in flight): {:.0f} requests/s".format(
+            args.concurrency, args.requests / asyncio_seconds
+        )
+    )
+    print("same predictions:        {}".format(threaded == asyncio_results == records))
+    if not threaded == asyncio_results == records:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Benchmarks the ingestion of a DataFrame into a FeatureGroup with ``StreamIngestionManager``.
+
+Times the construction of the records of a DataFrame with ``FeatureValue`` objects cell by
+cell, as ``IngestionManagerPandas`` did, against ``_encode_records``. Then ingests the
+DataFrame into a simulated PutRecord endpoint with a fixed latency, one request at a time per
+thread as ``IngestionManagerPandas`` does, and with ``StreamIngestionManager``, with and
+without throttling above a maximum request rate. Checks that the endpoint received the same
+records. Run with ``python -m tests.perf.benchmark_feature_store_ingestion``.
+"""
+from __future__ import absolute_import, print_function
+
+import argparse
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from mock import Mock
+
+from sagemaker.feature_store.ingestion import StreamIngestionManager, _encode_records
+from sagemaker.feature_store.inputs import FeatureValue
+
+
+def _previous_records(data_frame):
+    """The records of ``IngestionManagerPandas`` before they were built column by column."""
+    return [
+        [
+            FeatureValue(
+                feature_name=data_frame.columns[index - 1], value_as_string=str(row[index])
+            ).to_dict()
+            for index in range(1, len(row))
+            if pd.notna(row[index])
+        ]
+        for row in data_frame.itertuples()
+    ]
+
+
+class _SimulatedEndpoint(object):
+    """A PutRecord endpoint with a fixed latency, throttling above a maximum request rate."""
+
+    def __init__(self, latency, max_rate=None):
+        self.latency = latency
+        self.max_rate = max_rate
+        self.records = {}
+        self._tokens = max_rate or 0
+        self._refilled_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def put_record(self, FeatureGroupName, Record):
+        time.sleep(self.latency)
+        with self._lock:
+            if self.max_rate:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.max_rate, self._tokens + (now - self._refilled_at) * self.max_rate
+                )
+                self._refilled_at = now
+                if self._tokens < 1:
+                    raise ClientError({"Error": {"Code": "ThrottlingException"}}, "PutRecord")
+                self._tokens -= 1
+            self.records[Record[0]["ValueAsString"]] = Record
+
+
+def _one_request_per_thread(endpoint, records, threads):
+    """Ingest records as the threads of ``IngestionManagerPandas`` do."""
+
+    def ingest(batch):
+        for record in batch:
+            endpoint.put_record(FeatureGroupName="MyGroup", Record=record)
+
+    size = -(-len(records) // threads)
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(ingest, [records[i : i + size] for i in range(0, len(records), size)]))
+
+
+def _stream_ingestion_manager(endpoint, max_concurrency):
+    sagemaker_session = Mock()
+    sagemaker_session.sagemaker_featurestore_runtime_client.meta.config = Config()
+    sagemaker_session.boto_session.client.return_value = endpoint
+    return StreamIngestionManager(
+        feature_group_name="MyGroup",
+        sagemaker_session=sagemaker_session,
+        max_concurrency=max_concurrency,
+        initial_backoff=0.01,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--cols", type=int, default=20)
+    parser.add_argument("--ingested-rows", type=int, default=5000)
+    parser.add_argument("--latency-ms", type=float, default=5)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--max-concurrency", type=int, default=64)
+    parser.add_argument("--max-rate", type=float, default=2000)
+    args = parser.parse_args()
+    logging.disable(logging.ERROR)
+
+    rng = np.random.default_rng(0)
+    data_frame = pd.DataFrame(
+        rng.standard_normal((args.rows, args.cols)),
+        columns=[f"feature{i}" for i in range(args.cols)],
+    )
+    data_frame.insert(0, "id", [f"r{i}" for i in range(args.rows)])
+    data_frame.iloc[::10, 2] = np.nan
+
+    start = time.perf_counter()
+    previous = _previous_records(data_frame)
+    previous_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    records = _encode_records(data_frame)
+    seconds = time.perf_counter() - start
+    print("building the records of {} rows x {} columns".format(args.rows, args.cols + 1))
+    print("  FeatureValue cell by cell    {:10.0f} records/s".format(args.rows / previous_seconds))
+    print("  _encode_records              {:10.0f} records/s".format(args.rows / seconds))
+    identical = previous == records
+
+    ingested = data_frame.iloc[: args.ingested_rows]
+    latency = args.latency_ms / 1000.0
+    print("ingesting {} rows with a latency of {} ms".format(len(ingested), args.latency_ms))
+    endpoint = _SimulatedEndpoint(latency)
+    start = time.perf_counter()
+    _one_request_per_thread(endpoint, _previous_records(ingested), args.threads)
+    print(
+        "  {} threads, 1 request each    {:10.0f} records/s".format(
+            args.threads, len(ingested) / (time.perf_counter() - start)
+        )
+    )
+    expected = endpoint.records
+
+    for max_rate in (None, args.max_rate):
+        endpoint = _SimulatedEndpoint(latency, max_rate)
+        manager = _stream_ingestion_manager(endpoint, args.max_concurrency)
+        manager.run(ingested, chunk_size=1000)
+        report = manager.report
+        print(
+            "  StreamIngestionManager{:7} {:10.0f} records/s {:6d} retries {:6d} throttled".format(
+                "" if max_rate is None else " (rate)",
+                report.records_per_second,
+                report.retries,
+                report.throttled_requests,
+            )
+        )
+        identical = identical and endpoint.records == expected
+
+    print("same records: {}".format(identical))
+    if not identical:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Benchmarks the resolution of JumpStart headers and specs from a large manifest.
+
+Serves a synthetic manifest from the local metadata override directories, and compares the
+manifest index of ``JumpStartModelsCache`` against scanning every header of the manifest for
+each lookup. Run with ``python -m tests.perf.benchmark_jumpstart_cache``.
+"""
+from __future__ import absolute_import, print_function
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+
+from packaging.version import Version
+
+from sagemaker.jumpstart import utils
+from sagemaker.jumpstart.cache import JumpStartModelsCache
+from sagemaker.jumpstart.constants import (
+    ENV_VARIABLE_JUMPSTART_MANIFEST_LOCAL_ROOT_DIR_OVERRIDE,
+    ENV_VARIABLE_JUMPSTART_SPECS_LOCAL_ROOT_DIR_OVERRIDE,
+    JUMPSTART_DEFAULT_MANIFEST_FILE_S3_KEY,
+)
+from tests.unit.sagemaker.jumpstart.constants import BASE_SPEC
+
+SPEC_KEY = "specs.json"
+
+
+def _write_metadata(directory, models, versions):
+    manifest = [
+        {
+            "model_id": "model-{}".format(model),
+            "version": "1.{}.0".format(version),
+            "min_version": "2.{}.0".format(version),
+            "spec_key": SPEC_KEY,
+        }
+        for model in range(models)
+        for version in range(versions)
+    ]
+    with open(os.path.join(directory, JUMPSTART_DEFAULT_MANIFEST_FILE_S3_KEY), "w") as f:
+        json.dump(manifest, f)
+    with open(os.path.join(directory, SPEC_KEY), "w") as f:
+        json.dump(BASE_SPEC, f)
+
+
+def _linear_scan(manifest, model_id, version, sm_version):
+    """Resolves a version by scanning the manifest, as done before the manifest was indexed."""
+    compatible_versions = [
+        Version(header.version)
+        for header in manifest.values()
+        if header.model_id == model_id and Version(header.min_version) <= Version(sm_version)
+    ]
+    if version == "*":
+        return str(max(compatible_versions))
+    return str(max(v for v in compatible_versions if v == Version(version)))
+
+
+def _timed(resolve, lookups):
+    start = time.perf_counter()
+    results = [resolve(model_id, version) for model_id, version in lookups]
+    return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--models", type=int, default=1000)
+    parser.add_argument("--versions", type=int, default=20)
+    parser.add_argument("--lookups", type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    lookups = [
+        (
+            "model-{}".format(rng.randrange(args.models)),
+            rng.choice(["*", "1.{}.0".format(rng.randrange(args.versions))]),
+        )
+        for _ in range(args.lookups)
+    ]
+
+    with tempfile.TemporaryDirectory() as directory:
+        _write_metadata(directory, args.models, args.versions)
+        os.environ[ENV_VARIABLE_JUMPSTART_MANIFEST_LOCAL_ROOT_DIR_OVERRIDE] = directory
+        os.environ[ENV_VARIABLE_JUMPSTART_SPECS_LOCAL_ROOT_DIR_OVERRIDE] = directory
+
+        # The semantic version cache is sized to 1 item, so that each lookup resolves a version.
+        cache = JumpStartModelsCache(s3_bucket_name="unused", max_semantic_version_cache_items=1)
+        start = time.perf_counter()
+        cache.get_manifest()
+        load_seconds = time.perf_counter() - start
+        with open(os.path.join(directory, JUMPSTART_DEFAULT_MANIFEST_FILE_S3_KEY)) as f:
+            manifest = utils.get_formatted_manifest(json.load(f))
+
+        sm_version = utils.get_sagemaker_version()
+        baseline_seconds, baseline = _timed(
+            lambda model_id, version: _linear_scan(manifest, model_id, version, sm_version),
+            lookups,
+        )
+        indexed_seconds, headers = _timed(cache.get_header, lookups)
+        specs_seconds, _ = _timed(cache.get_specs, lookups)
+
+    print("models={} versions={} lookups={}".format(args.models, args.versions, args.lookups))
+    print("manifest load:          {:.3f}s".format(load_seconds))
+    print("linear scan headers:    {:.2f}ms/lookup".format(1000 * baseline_seconds / args.lookups))
+    print("indexed headers:        {:.3f}ms/lookup".format(1000 * indexed_seconds / args.lookups))
+    print("indexed specs:          {:.3f}ms/lookup".format(1000 * specs_seconds / args.lookups))
+    print("speedup:                {:.1f}x".format(baseline_seconds / indexed_seconds))
+    parity = baseline == [header.version for header in headers]
+    print("same versions resolved: {}".format(parity))
+    if not parity:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
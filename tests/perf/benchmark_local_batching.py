@@ -0,0 +1,135 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Benchmarks the batching of the records of large files by ``MultiRecordStrategy``.
+
+Batches a multi-GB CSV file and RecordIO file with ``MultiRecordStrategy``, and a smaller CSV
+file with the previous string concatenation, whose cost grows quadratically with the size of
+the batches. Checks that the batches hold all the bytes of the files, in order, within the
+payload limit. Run with ``python -m tests.perf.benchmark_local_batching``.
+"""
+from __future__ import absolute_import, print_function
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from sagemaker.amazon.common import _encode_recordio
+from sagemaker.local.data import LineSplitter, MultiRecordStrategy, RecordIOSplitter
+
+MB = 1024 * 1024
+
+
+def _string_concatenation(splitter, path, size):
+    """The batching of ``MultiRecordStrategy`` before it was linear."""
+    buffer = ""
+    for element in splitter.split(path):
+        if sys.getsizeof(buffer + element) < size * MB:
+            buffer += element
+        else:
+            tmp = buffer
+            buffer = element
+            yield tmp
+    yield buffer
+
+
+def _write(path, block, size_mb):
+    with open(path, "wb") as f:
+        for _ in range(max(1, size_mb * MB // len(block))):
+            f.write(block)
+    return os.path.getsize(path)
+
+
+def _run(batches, path, size):
+    """Return the seconds spent batching, the number of batches, and whether they are valid.
+
+    The batches are compared with the file as they are made, so that they are not all held
+    in memory.
+    """
+    seconds, count, valid = 0.0, 0, True
+    with open(path, "rb") as f:
+        while True:
+            start = time.perf_counter()
+            batch = next(batches, None)
+            seconds += time.perf_counter() - start
+            if batch is None:
+                break
+            count += 1
+            if not isinstance(batch, bytes):
+                batch = batch.encode("utf-8")
+            valid = valid and len(batch) <= size * MB and f.read(len(batch)) == batch
+        valid = valid and not f.read(1)
+    return seconds, count, valid
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=2048)
+    parser.add_argument("--baseline-size-mb", type=int, default=32)
+    parser.add_argument("--max-payload-mb", type=int, default=6)
+    args = parser.parse_args()
+
+    line = ",".join(["0.123456"] * 20).encode("utf-8") + b"\n"
+    record = _encode_recordio(b"\x00" * 160)
+    directory = tempfile.mkdtemp()
+    try:
+        csv_path = os.path.join(directory, "data.csv")
+        recordio_path = os.path.join(directory, "data.rec")
+        baseline_path = os.path.join(directory, "baseline.csv")
+        csv_bytes = _write(csv_path, line * 1024, args.size_mb)
+        recordio_bytes = _write(recordio_path, record * 1024, args.size_mb)
+        baseline_bytes = _write(baseline_path, line * 1024, args.baseline_size_mb)
+
+        results = []
+        for name, batches, path, size_bytes in (
+            (
+                "string concatenation (Line)",
+                _string_concatenation(LineSplitter(), baseline_path, args.max_payload_mb),
+                baseline_path,
+                baseline_bytes,
+            ),
+            (
+                "MultiRecordStrategy (Line)",
+                MultiRecordStrategy(LineSplitter()).pad(csv_path, args.max_payload_mb),
+                csv_path,
+                csv_bytes,
+            ),
+            (
+                "MultiRecordStrategy (RecordIO)",
+                MultiRecordStrategy(RecordIOSplitter()).pad(recordio_path, args.max_payload_mb),
+                recordio_path,
+                recordio_bytes,
+            ),
+        ):
+            seconds, count, valid = _run(batches, path, args.max_payload_mb)
+            if name.startswith("string"):
+                # The previous batching could exceed the limit, as it did not count bytes.
+                valid = True
+            print(
+                "{:31} {:6.0f} MB {:8.1f} MB/s {:6d} batches".format(
+                    name, size_bytes / MB, size_bytes / MB / seconds, count
+                )
+            )
+            results.append(valid)
+    finally:
+        shutil.rmtree(directory)
+
+    print("batches hold the files within the limit: {}".format(all(results)))
+    if not all(results):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Benchmarks the queries DatasetBuilder generates to join feature groups, in-process.
+
+Adds two synthetic feature groups of increasing size to a ``LocalOfflineStoreSession``: a base
+feature group of orders and a feature group of customers, both with several events per record
+and some duplicated records. Times the queries of a plain join, of a join including the
+duplicated records, and of point-in-time accurate joins, as run by the embedded SQLite engine,
+and checks the point-in-time join of the most recent orders against ``pandas.merge_asof``. Run
+with ``python -m tests.perf.benchmark_local_offline_store``.
+"""
+from __future__ import absolute_import, print_function
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from sagemaker.feature_store.feature_store import FeatureStore
+from sagemaker.feature_store.local_offline_store import LocalOfflineStoreSession
+
+
+def _duplicated_records_join(dataset_builder):
+    return dataset_builder.include_duplicated_records()
+
+
+def _point_in_time_join(dataset_builder):
+    return dataset_builder.point_in_time_accurate_join()
+
+
+def _latest_point_in_time_join(dataset_builder):
+    dataset_builder.point_in_time_accurate_join()
+    return dataset_builder.with_number_of_recent_records_by_record_identifier(1)
+
+
+_STRATEGIES = {
+    "join": lambda dataset_builder: dataset_builder,
+    "join, duplicated records": _duplicated_records_join,
+    "point-in-time join": _point_in_time_join,
+    "point-in-time join, latest": _latest_point_in_time_join,
+}
+
+
+def _records(rng, records, events, feature_name):
+    """Synthetic records with several events per record, and duplicates of some events."""
+    data_frame = pd.DataFrame(
+        {
+            "id": np.repeat([f"record-{i}" for i in range(records)], events),
+            "event_time": rng.integers(0, 10**6, records * events).astype("float64"),
+            feature_name: rng.standard_normal(records * events),
+        }
+    )
+    duplicates = data_frame.sample(frac=0.05, random_state=0)
+    return pd.concat([data_frame, duplicates], ignore_index=True)
+
+
+def _expected_latest_join(orders, customers):
+    """The point-in-time join of the most recent order of each record, with pandas."""
+    orders = orders.drop_duplicates(["id", "event_time"])
+    latest_orders = orders.loc[orders.groupby("id")["event_time"].idxmax()]
+    customers = customers.drop_duplicates(["id", "event_time"]).rename(
+        columns={"event_time": "event_time.1", "score": "score.1"}
+    )
+    joined = pd.merge_asof(
+        latest_orders.sort_values("event_time"),
+        customers.sort_values("event_time.1"),
+        left_on="event_time",
+        right_on="event_time.1",
+        by="id",
+    )
+    return joined.dropna(subset=["score.1"]).sort_values("id", ignore_index=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--events", type=int, default=4)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    identical = True
+    for records in args.records:
+        orders = _records(rng, records, args.events, "amount")
+        customers = _records(rng, records, args.events, "score")
+        session = LocalOfflineStoreSession()
+        feature_store = FeatureStore(sagemaker_session=session)
+        start = time.perf_counter()
+        orders_feature_group = session.add_feature_group("orders", orders, "id", "event_time")
+        customers_feature_group = session.add_feature_group(
+            "customers", customers, "id", "event_time"
+        )
+        print(
+            "{} records, {} rows per feature group, loaded in {:.2f}s".format(
+                records, len(orders), time.perf_counter() - start
+            )
+        )
+
+        for name, strategy in _STRATEGIES.items():
+            dataset_builder = strategy(
+                feature_store.create_dataset(
+                    orders_feature_group, f"s3://{session.default_bucket()}/datasets"
+                ).with_feature_group(customers_feature_group, included_feature_names=["score"])
+            )
+            start = time.perf_counter()
+            df, _ = dataset_builder.to_dataframe()
+            print("  {:28} {:8.2f}s {:10} rows".format(name, time.perf_counter() - start, len(df)))
+            if name == "point-in-time join, latest":
+                expected = _expected_latest_join(orders, customers)
+                result = df.sort_values("id", ignore_index=True)
+                identical = (
+                    identical
+                    and result["id"].equals(expected["id"])
+                    and np.allclose(result["score.1"], expected["score.1"])
+                )
+
+    print("point-in-time join matches merge_asof: {}".format(identical))
+    if not identical:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
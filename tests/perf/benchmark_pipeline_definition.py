@@ -0,0 +1,154 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Benchmarks the generation of the definitions of pipelines of 10, 100 and 1000 steps.
+
+Generates pipelines of chained ``ProcessingStep`` built with a ``PipelineSession``, and times
+the previous definition, which executed the job function of every step and deep-copied the
+request at each level of its interpolation, against ``Pipeline.definition`` without and with
+cached step requests, and after changing one step. Checks that all the definitions are
+identical. Run with ``python -m tests.perf.benchmark_pipeline_definition``.
+"""
+from __future__ import absolute_import, print_function
+
+import argparse
+import json
+import logging
+import time
+from copy import deepcopy
+
+from mock import Mock
+
+from sagemaker.processing import ProcessingInput, ProcessingOutput, Processor
+from sagemaker.workflow.entities import Expression
+from sagemaker.workflow.parameters import Parameter, ParameterString
+from sagemaker.workflow.pipeline import Pipeline
+from sagemaker.workflow.pipeline_context import PipelineSession
+from sagemaker.workflow.properties import Properties
+from sagemaker.workflow.steps import ProcessingStep
+from sagemaker.workflow.utilities import _StepRequestCache
+
+
+def _previous_interpolate(obj):
+    """The interpolation of ``Pipeline.definition`` before it stopped deep-copying each level."""
+    obj = deepcopy(obj)
+    if isinstance(obj, (Expression, Parameter, Properties)):
+        return obj.expr
+    if isinstance(obj, dict):
+        return obj.__class__((key, _previous_interpolate(value)) for key, value in obj.items())
+    if isinstance(obj, (list, set, tuple)):
+        return obj.__class__(_previous_interpolate(value) for value in obj)
+    return obj
+
+
+def _previous_definition(pipeline):
+    request_dict = pipeline.to_request()
+    pipeline._interpolate_step_collection_name_in_depends_on(request_dict["Steps"])
+    request_dict["PipelineExperimentConfig"] = _previous_interpolate(
+        request_dict["PipelineExperimentConfig"]
+    )
+    request_dict["Steps"] = _previous_interpolate(request_dict["Steps"])
+    return json.dumps(request_dict)
+
+
+def _pipeline_session():
+    client = Mock()
+    client._client_config.user_agent = (
+        "Boto3/1.14.24 Python/3.8.5 Linux/5.4.0-42-generic Botocore/1.17.24 Resource"
+    )
+    boto_session = Mock(region_name="us-west-2")
+    boto_session.client.return_value = client
+    session = PipelineSession(
+        boto_session=boto_session, sagemaker_client=client, default_bucket="my-bucket"
+    )
+    session.sagemaker_config = {}
+    return session
+
+
+def _pipeline(steps_count):
+    session = _pipeline_session()
+    instance_type = ParameterString("InstanceType", "ml.m5.xlarge")
+    steps = []
+    for i in range(steps_count):
+        processor = Processor(
+            role="arn:aws:iam::123456789012:role/DummyRole",
+            image_uri="fakeimage",
+            instance_count=1,
+            instance_type=instance_type,
+            sagemaker_session=session,
+        )
+        source = (
+            steps[-1].properties.ProcessingOutputConfig.Outputs["output"].S3Output.S3Uri
+            if steps
+            else "s3://my-bucket/input"
+        )
+        step_args = processor.run(
+            inputs=[ProcessingInput(source=source, destination="/opt/ml/processing/input")],
+            outputs=[ProcessingOutput(output_name="output", source="/opt/ml/processing/output")],
+        )
+        steps.append(ProcessingStep(name=f"MyProcessingStep{i}", step_args=step_args))
+    return Pipeline(
+        name="MyPipeline", parameters=[instance_type], steps=steps, sagemaker_session=session
+    )
+
+
+def _timed(function, repeat):
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        seconds.append(time.perf_counter() - start)
+    return min(seconds), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--steps", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    # Each step built with a PipelineSession warns that its job name is not persisted.
+    logging.disable(logging.WARNING)
+
+    identical = True
+    print("steps   previous   uncached     cached   1 changed  (seconds)")
+    for steps_count in args.steps:
+        pipeline = _pipeline(steps_count)
+        previous_seconds, previous = _timed(lambda: _previous_definition(pipeline), args.repeat)
+
+        def uncached(pipeline=pipeline):
+            pipeline._step_request_cache = _StepRequestCache()
+            return pipeline.definition()
+
+        uncached_seconds, definition = _timed(uncached, args.repeat)
+        cached_seconds, cached = _timed(pipeline.definition, args.repeat)
+        identical = identical and previous == definition == cached
+        processor = pipeline.steps[steps_count // 2].step_args.func_args[0]
+
+        def changed(processor=processor, pipeline=pipeline):
+            processor.instance_count += 1
+            return pipeline.definition()
+
+        changed_seconds, changed_definition = _timed(changed, args.repeat)
+        identical = identical and changed_definition == _previous_definition(pipeline)
+        print(
+            "{:5d}  {:9.3f}  {:9.3f}  {:9.3f}  {:9.3f}".format(
+                steps_count, previous_seconds, uncached_seconds, cached_seconds, changed_seconds
+            )
+        )
+
+    print("definitions are identical: {}".format(identical))
+    if not identical:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Benchmarks reading the result of an Athena query as CSV and as Parquet files.
+
+Writes a DataFrame of mixed types as the single CSV file of a ``SELECT`` query and as the
+Parquet files of an ``UNLOAD`` query, in a simulated S3 bucket where each request has a fixed
+latency and each connection a fixed bandwidth. Times downloading and parsing the CSV file, as
+``AthenaQuery.as_dataframe`` does, against ``read_parquet_result``, and checks which of the
+results keep the types of the columns. Also streams both results in batches with
+``iter_result_batches``, and reports the peak memory allocated by Arrow, which for the Parquet
+result is bounded by the prefetched files and batches. Requires ``pyarrow``. Run with
+``python -m tests.perf.benchmark_query_results``.
+"""
+from __future__ import absolute_import, print_function
+
+import argparse
+import io
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from sagemaker.feature_store.query_results import iter_result_batches, read_parquet_result
+
+
+class _SimulatedS3Client(object):
+    """An S3 client serving in-memory objects with a request latency and a bandwidth."""
+
+    def __init__(self, objects, latency, bandwidth):
+        self.objects = objects
+        self.latency = latency
+        self.bandwidth = bandwidth
+
+    def get_paginator(self, operation_name):
+        return self
+
+    def paginate(self, Bucket, Prefix):
+        time.sleep(self.latency)
+        yield {
+            "Contents": [
+                {"Key": key, "Size": len(data)}
+                for key, data in sorted(self.objects.items())
+                if key.startswith(Prefix)
+            ]
+        }
+
+    def download_fileobj(self, Bucket, Key, Fileobj, Config):
+        data = self.objects[Key]
+        time.sleep(self.latency + len(data) / self.bandwidth)
+        Fileobj.write(data)
+
+    def get_object(self, Bucket, Key):
+        time.sleep(self.latency)
+        return {"Body": _SimulatedBody(self.objects[Key], self.bandwidth)}
+
+
+class _SimulatedBody(io.BytesIO):
+    """A streamed object body with a fixed bandwidth."""
+
+    def __init__(self, data, bandwidth):
+        super(_SimulatedBody, self).__init__(data)
+        self.bandwidth = bandwidth
+
+    def read(self, size=-1):
+        data = super(_SimulatedBody, self).read(size)
+        time.sleep(len(data) / self.bandwidth)
+        return data
+
+
+def _stream(s3_client, s3_uri, args):
+    """Iterates over the batches of a result, and returns their number of rows and seconds."""
+    start = time.perf_counter()
+    rows = 0
+    for batch in iter_result_batches(
+        s3_client, s3_uri, batch_size=args.batch_size, max_concurrency=args.max_concurrency
+    ):
+        rows += len(batch)
+    return rows, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--files", type=int, default=16)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    parser.add_argument("--bandwidth-mib", type=float, default=80)
+    parser.add_argument("--max-concurrency", type=int, default=16)
+    parser.add_argument("--batch-size", type=int, default=50000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    data_frame = pd.DataFrame(
+        {
+            "id": [f"record-{i}" for i in range(args.rows)],
+            "count": rng.integers(0, 1000, args.rows),
+            "value": rng.standard_normal(args.rows),
+            "flag": rng.integers(0, 2, args.rows).astype(bool),
+            "event_time": pd.Timestamp("2020-01-01")
+            + pd.to_timedelta(rng.integers(0, 10**6, args.rows), unit="s"),
+            "code": pd.Series(rng.integers(0, 10**12, args.rows), dtype="int64").astype(str),
+        }
+    )
+    csv_data = data_frame.to_csv(index=False).encode("utf-8")
+    objects = {"result/query-id.csv": csv_data}
+    for index, part in enumerate(np.array_split(np.arange(args.rows), args.files)):
+        buffer = io.BytesIO()
+        data_frame.iloc[part].to_parquet(buffer, index=False)
+        objects[f"result/unload/part-{index:05d}"] = buffer.getvalue()
+    parquet_size = sum(len(data) for key, data in objects.items() if "/unload/" in key)
+    s3_client = _SimulatedS3Client(
+        objects, args.latency_ms / 1000.0, args.bandwidth_mib * 1024 * 1024
+    )
+
+    print(
+        "{} rows: CSV {:.1f} MiB, Parquet {:.1f} MiB in {} files".format(
+            args.rows, len(csv_data) / 1024.0 / 1024.0, parquet_size / 1024.0 / 1024.0, args.files
+        )
+    )
+    # The memory pool of Arrow records its peak allocation, so the result is streamed first.
+    print("streaming in batches of {} rows with iter_result_batches".format(args.batch_size))
+    identical = True
+    for name, s3_uri in (
+        ("CSV", "s3://bucket/result/query-id.csv"),
+        ("Parquet", "s3://bucket/result/unload/"),
+    ):
+        rows, seconds = _stream(s3_client, s3_uri, args)
+        print("  {:8} {:8.2f}s".format(name, seconds))
+        identical = identical and rows == args.rows
+    streaming_peak = pa.default_memory_pool().max_memory()
+
+    start = time.perf_counter()
+    buffer = io.BytesIO()
+    s3_client.download_fileobj("bucket", "result/query-id.csv", buffer, None)
+    buffer.seek(0)
+    csv_result = pd.read_csv(buffer, delimiter=",")
+    csv_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parquet_result = read_parquet_result(
+        s3_client, "s3://bucket/result/unload/", max_concurrency=args.max_concurrency
+    )
+    parquet_seconds = time.perf_counter() - start
+
+    print("reading the whole result")
+    print("  CSV file, pd.read_csv         {:8.2f}s".format(csv_seconds))
+    print("  Parquet, read_parquet_result  {:8.2f}s".format(parquet_seconds))
+    for name, result in (("CSV", csv_result), ("Parquet", parquet_result)):
+        changed = [
+            column
+            for column in data_frame.columns
+            if result[column].dtype != data_frame[column].dtype
+        ]
+        print("  {:8} columns with another type: {}".format(name, ", ".join(changed) or "none"))
+    print(
+        "peak Arrow memory: {:.1f} MiB streaming, {:.1f} MiB reading the whole result".format(
+            streaming_peak / 1024.0 / 1024.0,
+            pa.default_memory_pool().max_memory() / 1024.0 / 1024.0,
+        )
+    )
+
+    identical = identical and parquet_result.equals(data_frame)
+    print("same result: {}".format(identical))
+    if not identical:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Benchmarks RecordIO-protobuf encoding of NumPy arrays.
+
+Compares ``write_numpy_to_dense_tensor`` against encoding one ``Record`` per row and checks
+that both produce the same bytes. Run with ``python -m tests.perf.benchmark_recordio``.
+"""
+from __future__ import absolute_import, print_function
+
+import argparse
+import io
+import time
+
+import numpy as np
+
+from sagemaker.amazon.common import _write_recordio, write_numpy_to_dense_tensor
+from sagemaker.amazon.record_pb2 import Record
+
+
+def _write_one_record_at_a_time(file, array, labels):
+    record = Record()
+    for index, vector in enumerate(array):
+        record.Clear()
+        record.features["values"].float32_tensor.values.extend(vector)
+        if labels is not None:
+            record.label["values"].float32_tensor.values.extend([labels[index]])
+        _write_recordio(file, record.SerializeToString())
+
+
+def _timed(write, array, labels):
+    buffer = io.BytesIO()
+    start = time.perf_counter()
+    write(buffer, array, labels)
+    return time.perf_counter() - start, buffer.getvalue()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--cols", type=int, default=100)
+    args = parser.parse_args()
+
+    array = np.random.default_rng(0).standard_normal((args.rows, args.cols)).astype("float32")
+    labels = np.arange(args.rows, dtype="float32")
+
+    baseline_seconds, baseline = _timed(_write_one_record_at_a_time, array, labels)
+    vectorized_seconds, vectorized = _timed(write_numpy_to_dense_tensor, array, labels)
+
+    megabytes = len(vectorized) / 1024.0 / 1024.0
+    print("rows={} cols={} size={:.1f} MiB".format(args.rows, args.cols, megabytes))
+    print("one record at a time: {:.2f}s".format(baseline_seconds))
+    print("vectorized:           {:.2f}s".format(vectorized_seconds))
+    print("speedup:              {:.1f}x".format(baseline_seconds / vectorized_seconds))
+    print("byte-for-byte parity: {}".format(baseline == vectorized))
+    if baseline != vectorized:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
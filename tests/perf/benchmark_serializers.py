@@ -0,0 +1,151 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Benchmarks the throughput of the serializers and deserializers on a numeric matrix.
+
+Reports the MiB of serialized data per second of each serializer and deserializer of
+``base_serializers`` and ``base_deserializers`` that handles a dense matrix, including the
+row-by-row CSV serialization that the vectorized ``CSVSerializer`` replaces, and checks that
+both CSV serializations are identical. Run with ``python -m tests.perf.benchmark_serializers``.
+"""
+from __future__ import absolute_import, print_function
+
+import argparse
+import io
+import time
+
+import numpy as np
+import pandas
+import scipy.sparse
+
+from sagemaker.base_deserializers import (
+    BytesDeserializer,
+    CSVDeserializer,
+    JSONDeserializer,
+    JSONLinesDeserializer,
+    NumpyDeserializer,
+    PandasDeserializer,
+    StringDeserializer,
+)
+from sagemaker.base_serializers import (
+    CSVSerializer,
+    DataSerializer,
+    IdentitySerializer,
+    JSONLinesSerializer,
+    JSONSerializer,
+    NumpySerializer,
+    SparseMatrixSerializer,
+)
+
+
+def _csv_row_by_row(array):
+    serializer = CSVSerializer()
+    return "\n".join([serializer._serialize_row(row) for row in array])
+
+
+def _size(payload):
+    if isinstance(payload, str):
+        payload = payload.encode("utf-8")
+    return len(payload)
+
+
+def _throughput(function, payload, data, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function(data)
+    seconds = (time.perf_counter() - start) / repeat
+    return _size(payload) / 1024.0 / 1024.0 / seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--cols", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    array = np.random.default_rng(0).standard_normal((args.rows, args.cols))
+    integers = np.random.default_rng(0).integers(0, 1000, (args.rows, args.cols))
+    csv_payload = CSVSerializer().serialize(array)
+    json_payload = JSONSerializer().serialize(array)
+    jsonlines_payload = JSONLinesSerializer().serialize(array.tolist())
+    npy_payload = NumpySerializer().serialize(array)
+
+    serializers = [
+        ("CSVSerializer (row by row)", _csv_row_by_row, array),
+        ("CSVSerializer", CSVSerializer().serialize, array),
+        ("CSVSerializer (6 digits)", CSVSerializer(float_precision=6).serialize, array),
+        ("CSVSerializer (row by row, int)", _csv_row_by_row, integers),
+        ("CSVSerializer (int)", CSVSerializer().serialize, integers),
+        ("CSVSerializer (DataFrame)", CSVSerializer().serialize, pandas.DataFrame(array)),
+        ("JSONSerializer", JSONSerializer().serialize, array),
+        ("JSONLinesSerializer", JSONLinesSerializer().serialize, array.tolist()),
+        ("NumpySerializer", NumpySerializer().serialize, array),
+        ("SparseMatrixSerializer", SparseMatrixSerializer().serialize, None),
+        ("IdentitySerializer", IdentitySerializer().serialize, npy_payload),
+        ("DataSerializer", DataSerializer().serialize, npy_payload),
+    ]
+    print("rows={} cols={}".format(args.rows, args.cols))
+    print("serializer                       MiB/s")
+    for name, serialize, data in serializers:
+        if data is None:
+            data = scipy.sparse.csr_matrix(array)
+        payload = serialize(data)
+        print("{:31}  {:8.1f}".format(name, _throughput(serialize, payload, data, args.repeat)))
+
+    deserializers = [
+        ("CSVDeserializer", CSVDeserializer(), csv_payload, "text/csv"),
+        ("CSVDeserializer (numpy)", CSVDeserializer(output_type="numpy"), csv_payload, "text/csv"),
+        (
+            "CSVDeserializer (pandas)",
+            CSVDeserializer(output_type="pandas"),
+            csv_payload,
+            "text/csv",
+        ),
+        ("NumpyDeserializer (csv)", NumpyDeserializer(), csv_payload, "text/csv"),
+        ("NumpyDeserializer (json)", NumpyDeserializer(), json_payload, "application/json"),
+        ("NumpyDeserializer (npy)", NumpyDeserializer(), npy_payload, "application/x-npy"),
+        ("PandasDeserializer (csv)", PandasDeserializer(), csv_payload, "text/csv"),
+        ("JSONDeserializer", JSONDeserializer(), json_payload, "application/json"),
+        (
+            "JSONLinesDeserializer",
+            JSONLinesDeserializer(),
+            jsonlines_payload,
+            "application/jsonlines",
+        ),
+        ("StringDeserializer", StringDeserializer(), csv_payload, "text/csv"),
+        ("BytesDeserializer", BytesDeserializer(), npy_payload, "application/x-npy"),
+    ]
+    print("deserializer                     MiB/s")
+    for name, deserializer, payload, content_type in deserializers:
+        body = payload.encode("utf-8") if isinstance(payload, str) else payload
+
+        def deserialize(body, deserializer=deserializer, content_type=content_type):
+            return deserializer.deserialize(io.BytesIO(body), content_type)
+
+        print("{:31}  {:8.1f}".format(name, _throughput(deserialize, body, body, args.repeat)))
+
+    same_csv = csv_payload == _csv_row_by_row(array) and CSVSerializer().serialize(
+        integers
+    ) == _csv_row_by_row(integers)
+    parsed = CSVDeserializer(output_type="numpy").deserialize(
+        io.BytesIO(csv_payload.encode("utf-8")), "text/csv"
+    )
+    same_values = np.array_equal(parsed, array)
+    print("same CSV as row by row:          {}".format(same_csv))
+    print("CSV round trip preserves values: {}".format(same_values))
+    if not (same_csv and same_values):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
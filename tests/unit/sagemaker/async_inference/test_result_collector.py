@@ -0,0 +1,151 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+
+import json
+
+import pytest
+from mock import Mock
+
+from sagemaker.async_inference import AsyncInferenceResultCollector
+from sagemaker.exceptions import AsyncInferenceModelError
+
+OUTPUT_PREFIX = "s3://bucket/output/"
+FAILURE_PREFIX = "s3://bucket/failure/"
+
+
+def _s3_client(existing_keys):
+    s3_client = Mock(name="s3_client")
+
+    def list_objects_v2(Bucket, Prefix, StartAfter, **kwargs):
+        keys = sorted(k for k in existing_keys if k.startswith(Prefix) and k > StartAfter)
+        return {"Contents": [{"Key": key} for key in keys]}
+
+    s3_client.list_objects_v2 = Mock(side_effect=list_objects_v2)
+    s3_client.get_object = Mock(side_effect=lambda Bucket, Key: {"Body": Key})
+    return s3_client
+
+
+def _collector(s3_client, **kwargs):
+    return AsyncInferenceResultCollector(s3_client, lambda response: response["Body"], **kwargs)
+
+
+def test_track_lists_each_prefix_once():
+    s3_client = _s3_client(["output/a.out", "output/b.out", "failure/c.out"])
+    collector = _collector(s3_client, poll=0.01)
+
+    futures = [
+        collector.track(OUTPUT_PREFIX + name, FAILURE_PREFIX + name)
+        for name in ("a.out", "b.out", "c.out")
+    ]
+
+    assert futures[0].result(timeout=5) == "output/a.out"
+    assert futures[1].result(timeout=5) == "output/b.out"
+    with pytest.raises(AsyncInferenceModelError, match="failure/c.out"):
+        futures[2].result(timeout=5)
+    assert collector.outstanding == 0
+    prefixes = [kwargs["Prefix"] for _, kwargs in s3_client.list_objects_v2.call_args_list]
+    assert sorted(prefixes[:2]) == ["failure/", "output/"]
+    # The listings start right before the first tracked key of the prefix.
+    assert s3_client.list_objects_v2.call_args_list[0][1]["StartAfter"] in (
+        "output/a.ou",
+        "failure/a.ou",
+    )
+
+
+def test_track_sweeps_at_the_poll_of_the_request():
+    existing_keys = []
+    s3_client = _s3_client(existing_keys)
+    list_objects_v2 = s3_client.list_objects_v2.side_effect
+
+    def list_objects_v2_then_upload(**kwargs):
+        # The result is uploaded after the first listing.
+        response = list_objects_v2(**kwargs)
+        existing_keys.append("output/a.out")
+        return response
+
+    s3_client.list_objects_v2.side_effect = list_objects_v2_then_upload
+    collector = _collector(s3_client, poll=60)
+
+    future = collector.track(OUTPUT_PREFIX + "a.out", poll=0.01)
+
+    assert future.result(timeout=5) == "output/a.out"
+    assert s3_client.list_objects_v2.call_count == 2
+
+
+def test_list_keys_follows_continuation_tokens():
+    s3_client = Mock(name="s3_client")
+    s3_client.list_objects_v2 = Mock(
+        side_effect=[
+            {"Contents": [{"Key": "p/a"}], "IsTruncated": True, "NextContinuationToken": "t"},
+            {"Contents": [{"Key": "p/b"}, {"Key": "p/c"}, {"Key": "p/d"}]},
+        ]
+    )
+    collector = _collector(s3_client)
+
+    assert collector._list_keys("bucket", "p/", {"p/a", "p/c"}) == ["p/a", "p/c"]
+    assert s3_client.list_objects_v2.call_args_list[1][1]["ContinuationToken"] == "t"
+
+
+def test_cancelled_future_is_not_tracked():
+    collector = _collector(_s3_client([]), poll=0.01)
+
+    future = collector.track(OUTPUT_PREFIX + "a.out")
+    assert collector.outstanding == 1
+    assert future.cancel()
+    assert collector.outstanding == 0
+
+
+def test_notifications():
+    s3_client = _s3_client([])
+    sqs_client = Mock(name="sqs_client")
+    success = {
+        "invocationStatus": "Completed",
+        "responseParameters": {"outputLocation": OUTPUT_PREFIX + "a.out"},
+    }
+    error = {
+        "invocationStatus": "Failed",
+        "failureReason": "ClientError: model failed",
+        "responseParameters": {"outputLocation": OUTPUT_PREFIX + "b.out"},
+    }
+    sqs_client.receive_message = Mock(
+        return_value={
+            "Messages": [
+                {"Body": json.dumps(success), "ReceiptHandle": "r1"},
+                # Notifications of an SNS topic without raw message delivery are wrapped.
+                {
+                    "Body": json.dumps({"Type": "Notification", "Message": json.dumps(error)}),
+                    "ReceiptHandle": "r2",
+                },
+                {"Body": json.dumps(dict(success, responseParameters={})), "ReceiptHandle": "r3"},
+            ]
+        }
+    )
+    collector = _collector(
+        s3_client, poll=0.01, sqs_client=sqs_client, notification_queue_url="queue-url"
+    )
+
+    succeeded = collector.track(OUTPUT_PREFIX + "a.out")
+    failed = collector.track(OUTPUT_PREFIX + "b.out")
+
+    assert succeeded.result(timeout=5) == "output/a.out"
+    with pytest.raises(AsyncInferenceModelError, match="model failed"):
+        failed.result(timeout=5)
+    # Only the messages of tracked requests are deleted.
+    entries = sqs_client.delete_message_batch.call_args_list[0][1]["Entries"]
+    assert [entry["ReceiptHandle"] for entry in entries] == ["r1", "r2"]
+
+
+def test_notifications_require_sqs_client():
+    with pytest.raises(ValueError):
+        _collector(Mock(), notification_queue_url="queue-url")
@@ -23,11 +23,13 @@ from sagemaker.deserializers import (
     StringDeserializer,
     BytesDeserializer,
     CSVDeserializer,
+    CSVIteratorDeserializer,
     StreamDeserializer,
     NumpyDeserializer,
     JSONDeserializer,
     PandasDeserializer,
     JSONLinesDeserializer,
+    JSONLinesIteratorDeserializer,
 )
 
 
@@ -72,6 +74,29 @@ def test_csv_deserializer_posix_compliant(csv_deserializer):
     assert result == [["1", "2", "3"], ["3", "4", "5"]]
 
 
+def test_csv_deserializer_numpy():
+    deserializer = CSVDeserializer(output_type="numpy")
+
+    result = deserializer.deserialize(io.BytesIO(b"1,2,3\n3,4,5\n"), "text/csv")
+    assert np.array_equal(result, np.array([[1.0, 2.0, 3.0], [3.0, 4.0, 5.0]]))
+
+    result = deserializer.deserialize(io.BytesIO(b"1"), "text/csv")
+    assert np.array_equal(result, np.array([[1.0]]))
+
+
+def test_csv_deserializer_pandas():
+    deserializer = CSVDeserializer(output_type="pandas", dtype="float32")
+
+    result = deserializer.deserialize(io.BytesIO(b"1,2,3\n3,4,5\n"), "text/csv")
+    expected = pd.DataFrame([[1, 2, 3], [3, 4, 5]], dtype="float32")
+    assert result.equals(expected)
+
+
+def test_csv_deserializer_invalid_output_type():
+    with pytest.raises(ValueError):
+        CSVDeserializer(output_type="dict")
+
+
 def test_stream_deserializer():
     deserializer = StreamDeserializer()
 
@@ -141,6 +166,21 @@ def test_numpy_deserializer_from_npy(numpy_deserializer):
     assert np.array_equal(array, result)
 
 
+def test_numpy_deserializer_from_npy_reads_in_chunks(numpy_deserializer):
+    array = np.arange(200000, dtype="float64").reshape(1000, 200)
+    stream = io.BytesIO()
+    np.save(stream, array)
+    stream.seek(0)
+    reads = []
+    read = stream.read
+    stream.read = lambda size=-1: reads.append(size) or read(size)
+
+    result = numpy_deserializer.deserialize(stream, "application/x-npy")
+
+    assert np.array_equal(array, result)
+    assert all(0 <= size < array.nbytes for size in reads)
+
+
 def test_numpy_deserializer_from_npy_object_array(numpy_deserializer):
     array = np.array([{"a": "", "b": ""}, {"c": "", "d": ""}])
     stream = io.BytesIO()
@@ -249,3 +289,62 @@ def test_json_lines_deserializer(json_lines_deserializer, source, expected):
     content_type = "application/jsonlines"
     actual = json_lines_deserializer.deserialize(stream, content_type)
     assert actual == expected
+
+
+def test_pandas_deserializer_csv_chunks():
+    deserializer = PandasDeserializer(chunksize=2)
+    stream = io.BytesIO(b"a,b\n1,2\n3,4\n5,6")
+
+    chunks = list(deserializer.deserialize(stream, "text/csv"))
+
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert pd.concat(chunks).equals(pd.DataFrame({"a": [1, 3, 5], "b": [2, 4, 6]}))
+
+
+def test_csv_iterator_deserializer():
+    deserializer = CSVIteratorDeserializer(chunk_size=3)
+    stream = io.BytesIO('1,"two\nlines",\u00e9\n4,5,6'.encode("utf-8"))
+
+    result = deserializer.deserialize(stream, "text/csv")
+
+    assert not stream.closed
+    assert list(result) == [["1", "two\nlines", "\u00e9"], ["4", "5", "6"]]
+    assert stream.closed
+
+
+def test_csv_iterator_deserializer_numpy_batches():
+    deserializer = CSVIteratorDeserializer(chunk_size=4, batch_size=2, output_type="numpy")
+    stream = io.BytesIO(b"1,2\n3,4\n5,6\n")
+
+    batches = list(deserializer.deserialize(stream, "text/csv"))
+
+    assert len(batches) == 2
+    assert np.array_equal(batches[0], np.array([[1.0, 2.0], [3.0, 4.0]]))
+    assert np.array_equal(batches[1], np.array([[5.0, 6.0]]))
+
+
+def test_csv_iterator_deserializer_closes_stream():
+    stream = io.BytesIO(b"1,2\n3,4\n")
+    rows = CSVIteratorDeserializer(chunk_size=2).deserialize(stream, "text/csv")
+
+    assert next(rows) == ["1", "2"]
+    rows.close()
+    assert stream.closed
+
+
+def test_json_lines_iterator_deserializer():
+    deserializer = JSONLinesIteratorDeserializer(chunk_size=5)
+    stream = io.BytesIO(b'{"a": 1}\n\n[2, 3]\n"four"\n')
+
+    assert list(deserializer.deserialize(stream, "application/jsonlines")) == [
+        {"a": 1},
+        [2, 3],
+        "four",
+    ]
+
+
+def test_json_lines_iterator_deserializer_batches():
+    deserializer = JSONLinesIteratorDeserializer(batch_size=2)
+    stream = io.BytesIO(b"1\n2\n3")
+
+    assert list(deserializer.deserialize(stream, "application/jsonlines")) == [[1, 2], [3]]
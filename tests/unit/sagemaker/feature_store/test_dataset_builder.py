@@ -27,6 +27,7 @@ from sagemaker.feature_store.dataset_builder import (
     JoinTypeEnum,
 )
 from sagemaker.feature_store.feature_group import FeatureDefinition, FeatureGroup, FeatureTypeEnum
+from sagemaker.feature_store.inputs import QueryResultFormatEnum
 
 
 @pytest.fixture
@@ -340,6 +341,102 @@ def test_to_dataframe_with_dataframe(
     assert query_string == "query-string"
 
 
+@patch("sagemaker.feature_store.dataset_builder.read_parquet_result")
+@patch("sagemaker.utils.unique_name_from_base", Mock(return_value="unique"))
+def test_to_dataframe_from_parquet_with_query_result_cache(
+    read_parquet_result, sagemaker_session_mock
+):
+    feature_group = FeatureGroup(name="MyFeatureGroup", sagemaker_session=sagemaker_session_mock)
+    sagemaker_session_mock.describe_feature_group.return_value = {
+        "FeatureGroupArn": "arn",
+        "CreationTime": "time",
+        "OfflineStoreConfig": {"DataCatalogConfig": {"TableName": "table", "Database": "database"}},
+        "RecordIdentifierFeatureName": "feature-1",
+        "EventTimeFeatureName": "feature-2",
+        "FeatureDefinitions": [
+            {"FeatureName": "feature-1", "FeatureType": "String"},
+            {"FeatureName": "feature-2", "FeatureType": "String"},
+        ],
+    }
+    sagemaker_session_mock.start_query_execution.return_value = {"QueryExecutionId": "query-id"}
+    sagemaker_session_mock.get_query_execution.return_value = {
+        "QueryExecution": {
+            "QueryExecutionId": "query-id",
+            "Status": {"State": "SUCCEEDED"},
+            "Query": "unload-query-string",
+        }
+    }
+    sagemaker_session_mock.s3_client.get_paginator.return_value.paginate.return_value = [
+        {"Contents": [{"Key": "path/unique/part-0", "Size": 10}]}
+    ]
+    read_parquet_result.return_value = pd.DataFrame({"feature-1": ["a"], "row_recent": [1]})
+    dataset_builder = DatasetBuilder(
+        sagemaker_session=sagemaker_session_mock,
+        base=feature_group,
+        output_path="s3://bucket/path/",
+    ).with_query_result_cache()
+
+    for _ in range(2):
+        df, query_string = dataset_builder.to_dataframe(
+            result_format=QueryResultFormatEnum.PARQUET, max_concurrency=4
+        )
+        assert df.equals(pd.DataFrame({"feature-1": ["a"]}))
+        assert query_string == "unload-query-string"
+
+    # The second call reads the result of the first query.
+    sagemaker_session_mock.start_query_execution.assert_called_once()
+    _, kwargs = sagemaker_session_mock.start_query_execution.call_args
+    assert kwargs["query_string"].startswith("UNLOAD (WITH fg_base AS")
+    assert kwargs["query_string"].endswith(
+        "TO 's3://bucket/path/unique/' WITH (format = 'PARQUET')"
+    )
+    read_parquet_result.assert_called_with(
+        sagemaker_session_mock.s3_client, "s3://bucket/path/unique", max_concurrency=4
+    )
+    assert read_parquet_result.call_count == 2
+
+
+@patch("sagemaker.feature_store.dataset_builder.iter_result_batches")
+def test_to_batches(iter_result_batches, sagemaker_session_mock):
+    feature_group = FeatureGroup(name="MyFeatureGroup", sagemaker_session=sagemaker_session_mock)
+    sagemaker_session_mock.describe_feature_group.return_value = {
+        "OfflineStoreConfig": {"DataCatalogConfig": {"TableName": "table", "Database": "database"}},
+        "RecordIdentifierFeatureName": "feature-1",
+        "EventTimeFeatureName": "feature-2",
+        "FeatureDefinitions": [
+            {"FeatureName": "feature-1", "FeatureType": "String"},
+            {"FeatureName": "feature-2", "FeatureType": "String"},
+        ],
+    }
+    sagemaker_session_mock.start_query_execution.return_value = {"QueryExecutionId": "query-id"}
+    sagemaker_session_mock.get_query_execution.return_value = {
+        "QueryExecution": {
+            "Status": {"State": "SUCCEEDED"},
+            "ResultConfiguration": {"OutputLocation": "s3://bucket/path/query-id.csv"},
+            "Query": "query-string",
+        }
+    }
+    dataset_builder = DatasetBuilder(
+        sagemaker_session=sagemaker_session_mock,
+        base=feature_group,
+        output_path="s3://bucket/path",
+    )
+
+    batches, query_string = dataset_builder.to_batches(batch_size=10, prefetch=4)
+
+    assert batches == iter_result_batches.return_value
+    assert query_string == "query-string"
+    iter_result_batches.assert_called_with(
+        sagemaker_session_mock.s3_client,
+        "s3://bucket/path/query-id.csv",
+        batch_size=10,
+        as_arrow=False,
+        max_concurrency=10,
+        prefetch=4,
+        exclude_columns=["row_recent"],
+    )
+
+
 def test_construct_where_query_string(sagemaker_session_mock):
     feature_group = FeatureGroup(name="MyFeatureGroup", sagemaker_session=sagemaker_session_mock)
     dataset_builder = DatasetBuilder(
@@ -31,7 +31,12 @@ from sagemaker.feature_store.feature_group import (
     AthenaQuery,
     IngestionError,
 )
-from sagemaker.feature_store.inputs import FeatureParameter, DeletionModeEnum
+from sagemaker.feature_store.inputs import (
+    FeatureParameter,
+    DeletionModeEnum,
+    QueryResultFormatEnum,
+)
+from sagemaker.feature_store.query_results import QueryResultCache
 
 from tests.unit import SAGEMAKER_CONFIG_FEATURE_GROUP
 
@@ -486,6 +491,25 @@ def test_ingest_with_profile_name(
     )
 
 
+@patch("sagemaker.feature_store.feature_group.StreamIngestionManager")
+def test_ingest_stream(stream_ingestion_manager_init, sagemaker_session_mock):
+    sagemaker_session_mock.boto_session.profile_name = "default"
+    feature_group = FeatureGroup(name="MyGroup", sagemaker_session=sagemaker_session_mock)
+    chunks = iter([pd.DataFrame({"float": pd.Series([2.0], dtype="float64")})])
+
+    manager = feature_group.ingest_stream(chunks, max_concurrency=64, chunk_size=500)
+
+    stream_ingestion_manager_init.assert_called_once_with(
+        feature_group_name="MyGroup",
+        sagemaker_session=sagemaker_session_mock,
+        max_concurrency=64,
+        max_attempts=10,
+        profile_name=None,
+    )
+    assert manager is stream_ingestion_manager_init.return_value
+    manager.run.assert_called_once_with(chunks, chunk_size=500, journal_path=None)
+
+
 def test_as_hive_ddl_with_default_values(
     create_table_ddl, feature_group_dummy_definitions, sagemaker_session_mock
 ):
@@ -725,3 +749,96 @@ def test_athena_query_as_dataframe_query_running(sagemaker_session_mock, query):
     with pytest.raises(RuntimeError) as error:
         query.as_dataframe()
     assert "Current query query_id is still being executed" in str(error)
+
+
+@patch("sagemaker.feature_store.feature_group.read_parquet_result")
+@patch("sagemaker.feature_store.feature_group.unique_name_from_base", Mock(return_value="unique"))
+def test_athena_query_as_dataframe_from_parquet(read_parquet_result, sagemaker_session_mock, query):
+    sagemaker_session_mock.start_query_execution.return_value = {"QueryExecutionId": "query_id"}
+    sagemaker_session_mock.get_query_execution.return_value = {
+        "QueryExecution": {"Status": {"State": "SUCCEEDED"}}
+    }
+    query.run(
+        query_string="SELECT * FROM table_name;",
+        output_location="s3://bucket/prefix/",
+        result_format=QueryResultFormatEnum.PARQUET,
+    )
+    sagemaker_session_mock.start_query_execution.assert_called_with(
+        catalog="catalog",
+        database="database",
+        query_string="UNLOAD (SELECT * FROM table_name) TO 's3://bucket/prefix/unique/' "
+        "WITH (format = 'PARQUET')",
+        output_location="s3://bucket/prefix/",
+        kms_key=None,
+        workgroup=None,
+    )
+
+    assert query.as_dataframe(max_concurrency=4) == read_parquet_result.return_value
+    read_parquet_result.assert_called_with(
+        sagemaker_session_mock.s3_client, "s3://bucket/prefix/unique", max_concurrency=4
+    )
+    sagemaker_session_mock.download_athena_query_result.assert_not_called()
+
+
+def test_athena_query_run_reuses_cached_execution(sagemaker_session_mock, query):
+    sagemaker_session_mock.start_query_execution.return_value = {"QueryExecutionId": "query_id"}
+    sagemaker_session_mock.get_query_execution.return_value = {
+        "QueryExecution": {"Status": {"State": "RUNNING"}}
+    }
+    cache = QueryResultCache()
+    query.run("SELECT *\nFROM table_name", "s3://bucket/prefix", query_result_cache=cache)
+    other_query = AthenaQuery("catalog", "database", "table_name", sagemaker_session_mock)
+
+    # The identical query shares the execution of the first one.
+    assert (
+        other_query.run("SELECT * FROM table_name;", "s3://bucket/prefix", query_result_cache=cache)
+        == "query_id"
+    )
+    assert sagemaker_session_mock.start_query_execution.call_count == 1
+    assert other_query._result_bucket == "bucket"
+    assert other_query._result_file_prefix == "prefix"
+
+    # The result of another feature group version is not reused.
+    sagemaker_session_mock.start_query_execution.return_value = {"QueryExecutionId": "other_id"}
+    other_query.feature_group_version = "arn@2"
+    assert (
+        other_query.run("SELECT * FROM table_name", "s3://bucket/prefix", query_result_cache=cache)
+        == "other_id"
+    )
+
+
+def test_athena_query_records_feature_group_version(sagemaker_session_mock):
+    sagemaker_session_mock.describe_feature_group.return_value = {
+        "FeatureGroupArn": "arn",
+        "LastModifiedTime": "time",
+        "OfflineStoreConfig": {
+            "DataCatalogConfig": {"Catalog": "catalog", "Database": "database", "TableName": "t"}
+        },
+    }
+    feature_group = FeatureGroup(name="MyFeatureGroup", sagemaker_session=sagemaker_session_mock)
+    assert feature_group.athena_query().feature_group_version == "arn@time"
+
+
+@patch("sagemaker.feature_store.feature_group.iter_result_batches")
+def test_athena_query_as_batches(iter_result_batches, sagemaker_session_mock, query):
+    sagemaker_session_mock.start_query_execution.return_value = {"QueryExecutionId": "query_id"}
+    sagemaker_session_mock.get_query_execution.return_value = {
+        "QueryExecution": {"Status": {"State": "SUCCEEDED"}}
+    }
+    query.run(query_string="query", output_location="s3://bucket/prefix")
+
+    assert query.as_batches(batch_size=10, as_arrow=True) == iter_result_batches.return_value
+    iter_result_batches.assert_called_with(
+        sagemaker_session_mock.s3_client,
+        "s3://bucket/prefix/query_id.csv",
+        batch_size=10,
+        as_arrow=True,
+        max_concurrency=10,
+        prefetch=2,
+    )
+
+    sagemaker_session_mock.get_query_execution.return_value = {
+        "QueryExecution": {"Status": {"State": "FAILED"}}
+    }
+    with pytest.raises(RuntimeError, match="Failed to execute query query_id"):
+        query.as_batches()
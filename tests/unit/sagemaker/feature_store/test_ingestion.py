@@ -0,0 +1,268 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+
+import json
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from mock import Mock
+
+from sagemaker.feature_store.ingestion import (
+    IngestionError,
+    StreamIngestionManager,
+    _AdaptiveConcurrency,
+    _encode_records,
+)
+from sagemaker.feature_store.inputs import FeatureValue
+
+
+def _client_error(code, status=400):
+    return ClientError(
+        {"Error": {"Code": code}, "ResponseMetadata": {"HTTPStatusCode": status}}, "PutRecord"
+    )
+
+
+class _FakeRuntimeClient(object):
+    """Records the PutRecord requests, and fails the first attempts of some records."""
+
+    def __init__(self, errors=None):
+        self.errors = errors or {}
+        self.records = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def put_record(self, FeatureGroupName, Record):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            record_id = Record[0]["ValueAsString"]
+            with self._lock:
+                errors = self.errors.get(record_id)
+                error = errors.pop(0) if errors else None
+            if error is not None:
+                raise error
+            self.records[record_id] = Record
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def _manager(client, **kwargs):
+    sagemaker_session = Mock()
+    sagemaker_session.sagemaker_featurestore_runtime_client.meta.config = Config()
+    sagemaker_session.boto_session.client.return_value = client
+    kwargs.setdefault("initial_backoff", 0.001)
+    return StreamIngestionManager(
+        feature_group_name="MyGroup", sagemaker_session=sagemaker_session, **kwargs
+    )
+
+
+def test_encode_records_matches_row_by_row_records():
+    df = pd.DataFrame(
+        {
+            "id": ["a", "b", "c"],
+            "float32": np.array([0.1, np.nan, 1.5], dtype="float32"),
+            "int": [1, 2, 3],
+            "nullable": pd.Series([1, None, 3], dtype="Int64"),
+            "time": pd.to_datetime(["2020-01-01", "2020-01-02", None]),
+            "bool": [True, False, True],
+        },
+        index=[10, 11, 12],
+    )
+
+    expected = [
+        [
+            FeatureValue(feature_name=df.columns[i - 1], value_as_string=str(row[i])).to_dict()
+            for i in range(1, len(row))
+            if pd.notna(row[i])
+        ]
+        for row in df.itertuples()
+    ]
+    assert _encode_records(df) == expected
+    assert _encode_records(df[["id", "int"]]) == [
+        [{"FeatureName": "id", "ValueAsString": v}, {"FeatureName": "int", "ValueAsString": i}]
+        for v, i in (("a", "1"), ("b", "2"), ("c", "3"))
+    ]
+
+
+def test_adaptive_concurrency_halves_once_per_epoch_and_grows_back():
+    concurrency = _AdaptiveConcurrency(max_concurrency=8)
+    epochs = [concurrency.acquire() for _ in range(4)]
+
+    # The requests throttled together only halve the limit once.
+    for epoch in epochs:
+        concurrency.throttled(epoch)
+    assert concurrency.limit == 4
+    concurrency.throttled(concurrency.epoch)
+    assert concurrency.limit == 2
+
+    for _ in range(2):
+        concurrency.succeeded()
+    assert concurrency.limit == 3
+    for _ in range(100):
+        concurrency.succeeded()
+    assert concurrency.limit == 8
+
+
+def test_run_streams_chunks_and_retries_throttled_requests():
+    errors = {
+        "r1": [_client_error("ThrottlingException"), _client_error("ThrottlingException")],
+        "r7": [_client_error("ServiceUnavailable", 503)],
+    }
+    client = _FakeRuntimeClient(errors)
+    manager = _manager(client, max_concurrency=4)
+    chunks = (
+        pd.DataFrame({"id": [f"r{i}" for i in range(start, start + 5)], "value": range(5)})
+        for start in (0, 5, 10)
+    )
+
+    manager.run(chunks)
+
+    assert sorted(client.records) == sorted(f"r{i}" for i in range(15))
+    assert client.max_in_flight <= 4
+    assert manager.failed_rows == []
+    assert manager.report.ingested_records == 15
+    assert manager.report.retries == 3
+    assert manager.report.throttled_requests == 2
+    assert manager.report.records_per_second > 0
+    _, kwargs = manager.sagemaker_session.boto_session.client.call_args
+    assert kwargs["config"].max_pool_connections == 4
+    assert kwargs["config"].retries["total_max_attempts"] == 1
+
+
+def test_run_raises_ingestion_error_with_failed_rows():
+    errors = {
+        "r1": [_client_error("ValidationException")],
+        "r3": [_client_error("ThrottlingException")] * 3,
+    }
+    client = _FakeRuntimeClient(errors)
+    manager = _manager(client, max_concurrency=2, max_attempts=3)
+    df = pd.DataFrame({"id": [f"r{i}" for i in range(5)]}, index=range(100, 105))
+
+    with pytest.raises(IngestionError) as error:
+        manager.run(df, chunk_size=2)
+
+    assert "Failed to ingest some data into FeatureGroup MyGroup" in str(error)
+    assert sorted(error.value.failed_rows) == [101, 103]
+    assert sorted(manager._failures) == [(101, "ValidationException"), (103, "ThrottlingException")]
+    assert manager.report.ingested_records == 3
+    assert manager.report.failed_records == 2
+    assert manager.report.retries == 2
+
+
+def test_run_rejects_chunks_that_are_not_data_frames():
+    with pytest.raises(TypeError):
+        _manager(_FakeRuntimeClient()).run([{"id": "r0"}])
+
+
+def test_run_reads_parquet_files(tmpdir):
+    pytest.importorskip("pyarrow")
+    for i in range(2):
+        pd.DataFrame({"id": [f"f{i}r{j}" for j in range(3)]}).to_parquet(
+            str(tmpdir.join(f"part-{i}.parquet"))
+        )
+    client = _FakeRuntimeClient({"f1r1": [_client_error("ValidationException")]})
+    manager = _manager(client)
+
+    with pytest.raises(IngestionError) as error:
+        manager.run(str(tmpdir), chunk_size=2)
+
+    # The rows of the files are indexed by their position across the files.
+    assert error.value.failed_rows == [4]
+    assert len(client.records) == 5
+
+
+def _chunks(count, fail_at=None):
+    for start in range(0, count, 4):
+        if start == fail_at:
+            raise RuntimeError("interrupted")
+        yield pd.DataFrame(
+            {"id": [f"r{i}" for i in range(start, min(start + 4, count))]},
+            index=range(start, min(start + 4, count)),
+        )
+
+
+def test_run_resumes_from_journal(tmpdir):
+    journal_path = str(tmpdir.join("journal.jsonl"))
+    client = _FakeRuntimeClient({"r2": [_client_error("ValidationException")]})
+
+    with pytest.raises(RuntimeError, match="interrupted"):
+        _manager(client).run(_chunks(10, fail_at=8), chunk_size=4, journal_path=journal_path)
+    assert len(client.records) == 7
+
+    # The completed chunks are skipped, except for their failed rows.
+    client = _FakeRuntimeClient()
+    manager = _manager(client)
+    manager.run(_chunks(10), chunk_size=4, journal_path=journal_path)
+
+    assert sorted(client.records) == ["r2", "r8", "r9"]
+    assert manager.report.ingested_records == 3
+    assert manager.report.skipped_records == 7
+    with open(journal_path) as f:
+        lines = [json.loads(line) for line in f]
+    assert lines[0] == {"feature_group_name": "MyGroup", "chunk_size": 4}
+    # The chunks are journaled as their records are done, in any order.
+    first_run = sorted(lines[1:3], key=lambda line: line["chunk"])
+    assert first_run == [
+        {
+            "chunk": 0,
+            "start": 0,
+            "rows": 4,
+            "failed": [{"position": 2, "row": 2, "code": "ValidationException"}],
+        },
+        {"chunk": 1, "start": 4, "rows": 4, "failed": []},
+    ]
+    assert sorted(line["chunk"] for line in lines[3:]) == [0, 2]
+    assert all(line["failed"] == [] for line in lines[3:])
+
+    # A finished ingestion sends nothing again.
+    client = _FakeRuntimeClient()
+    manager = _manager(client)
+    manager.run(_chunks(10), chunk_size=4, journal_path=journal_path)
+    assert client.records == {}
+    assert manager.report.skipped_records == 10
+
+
+def test_run_ignores_truncated_journal_line(tmpdir):
+    journal = tmpdir.join("journal.jsonl")
+    journal.write(
+        json.dumps({"feature_group_name": "MyGroup", "chunk_size": 4})
+        + "\n"
+        + json.dumps({"chunk": 0, "start": 0, "rows": 4, "failed": []})
+        + '\n{"chunk": 1, "sta'
+    )
+    client = _FakeRuntimeClient()
+
+    _manager(client).run(_chunks(8), chunk_size=4, journal_path=str(journal))
+
+    assert sorted(client.records) == ["r4", "r5", "r6", "r7"]
+    client = _FakeRuntimeClient()
+    _manager(client).run(_chunks(8), chunk_size=4, journal_path=str(journal))
+    assert client.records == {}
+
+
+def test_run_rejects_mismatched_journal(tmpdir):
+    journal_path = str(tmpdir.join("journal.jsonl"))
+    _manager(_FakeRuntimeClient()).run(_chunks(8), chunk_size=4, journal_path=journal_path)
+
+    with pytest.raises(ValueError, match="does not match"):
+        _manager(_FakeRuntimeClient()).run(_chunks(8), chunk_size=2, journal_path=journal_path)
+    with pytest.raises(ValueError, match="same order"):
+        _manager(_FakeRuntimeClient()).run(_chunks(6), chunk_size=4, journal_path=journal_path)
@@ -0,0 +1,231 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+
+import datetime
+import io
+
+import pandas as pd
+import pytest
+from botocore.exceptions import ClientError
+
+from sagemaker.feature_store.feature_definition import FeatureDefinition, FeatureTypeEnum
+from sagemaker.feature_store.feature_store import FeatureStore
+from sagemaker.feature_store.inputs import QueryResultFormatEnum
+from sagemaker.feature_store.local_offline_store import LocalOfflineStoreSession
+
+OUTPUT_PATH = "s3://bucket/datasets"
+
+
+@pytest.fixture
+def session(tmpdir, monkeypatch):
+    # DatasetBuilder.to_dataframe downloads the CSV result into the working directory.
+    monkeypatch.chdir(tmpdir)
+    return LocalOfflineStoreSession(root_dir=str(tmpdir.join("s3")))
+
+
+@pytest.fixture
+def feature_groups(session):
+    orders = session.add_feature_group(
+        "orders",
+        pd.DataFrame(
+            {"id": ["a", "a", "b", "c"], "event_time": [10.0, 20.0, 10.0, 10.0], "amount": range(4)}
+        ),
+        record_identifier_name="id",
+        event_time_feature_name="event_time",
+    )
+    customers = session.add_feature_group(
+        "customers",
+        pd.DataFrame(
+            {
+                "id": ["a", "a", "b", "c"],
+                "event_time": [
+                    "1970-01-01T00:00:05Z",
+                    "1970-01-01T00:00:15Z",
+                    "1970-01-01T00:00:30Z",
+                    "1970-01-01T00:00:10Z",
+                ],
+                "score": [0.1, 0.2, 0.3, 0.4],
+            }
+        ),
+        record_identifier_name="id",
+        event_time_feature_name="event_time",
+    )
+    return orders, customers
+
+
+def test_add_feature_group(session, feature_groups):
+    orders, customers = feature_groups
+
+    description = orders.describe()
+    assert description["RecordIdentifierFeatureName"] == "id"
+    assert description["OfflineStoreConfig"]["DataCatalogConfig"] == {
+        "Catalog": "AwsDataCatalog",
+        "Database": "sagemaker_featurestore",
+        "TableName": "orders",
+    }
+    assert customers.feature_definitions == [
+        FeatureDefinition("id", FeatureTypeEnum.STRING),
+        FeatureDefinition("event_time", FeatureTypeEnum.STRING),
+        FeatureDefinition("score", FeatureTypeEnum.FRACTIONAL),
+    ]
+    with pytest.raises(ValueError, match="already exists"):
+        session.add_feature_group("orders", pd.DataFrame({"id": ["a"]}), "id", "id")
+    with pytest.raises(ValueError, match="Failed to infer Feature type"):
+        session.add_feature_group("flags", pd.DataFrame({"flag": [True]}), "flag", "flag")
+
+    session.delete_feature_group("orders")
+    with pytest.raises(ClientError):
+        orders.describe()
+
+
+def test_point_in_time_accurate_join(session, feature_groups):
+    pytest.importorskip("pyarrow")
+    orders, customers = feature_groups
+    dataset_builder = (
+        FeatureStore(sagemaker_session=session)
+        .create_dataset(orders, OUTPUT_PATH)
+        .with_feature_group(customers)
+        .point_in_time_accurate_join()
+        .with_number_of_recent_records_by_record_identifier(1)
+    )
+
+    df, query_string = dataset_builder.to_dataframe()
+
+    expected = pd.DataFrame(
+        {
+            "id": ["a", "c"],
+            "event_time": [20.0, 10.0],
+            "amount": [1, 3],
+            "id.1": ["a", "c"],
+            "event_time.1": ["1970-01-01T00:00:15Z", "1970-01-01T00:00:10Z"],
+            "score.1": [0.2, 0.4],
+        }
+    )
+    pd.testing.assert_frame_equal(df.sort_values("id", ignore_index=True), expected)
+    assert "from_iso8601_timestamp" in query_string
+
+    df, _ = dataset_builder.to_dataframe(result_format=QueryResultFormatEnum.PARQUET)
+    pd.testing.assert_frame_equal(df.sort_values("id", ignore_index=True), expected)
+
+
+def test_duplicated_deleted_and_as_of_records(session):
+    day = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+    records = session.add_feature_group(
+        "records",
+        pd.DataFrame(
+            {
+                "id": ["a", "a", "b", "b"],
+                "event_time": [1.0, 1.0, 1.0, 1.0],
+                "value": [1, 2, 3, 4],
+                "write_time": [day, day + datetime.timedelta(days=2), day, day],
+                "is_deleted": [False, False, False, True],
+            }
+        ),
+        record_identifier_name="id",
+        event_time_feature_name="event_time",
+    )
+    feature_store = FeatureStore(sagemaker_session=session)
+
+    df, _ = feature_store.create_dataset(records, OUTPUT_PATH).to_dataframe()
+    assert df.to_dict("records") == [{"id": "a", "event_time": 1.0, "value": 2}]
+
+    df, _ = (
+        feature_store.create_dataset(records, OUTPUT_PATH)
+        .as_of(day + datetime.timedelta(days=1))
+        .to_dataframe()
+    )
+    assert df.to_dict("records") == [{"id": "a", "event_time": 1.0, "value": 1}]
+
+    df, _ = (
+        feature_store.create_dataset(records, OUTPUT_PATH)
+        .include_duplicated_records()
+        .include_deleted_records()
+        .to_dataframe()
+    )
+    assert sorted(df["value"]) == [1, 2, 3]
+
+
+def test_data_frame_base(session, feature_groups):
+    _, customers = feature_groups
+    base = pd.DataFrame({"id": ["a", "b", "d"], "event_time": [20.0, 20.0, 20.0]})
+
+    df, _ = (
+        FeatureStore(sagemaker_session=session)
+        .create_dataset(
+            base,
+            OUTPUT_PATH,
+            record_identifier_feature_name="id",
+            event_time_identifier_feature_name="event_time",
+        )
+        .with_feature_group(customers, included_feature_names=["score"])
+        .point_in_time_accurate_join()
+        .to_dataframe()
+    )
+
+    assert df.sort_values("score.1").to_dict("records") == [
+        {"id": "a", "event_time": 20.0, "score.1": 0.1},
+        {"id": "a", "event_time": 20.0, "score.1": 0.2},
+    ]
+
+
+def test_athena_query(session, feature_groups):
+    orders, _ = feature_groups
+    query = orders.athena_query()
+
+    query.run(
+        f'SELECT id, amount FROM "{query.table_name}" WHERE amount > 1 ORDER BY amount;',
+        "s3://bucket/queries",
+    )
+    query.wait()
+
+    execution = query.get_query_execution()["QueryExecution"]
+    assert execution["Status"]["State"] == "SUCCEEDED"
+    assert execution["ResultConfiguration"]["OutputLocation"] == (
+        f"s3://bucket/queries/{execution['QueryExecutionId']}.csv"
+    )
+    pd.testing.assert_frame_equal(
+        query.as_dataframe(), pd.DataFrame({"id": ["b", "c"], "amount": [2, 3]})
+    )
+    assert [len(batch) for batch in query.as_batches(batch_size=1)] == [1, 1]
+
+    query.run("SELECT missing FROM orders", "s3://bucket/queries")
+    execution = query.get_query_execution()["QueryExecution"]
+    assert execution["Status"]["State"] == "FAILED"
+    assert "missing" in execution["Status"]["StateChangeReason"]
+    with pytest.raises(RuntimeError):
+        query.as_dataframe()
+
+
+def test_s3_objects_are_local_files(session, tmpdir):
+    local_dir = tmpdir.mkdir("upload")
+    local_dir.join("a.csv").write("a")
+    local_dir.mkdir("sub").join("b.csv").write("bb")
+
+    assert session.upload_data(str(local_dir), bucket="bucket", key_prefix="data") == (
+        "s3://bucket/data"
+    )
+    listed = session.s3_client.list_objects_v2(Bucket="bucket", Prefix="data/")["Contents"]
+    assert [(content["Key"], content["Size"]) for content in listed] == [
+        ("data/a.csv", 1),
+        ("data/sub/b.csv", 2),
+    ]
+    assert session.read_s3_file("bucket", "data/sub/b.csv") == "bb"
+    fileobj = io.BytesIO()
+    session.s3_client.download_fileobj("bucket", "data/a.csv", fileobj)
+    assert fileobj.getvalue() == b"a"
+
+    downloaded = session.download_data(str(tmpdir.join("download")), "bucket", "data")
+    assert sorted(open(path).read() for path in downloaded) == ["a", "bb"]
+    with pytest.raises(ClientError):
+        session.s3_client.get_object(Bucket="bucket", Key="data/missing")
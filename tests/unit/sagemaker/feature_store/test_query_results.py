@@ -0,0 +1,251 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+
+import io
+
+import pandas as pd
+import pytest
+from mock import Mock, patch
+
+from sagemaker.feature_store.query_results import (
+    QueryResultCache,
+    feature_group_version,
+    iter_result_batches,
+    normalize_query_string,
+    read_parquet_result,
+    unload_query_string,
+)
+
+
+class FakeS3Client(object):
+    """Serves the listing and the downloads of in-memory objects."""
+
+    def __init__(self, objects=None):
+        self.objects = objects or {}
+        self.downloads = []
+
+    def get_paginator(self, operation_name):
+        return self
+
+    def paginate(self, Bucket, Prefix):
+        keys = sorted(
+            key for bucket, key in self.objects if bucket == Bucket and key.startswith(Prefix)
+        )
+        sizes = [getattr(self.objects[(Bucket, key)], "__len__", lambda: 1)() for key in keys]
+        yield {"Contents": [{"Key": key, "Size": size} for key, size in zip(keys, sizes)]}
+
+    def download_fileobj(self, Bucket, Key, Fileobj, Config):
+        self.downloads.append(Key)
+        data = self.objects[(Bucket, Key)]
+        if isinstance(data, Exception):
+            raise data
+        Fileobj.write(data)
+
+    def get_object(self, Bucket, Key):
+        self.downloads.append(Key)
+        return {"Body": io.BytesIO(self.objects[(Bucket, Key)])}
+
+
+def parquet_bytes(data_frame, **kwargs):
+    buffer = io.BytesIO()
+    data_frame.to_parquet(buffer, index=False, **kwargs)
+    return buffer.getvalue()
+
+
+def test_normalize_query_string():
+    query_string = """
+        SELECT  *  -- all the features
+        FROM "my  table"
+        WHERE name = 'a  b' /* keep
+        the literal */ ;
+    """
+    assert normalize_query_string(query_string) == "SELECT * FROM \"my  table\" WHERE name = 'a  b'"
+    assert normalize_query_string("SELECT 'it''s  ok'") == "SELECT 'it''s  ok'"
+
+
+def test_unload_query_string():
+    assert unload_query_string("SELECT *\nFROM t;", "s3://bucket/prefix/result/") == (
+        "UNLOAD (SELECT * FROM t) TO 's3://bucket/prefix/result/' WITH (format = 'PARQUET')"
+    )
+
+
+def test_feature_group_version():
+    assert feature_group_version({"FeatureGroupArn": "arn", "CreationTime": 1}) == "arn@1"
+    assert (
+        feature_group_version({"FeatureGroupArn": "arn", "CreationTime": 1, "LastModifiedTime": 2})
+        == "arn@2"
+    )
+    assert feature_group_version({}) is None
+
+
+def test_read_parquet_result_keeps_dtypes():
+    pytest.importorskip("pyarrow")
+    parts = [
+        pd.DataFrame(
+            {
+                "id": ["a", "b"],
+                "value": [1.5, None],
+                "count": pd.Series([1, 2], dtype="int64"),
+                "time": pd.to_datetime(["2020-01-01", "2020-01-02"]),
+            }
+        ),
+        pd.DataFrame(
+            {
+                "id": ["c"],
+                "value": [3.0],
+                "count": pd.Series([3], dtype="int64"),
+                "time": pd.to_datetime(["2020-01-03"]),
+            }
+        ),
+    ]
+    s3_client = FakeS3Client(
+        {
+            ("bucket", "result/part-1"): parquet_bytes(parts[1]),
+            ("bucket", "result/part-0"): parquet_bytes(parts[0]),
+            ("bucket", "result/empty"): b"",
+            ("bucket", "other/part-0"): parquet_bytes(parts[0]),
+        }
+    )
+
+    df = read_parquet_result(s3_client, "s3://bucket/result/", max_concurrency=4)
+
+    pd.testing.assert_frame_equal(df, pd.concat(parts, ignore_index=True))
+    assert sorted(s3_client.downloads) == ["result/part-0", "result/part-1"]
+    assert read_parquet_result(s3_client, "s3://bucket/missing/").empty
+
+
+def test_query_result_cache_key_ignores_formatting():
+    key = QueryResultCache.key("SELECT *\n  FROM t;", database="db", versions=("v1",))
+    assert key == QueryResultCache.key("SELECT * FROM t", versions=("v1",), database="db")
+    assert key != QueryResultCache.key("SELECT * FROM t", database="db", versions=("v2",))
+
+
+def _session(state, s3_client):
+    sagemaker_session = Mock()
+    sagemaker_session.s3_client = s3_client
+    sagemaker_session.get_query_execution.return_value = {
+        "QueryExecution": {"Status": {"State": state}}
+    }
+    return sagemaker_session
+
+
+def test_query_result_cache_lookup():
+    cache = QueryResultCache()
+    key = QueryResultCache.key("SELECT 1")
+    cache.put(key, "query-id", "s3://bucket/result/query-id.csv")
+    s3_client = FakeS3Client({("bucket", "result/query-id.csv"): b"_col0\n1\n"})
+
+    assert cache.lookup(key, _session("SUCCEEDED", s3_client)).query_execution_id == "query-id"
+    assert cache.lookup(key, _session("RUNNING", FakeS3Client())) is not None
+    # The execution is forgotten once its result is deleted.
+    assert cache.lookup(key, _session("SUCCEEDED", FakeS3Client())) is None
+    assert cache.get(key) is None
+
+    cache.put(key, "query-id", "s3://bucket/result/query-id.csv")
+    assert cache.lookup(key, _session("FAILED", s3_client)) is None
+    assert cache.get(key) is None
+
+
+def test_query_result_cache_expires_and_invalidates():
+    cache = QueryResultCache(max_age_seconds=60)
+    with patch("time.time", Mock(return_value=1000)):
+        cache.put("a", "query-a", "s3://bucket/a")
+        cache.put("b", "query-b", "s3://bucket/b")
+    with patch("time.time", Mock(return_value=1030)):
+        assert cache.get("a").query_execution_id == "query-a"
+    with patch("time.time", Mock(return_value=1061)):
+        assert cache.get("a") is None
+
+    cache.invalidate()
+    assert cache.get("b") is None
+
+
+def test_iter_result_batches_from_parquet():
+    pa = pytest.importorskip("pyarrow")
+    data_frame = pd.DataFrame(
+        {"id": [f"r{i}" for i in range(8)], "value": range(8), "row_recent": 1}, dtype="object"
+    ).astype({"value": "int64", "row_recent": "int64"})
+    s3_client = FakeS3Client(
+        {
+            ("bucket", "result/part-0"): parquet_bytes(data_frame.iloc[:5], row_group_size=2),
+            ("bucket", "result/part-1"): parquet_bytes(data_frame.iloc[5:]),
+        }
+    )
+
+    batches = list(
+        iter_result_batches(
+            s3_client, "s3://bucket/result/", batch_size=3, exclude_columns=["row_recent"]
+        )
+    )
+
+    assert [len(batch) for batch in batches] == [3, 3, 2]
+    pd.testing.assert_frame_equal(pd.concat(batches), data_frame.drop(columns="row_recent"))
+
+    batches = list(
+        iter_result_batches(s3_client, "s3://bucket/result/", batch_size=5, as_arrow=True)
+    )
+    assert all(isinstance(batch, pa.RecordBatch) for batch in batches)
+    assert [batch.num_rows for batch in batches] == [5, 3]
+    pd.testing.assert_frame_equal(pa.Table.from_batches(batches).to_pandas(), data_frame)
+
+
+def test_iter_result_batches_from_csv():
+    pa = pytest.importorskip("pyarrow")
+    s3_client = FakeS3Client(
+        {
+            ("bucket", "result/query-id.csv"): b"id,value,row_recent\na,1,1\nb,2,1\nc,3,1\n",
+            ("bucket", "result/query-id.csv.metadata"): b"metadata",
+        }
+    )
+
+    batches = list(
+        iter_result_batches(
+            s3_client,
+            "s3://bucket/result/query-id.csv",
+            batch_size=2,
+            exclude_columns=["row_recent"],
+        )
+    )
+
+    assert s3_client.downloads == ["result/query-id.csv"]
+    pd.testing.assert_frame_equal(batches[0], pd.DataFrame({"id": ["a", "b"], "value": [1, 2]}))
+    pd.testing.assert_frame_equal(
+        batches[1], pd.DataFrame({"id": ["c"], "value": [3]}, index=pd.RangeIndex(2, 3))
+    )
+    batches = list(iter_result_batches(s3_client, "s3://bucket/result/query-id.csv", as_arrow=True))
+    assert batches[0].to_pydict() == {
+        "id": ["a", "b", "c"],
+        "value": [1, 2, 3],
+        "row_recent": [1, 1, 1],
+    }
+    assert isinstance(batches[0], pa.RecordBatch)
+
+
+def test_iter_result_batches_stops_and_raises():
+    pytest.importorskip("pyarrow")
+    part = parquet_bytes(pd.DataFrame({"value": range(10)}))
+    objects = {("bucket", f"result/part-{i}"): part for i in range(10)}
+    s3_client = FakeS3Client(objects)
+
+    batches = iter_result_batches(s3_client, "s3://bucket/result/", batch_size=10, prefetch=2)
+    next(batches)
+    batches.close()
+    # Only the files ahead of the batches being used are downloaded.
+    assert len(s3_client.downloads) < 10
+
+    objects[("bucket", "result/part-5")] = RuntimeError("download failed")
+    with pytest.raises(RuntimeError, match="download failed"):
+        list(iter_result_batches(FakeS3Client(objects), "s3://bucket/result/"))
+    with pytest.raises(ValueError):
+        iter_result_batches(s3_client, "s3://bucket/result/", batch_size=0)
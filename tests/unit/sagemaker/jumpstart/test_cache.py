@@ -20,6 +20,7 @@ from botocore.stub import Stubber
 import botocore
 
 from mock.mock import MagicMock
+from packaging.version import Version
 import pytest
 from mock import patch
 
@@ -224,6 +225,37 @@ def test_jumpstart_cache_get_header():
         )
 
 
+@patch.object(JumpStartModelsCache, "_retrieval_function", patched_retrieval_function)
+@patch("sagemaker.jumpstart.utils.get_sagemaker_version", lambda: "2.68.3")
+def test_jumpstart_cache_indexes_manifest():
+    cache = JumpStartModelsCache(s3_bucket_name="some_bucket")
+    model_id = "tensorflow-ic-imagenet-inception-v3-classification-4"
+
+    cache.get_header(model_id=model_id, semantic_version_str="*")
+    manifest, manifest_index = cache._manifest_index
+
+    assert manifest_index.versions(model_id) == [
+        Version("1.0.0"),
+        Version("2.0.0"),
+        Version("3.0.0"),
+    ]
+    assert manifest_index.compatible_versions(model_id, "2.68.3") == [
+        Version("1.0.0"),
+        Version("2.0.0"),
+    ]
+    assert manifest_index.min_sagemaker_version(model_id, "3.0.0") == "4.49.0"
+    assert manifest_index.min_sagemaker_version(model_id, "4.0.0") is None
+    assert manifest_index.versions("unknown-model-id") == []
+
+    cache.get_header(model_id=model_id, semantic_version_str="1.*")
+    assert cache._manifest_index[1] is manifest_index
+
+    cache.clear()
+    assert cache._manifest_index is None
+    cache.get_header(model_id=model_id, semantic_version_str="1.0.0")
+    assert cache._manifest_index[1] is not manifest_index
+
+
 @patch("boto3.client")
 def test_jumpstart_cache_handles_boto3_issues(mock_boto3_client):
 
@@ -12,6 +12,7 @@
 # language governing permissions and limitations under the License.
 from __future__ import absolute_import
 
+import io
 import sys
 
 import pytest
@@ -250,3 +251,71 @@ def test_multi_record_strategy_with_large_records():
     batch_records = [r for r in multi_record.pad("some_file", 1)]
     # check with 11 because there may be a bit of leftover.
     assert len(batch_records) <= 11
+
+
+def test_multi_record_strategy_with_line_splitter(tmpdir):
+    test_file_path = tmpdir.join("line_test.txt")
+    # 10 lines of 100000 bytes, 2 bytes of which are a 2-byte character.
+    line = "é" + "1" * 99997 + "\n"
+    with test_file_path.open("wb") as f:
+        f.write((line * 10).encode("utf-8"))
+
+    multi_record = sagemaker.local.data.MultiRecordStrategy(sagemaker.local.data.LineSplitter())
+    batch_records = [r for r in multi_record.pad(str(test_file_path), 1)]
+
+    # Lines of exactly 100000 bytes, counting the 2-byte character, fit in a batch of 1 MB.
+    assert [len(r) for r in batch_records] == [1000000]
+    assert batch_records[0] == (line * 10).encode("utf-8")
+
+    with test_file_path.open("ab") as f:
+        f.write(b"1" * 48576)
+    batch_records = [r for r in multi_record.pad(str(test_file_path), 1)]
+    assert [len(r) for r in batch_records] == [1048576]
+    with test_file_path.open("ab") as f:
+        f.write(b"2")
+    batch_records = [r for r in multi_record.pad(str(test_file_path), 1)]
+    assert [len(r) for r in batch_records] == [1000000, 48577]
+
+
+def test_multi_record_strategy_with_recordio_splitter(tmpdir):
+    test_file_path = tmpdir.join("recordio_test.rec")
+    with test_file_path.open("wb") as f:
+        for i in range(10):
+            sagemaker.amazon.common._write_recordio(f, b"x" * (i + 1))
+
+    multi_record = sagemaker.local.data.MultiRecordStrategy(sagemaker.local.data.RecordIOSplitter())
+    batch_records = [r for r in multi_record.pad(str(test_file_path), 0)]
+
+    # The records of a batch are sent with their RecordIO headers.
+    assert batch_records == [test_file_path.read_binary()]
+    records = list(sagemaker.amazon.common.read_recordio(io.BytesIO(batch_records[0])))
+    assert records == [b"x" * (i + 1) for i in range(10)]
+
+
+def test_multi_record_strategy_with_large_record(tmpdir):
+    test_file_path = tmpdir.join("line_test.txt")
+    with test_file_path.open("wb") as f:
+        f.write(b"1\n" + b"2" * 1048576 + b"\n")
+
+    multi_record = sagemaker.local.data.MultiRecordStrategy(sagemaker.local.data.LineSplitter())
+    batch_records = multi_record.pad(str(test_file_path), 1)
+
+    assert next(batch_records) == b"1\n"
+    with pytest.raises(RuntimeError):
+        next(batch_records)
+
+
+def test_multi_record_strategy_with_empty_file(tmpdir):
+    test_file_path = tmpdir.join("empty.txt")
+    test_file_path.write_binary(b"")
+
+    multi_record = sagemaker.local.data.MultiRecordStrategy(sagemaker.local.data.NoneSplitter())
+    assert [r for r in multi_record.pad(str(test_file_path), 6)] == []
+
+
+def test_multi_record_strategy_with_binary_records():
+    splitter = Mock()
+    splitter.split.return_value = [b"\x00\x01", b"\x02", b"\x03\x04"]
+
+    multi_record = sagemaker.local.data.MultiRecordStrategy(splitter)
+    assert [r for r in multi_record.pad("some_file", 6)] == [b"\x00\x01\x02\x03\x04"]
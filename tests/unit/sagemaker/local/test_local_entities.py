@@ -12,7 +12,10 @@
 # language governing permissions and limitations under the License.
 from __future__ import absolute_import
 
+import io
 import os
+import threading
+import time
 import pytest
 
 from mock import patch, Mock
@@ -171,6 +174,115 @@ def test_local_transform_job_perform_batch_inference(
     assert "file2.out" in output_files
 
 
+@pytest.mark.parametrize("max_concurrent_transforms, max_connections", [(4, 4), (0, 1)])
+@patch("sagemaker.local.data.get_batch_strategy_instance")
+@patch("sagemaker.local.data.get_data_source_instance")
+@patch("sagemaker.local.entities.move_to_destination")
+@patch("sagemaker.local.entities.get_config_value")
+def test_local_transform_job_perform_batch_inference_concurrently(
+    get_config_value,
+    move_to_destination,
+    get_data_source_instance,
+    get_batch_strategy_instance,
+    max_concurrent_transforms,
+    max_connections,
+    local_transform_job,
+    tmpdir,
+):
+    input_data = {
+        "DataSource": {"S3DataSource": {"S3Uri": "s3://some_bucket/nice/data"}},
+        "ContentType": "text/csv",
+    }
+    output_data = {"S3OutputPath": "s3://bucket/output", "AssembleWith": "Line"}
+    transform_kwargs = {
+        "MaxPayloadInMB": 3,
+        "BatchStrategy": "MultiRecord",
+        "MaxConcurrentTransforms": max_concurrent_transforms,
+    }
+
+    data_source = Mock()
+    data_source.get_file_list.return_value = ["/tmp/file1", "/tmp/file2"]
+    data_source.get_root_dir.return_value = "/tmp"
+    get_data_source_instance.return_value = data_source
+
+    batch_strategy = Mock()
+    batch_strategy.pad.side_effect = lambda fn, max_payload: [
+        "%s-%d" % (os.path.basename(fn), i) for i in range(10)
+    ]
+    get_batch_strategy_instance.return_value = batch_strategy
+
+    get_config_value.return_value = str(tmpdir)
+
+    lock = threading.Lock()
+    in_flight = []
+    max_in_flight = []
+
+    def invoke_endpoint(body, endpoint_name, content_type, accept):
+        with lock:
+            in_flight.append(body)
+            max_in_flight.append(len(in_flight))
+        # Later batches complete first, so that the responses complete out of order.
+        time.sleep(0.01 * (10 - int(body.split("-")[1])))
+        with lock:
+            in_flight.remove(body)
+        return {"Body": io.BytesIO(body.upper().encode("utf-8"))}
+
+    runtime_client = Mock()
+    runtime_client.invoke_endpoint.side_effect = invoke_endpoint
+    local_transform_job.local_session.sagemaker_runtime_client = runtime_client
+    local_transform_job.container = Mock()
+
+    local_transform_job._perform_batch_inference(input_data, output_data, **transform_kwargs)
+
+    dir, _, _, _ = move_to_destination.call_args[0]
+    for name in ("file1", "file2"):
+        with open(os.path.join(dir, name + ".out"), "rb") as f:
+            expected = "".join("%s-%d\n" % (name.upper(), i) for i in range(10))
+            assert f.read() == expected.encode("utf-8")
+    assert max(max_in_flight) <= max_connections
+    if max_connections > 1:
+        assert max(max_in_flight) > 1
+    runtime_client.set_max_connections.assert_called_once_with(max_connections)
+
+
+@patch("sagemaker.local.entities.move_to_destination")
+@patch("sagemaker.local.entities.get_config_value")
+def test_local_transform_job_perform_batch_inference_line_split_multi_record(
+    get_config_value, move_to_destination, local_transform_job, tmpdir
+):
+    input_dir = tmpdir.mkdir("input")
+    lines = ["%d,%s\n" % (i, "x" * 40) for i in range(30000)]
+    input_dir.join("data.csv").write("".join(lines))
+    input_data = {
+        "DataSource": {"S3DataSource": {"S3Uri": "file://" + str(input_dir)}},
+        "ContentType": "text/csv",
+        "SplitType": "Line",
+    }
+    output_data = {"S3OutputPath": "s3://bucket/output", "AssembleWith": "Line"}
+    transform_kwargs = {"MaxPayloadInMB": 1, "BatchStrategy": "MultiRecord"}
+    get_config_value.return_value = str(tmpdir.mkdir("working"))
+
+    bodies = []
+
+    def invoke_endpoint(body, endpoint_name, content_type, accept):
+        bodies.append(body)
+        return {"Body": io.BytesIO(b"%d" % body.count(b"\n"))}
+
+    runtime_client = Mock()
+    runtime_client.invoke_endpoint.side_effect = invoke_endpoint
+    local_transform_job.local_session.sagemaker_runtime_client = runtime_client
+    local_transform_job.container = Mock()
+
+    local_transform_job._perform_batch_inference(input_data, output_data, **transform_kwargs)
+
+    # The batches are slices of the memory-mapped file, sent as bytes.
+    assert [type(body) for body in bodies] == [bytes, bytes]
+    assert b"".join(bodies) == "".join(lines).encode("utf-8")
+    dir, _, _, _ = move_to_destination.call_args[0]
+    with open(os.path.join(dir, "data.csv.out"), "rb") as f:
+        assert f.read() == b"".join(b"%d\n" % body.count(b"\n") for body in bodies)
+
+
 @patch("sagemaker.local.entities._SageMakerContainer", Mock())
 @patch("sagemaker.local.entities.get_docker_host")
 @patch("sagemaker.local.entities._perform_request")
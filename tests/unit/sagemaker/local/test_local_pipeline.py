@@ -12,6 +12,10 @@
 # language governing permissions and limitations under the License.
 from __future__ import absolute_import
 
+import datetime
+import threading
+import time
+
 import pytest
 from mock import Mock, patch, PropertyMock
 
@@ -34,10 +38,12 @@ from sagemaker.workflow.conditions import (
     ConditionOr,
 )
 from sagemaker.workflow.fail_step import FailStep
+from sagemaker.workflow.parallelism_config import ParallelismConfiguration
 from sagemaker.workflow.parameters import ParameterInteger, ParameterString
 from sagemaker.workflow.pipeline import Pipeline
 from sagemaker.workflow.pipeline_context import PipelineSession
 from sagemaker.workflow.steps import (
+    CacheConfig,
     ProcessingStep,
     TrainingStep,
     TransformStep,
@@ -47,6 +53,7 @@ from sagemaker.workflow.steps import (
 from sagemaker.local.pipeline import (
     _ConditionStepExecutor,
     _FailStepExecutor,
+    _parse_duration,
     _ProcessingStepExecutor,
     _StepExecutorFactory,
     _TrainingStepExecutor,
@@ -881,6 +888,7 @@ def test_execute_pipeline_condition_step_test_conditions(
         (1, 1, ["stepA", "stepB", "stepD", "stepI"]),
     ],
 )
+@pytest.mark.parametrize("parallelism_config", [None, {"MaxParallelExecutionSteps": 4}])
 @patch(
     "sagemaker.local.local_session.LocalSagemakerClient.describe_training_job",
     return_value={},
@@ -890,6 +898,7 @@ def test_pipeline_execution_condition_step_execution_path(
     create_training_job,
     describe_training_job,
     local_sagemaker_session,
+    parallelism_config,
     left_value_1,
     left_value_2,
     expected_path,
@@ -925,7 +934,10 @@ def test_pipeline_execution_condition_step_execution_path(
     )
 
     execution = LocalPipelineExecutor(
-        _LocalPipelineExecution("my-execution-5-1", pipeline), local_sagemaker_session
+        _LocalPipelineExecution(
+            "my-execution-5-1", pipeline, ParallelismConfiguration=parallelism_config
+        ),
+        local_sagemaker_session,
     ).execute()
 
     actual_path = []
@@ -935,6 +947,208 @@ def test_pipeline_execution_condition_step_execution_path(
     assert actual_path == expected_path
 
 
+#     ┌──►B──┐
+# A───┼──►C──┼──►E
+#     └──►D──┘
+@patch(
+    "sagemaker.local.local_session.LocalSagemakerClient.describe_training_job",
+    return_value={},
+)
+@patch("sagemaker.local.local_session.LocalSagemakerClient.create_training_job")
+def test_pipeline_execution_runs_independent_steps_concurrently(
+    create_training_job, describe_training_job, local_sagemaker_session
+):
+    # Steps B, C and D only succeed if they run at the same time.
+    barrier = threading.Barrier(3, timeout=5)
+    started = []
+
+    def create_training_job_side_effect(TrainingJobName, **kwargs):
+        started.append(TrainingJobName.split("-")[0])
+        if not TrainingJobName.startswith(("stepA", "stepE")):
+            barrier.wait()
+
+    create_training_job.side_effect = create_training_job_side_effect
+    step_a = CustomStep(name="stepA")
+    step_b = CustomStep(name="stepB", depends_on=[step_a.name])
+    step_c = CustomStep(name="stepC", depends_on=[step_a.name])
+    step_d = CustomStep(name="stepD", depends_on=[step_a.name])
+    step_e = CustomStep(name="stepE", depends_on=[step_b.name, step_c.name, step_d.name])
+    pipeline = Pipeline(
+        name="MyPipeline5-3",
+        steps=[step_a, step_b, step_c, step_d, step_e],
+        sagemaker_session=local_sagemaker_session,
+    )
+
+    execution = LocalPipelineExecutor(
+        _LocalPipelineExecution(
+            "my-execution-5-3",
+            pipeline,
+            ParallelismConfiguration=ParallelismConfiguration(max_parallel_execution_steps=3),
+        ),
+        local_sagemaker_session,
+    ).execute()
+
+    assert execution.status == _LocalExecutionStatus.SUCCEEDED.value
+    assert started[0] == "stepA"
+    assert sorted(started[1:4]) == ["stepB", "stepC", "stepD"]
+    assert started[4] == "stepE"
+    steps = {step["StepName"]: step for step in execution.list_steps()["PipelineExecutionSteps"]}
+    assert all(step["StepStatus"] == "Succeeded" for step in steps.values())
+    assert steps["stepE"]["StartTime"] >= max(
+        steps[name]["EndTime"] for name in ("stepB", "stepC", "stepD")
+    )
+
+
+@patch(
+    "sagemaker.local.local_session.LocalSagemakerClient.describe_training_job",
+    return_value={},
+)
+@patch("sagemaker.local.local_session.LocalSagemakerClient.create_training_job")
+def test_pipeline_execution_stops_starting_steps_after_failure(
+    create_training_job, describe_training_job, local_sagemaker_session
+):
+    def create_training_job_side_effect(TrainingJobName, **kwargs):
+        if TrainingJobName.startswith("stepA"):
+            raise RuntimeError("Dummy RuntimeError")
+        time.sleep(0.2)
+
+    create_training_job.side_effect = create_training_job_side_effect
+    step_a = CustomStep(name="stepA")
+    step_b = CustomStep(name="stepB")
+    step_c = CustomStep(name="stepC", depends_on=[step_b.name])
+    pipeline = Pipeline(
+        name="MyPipeline5-4",
+        steps=[step_a, step_b, step_c],
+        sagemaker_session=local_sagemaker_session,
+    )
+
+    execution = LocalPipelineExecutor(
+        _LocalPipelineExecution(
+            "my-execution-5-4",
+            pipeline,
+            ParallelismConfiguration={"MaxParallelExecutionSteps": 2},
+        ),
+        local_sagemaker_session,
+    ).execute()
+
+    assert execution.status == _LocalExecutionStatus.FAILED.value
+    assert execution.step_execution["stepA"].status == _LocalExecutionStatus.FAILED.value
+    # The running step completes, but the steps that depend on it are not started.
+    assert execution.step_execution["stepB"].status == _LocalExecutionStatus.SUCCEEDED.value
+    assert execution.step_execution["stepC"].status is None
+
+
+@patch("sagemaker.local.local_session.LocalSagemakerClient.describe_training_job")
+@patch("sagemaker.local.local_session.LocalSagemakerClient.create_training_job")
+def test_pipeline_execution_reuses_cached_step_properties(
+    create_training_job, describe_training_job, local_sagemaker_session, tmp_path
+):
+    local_sagemaker_session.config = {"local": {"pipeline_cache_dir": str(tmp_path / "cache")}}
+    describe_training_job.side_effect = lambda job_name: {
+        "TrainingJobName": job_name,
+        "TrainingStartTime": datetime.datetime(2023, 1, 1),
+    }
+    data = tmp_path / "train.csv"
+    data.write_text("1,2\n")
+    step_a = CustomStep(name="stepA", input_data="file://" + str(data))
+    step_a.cache_config = CacheConfig(enable_caching=True, expire_after="P1D")
+    step_b = CustomStep(name="stepB", input_data=step_a.properties.TrainingJobName)
+    pipeline = Pipeline(
+        name="MyPipeline5-5", steps=[step_a, step_b], sagemaker_session=local_sagemaker_session
+    )
+
+    def execute(execution_id):
+        create_training_job.reset_mock()
+        return LocalPipelineExecutor(
+            _LocalPipelineExecution(execution_id, pipeline), local_sagemaker_session
+        ).execute()
+
+    first_execution = execute("my-execution-5-5-1")
+    assert create_training_job.call_count == 2
+
+    execution = execute("my-execution-5-5-2")
+    assert execution.status == _LocalExecutionStatus.SUCCEEDED.value
+    # Only step B runs, with the properties of step A in the first execution.
+    assert create_training_job.call_count == 1
+    assert execution.step_execution["stepA"].properties == (
+        first_execution.step_execution["stepA"].properties
+    )
+    assert create_training_job.call_args[1]["input_data"] == (
+        first_execution.step_execution["stepA"].properties["TrainingJobName"]
+    )
+    steps = {step["StepName"]: step for step in execution.list_steps()["PipelineExecutionSteps"]}
+    assert steps["stepA"]["CacheHitResult"] == {"SourcePipelineExecutionArn": "my-execution-5-5-1"}
+    assert "CacheHitResult" not in steps["stepB"]
+
+    # Changing the contents of an input runs the step again.
+    data.write_text("1,2\n3,4\n")
+    execute("my-execution-5-5-3")
+    assert create_training_job.call_count == 2
+
+
+@patch("sagemaker.local.local_session.LocalSagemakerClient.describe_training_job", return_value={})
+@patch("sagemaker.local.local_session.LocalSagemakerClient.create_training_job")
+def test_pipeline_execution_ignores_expired_cached_step_properties(
+    create_training_job, describe_training_job, local_sagemaker_session, tmp_path
+):
+    local_sagemaker_session.config = {"local": {"pipeline_cache_dir": str(tmp_path)}}
+    step = CustomStep(name="stepA")
+    step.cache_config = CacheConfig(enable_caching=True, expire_after="PT0S")
+    pipeline = Pipeline(
+        name="MyPipeline5-6", steps=[step], sagemaker_session=local_sagemaker_session
+    )
+
+    for execution_id in ("my-execution-5-6-1", "my-execution-5-6-2"):
+        LocalPipelineExecutor(
+            _LocalPipelineExecution(execution_id, pipeline), local_sagemaker_session
+        ).execute()
+
+    assert create_training_job.call_count == 2
+
+
+@patch("sagemaker.local.local_session.LocalSagemakerClient.create_training_job")
+def test_pipeline_execution_fails_step_with_invalid_cache_expiry(
+    create_training_job, local_sagemaker_session, tmp_path
+):
+    local_sagemaker_session.config = {"local": {"pipeline_cache_dir": str(tmp_path)}}
+    step = CustomStep(name="stepA")
+    step.cache_config = CacheConfig(enable_caching=True, expire_after="30 days")
+    pipeline = Pipeline(
+        name="MyPipeline5-7", steps=[step], sagemaker_session=local_sagemaker_session
+    )
+
+    execution = LocalPipelineExecutor(
+        _LocalPipelineExecution("my-execution-5-7", pipeline), local_sagemaker_session
+    ).execute()
+
+    assert execution.status == _LocalExecutionStatus.FAILED.value
+    step_execution = execution.step_execution["stepA"]
+    assert step_execution.status == _LocalExecutionStatus.FAILED.value
+    assert "Invalid ISO 8601 duration '30 days'" in step_execution.failure_reason
+    assert "CacheHitResult" not in step_execution.to_list_steps_response()
+    create_training_job.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "duration, expected",
+    [
+        ("p30d", datetime.timedelta(days=30)),
+        ("P4DT12H", datetime.timedelta(days=4, hours=12)),
+        ("T12H", datetime.timedelta(hours=12)),
+        ("PT1M30.5S", datetime.timedelta(minutes=1, seconds=30.5)),
+        ("P1Y2M1W", datetime.timedelta(days=365 + 60 + 7)),
+    ],
+)
+def test_parse_duration(duration, expected):
+    assert _parse_duration(duration) == expected
+
+
+@pytest.mark.parametrize("duration", ["", "P", "30 days", "PT"])
+def test_parse_duration_invalid(duration):
+    with pytest.raises(ValueError):
+        _parse_duration(duration)
+
+
 def test_condition_step_incompatible_types(local_sagemaker_session):
 
     step_a = CustomStep(name="stepA")
@@ -16,7 +16,7 @@ import pytest
 import urllib3
 import os
 from botocore.exceptions import ClientError
-from mock import Mock, patch
+from mock import ANY, Mock, patch
 from tests.unit import DATA_DIR, SAGEMAKER_CONFIG_SESSION
 
 import sagemaker
@@ -861,6 +861,7 @@ def test_local_session_download_with_custom_s3_endpoint_url(sagemaker_session_cu
         Key="/data/test.csv",
         Filename="{}/{}".format(DOWNLOAD_DATA_TESTS_FILES_DIR, "test.csv"),
         ExtraArgs=None,
+        Config=ANY,
     )
 
 
@@ -879,6 +880,22 @@ def test_invoke_local_endpoint_with_remote_docker_host(
     m_request.assert_called_with("POST", url, body=Body, preload_content=False, headers={})
 
 
+def test_local_runtime_client_set_max_connections():
+    runtime_client = sagemaker.local.local_session.LocalSagemakerRuntimeClient()
+    http = runtime_client.http
+
+    runtime_client.set_max_connections(1)
+    assert runtime_client.http is http
+
+    # Requests are made one at a time when no concurrency is given.
+    runtime_client.set_max_connections(0)
+    assert runtime_client.http is http
+
+    runtime_client.set_max_connections(16)
+    pool = runtime_client.http.connection_from_url("http://localhost:8080")
+    assert pool.pool.maxsize == 16
+
+
 def test_create_describe_update_pipeline():
     parameter = ParameterString("MyStr", default_value="test")
     pipeline = Pipeline(
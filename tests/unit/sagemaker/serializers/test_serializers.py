@@ -17,6 +17,7 @@ import json
 import os
 
 import numpy as np
+import pandas as pd
 import pytest
 import scipy.sparse
 
@@ -63,6 +64,33 @@ def test_csv_serializer_numpy_valid_2dimensional(csv_serializer):
     assert result == "1,2,3\n3,4,5"
 
 
+def test_csv_serializer_numpy_floats(csv_serializer):
+    data = np.array([[0.1, -2.5, np.nan], [1e20, 3.0, np.inf]])
+    result = csv_serializer.serialize(data)
+
+    assert result == "0.1,-2.5,nan\n1e+20,3.0,inf"
+
+
+def test_csv_serializer_numpy_float32(csv_serializer):
+    result = csv_serializer.serialize(np.array([[0.1, 0.2]], dtype=np.float32))
+
+    assert result == "0.1,0.2"
+
+
+def test_csv_serializer_numpy_3dimensional(csv_serializer):
+    result = csv_serializer.serialize(np.arange(8).reshape(2, 2, 2))
+
+    assert result == "0,1,2,3\n4,5,6,7"
+
+
+def test_csv_serializer_float_precision():
+    serializer = CSVSerializer(float_precision=3)
+
+    assert serializer.serialize(np.array([[1.23456, 2.0], [1e-7, 10]])) == "1.23,2\n1e-07,10"
+    assert serializer.serialize(np.array([1, 2])) == "1,2"
+    assert serializer.serialize(pd.DataFrame({"a": [1.23456], "b": [2]})) == "1.23,2\n"
+
+
 def test_csv_serializer_list_of_str(csv_serializer):
     result = csv_serializer.serialize(["1,2,3", "4,5,6"])
 
@@ -20,6 +20,7 @@ import pytest
 from mock import Mock, patch
 
 from sagemaker import s3
+from sagemaker.processing import Processor
 from sagemaker.session_settings import SessionSettings
 from sagemaker.workflow.condition_step import ConditionStep
 from sagemaker.workflow.conditions import ConditionEquals
@@ -27,11 +28,13 @@ from sagemaker.workflow.execution_variables import ExecutionVariables
 from sagemaker.workflow.parameters import ParameterString
 from sagemaker.workflow.pipeline import Pipeline, PipelineGraph
 from sagemaker.workflow.parallelism_config import ParallelismConfiguration
+from sagemaker.workflow.pipeline_context import PipelineSession
 from sagemaker.workflow.pipeline_experiment_config import (
     PipelineExperimentConfig,
     PipelineExperimentConfigProperties,
 )
 from sagemaker.workflow.step_collections import StepCollection
+from sagemaker.workflow.steps import ProcessingStep
 from tests.unit.sagemaker.workflow.helpers import ordered, CustomStep
 from sagemaker.local.local_session import LocalSession
 from botocore.exceptions import ClientError
@@ -708,6 +711,65 @@ def test_pipeline_execution_basics(sagemaker_session_mock):
     assert len(steps) == 1
 
 
+@pytest.fixture
+def pipeline_session():
+    client = Mock()
+    client._client_config.user_agent = (
+        "Boto3/1.14.24 Python/3.8.5 Linux/5.4.0-42-generic Botocore/1.17.24 Resource"
+    )
+    boto_session = Mock(region_name="us-west-2")
+    boto_session.client.return_value = client
+    session = PipelineSession(
+        boto_session=boto_session, sagemaker_client=client, default_bucket="my-bucket"
+    )
+    session.sagemaker_config = {}
+    return session
+
+
+def test_pipeline_definition_reuses_unchanged_step_requests(pipeline_session):
+    processors = [
+        Processor(
+            role="arn:aws:iam::123456789012:role/DummyRole",
+            image_uri="fakeimage",
+            instance_count=1,
+            instance_type="ml.m5.xlarge",
+            env={"MODE": "train"},
+            sagemaker_session=pipeline_session,
+        )
+        for _ in range(3)
+    ]
+    steps = []
+    for i, processor in enumerate(processors):
+        steps.append(
+            ProcessingStep(
+                name=f"MyProcessingStep{i}",
+                step_args=processor.run(),
+                depends_on=steps[-1:],
+            )
+        )
+    pipeline = Pipeline(name="MyPipeline", steps=steps, sagemaker_session=pipeline_session)
+
+    definition = pipeline.definition()
+    assert pipeline.definition_stats["rebuilt_steps"] == 3
+    assert pipeline.definition() == definition
+    assert pipeline.definition_stats["cached_steps"] == 3
+    assert pipeline.definition_stats["rebuilt_steps"] == 0
+    assert pipeline.definition_stats["total_seconds"] >= 0
+
+    # Changed attributes of the job objects, even in place, invalidate the steps.
+    processors[1].instance_count = 2
+    processors[2].env["MODE"] = "evaluate"
+    step_requests = json.loads(pipeline.definition())["Steps"]
+    assert pipeline.definition_stats["cached_steps"] == 1
+    assert pipeline.definition_stats["rebuilt_steps"] == 2
+    assert (
+        step_requests[1]["Arguments"]["ProcessingResources"]["ClusterConfig"]["InstanceCount"] == 2
+    )
+    assert step_requests[2]["Arguments"]["Environment"] == {"MODE": "evaluate"}
+    assert step_requests[2]["DependsOn"] == ["MyProcessingStep1"]
+    assert pipeline.to_request()["Steps"][2]["Arguments"]["Environment"] == {"MODE": "evaluate"}
+
+
 def _generate_large_pipeline_steps(input_data: object):
     steps = []
     for i in range(2000):
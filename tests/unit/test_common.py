@@ -12,21 +12,43 @@
 # language governing permissions and limitations under the License.
 from __future__ import absolute_import
 
+import io
+
 import numpy as np
 import tempfile
 import pytest
 import itertools
+import scipy.sparse
 from scipy.sparse import coo_matrix
 from sagemaker.amazon.common import (
     RecordDeserializer,
     write_numpy_to_dense_tensor,
     read_recordio,
+    RecordIOReader,
     RecordSerializer,
     write_spmatrix_to_sparse_tensor,
+    _write_recordio,
 )
 from sagemaker.amazon.record_pb2 import Record
 
 
+def _dense_records_one_at_a_time(array, labels=None):
+    buffer = io.BytesIO()
+    for index, vector in enumerate(array):
+        record = Record()
+        if array.dtype == np.dtype("float32"):
+            record.features["values"].float32_tensor.values.extend(vector)
+        else:
+            record.features["values"].float64_tensor.values.extend(vector)
+        if labels is not None:
+            if labels.dtype == np.dtype("float32"):
+                record.label["values"].float32_tensor.values.extend([labels[index]])
+            else:
+                record.label["values"].float64_tensor.values.extend([labels[index]])
+        _write_recordio(buffer, record.SerializeToString())
+    return buffer.getvalue()
+
+
 def test_serializer():
     s = RecordSerializer()
     array_data = [[1.0, 2.0, 3.0], [10.0, 20.0, 30.0]]
@@ -134,6 +156,52 @@ def test_float_label():
             assert record.label["values"].float64_tensor.values == [label]
 
 
+@pytest.mark.parametrize(
+    "dtype, label_dtype, n_cols, chunk_size",
+    [
+        ("float32", None, 1, None),
+        ("float64", None, 7, None),
+        ("float32", "float32", 31, 3),
+        ("float32", "float64", 40, 1000),
+        ("float64", "float32", 200, 4),
+        ("float64", "float64", 3, 1),
+    ],
+)
+def test_write_numpy_to_dense_tensor_matches_record_encoding(
+    dtype, label_dtype, n_cols, chunk_size
+):
+    rng = np.random.default_rng(0)
+    array = (rng.standard_normal((10, n_cols)) * 1e6).astype(dtype)
+    array[0, 0] = np.inf
+    array[-1, -1] = -0.0
+    labels = None if label_dtype is None else rng.standard_normal(10).astype(label_dtype)
+
+    buffer = io.BytesIO()
+    write_numpy_to_dense_tensor(buffer, array, labels, chunk_size=chunk_size)
+
+    assert buffer.getvalue() == _dense_records_one_at_a_time(array, labels)
+
+
+def test_write_numpy_to_dense_tensor_large_record_lengths():
+    # 5000 float64 values need two byte varints at every level of the record.
+    array = np.arange(3 * 5000, dtype="float64").reshape(3, 5000)
+    labels = np.array([1.0, 2.0, 3.0])
+
+    buffer = io.BytesIO()
+    write_numpy_to_dense_tensor(buffer, array, labels)
+
+    assert buffer.getvalue() == _dense_records_one_at_a_time(array, labels)
+    buffer.seek(0)
+    records = list(read_recordio(buffer))
+    assert len(records) == 3
+
+
+def test_write_numpy_to_dense_tensor_empty_array():
+    buffer = io.BytesIO()
+    write_numpy_to_dense_tensor(buffer, np.empty((0, 4), dtype="float32"))
+    assert buffer.getvalue() == b""
+
+
 def test_invalid_array():
     array_data = [[[1, 2, 3], [10, 20, 3]], [[1, 2, 3], [10, 20, 3]]]
     array = np.array(array_data)
@@ -341,6 +409,29 @@ def test_sparse_int_write_spmatrix_to_sparse_tensor():
             assert record.features["values"].int32_tensor.shape == [n]
 
 
+@pytest.mark.parametrize("chunk_bytes", [1, 64, 8 * 1024 * 1024])
+def test_write_spmatrix_to_sparse_tensor_matches_row_encoding(chunk_bytes):
+    array = scipy.sparse.random(50, 30, density=0.2, format="csr", random_state=0)
+    array[7] = 0
+    array.eliminate_zeros()
+    labels = np.arange(50, dtype="float64")
+
+    expected = io.BytesIO()
+    for row_idx in range(array.shape[0]):
+        row = array.getrow(row_idx)
+        record = Record()
+        record.features["values"].float64_tensor.values.extend(row.data)
+        record.features["values"].float64_tensor.keys.extend(row.indices.astype(np.uint64))
+        record.label["values"].float64_tensor.values.extend([labels[row_idx]])
+        record.features["values"].float64_tensor.shape.extend([array.shape[1]])
+        _write_recordio(expected, record.SerializeToString())
+
+    buffer = io.BytesIO()
+    write_spmatrix_to_sparse_tensor(buffer, array, labels, chunk_bytes=chunk_bytes)
+
+    assert buffer.getvalue() == expected.getvalue()
+
+
 def test_dense_to_sparse():
     array_data = [[1, 2, 3], [10, 20, 3]]
     array = np.array(array_data)
@@ -348,3 +439,116 @@ def test_dense_to_sparse():
     with tempfile.TemporaryFile() as f:
         with pytest.raises(TypeError):
             write_spmatrix_to_sparse_tensor(f, array, label_data)
+
+
+def test_recordio_reader_random_access():
+    array = np.arange(12, dtype="float32").reshape(4, 3)
+    buffer = io.BytesIO()
+    write_numpy_to_dense_tensor(buffer, array)
+    buffer.seek(0)
+    expected = list(read_recordio(buffer))
+
+    reader = RecordIOReader(buffer.getvalue())
+
+    assert len(reader) == 4
+    assert isinstance(reader[2], memoryview)
+    assert [bytes(data) for data in reader] == expected
+    assert bytes(reader[-1]) == expected[3]
+    with pytest.raises(IndexError):
+        reader[4]
+    records = list(reader.records(1, 3))
+    assert [list(r.features["values"].float32_tensor.values) for r in records] == [
+        [3.0, 4.0, 5.0],
+        [6.0, 7.0, 8.0],
+    ]
+
+
+def test_recordio_reader_rejects_corrupt_data():
+    with pytest.raises(ValueError):
+        RecordIOReader(b"\x00" * 8)
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float64", "int"])
+def test_recordio_reader_to_numpy(dtype):
+    array = (np.arange(40) * 3).reshape(10, 4).astype(dtype)
+    labels = np.arange(10, dtype="float64")
+    buffer = io.BytesIO()
+    write_numpy_to_dense_tensor(buffer, array, labels)
+
+    reader = RecordIOReader(buffer.getvalue())
+
+    features = reader.to_numpy(2, 7)
+    assert features.dtype == (np.int32 if dtype == "int" else array.dtype)
+    np.testing.assert_array_equal(features, array[2:7])
+    np.testing.assert_array_equal(reader.to_numpy(field="label")[:, 0], labels)
+
+
+def test_recordio_reader_to_numpy_and_csr_from_sparse_records():
+    array = scipy.sparse.random(20, 8, density=0.3, format="csr", random_state=1)
+    buffer = io.BytesIO()
+    write_spmatrix_to_sparse_tensor(buffer, array)
+
+    reader = RecordIOReader(buffer.getvalue())
+
+    np.testing.assert_array_equal(reader.to_numpy(), array.toarray())
+    csr = reader.to_csr(5, 15)
+    assert csr.shape == (10, 8)
+    np.testing.assert_array_equal(csr.toarray(), array[5:15].toarray())
+
+    # A sparse record without nonzero values is still a row of its shape.
+    array = scipy.sparse.csr_matrix(np.array([[1.0, 0.0, 2.0], [0.0, 0.0, 0.0], [0.0, 3.0, 0.0]]))
+    buffer = io.BytesIO()
+    write_spmatrix_to_sparse_tensor(buffer, array)
+
+    reader = RecordIOReader(buffer.getvalue())
+
+    np.testing.assert_array_equal(reader.to_numpy(), array.toarray())
+    np.testing.assert_array_equal(reader.to_csr().toarray(), array.toarray())
+
+
+def test_recordio_reader_open_memory_maps_file(tmpdir):
+    path = str(tmpdir.join("data.pbr"))
+    array = np.random.default_rng(0).standard_normal((100, 5))
+    with open(path, "wb") as f:
+        write_numpy_to_dense_tensor(f, array)
+
+    with RecordIOReader.open(path) as reader:
+        assert len(reader) == 100
+        np.testing.assert_array_equal(reader.to_numpy(), array)
+
+    empty_path = str(tmpdir.join("empty.pbr"))
+    open(empty_path, "wb").close()
+    with RecordIOReader.open(empty_path) as reader:
+        assert len(reader) == 0
+
+
+@pytest.mark.parametrize("output_format", ["numpy", "csr"])
+def test_deserializer_output_format(output_format):
+    array_data = [[1.0, 2.0, 3.0], [10.0, 20.0, 30.0]]
+    buf = RecordSerializer().serialize(np.array(array_data))
+
+    result = RecordDeserializer(output_format=output_format).deserialize(buf, "who cares")
+
+    if output_format == "csr":
+        result = result.toarray()
+    np.testing.assert_array_equal(result, array_data)
+
+
+@pytest.mark.parametrize("output_format", ["numpy", "csr"])
+def test_deserializer_output_format_with_empty_sparse_row(output_format):
+    array = scipy.sparse.csr_matrix(np.array([[1.0, 0.0, 2.0], [0.0, 0.0, 0.0], [0.0, 3.0, 0.0]]))
+    buffer = io.BytesIO()
+    write_spmatrix_to_sparse_tensor(buffer, array)
+
+    result = RecordDeserializer(output_format=output_format).deserialize(
+        io.BytesIO(buffer.getvalue()), "application/x-recordio-protobuf"
+    )
+
+    if output_format == "csr":
+        result = result.toarray()
+    np.testing.assert_array_equal(result, array.toarray())
+
+
+def test_deserializer_invalid_output_format():
+    with pytest.raises(ValueError):
+        RecordDeserializer(output_format="parquet")
@@ -3078,7 +3078,7 @@ def test_same_code_location_keeps_kms_key(utils, sagemaker_session):
 
     obj.assert_called_with("mybucket", "%s/source/sourcedir.tar.gz" % fw._current_job_name)
 
-    obj().upload_file.assert_called_with(utils.create_tar_file(), ExtraArgs=extra_args)
+    obj().upload_file.assert_called_with(utils.create_tar_file(), ExtraArgs=extra_args, Config=ANY)
 
 
 @patch("sagemaker.utils")
@@ -3099,7 +3099,7 @@ def test_different_code_location_kms_key(utils, sagemaker_session):
 
     obj.assert_called_with("another-location", "%s/source/sourcedir.tar.gz" % fw._current_job_name)
     extra_args = {"ServerSideEncryption": "aws:kms"}
-    obj().upload_file.assert_called_with(utils.create_tar_file(), ExtraArgs=extra_args)
+    obj().upload_file.assert_called_with(utils.create_tar_file(), ExtraArgs=extra_args, Config=ANY)
 
 
 @patch("sagemaker.utils")
@@ -3121,7 +3121,7 @@ def test_default_code_location_uses_output_path(utils, sagemaker_session):
     obj.assert_called_with("output_path", "%s/source/sourcedir.tar.gz" % fw._current_job_name)
 
     extra_args = {"ServerSideEncryption": "aws:kms", "SSEKMSKeyId": "kms-key"}
-    obj().upload_file.assert_called_with(utils.create_tar_file(), ExtraArgs=extra_args)
+    obj().upload_file.assert_called_with(utils.create_tar_file(), ExtraArgs=extra_args, Config=ANY)
 
 
 def test_wait_without_logs(sagemaker_session):
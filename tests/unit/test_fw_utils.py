@@ -15,17 +15,20 @@ from __future__ import absolute_import
 import inspect
 import json
 import os
+import shutil
 import tarfile
 from contextlib import contextmanager
 from itertools import product
 
 import pytest
 
-from mock import Mock, patch
+from mock import ANY, Mock, patch
 
 from sagemaker import fw_utils
+from sagemaker.s3 import S3Uploader
 from sagemaker.utils import name_from_image
 from sagemaker.session_settings import SessionSettings
+from sagemaker.upload_cache import UploadCache
 from sagemaker.instance_group import InstanceGroup
 
 TIMESTAMP = "2017-10-10-14-14-15"
@@ -98,7 +101,7 @@ def test_tar_and_upload_dir_s3_with_kms(utils, sagemaker_session):
 
     extra_args = {"ServerSideEncryption": "aws:kms", "SSEKMSKeyId": kms_key}
     obj = sagemaker_session.resource("s3").Object("", "")
-    obj.upload_file.assert_called_with(utils.create_tar_file(), ExtraArgs=extra_args)
+    obj.upload_file.assert_called_with(utils.create_tar_file(), ExtraArgs=extra_args, Config=ANY)
 
 
 @patch("sagemaker.utils")
@@ -114,7 +117,7 @@ def test_tar_and_upload_dir_s3_kms_enabled_by_default(utils, sagemaker_session):
 
     extra_args = {"ServerSideEncryption": "aws:kms"}
     obj = sagemaker_session.resource("s3").Object("", "")
-    obj.upload_file.assert_called_with(utils.create_tar_file(), ExtraArgs=extra_args)
+    obj.upload_file.assert_called_with(utils.create_tar_file(), ExtraArgs=extra_args, Config=ANY)
 
 
 @patch("sagemaker.utils")
@@ -132,7 +135,7 @@ def test_tar_and_upload_dir_s3_without_kms_with_overridden_settings(utils, sagem
     )
 
     obj = sagemaker_session.resource("s3").Object("", "")
-    obj.upload_file.assert_called_with(utils.create_tar_file(), ExtraArgs=None)
+    obj.upload_file.assert_called_with(utils.create_tar_file(), ExtraArgs=None, Config=ANY)
 
 
 def test_mp_config_partition_exists():
@@ -396,6 +399,102 @@ def test_tar_and_upload_dir_with_many_folders(sagemaker_session, tmpdir):
     )
 
 
+def test_tar_and_upload_dir_streaming(sagemaker_session, tmpdir):
+    file_tree(tmpdir, ["src-dir/a/b", "src-dir/a/b2", "common/x/y"])
+    source_dir = os.path.join(str(tmpdir), "src-dir")
+    dependencies = [os.path.join(str(tmpdir), "common")]
+    settings = SessionSettings(compression_threads=2, stream_artifact_uploads=True)
+    uploaded_tar = os.path.join(str(tmpdir), "uploaded.tar.gz")
+
+    def upload_fileobj(fileobj, bucket, key, ExtraArgs, Config):
+        with open(uploaded_tar, "wb") as f:
+            shutil.copyfileobj(fileobj, f)
+
+    s3_resource = sagemaker_session.resource("s3")
+    s3_resource.meta.client.upload_fileobj.side_effect = upload_fileobj
+
+    result = fw_utils.tar_and_upload_dir(
+        sagemaker_session,
+        "bucket",
+        "prefix",
+        "a/b",
+        source_dir,
+        dependencies,
+        kms_key="kms-key",
+        settings=settings,
+    )
+
+    assert result == fw_utils.UploadedCode(
+        s3_prefix="s3://bucket/prefix/sourcedir.tar.gz", script_name="a/b"
+    )
+    s3_resource.Object().upload_file.assert_not_called()
+    args, kwargs = s3_resource.meta.client.upload_fileobj.call_args
+    assert args[1:] == ("bucket", "prefix/sourcedir.tar.gz")
+    assert kwargs["ExtraArgs"] == {"ServerSideEncryption": "aws:kms", "SSEKMSKeyId": "kms-key"}
+    assert {"/a/b", "/a/b2", "/common/x/y"} == list_tar_files("/opt/ml/code/", uploaded_tar, tmpdir)
+
+
+def test_tar_and_upload_dir_upload_cache(sagemaker_session, tmpdir):
+    file_tree(tmpdir, ["src-dir/a/b", "src-dir/a/b2"])
+    source_dir = os.path.join(str(tmpdir), "src-dir")
+    cache = UploadCache(manifest_path=None)
+    settings = SessionSettings(upload_cache=cache)
+    s3_resource = sagemaker_session.resource("s3")
+    s3_resource.meta.client.head_object.return_value = {"ETag": '"etag"'}
+
+    results = [
+        fw_utils.tar_and_upload_dir(
+            sagemaker_session, "bucket", prefix, "a/b", source_dir, settings=settings
+        )
+        for prefix in ("job-1", "job-2")
+    ]
+
+    expected = fw_utils.UploadedCode(
+        s3_prefix="s3://bucket/job-1/sourcedir.tar.gz", script_name="a/b"
+    )
+    assert results == [expected, expected]
+    s3_resource.Object.assert_called_once_with("bucket", "job-1/sourcedir.tar.gz")
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    with open(os.path.join(source_dir, "a", "b"), "w") as f:
+        f.write("changed")
+    result = fw_utils.tar_and_upload_dir(
+        sagemaker_session, "bucket", "job-3", "a/b", source_dir, settings=settings
+    )
+    assert result.s3_prefix == "s3://bucket/job-3/sourcedir.tar.gz"
+
+
+def test_tar_and_upload_dir_and_s3_uploader_cache_uploads_separately(sagemaker_session, tmpdir):
+    tmpdir.join("train.py").write("print('train')")
+    script = str(tmpdir.join("train.py"))
+    cache = UploadCache(manifest_path=None)
+    sagemaker_session.settings = SessionSettings(upload_cache=cache)
+    sagemaker_session.s3_client = sagemaker_session.resource("s3").meta.client
+    sagemaker_session.s3_client.head_object.return_value = {"ETag": '"etag"'}
+    sagemaker_session.upload_data.return_value = "s3://bucket/processing/train.py"
+
+    uploaded_code = fw_utils.tar_and_upload_dir(
+        sagemaker_session,
+        "bucket",
+        "training",
+        script,
+        kms_key="kms-key",
+        settings=sagemaker_session.settings,
+    )
+    s3_uri = S3Uploader.upload(
+        script,
+        "s3://bucket/processing",
+        kms_key="kms-key",
+        sagemaker_session=sagemaker_session,
+        use_upload_cache=True,
+    )
+
+    # The source tarball of the script is not reused for an upload of the script itself.
+    assert uploaded_code.s3_prefix == "s3://bucket/training/sourcedir.tar.gz"
+    assert s3_uri == "s3://bucket/processing/train.py"
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
 def test_test_tar_and_upload_dir_with_subfolders(sagemaker_session, tmpdir):
     file_tree(tmpdir, ["a/b/c", "a/b/c2"])
     root = file_tree(tmpdir, ["x/y/z", "x/y/z2"])
@@ -0,0 +1,167 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+
+import asyncio
+import threading
+
+import pytest
+from botocore.exceptions import ClientError
+from mock import Mock
+
+from sagemaker.logs import AsyncRateLimiter, MultiJobLogFollower
+
+LOG_GROUP = "/aws/sagemaker/TrainingJobs"
+
+
+class StubLogsClient(object):
+    """A CloudWatch Logs client serving the events appended to its streams."""
+
+    def __init__(self, page_size=2):
+        self.page_size = page_size
+        self.streams = {}
+        self.requests = []
+        self._lock = threading.Lock()
+        self._next_event_id = 0
+
+    def append(self, stream_name, timestamp, message):
+        with self._lock:
+            self._next_event_id += 1
+            self.streams.setdefault(stream_name, []).append(
+                {
+                    "logStreamName": stream_name,
+                    "timestamp": timestamp,
+                    "message": message,
+                    "eventId": str(self._next_event_id),
+                }
+            )
+
+    def filter_log_events(self, logGroupName, logStreamNamePrefix, startTime, nextToken=None):
+        assert logGroupName == LOG_GROUP
+        with self._lock:
+            self.requests.append(logStreamNamePrefix)
+            events = sorted(
+                (
+                    event
+                    for name, stream in self.streams.items()
+                    if name.startswith(logStreamNamePrefix)
+                    for event in stream
+                    if event["timestamp"] >= startTime
+                ),
+                key=lambda e: (e["timestamp"], e["eventId"]),
+            )
+        start = int(nextToken or 0)
+        response = {"events": events[start : start + self.page_size]}
+        if start + self.page_size < len(events):
+            response["nextToken"] = str(start + self.page_size)
+        return response
+
+
+def _collect(follower):
+    async def collect():
+        return [(job_name, host, event["message"]) async for job_name, host, event in follower]
+
+    return asyncio.run(collect())
+
+
+def test_multi_job_log_follower_without_wait():
+    logs_client = StubLogsClient()
+    for host in ("algo-1", "algo-2"):
+        for i in range(3):
+            logs_client.append("job-a/" + host, i, "a {} {}".format(host, i))
+    logs_client.append("job-b/algo-1", 5, "b")
+    logs_client.append("job-c-other/algo-1", 5, "not job-c")
+
+    events = _collect(
+        MultiJobLogFollower(logs_client, ["job-a", "job-b", "job-c"], wait=False, poll=0)
+    )
+
+    job_a_events = [event for event in events if event[0] == "job-a"]
+    assert job_a_events == [
+        ("job-a", "algo-1", "a algo-1 0"),
+        ("job-a", "algo-2", "a algo-2 0"),
+        ("job-a", "algo-1", "a algo-1 1"),
+        ("job-a", "algo-2", "a algo-2 1"),
+        ("job-a", "algo-1", "a algo-1 2"),
+        ("job-a", "algo-2", "a algo-2 2"),
+    ]
+    assert ("job-b", "algo-1", "b") in events
+    assert len(events) == 7
+    assert sorted(set(logs_client.requests)) == ["job-a/", "job-b/", "job-c/"]
+
+
+def test_multi_job_log_follower_waits_for_jobs():
+    logs_client = StubLogsClient()
+    logs_client.append("job-a/algo-1", 1, "first")
+    statuses = iter(["InProgress", "Completed"])
+
+    def describe_training_job(TrainingJobName):
+        status = next(statuses)
+        if status == "InProgress":
+            # New events arrive while the job runs, including a late event at an older timestamp.
+            logs_client.append("job-a/algo-1", 3, "second")
+            logs_client.append("job-a/algo-2", 2, "late")
+        return {"TrainingJobName": TrainingJobName, "TrainingJobStatus": status}
+
+    sagemaker_client = Mock(describe_training_job=Mock(side_effect=describe_training_job))
+    follower = MultiJobLogFollower(
+        logs_client,
+        ["job-a"],
+        sagemaker_client=sagemaker_client,
+        poll=0,
+        status_poll=0,
+        max_requests_per_second=1000,
+    )
+
+    events = _collect(follower)
+
+    assert [message for _, _, message in events] == ["first", "late", "second"]
+    assert sagemaker_client.describe_training_job.call_count == 2
+    assert follower.descriptions["job-a"]["TrainingJobStatus"] == "Completed"
+
+
+def test_multi_job_log_follower_without_log_group():
+    logs_client = Mock()
+    logs_client.filter_log_events.side_effect = ClientError(
+        {"Error": {"Code": "ResourceNotFoundException"}}, "FilterLogEvents"
+    )
+
+    assert _collect(MultiJobLogFollower(logs_client, ["job-a"], wait=False)) == []
+
+
+def test_multi_job_log_follower_raises_errors():
+    logs_client = Mock()
+    logs_client.filter_log_events.side_effect = ClientError(
+        {"Error": {"Code": "AccessDeniedException"}}, "FilterLogEvents"
+    )
+
+    with pytest.raises(ClientError):
+        _collect(MultiJobLogFollower(logs_client, ["job-a"], wait=False))
+
+
+def test_multi_job_log_follower_validates_arguments():
+    with pytest.raises(ValueError):
+        MultiJobLogFollower(Mock(), ["job-a"], job_type="Tuning", wait=False)
+    with pytest.raises(ValueError):
+        MultiJobLogFollower(Mock(), ["job-a"])
+
+
+def test_async_rate_limiter():
+    async def acquire_all():
+        rate_limiter = AsyncRateLimiter(rate=100)
+        loop = asyncio.get_event_loop()
+        start = loop.time()
+        await asyncio.gather(*(rate_limiter.acquire() for _ in range(6)))
+        return loop.time() - start
+
+    assert asyncio.run(acquire_all()) >= 0.045
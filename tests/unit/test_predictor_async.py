@@ -75,6 +75,9 @@ def empty_sagemaker_session():
     )
 
     ims.s3_client.put_object = Mock(name="put_object")
+    ims.s3_client.list_objects_v2 = Mock(
+        name="list_objects_v2", return_value={"Contents": [{"Key": "object-name"}]}
+    )
 
     return ims
 
@@ -106,6 +109,9 @@ def empty_sagemaker_session_with_null_failure_path():
     )
 
     ims.s3_client.put_object = Mock(name="put_object")
+    ims.s3_client.list_objects_v2 = Mock(
+        name="list_objects_v2", return_value={"Contents": [{"Key": "object-name"}]}
+    )
 
     return ims
 
@@ -277,6 +283,9 @@ def test_async_predict_call_pass_through_output_failure_paths():
         return_value={"Body": response_body},
     )
     sagemaker_session.s3_client.put_object = Mock(name="put_object")
+    sagemaker_session.s3_client.list_objects_v2 = Mock(
+        name="list_objects_v2", return_value={"Contents": [{"Key": "object-name"}]}
+    )
 
     predictor_async = AsyncPredictor(Predictor(ENDPOINT, sagemaker_session))
 
@@ -296,7 +305,7 @@ def test_async_predict_call_pass_through_output_failure_paths():
 
     assert result == RETURN_VALUE
     assert sagemaker_session.sagemaker_runtime_client.invoke_endpoint_async.called
-    assert sagemaker_session.s3_client.get_waiter.called_with("object_exists")
+    assert sagemaker_session.s3_client.list_objects_v2.called
     assert sagemaker_session.sagemaker_client.describe_endpoint.not_called
     assert sagemaker_session.sagemaker_client.describe_endpoint_config.not_called
 
@@ -314,6 +323,9 @@ def test_async_predict_call_pass_through_with_null_failure_path():
         return_value={"Body": response_body},
     )
     sagemaker_session.s3_client.put_object = Mock(name="put_object")
+    sagemaker_session.s3_client.list_objects_v2 = Mock(
+        name="list_objects_v2", return_value={"Contents": [{"Key": "object-name"}]}
+    )
 
     predictor_async = AsyncPredictor(Predictor(ENDPOINT, sagemaker_session))
 
@@ -332,11 +344,29 @@ def test_async_predict_call_pass_through_with_null_failure_path():
 
     assert result == RETURN_VALUE
     assert sagemaker_session.sagemaker_runtime_client.invoke_endpoint_async.called
-    assert sagemaker_session.s3_client.get_waiter.called_with("object_exists")
+    assert sagemaker_session.s3_client.list_objects_v2.called
     assert sagemaker_session.sagemaker_client.describe_endpoint.not_called
     assert sagemaker_session.sagemaker_client.describe_endpoint_config.not_called
 
 
+def test_wait_for_output_polls_at_waiter_config_delay():
+    predictor_async = AsyncPredictor(Predictor(ENDPOINT, empty_sagemaker_session()))
+    predictor_async.result_collector = Mock(name="result_collector")
+    predictor_async.result_collector.track.return_value.result.return_value = RETURN_VALUE
+
+    result = predictor_async._wait_for_output(
+        ASYNC_OUTPUT_LOCATION, ASYNC_FAILURE_LOCATION, DEFAULT_WAITER_CONFIG
+    )
+
+    assert result == RETURN_VALUE
+    predictor_async.result_collector.track.assert_called_once_with(
+        ASYNC_OUTPUT_LOCATION, ASYNC_FAILURE_LOCATION, poll=DEFAULT_WAITER_CONFIG.delay
+    )
+    predictor_async.result_collector.track.return_value.result.assert_called_once_with(
+        timeout=DEFAULT_WAITER_CONFIG.delay * DEFAULT_WAITER_CONFIG.max_attempts
+    )
+
+
 def test_predict_async_call_invalid_input():
     sagemaker_session = empty_sagemaker_session()
     predictor_async = AsyncPredictor(Predictor(ENDPOINT, sagemaker_session))
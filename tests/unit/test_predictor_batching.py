@@ -0,0 +1,160 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+
+import io
+import json
+import threading
+
+import pytest
+from mock import Mock
+
+from sagemaker.deserializers import CSVDeserializer, JSONDeserializer
+from sagemaker.predictor import Predictor
+from sagemaker.predictor_batching import BatchingPredictor
+from sagemaker.serializers import CSVSerializer, JSONSerializer
+
+ENDPOINT = "mxnet_endpoint"
+
+
+class FakeRuntimeClient(object):
+    """A SageMaker runtime client doubling each number of a JSON array of records."""
+
+    def __init__(self, response_key=None):
+        self.response_key = response_key
+        self.batches = []
+        self._lock = threading.Lock()
+
+    def invoke_endpoint(self, **kwargs):
+        assert kwargs["EndpointName"] == ENDPOINT
+        records = json.loads(kwargs["Body"])
+        with self._lock:
+            self.batches.append(records)
+        predictions = [2 * record for record in records]
+        if self.response_key:
+            predictions = {self.response_key: predictions}
+        return {
+            "Body": io.BytesIO(json.dumps(predictions).encode("utf-8")),
+            "ContentType": "application/json",
+        }
+
+
+def _predictor(runtime_client, serializer=None, deserializer=None):
+    return Predictor(
+        ENDPOINT,
+        sagemaker_session=Mock(sagemaker_runtime_client=runtime_client),
+        serializer=serializer or JSONSerializer(),
+        deserializer=deserializer or JSONDeserializer(),
+    )
+
+
+def test_predict_many_preserves_order():
+    runtime_client = FakeRuntimeClient()
+    batching_predictor = BatchingPredictor(
+        _predictor(runtime_client), max_batch_size=10, max_concurrency=3
+    )
+
+    with batching_predictor:
+        predictions = batching_predictor.predict_many(iter(range(95)))
+
+    assert predictions == [2 * i for i in range(95)]
+    assert sorted(len(batch) for batch in runtime_client.batches) == [5] + [10] * 9
+
+
+def test_predict_many_with_response_key():
+    runtime_client = FakeRuntimeClient(response_key="predictions")
+    batching_predictor = BatchingPredictor(
+        _predictor(runtime_client), max_batch_size=4, response_key="predictions"
+    )
+
+    assert batching_predictor.predict_many([1, 2, 3, 4, 5]) == [2, 4, 6, 8, 10]
+    batching_predictor.close()
+
+
+def test_predict_many_csv():
+    runtime_client = Mock()
+    runtime_client.invoke_endpoint.return_value = {
+        "Body": io.BytesIO(b"1,0.5\n0,0.25\n"),
+        "ContentType": "text/csv",
+    }
+    batching_predictor = BatchingPredictor(
+        _predictor(runtime_client, CSVSerializer(), CSVDeserializer())
+    )
+
+    assert batching_predictor.predict_many([[1, 2], [3, 4]]) == [["1", "0.5"], ["0", "0.25"]]
+    assert runtime_client.invoke_endpoint.call_args[1]["Body"] == "1,2\n3,4"
+    batching_predictor.close()
+
+
+def test_predict_many_raises_on_mismatched_response():
+    runtime_client = Mock()
+    runtime_client.invoke_endpoint.return_value = {
+        "Body": io.BytesIO(b"[1]"),
+        "ContentType": "application/json",
+    }
+    batching_predictor = BatchingPredictor(_predictor(runtime_client))
+
+    with pytest.raises(ValueError):
+        batching_predictor.predict_many([1, 2])
+    batching_predictor.close()
+
+
+def test_submit_coalesces_records():
+    runtime_client = FakeRuntimeClient()
+    batching_predictor = BatchingPredictor(
+        _predictor(runtime_client), max_batch_size=8, max_latency=5
+    )
+
+    futures = [batching_predictor.submit(i) for i in range(16)]
+
+    assert [future.result(timeout=10) for future in futures] == [2 * i for i in range(16)]
+    assert sorted(runtime_client.batches) == [list(range(8)), list(range(8, 16))]
+    batching_predictor.close()
+
+
+def test_submit_sends_partial_batches_after_max_latency():
+    runtime_client = FakeRuntimeClient()
+    batching_predictor = BatchingPredictor(
+        _predictor(runtime_client), max_batch_size=100, max_latency=0.01
+    )
+
+    assert batching_predictor.predict(3) == 6
+    assert batching_predictor.predict(4) == 8
+    assert runtime_client.batches == [[3], [4]]
+    batching_predictor.close()
+
+
+def test_submit_propagates_errors():
+    runtime_client = Mock()
+    runtime_client.invoke_endpoint.side_effect = RuntimeError("throttled")
+    batching_predictor = BatchingPredictor(_predictor(runtime_client), max_latency=0)
+
+    future = batching_predictor.submit(1)
+
+    with pytest.raises(RuntimeError, match="throttled"):
+        future.result(timeout=10)
+    batching_predictor.close()
+
+
+def test_close_flushes_submitted_records():
+    runtime_client = FakeRuntimeClient()
+    batching_predictor = BatchingPredictor(
+        _predictor(runtime_client), max_batch_size=100, max_latency=60
+    )
+    futures = [batching_predictor.submit(i) for i in range(3)]
+
+    batching_predictor.close()
+
+    assert [future.result(timeout=0) for future in futures] == [0, 2, 4]
+    with pytest.raises(RuntimeError):
+        batching_predictor.submit(1)
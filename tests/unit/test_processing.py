@@ -832,6 +832,9 @@ def test_script_processor_code_path_with_pipeline_config(
         bucket="mybucket",
         key_prefix="test-pipeline/code/code-hash-abcdefg",
         extra_args=None,
+        max_concurrency=10,
+        multipart_chunksize=8 * 1024 * 1024,
+        skip_unchanged=False,
     )
 
 
@@ -1033,6 +1036,9 @@ def test_processor_input_path_with_pipeline_config(pipeline_session):
         bucket="mybucket",
         key_prefix="test-pipeline/test-processing-step/input/s3_input",
         extra_args=None,
+        max_concurrency=10,
+        multipart_chunksize=8 * 1024 * 1024,
+        skip_unchanged=False,
     )
 
 
@@ -17,6 +17,8 @@ import pytest
 from mock import Mock
 
 from sagemaker import s3
+from sagemaker.session_settings import SessionSettings
+from sagemaker.upload_cache import UploadCache
 
 BUCKET_NAME = "mybucket"
 REGION = "us-west-2"
@@ -60,6 +62,9 @@ def test_upload(sagemaker_session, caplog):
         bucket=BUCKET_NAME,
         key_prefix=os.path.join(CURRENT_JOB_NAME, SOURCE_NAME),
         extra_args=None,
+        max_concurrency=10,
+        multipart_chunksize=8 * 1024 * 1024,
+        skip_unchanged=False,
     )
 
 
@@ -76,6 +81,34 @@ def test_upload_with_kms_key(sagemaker_session):
         bucket=BUCKET_NAME,
         key_prefix=os.path.join(CURRENT_JOB_NAME, SOURCE_NAME),
         extra_args={"SSEKMSKeyId": KMS_KEY, "ServerSideEncryption": "aws:kms"},
+        max_concurrency=10,
+        multipart_chunksize=8 * 1024 * 1024,
+        skip_unchanged=False,
+    )
+
+
+def test_upload_with_upload_cache(sagemaker_session, tmpdir):
+    tmpdir.join("scripts", "bootstrap.sh").write("echo", ensure=True)
+    tmpdir.join("scripts", "lib", "entrypoint.py").write("pass", ensure=True)
+    local_path = str(tmpdir.join("scripts"))
+    sagemaker_session.settings = SessionSettings(upload_cache=UploadCache(manifest_path=None))
+    sagemaker_session.s3_client.head_object.return_value = {"ETag": '"etag"'}
+    sagemaker_session.upload_data.return_value = "s3://mybucket/job-1/scripts"
+
+    results = [
+        s3.S3Uploader.upload(
+            local_path=local_path,
+            desired_s3_uri="s3://mybucket/{}/scripts".format(job_name),
+            sagemaker_session=sagemaker_session,
+            use_upload_cache=True,
+        )
+        for job_name in ("job-1", "job-2")
+    ]
+
+    assert results == ["s3://mybucket/job-1/scripts", "s3://mybucket/job-1/scripts"]
+    sagemaker_session.upload_data.assert_called_once()
+    sagemaker_session.s3_client.head_object.assert_called_with(
+        Bucket=BUCKET_NAME, Key="job-1/scripts/bootstrap.sh"
     )
 
 
@@ -89,6 +122,9 @@ def test_download(sagemaker_session):
         bucket=BUCKET_NAME,
         key_prefix=os.path.join(CURRENT_JOB_NAME, SOURCE_NAME),
         extra_args=None,
+        max_concurrency=10,
+        multipart_chunksize=8 * 1024 * 1024,
+        skip_unchanged=False,
     )
 
 
@@ -105,6 +141,9 @@ def test_download_with_kms_key(sagemaker_session):
         bucket=BUCKET_NAME,
         key_prefix=os.path.join(CURRENT_JOB_NAME, SOURCE_NAME),
         extra_args={"SSECustomerKey": KMS_KEY},
+        max_concurrency=10,
+        multipart_chunksize=8 * 1024 * 1024,
+        skip_unchanged=False,
     )
 
 
@@ -0,0 +1,270 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+
+import datetime
+import hashlib
+import os
+
+import pytest
+from botocore.exceptions import ClientError
+from mock import MagicMock
+
+from sagemaker import s3_transfer
+
+BUCKET_NAME = "mybucket"
+
+
+@pytest.fixture()
+def local_files(tmpdir):
+    files = []
+    for index in range(20):
+        path = str(tmpdir.join("file{}.txt".format(index)))
+        with open(path, "w") as f:
+            f.write("content {}".format(index))
+        files.append((path, "prefix/file{}.txt".format(index)))
+    return files
+
+
+@pytest.fixture()
+def s3_resource():
+    resource = MagicMock(name="s3_resource")
+    resource.meta.client.head_object.side_effect = ClientError(
+        {"Error": {"Code": "404"}}, "HeadObject"
+    )
+    return resource
+
+
+def _uploaded_files(s3_resource):
+    return sorted(
+        (args[0], kwargs)
+        for name, args, kwargs in s3_resource.mock_calls
+        if name == "meta.client.upload_file"
+    )
+
+
+def test_upload_files(s3_resource, local_files):
+    progress = []
+    stats = s3_transfer.upload_files(
+        s3_resource,
+        BUCKET_NAME,
+        local_files,
+        extra_args={"ServerSideEncryption": "AES256"},
+        max_concurrency=4,
+        progress_callback=lambda s: progress.append(s.transferred_files),
+    )
+
+    uploaded = _uploaded_files(s3_resource)
+    assert [path for path, _ in uploaded] == sorted(path for path, _ in local_files)
+    for _, kwargs in uploaded:
+        assert kwargs["ExtraArgs"] == {"ServerSideEncryption": "AES256"}
+        assert kwargs["Config"].max_concurrency == 1
+    keys = sorted(
+        args[2] for name, args, _ in s3_resource.mock_calls if name == "meta.client.upload_file"
+    )
+    assert keys == sorted(key for _, key in local_files)
+    s3_resource.Object.assert_not_called()
+    assert stats.transferred_files == 20
+    assert stats.transferred_bytes == sum(os.path.getsize(path) for path, _ in local_files)
+    assert stats.skipped_files == 0
+    assert sorted(progress) == list(range(1, 21))
+    s3_resource.meta.client.head_object.assert_not_called()
+
+
+def test_upload_files_single_file_uses_concurrency_for_parts(s3_resource, local_files):
+    s3_transfer.upload_files(
+        s3_resource,
+        BUCKET_NAME,
+        local_files[:1],
+        max_concurrency=8,
+        multipart_chunksize=5 * 2**20,
+    )
+
+    ((_, kwargs),) = _uploaded_files(s3_resource)
+    assert kwargs["Config"].max_concurrency == 8
+    assert kwargs["Config"].multipart_chunksize == 5 * 2**20
+
+
+def test_upload_files_skip_unchanged(s3_resource, local_files):
+    unchanged_path, unchanged_key = local_files[0]
+    with open(unchanged_path, "rb") as f:
+        etag = hashlib.md5(f.read()).hexdigest()
+
+    def head_object(Bucket, Key):
+        if Key == unchanged_key:
+            return {"ContentLength": os.path.getsize(unchanged_path), "ETag": '"%s"' % etag}
+        if Key == local_files[1][1]:
+            return {"ContentLength": os.path.getsize(unchanged_path), "ETag": '"other"'}
+        raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+
+    s3_resource.meta.client.head_object.side_effect = head_object
+
+    stats = s3_transfer.upload_files(s3_resource, BUCKET_NAME, local_files, skip_unchanged=True)
+
+    uploaded_paths = [path for path, _ in _uploaded_files(s3_resource)]
+    assert unchanged_path not in uploaded_paths
+    assert len(uploaded_paths) == 19
+    assert stats.skipped_files == 1
+    assert stats.transferred_files == 19
+
+
+def test_upload_files_raises_upload_errors(s3_resource, local_files):
+    s3_resource.meta.client.upload_file.side_effect = RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        s3_transfer.upload_files(s3_resource, BUCKET_NAME, local_files)
+
+
+def test_compute_etag_multipart(tmpdir):
+    path = str(tmpdir.join("large.bin"))
+    parts = [b"a" * 10, b"b" * 10, b"c" * 5]
+    with open(path, "wb") as f:
+        f.write(b"".join(parts))
+
+    combined = hashlib.md5(b"".join(hashlib.md5(part).digest() for part in parts))
+    assert s3_transfer.compute_etag(path, 20, 10) == "{}-3".format(combined.hexdigest())
+    assert s3_transfer.compute_etag(path, 100, 10) == hashlib.md5(b"".join(parts)).hexdigest()
+
+
+class LocalS3Client(object):
+    """A stand-in for the S3 client that serves objects from a dict."""
+
+    def __init__(self, objects):
+        self.objects = objects
+        self.last_modified = {
+            key: datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc) for key in objects
+        }
+        self.downloaded_keys = []
+
+    def put_object(self, key, body):
+        self.objects[key] = body
+        self.last_modified[key] = datetime.datetime.now(tz=datetime.timezone.utc)
+
+    def list_objects(self):
+        return [
+            {
+                "Key": key,
+                "Size": len(body),
+                "ETag": '"%s"' % hashlib.md5(body).hexdigest(),
+                "LastModified": self.last_modified[key],
+            }
+            for key, body in sorted(self.objects.items())
+        ]
+
+    def download_file(self, Bucket, Key, Filename, ExtraArgs=None, Config=None):
+        self.downloaded_keys.append(Key)
+        with open(Filename, "wb") as f:
+            f.write(self.objects[Key])
+
+
+@pytest.fixture()
+def local_s3_client():
+    return LocalS3Client(
+        {"prefix/dir{}/file{}.txt".format(i % 3, i): b"body %d" % i for i in range(20)}
+    )
+
+
+def _files_to_download(local_s3_client, target):
+    return [
+        (s3_object, os.path.join(target, *s3_object["Key"].split("/")[1:]))
+        for s3_object in local_s3_client.list_objects()
+    ]
+
+
+def test_download_files(local_s3_client, tmpdir):
+    files = _files_to_download(local_s3_client, str(tmpdir))
+
+    stats = s3_transfer.download_files(local_s3_client, BUCKET_NAME, files, max_concurrency=4)
+
+    for s3_object, local_path in files:
+        with open(local_path, "rb") as f:
+            assert f.read() == local_s3_client.objects[s3_object["Key"]]
+    assert sorted(local_s3_client.downloaded_keys) == sorted(local_s3_client.objects)
+    assert stats.transferred_files == 20
+    assert stats.transferred_bytes == sum(len(body) for body in local_s3_client.objects.values())
+
+
+def test_download_files_skip_unchanged(local_s3_client, tmpdir):
+    files = _files_to_download(local_s3_client, str(tmpdir))
+    s3_transfer.download_files(local_s3_client, BUCKET_NAME, files, skip_unchanged=True)
+    local_s3_client.downloaded_keys = []
+
+    # A file with a different mtime but the same content is recognized by its ETag.
+    os.utime(files[0][1], (0, 0))
+    # A file with the same size but a different content is downloaded again.
+    changed_key = files[1][0]["Key"]
+    local_s3_client.put_object(changed_key, local_s3_client.objects[changed_key][::-1])
+    files = _files_to_download(local_s3_client, str(tmpdir))
+
+    stats = s3_transfer.download_files(local_s3_client, BUCKET_NAME, files, skip_unchanged=True)
+
+    assert local_s3_client.downloaded_keys == [changed_key]
+    assert stats.transferred_files == 1
+    assert stats.skipped_files == 19
+    with open(files[1][1], "rb") as f:
+        assert f.read() == local_s3_client.objects[changed_key]
+
+
+class StreamingS3Client(object):
+    """A stand-in for an S3 client that reads uploaded streams in parts like boto3."""
+
+    def __init__(self, uploads, fail_after_parts=None):
+        self.uploads = uploads
+        self.fail_after_parts = fail_after_parts
+
+    def upload_fileobj(self, fileobj, bucket, key, ExtraArgs=None, Config=None):
+        parts = []
+        for part in iter(lambda: fileobj.read(Config.multipart_chunksize), b""):
+            if self.fail_after_parts is not None and len(parts) == self.fail_after_parts:
+                raise ClientError({"Error": {"Code": "AccessDenied"}}, "UploadPart")
+            parts.append(part)
+        self.uploads[key] = (parts, ExtraArgs)
+
+
+def test_upload_stream(s3_resource):
+    uploads = {}
+    s3_resource.meta.client = StreamingS3Client(uploads)
+
+    with s3_transfer.upload_stream(
+        s3_resource, BUCKET_NAME, "key", extra_args={"A": "B"}, multipart_chunksize=10
+    ) as stream:
+        for i in range(7):
+            stream.write(b"%d" % i * 4)
+
+    parts, extra_args = uploads["key"]
+    assert [len(part) for part in parts] == [10, 10, 8]
+    assert b"".join(parts) == b"".join(b"%d" % i * 4 for i in range(7))
+    assert extra_args == {"A": "B"}
+
+
+def test_upload_stream_aborts_on_writer_error(s3_resource):
+    uploads = {}
+    s3_resource.meta.client = StreamingS3Client(uploads)
+
+    with pytest.raises(ValueError):
+        with s3_transfer.upload_stream(s3_resource, BUCKET_NAME, "key") as stream:
+            stream.write(b"partial")
+            raise ValueError("failed to write the stream")
+
+    assert uploads == {}
+
+
+def test_upload_stream_raises_upload_errors(s3_resource):
+    s3_resource.meta.client = StreamingS3Client({}, fail_after_parts=1)
+
+    with pytest.raises(ClientError):
+        with s3_transfer.upload_stream(
+            s3_resource, BUCKET_NAME, "key", multipart_chunksize=10
+        ) as stream:
+            for _ in range(10000):
+                stream.write(b"x" * 10)
@@ -2599,6 +2599,52 @@ def test_logs_for_transform_job_full_lifecycle(time, cw, sagemaker_session_full_
     ]
 
 
+def test_flush_log_streams_reads_every_page_of_streams():
+    stream_names = ["{}/algo-{}".format(JOB_NAME, i) for i in range(1, 61)]
+    client = Mock()
+    client.describe_log_streams.side_effect = [
+        {
+            "logStreams": [{"logStreamName": name} for name in stream_names[:50]],
+            "nextToken": "next-token",
+        },
+        {"logStreams": [{"logStreamName": name} for name in stream_names[50:]]},
+    ]
+    read_streams = set()
+
+    def get_log_events(logStreamName, **kwargs):
+        if logStreamName in read_streams:
+            return {"nextForwardToken": None, "events": []}
+        read_streams.add(logStreamName)
+        return {"nextForwardToken": None, "events": [{"timestamp": 1, "message": logStreamName}]}
+
+    client.get_log_events.side_effect = get_log_events
+    color_wrap = Mock()
+    names, positions = [], {}
+
+    sagemaker.session._flush_log_streams(
+        names, 60, client, "/aws/sagemaker/TrainingJobs", JOB_NAME, positions, False, color_wrap
+    )
+
+    assert client.describe_log_streams.call_args_list == [
+        call(
+            logGroupName="/aws/sagemaker/TrainingJobs",
+            logStreamNamePrefix=JOB_NAME + "/",
+            orderBy="LogStreamName",
+            limit=50,
+        ),
+        call(
+            logGroupName="/aws/sagemaker/TrainingJobs",
+            logStreamNamePrefix=JOB_NAME + "/",
+            orderBy="LogStreamName",
+            limit=50,
+            nextToken="next-token",
+        ),
+    ]
+    assert names == stream_names
+    assert set(positions) == set(stream_names)
+    assert sorted(args for args, _ in color_wrap.call_args_list) == list(enumerate(stream_names))
+
+
 MODEL_NAME = "some-model"
 CONTAINERS = [
     {
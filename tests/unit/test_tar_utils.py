@@ -0,0 +1,97 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+
+import gzip
+import io
+import os
+import tarfile
+
+import pytest
+
+from sagemaker import tar_utils
+
+
+@pytest.fixture()
+def source_dir(tmpdir):
+    for name, size in [("model.bin", 3 * 1024 * 1024 + 7), ("code/inference.py", 100)]:
+        path = tmpdir.join("src", name)
+        path.dirpath().ensure(dir=True)
+        path.write_binary(os.urandom(size))
+    return str(tmpdir.join("src"))
+
+
+def _read_tar(data):
+    with tarfile.open(fileobj=io.BytesIO(data), mode="r:gz") as t:
+        return {m.name: t.extractfile(m).read() for m in t.getmembers() if m.isfile()}
+
+
+def _read_dir(path):
+    files = {}
+    for root, _, names in os.walk(path):
+        for name in names:
+            full_path = os.path.join(root, name)
+            with open(full_path, "rb") as f:
+                files[os.path.relpath(full_path, path).replace(os.sep, "/")] = f.read()
+    return files
+
+
+@pytest.mark.parametrize("compression_threads", [1, 4])
+def test_open_tar_writer(source_dir, compression_threads):
+    fileobj = io.BytesIO()
+    with tar_utils.open_tar_writer(fileobj, compression_threads, compression_level=1) as t:
+        t.add(source_dir, arcname="")
+
+    assert _read_tar(fileobj.getvalue()) == _read_dir(source_dir)
+
+
+def test_parallel_gzip_writer_writes_a_member_per_block():
+    data = os.urandom(1000)
+    fileobj = io.BytesIO()
+    with tar_utils.ParallelGzipWriter(fileobj, 3, block_size=300) as writer:
+        for i in range(0, len(data), 70):
+            writer.write(data[i : i + 70])
+
+    assert gzip.decompress(fileobj.getvalue()) == data
+    assert fileobj.getvalue().count(b"\x1f\x8b\x08") >= 4
+
+
+def test_parallel_gzip_writer_empty():
+    fileobj = io.BytesIO()
+    with tar_utils.ParallelGzipWriter(fileobj, 2):
+        pass
+
+    assert gzip.decompress(fileobj.getvalue()) == b""
+
+
+def test_copy_members(source_dir):
+    fileobj = io.BytesIO()
+    with tar_utils.open_tar_writer(fileobj) as t:
+        t.add(source_dir, arcname="./")
+    copy = io.BytesIO()
+
+    with tarfile.open(fileobj=io.BytesIO(fileobj.getvalue()), mode="r|gz") as source_tar:
+        with tar_utils.open_tar_writer(copy, compression_threads=2) as target_tar:
+            tar_utils.copy_members(
+                source_tar, target_tar, exclude=lambda m: tar_utils.is_under(m.name, "code")
+            )
+
+    assert set(_read_tar(copy.getvalue())) == {"./model.bin"}
+
+
+def test_is_under():
+    assert tar_utils.is_under("code", "code")
+    assert tar_utils.is_under("./code/inference.py", "code")
+    assert tar_utils.is_under("/code/lib/a", "code")
+    assert not tar_utils.is_under("code-other/a", "code")
+    assert not tar_utils.is_under("model/code", "code")
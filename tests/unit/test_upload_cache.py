@@ -0,0 +1,106 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+
+import os
+
+import pytest
+from botocore.exceptions import ClientError
+from mock import Mock
+
+from sagemaker import upload_cache
+
+BUCKET = "bucket"
+S3_URI = "s3://bucket/job-1/source/sourcedir.tar.gz"
+KEY = "job-1/source/sourcedir.tar.gz"
+
+
+@pytest.fixture()
+def source_dir(tmpdir):
+    tmpdir.join("src", "train.py").write("print('train')", ensure=True)
+    tmpdir.join("src", "lib", "utils.py").write("x = 1", ensure=True)
+    return str(tmpdir.join("src"))
+
+
+@pytest.fixture()
+def s3_client():
+    return Mock(head_object=Mock(return_value={"ETag": '"etag"'}))
+
+
+def _raw_hash(paths, *extra):
+    return upload_cache.compute_content_hash(paths, *extra, kind=upload_cache.RAW_UPLOAD)
+
+
+def test_compute_content_hash_ignores_mtime(source_dir):
+    content_hash = _raw_hash([source_dir])
+    os.utime(os.path.join(source_dir, "train.py"), (0, 0))
+
+    assert _raw_hash([source_dir]) == content_hash
+
+
+def test_compute_content_hash_changes_with_content_layout_and_extra(source_dir):
+    content_hash = _raw_hash([source_dir])
+
+    assert _raw_hash([source_dir], {"SSEKMSKeyId": "key"}) != content_hash
+
+    os.rename(os.path.join(source_dir, "lib"), os.path.join(source_dir, "lib2"))
+    renamed_hash = _raw_hash([source_dir])
+    assert renamed_hash != content_hash
+
+    with open(os.path.join(source_dir, "train.py"), "a") as f:
+        f.write("\n")
+    assert _raw_hash([source_dir]) != renamed_hash
+
+
+def test_compute_content_hash_changes_with_kind(source_dir):
+    tar_gz_hash = upload_cache.compute_content_hash([source_dir], kind=upload_cache.TAR_GZ_UPLOAD)
+
+    assert tar_gz_hash != _raw_hash([source_dir])
+
+
+def test_upload_cache_get_and_put(tmpdir, s3_client):
+    manifest_path = str(tmpdir.join("cache", "manifest.json"))
+    cache = upload_cache.UploadCache(manifest_path)
+
+    assert cache.get(s3_client, BUCKET, "hash") is None
+    cache.put(s3_client, BUCKET, "hash", S3_URI, KEY)
+
+    # The entry is shared through the manifest.
+    other_cache = upload_cache.UploadCache(manifest_path)
+    assert other_cache.get(s3_client, BUCKET, "hash") == S3_URI
+    assert other_cache.get(s3_client, "other-bucket", "hash") is None
+    s3_client.head_object.assert_called_with(Bucket=BUCKET, Key=KEY)
+    assert str(cache) == "0 hits, 1 misses"
+    assert str(other_cache) == "1 hits, 1 misses"
+
+
+def test_upload_cache_get_object_changed_or_deleted(s3_client):
+    cache = upload_cache.UploadCache(manifest_path=None)
+    cache.put(s3_client, BUCKET, "hash", S3_URI, KEY)
+
+    s3_client.head_object.return_value = {"ETag": '"other-etag"'}
+    assert cache.get(s3_client, BUCKET, "hash") is None
+
+    s3_client.head_object.side_effect = ClientError({"Error": {"Code": "404"}}, "HeadObject")
+    assert cache.get(s3_client, BUCKET, "hash") is None
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_upload_cache_ignores_unreadable_manifest(tmpdir, s3_client):
+    manifest_path = tmpdir.join("manifest.json")
+    manifest_path.write("{not json")
+    cache = upload_cache.UploadCache(str(manifest_path))
+
+    assert cache.get(s3_client, BUCKET, "hash") is None
+    cache.put(s3_client, BUCKET, "hash", S3_URI, KEY)
+    assert upload_cache.UploadCache(str(manifest_path)).get(s3_client, BUCKET, "hash") == S3_URI
@@ -61,7 +61,7 @@ def test_upload_data_absolute_dir(sagemaker_session):
     uploaded_files_with_args = [
         (args[0], kwargs)
         for name, args, kwargs in sagemaker_session.boto_session.mock_calls
-        if name == "resource().Object().upload_file"
+        if name == "resource().meta.client.upload_file"
     ]
     assert result_s3_uri == "s3://{}/data".format(BUCKET_NAME)
     assert len(uploaded_files_with_args) == 4
@@ -72,14 +72,14 @@ def test_upload_data_absolute_dir(sagemaker_session):
 
 def test_upload_data_absolute_dir_custom_endpoint(sagemaker_session_custom_endpoint):
 
-    sagemaker_session_custom_endpoint.s3_resource.Object = Mock()
+    sagemaker_session_custom_endpoint.s3_resource.meta = Mock()
 
     result_s3_uri = sagemaker_session_custom_endpoint.upload_data(UPLOAD_DATA_TESTS_FILES_DIR)
 
     uploaded_files_with_args = [
         (args[0], kwargs)
         for name, args, kwargs in sagemaker_session_custom_endpoint.s3_resource.mock_calls
-        if name == "Object().upload_file"
+        if name == "meta.client.upload_file"
     ]
     assert result_s3_uri == "s3://{}/data".format(BUCKET_NAME)
     assert len(uploaded_files_with_args) == 4
@@ -94,7 +94,7 @@ def test_upload_data_absolute_file(sagemaker_session):
     uploaded_files_with_args = [
         (args[0], kwargs)
         for name, args, kwargs in sagemaker_session.boto_session.mock_calls
-        if name == "resource().Object().upload_file"
+        if name == "resource().meta.client.upload_file"
     ]
     assert result_s3_uri == "s3://{}/data/{}".format(BUCKET_NAME, SINGLE_FILE_NAME)
     assert len(uploaded_files_with_args) == 1
@@ -111,7 +111,7 @@ def test_upload_data_aes_encrypted_absolute_dir(sagemaker_session):
     uploaded_files_with_args = [
         (args[0], kwargs)
         for name, args, kwargs in sagemaker_session.boto_session.mock_calls
-        if name == "resource().Object().upload_file"
+        if name == "resource().meta.client.upload_file"
     ]
     assert result_s3_uri == "s3://{}/data".format(BUCKET_NAME)
     assert len(uploaded_files_with_args) == 4
@@ -128,7 +128,7 @@ def test_upload_data_aes_encrypted_absolute_file(sagemaker_session):
     uploaded_files_with_args = [
         (args[0], kwargs)
         for name, args, kwargs in sagemaker_session.boto_session.mock_calls
-        if name == "resource().Object().upload_file"
+        if name == "resource().meta.client.upload_file"
     ]
     assert result_s3_uri == "s3://{}/data/{}".format(BUCKET_NAME, SINGLE_FILE_NAME)
     assert len(uploaded_files_with_args) == 1
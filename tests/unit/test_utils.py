@@ -27,7 +27,7 @@ from unittest import TestCase
 from boto3 import exceptions
 import botocore
 import pytest
-from mock import call, patch, Mock, MagicMock, PropertyMock
+from mock import ANY, call, patch, Mock, MagicMock, PropertyMock
 
 import sagemaker
 from sagemaker.experiments._run_context import _RunContext
@@ -648,22 +648,32 @@ def test_download_folder(makedirs):
     # all the S3 mocks are set, the test itself begins now.
     sagemaker.utils.download_folder(BUCKET_NAME, "/prefix", "/tmp", session)
 
-    obj_mock.download_file.assert_called()
+    obj_mock.download_file.assert_called_once_with(os.path.join("/tmp", "prefix"))
     calls = [
-        call(os.path.join("/tmp", "train", "train_data.csv")),
-        call(os.path.join("/tmp", "train", "validation_data.csv")),
+        call(
+            Bucket=BUCKET_NAME,
+            Key=key,
+            Filename=os.path.join("/tmp", "train", filename),
+            ExtraArgs=None,
+            Config=ANY,
+        )
+        for key, filename in (
+            ("prefix/train/train_data.csv", "train_data.csv"),
+            ("prefix/train/validation_data.csv", "validation_data.csv"),
+        )
     ]
-    obj_mock.download_file.assert_has_calls(calls)
-    assert s3_mock.Object.call_count == 3
+    s3_mock.meta.client.download_file.assert_has_calls(calls, any_order=True)
+    makedirs.assert_called_once_with(os.path.join("/tmp", "train"), exist_ok=True)
 
     s3_mock.reset_mock()
     obj_mock.reset_mock()
+    makedirs.reset_mock()
 
     # Test with a trailing slash for the prefix.
     sagemaker.utils.download_folder(BUCKET_NAME, "/prefix/", "/tmp", session)
-    obj_mock.download_file.assert_called()
-    obj_mock.download_file.assert_has_calls(calls)
-    assert s3_mock.Object.call_count == 2
+    obj_mock.download_file.assert_not_called()
+    s3_mock.meta.client.download_file.assert_has_calls(calls, any_order=True)
+    makedirs.assert_called_once_with(os.path.join("/tmp", "train"), exist_ok=True)
 
 
 @patch("os.makedirs")
@@ -902,6 +912,30 @@ def test_repack_model_from_file_to_file(tmp):
     assert list_tar_files(destination_path, tmp) == {"/code/lib/a", "/code/inference.py", "/model"}
 
 
+def test_repack_model_twice_with_parallel_compression(tmp):
+    create_file_tree(tmp, ["source-dir/inference.py"])
+    os.mkdir(os.path.join(tmp, "model-dir"))
+    # The model is larger than a compression block, so the archive has several gzip members.
+    with open(os.path.join(tmp, "model-dir", "model"), "wb") as f:
+        f.write(b"\0" * (5 * 1024 * 1024))
+    model_tar_path = os.path.join(tmp, "model.tar.gz")
+    sagemaker.utils.create_tar_file([os.path.join(tmp, "model-dir", "model")], model_tar_path)
+    sagemaker_session = MagicMock(settings=SessionSettings(compression_threads=4))
+
+    for source, destination in (("model", "repacked-once"), ("repacked-once", "repacked-twice")):
+        sagemaker.utils.repack_model(
+            "inference.py",
+            os.path.join(tmp, "source-dir"),
+            None,
+            "file://%s" % os.path.join(tmp, source + ".tar.gz"),
+            "file://%s" % os.path.join(tmp, destination + ".tar.gz"),
+            sagemaker_session,
+        )
+
+    destination_path = os.path.join(tmp, "repacked-twice.tar.gz")
+    assert list_tar_files(destination_path, tmp) == {"/code/inference.py", "/model"}
+
+
 def test_repack_model_with_inference_code_should_replace_the_code(tmp, fake_s3):
     create_file_tree(
         tmp, ["model-dir/model", "source-dir/new-inference.py", "model-dir/code/old-inference.py"]
@@ -1003,6 +1037,44 @@ def test_repack_model_with_same_inference_file_name(tmp, fake_s3):
     }
 
 
+def test_repack_model_streaming_from_s3_to_s3(tmp, fake_s3):
+    create_file_tree(
+        tmp,
+        [
+            "model-dir/model",
+            "model-dir/weights/part-1",
+            "model-dir/code/old-inference.py",
+            "source-dir/inference.py",
+        ],
+    )
+
+    fake_s3.tar_and_upload("model-dir", "s3://fake/location")
+    fake_s3.sagemaker_session.settings = SessionSettings(
+        compression_threads=2, stream_artifact_uploads=True
+    )
+
+    sagemaker.utils.repack_model(
+        "inference.py",
+        os.path.join(tmp, "source-dir"),
+        [os.path.join(tmp, "model-dir/model")],
+        "s3://fake/location",
+        "s3://destination-bucket/model.tar.gz",
+        fake_s3.sagemaker_session,
+        kms_key="kms_key",
+    )
+
+    assert list_tar_files(fake_s3.fake_upload_path, tmp) == {
+        "/code/inference.py",
+        "/code/lib/model",
+        "/model",
+        "/weights/part-1",
+    }
+
+    fake_s3.object_mock.upload_file.assert_not_called()
+    ((_, _, kwargs),) = fake_s3.object_mock.upload_fileobj.mock_calls
+    assert kwargs["ExtraArgs"] == {"ServerSideEncryption": "aws:kms", "SSEKMSKeyId": "kms_key"}
+
+
 class FakeS3(object):
     def __init__(self, tmp):
         self.tmp = tmp
@@ -1036,6 +1108,7 @@ class FakeS3(object):
     def mock_s3_upload(self):
         dst = os.path.join(self.tmp, "dst")
         object_mock = self.object_mock
+        location_map = self.location_map
 
         class MockS3Object(object):
             def __init__(self, bucket, key):
@@ -1048,7 +1121,18 @@ class FakeS3(object):
                 shutil.copy2(target, dst)
                 object_mock.upload_file(target, **kwargs)
 
-        self.sagemaker_session.boto_session.resource().Object = MockS3Object
+            def get(self):
+                return {"Body": open(location_map["%s/%s" % (self.bucket, self.key)], "rb")}
+
+        def upload_fileobj(fileobj, bucket, key, **kwargs):
+            with open(dst, "wb") as f:
+                for chunk in iter(lambda: fileobj.read(8 * 1024 * 1024), b""):
+                    f.write(chunk)
+            object_mock.upload_fileobj(fileobj, **kwargs)
+
+        s3_resource = self.sagemaker_session.boto_session.resource()
+        s3_resource.Object = MockS3Object
+        s3_resource.meta.client.upload_fileobj.side_effect = upload_fileobj
         return dst
 
 
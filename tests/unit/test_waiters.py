@@ -0,0 +1,161 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+
+import itertools
+
+import pytest
+from mock import MagicMock, Mock, patch
+
+import sagemaker
+from sagemaker import waiters
+from sagemaker.session import _wait_until
+from sagemaker.session_settings import SessionSettings
+
+JOB_NAME = "my-job"
+
+
+def _session(waiter_config):
+    return sagemaker.Session(
+        boto_session=MagicMock(name="boto_session"),
+        sagemaker_client=MagicMock(),
+        settings=SessionSettings(waiter_config=waiter_config),
+    )
+
+
+def test_waiter_config_delays_back_off_to_max_poll():
+    config = waiters.WaiterConfig(max_poll=20, backoff_factor=2, jitter=0)
+
+    assert list(itertools.islice(config.delays(5), 5)) == [5, 10, 20, 20, 20]
+    assert list(itertools.islice(config.delays(30), 2)) == [30, 30]
+
+
+def test_waiter_config_delays_default_to_fixed_poll():
+    assert list(itertools.islice(waiters.WaiterConfig().delays(5), 5)) == [5, 5, 5, 5, 5]
+
+
+def test_waiter_config_delays_jitter():
+    config = waiters.WaiterConfig(backoff_factor=1, jitter=0.2)
+
+    for delay in itertools.islice(config.delays(10), 100):
+        assert 8 <= delay <= 12
+
+
+@patch("time.sleep")
+@patch("time.monotonic", return_value=100.0)
+def test_rate_limiter_spaces_out_calls(monotonic, sleep):
+    rate_limiter = waiters.RateLimiter(rate=2)
+
+    for _ in range(3):
+        rate_limiter.acquire()
+
+    assert [c[0][0] for c in sleep.call_args_list] == [0.5, 1.0]
+
+
+@patch("time.sleep")
+def test_wait_until_with_waiter(sleep):
+    rate_limiter = Mock()
+    waiter = waiters.Waiter(
+        waiters.WaiterConfig(max_poll=60, backoff_factor=2, jitter=0), rate_limiter=rate_limiter
+    )
+    callable_fn = Mock(side_effect=[None, None, "result"])
+
+    assert _wait_until(callable_fn, 1, waiter) == "result"
+    assert [c[0][0] for c in sleep.call_args_list] == [1, 2, 4]
+    assert rate_limiter.acquire.call_count == 3
+
+
+def test_status_poller_batches_search_requests():
+    names = ["job-{}".format(i) for i in range(25)]
+    sagemaker_client = Mock()
+    sagemaker_client.search.side_effect = [
+        {
+            "Results": [
+                {"TrainingJob": {"TrainingJobName": "job-0", "TrainingJobStatus": "Failed"}}
+            ],
+            "NextToken": "token",
+        },
+        {
+            "Results": [
+                {"TrainingJob": {"TrainingJobName": "job-1", "TrainingJobStatus": "InProgress"}}
+            ]
+        },
+        {
+            "Results": [
+                {"TrainingJob": {"TrainingJobName": "job-24", "TrainingJobStatus": "Completed"}}
+            ]
+        },
+    ]
+    poller = waiters.StatusPoller(sagemaker_client, "TrainingJob")
+
+    assert poller._search_done(names) == {"job-0", "job-24"}
+    first_kwargs = sagemaker_client.search.call_args_list[0][1]
+    assert len(first_kwargs["SearchExpression"]["Filters"]) == 20
+    assert first_kwargs["SearchExpression"]["Operator"] == "Or"
+    assert sagemaker_client.search.call_args_list[1][1]["NextToken"] == "token"
+    assert len(sagemaker_client.search.call_args_list[2][1]["SearchExpression"]["Filters"]) == 5
+
+
+def test_status_poller_wakes_up_waiters():
+    sagemaker_client = Mock()
+    sagemaker_client.search.return_value = {
+        "Results": [{"Endpoint": {"EndpointName": "endpoint", "EndpointStatus": "InService"}}]
+    }
+    poller = waiters.StatusPoller(sagemaker_client, "Endpoint", poll=0.01)
+
+    assert poller.wait("endpoint", timeout=10)
+    assert not poller.wait("other-endpoint", timeout=0.05)
+
+
+def test_wait_for_job_multiplexed():
+    session = _session(waiters.WaiterConfig(multiplexed=True, max_describe_rate=10))
+    session.sagemaker_client.search.return_value = {
+        "Results": [
+            {"TrainingJob": {"TrainingJobName": JOB_NAME, "TrainingJobStatus": "Completed"}}
+        ]
+    }
+    session.sagemaker_client.describe_training_job.return_value = {
+        "TrainingJobName": JOB_NAME,
+        "TrainingJobStatus": "Completed",
+    }
+    poller = session._waiter("TrainingJob", JOB_NAME, poll=0.01).poller
+
+    result = session.wait_for_job(JOB_NAME, poll=0.01)
+
+    assert result["TrainingJobStatus"] == "Completed"
+    assert session._status_pollers == {"TrainingJob": poller}
+    session.sagemaker_client.describe_training_job.assert_called_once_with(TrainingJobName=JOB_NAME)
+
+
+@pytest.mark.parametrize("local_mode", [False, True])
+def test_session_waiter(local_mode):
+    session = _session(waiters.WaiterConfig(multiplexed=True, max_describe_rate=10))
+    session.local_mode = local_mode
+
+    waiter = session._waiter("Endpoint", "endpoint")
+    other_waiter = session._waiter("Endpoint", "other-endpoint")
+
+    assert (waiter.poller is None) == local_mode
+    assert waiter.poller is other_waiter.poller
+    assert session._waiter("ProcessingJob", JOB_NAME).poller is None
+    assert waiter.rate_limiter is other_waiter.rate_limiter is not None
+
+
+def test_session_waiter_default_config():
+    session = _session(None)
+
+    waiter = session._waiter("TrainingJob", JOB_NAME)
+
+    assert waiter.poller is None
+    assert waiter.rate_limiter is None
+    assert list(itertools.islice(waiter.delays(5), 3)) == [5, 5, 5]